@@ -8,9 +8,11 @@ from testcontainers.core.waiting_utils import wait_for_logs
 
 from benchmarks.runner import (
     AsgiResult,
+    BatchResult,
     BenchmarkResult,
     MicroResult,
     format_asgi_table,
+    format_batch_table,
     format_micro_table,
     format_table,
 )
@@ -93,3 +95,8 @@ def micro_results() -> Iterator[_Sink[MicroResult]]:
 @pytest.fixture(scope="session")
 def asgi_results() -> Iterator[_Sink[AsgiResult]]:
     yield from _sink_fixture("ASGI BENCHMARK SUMMARY", format_asgi_table)
+
+
+@pytest.fixture(scope="session")
+def batch_results() -> Iterator[_Sink[BatchResult]]:
+    yield from _sink_fixture("BATCH SIZE SUMMARY", format_batch_table)
@@ -37,6 +37,11 @@ MGET_BATCH = 10
 PHASE_NAMES = ("get", "get-miss", "set", "mget", "mset", "incr", "delete")
 BATCH_PHASES = frozenset({"mget", "mset"})
 
+# Batch-size sweep for ``run_batch_benchmark``: one get_many/set_many call
+# per run at each size, so per-key cost and server blocking time show up as
+# the batch grows.
+BATCH_SIZES = (10, 100, 1_000, 10_000, 50_000)
+
 
 @dataclass
 class PhaseTiming:
@@ -115,6 +120,10 @@ class AsgiResult:
     settled_conns: int
     duration_s: float
     concurrency: int
+    # Event-loop lag seen by the ``lag`` view's probe; None for other views.
+    loop_lag_p50_ms: float | None = None
+    loop_lag_p99_ms: float | None = None
+    loop_lag_max_ms: float | None = None
 
     @property
     def label(self) -> str:
@@ -140,6 +149,28 @@ class MicroResult:
         return self.output_bytes / self.input_bytes if self.input_bytes else 0.0
 
 
+@dataclass
+class BatchResult:
+    """get_many/set_many throughput at one batch size, sync and async."""
+
+    adapter_id: str
+    server: str
+    batch_size: int
+    max_batch_keys: int | None
+    mget_seconds: float
+    mset_seconds: float
+    amget_seconds: float
+    amset_seconds: float
+
+    @property
+    def label(self) -> str:
+        chunking = f"/chunk={self.max_batch_keys}" if self.max_batch_keys else ""
+        return f"{self.adapter_id}@{self.server}{chunking}"
+
+    def keys_per_sec(self, seconds: float) -> float:
+        return self.batch_size / seconds if seconds else 0.0
+
+
 def _new_result(
     adapter: AdapterConfig,
     serializer: SerializerConfig,
@@ -161,8 +192,11 @@ def build_caches(
     serializer: SerializerConfig,
     location: str,
     compressor: CompressorConfig | None = None,
+    extra_options: dict[str, Any] | None = None,
 ) -> dict[str, dict[str, Any]]:
     options = dict(adapter.options)
+    if extra_options:
+        options.update(extra_options)
     if serializer.dotted_path is not None:
         options["serializer"] = serializer.dotted_path
     if compressor is not None and compressor.dotted_path is not None:
@@ -445,11 +479,16 @@ def run_benchmark(
     *,
     compressor: CompressorConfig | None = None,
     payload_kind: str = "small",
+    extra_options: dict[str, Any] | None = None,
 ) -> BenchmarkResult:
-    """Run the workload K_RUNS times and return aggregated metrics."""
+    """Run the workload K_RUNS times and return aggregated metrics.
+
+    ``extra_options`` is merged into the adapter's ``OPTIONS``, for A/B runs
+    of a single knob (e.g. ``atomic_set_many`` against the ``mset`` phase).
+    """
 
     result = _new_result(adapter, serializer, compressor)
-    caches = build_caches(adapter, serializer, location, compressor=compressor)
+    caches = build_caches(adapter, serializer, location, compressor=compressor, extra_options=extra_options)
     payload = _build_payload_large() if payload_kind == "large" else _build_payload()
 
     info_client = _open_info_client(location)
@@ -641,6 +680,8 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
     port: int = 8787,
     sample_every_s: float = 5.0,
     cooldown_s: float = 5.0,
+    view: str = "mixed",
+    extra_options: dict[str, Any] | None = None,
 ) -> AsgiResult:
     """Full-stack ASGI benchmark: granian + httpx + 6-op view.
 
@@ -657,8 +698,14 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
     finish too quickly to pile up. Run this benchmark inside a Docker
     container with ``--cap-add NET_ADMIN`` and apply ``netem`` against the
     Valkey/Redis interface to reproduce vcache's numbers.
+
+    ``view`` picks the ``/bench/<view>/`` endpoint (``"fanout"`` gathers
+    many independent ``aget`` calls per request, ``"lag"`` mixes a ~5 MB
+    read with small ones and reports event-loop lag); ``extra_options`` are
+    merged into the backend ``OPTIONS``. Loop lag is collected per worker
+    process, so run the ``lag`` view with ``workers=1``.
     """
-    options_for_env = dict(adapter.options)
+    options_for_env = {**adapter.options, **(extra_options or {})}
     if serializer.dotted_path is not None:
         options_for_env["serializer"] = serializer.dotted_path
 
@@ -701,7 +748,8 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
         # Seed cache + give workers a moment to spawn.
         time.sleep(1.0)
         with httpx.Client(timeout=5.0) as c:
-            r = c.get(f"http://127.0.0.1:{port}/bench/seed/")
+            seed = "seed-lag" if view == "lag" else "seed"
+            r = c.get(f"http://127.0.0.1:{port}/bench/{seed}/", timeout=30.0)
             r.raise_for_status()
 
         initial_rss = _total_rss_kb(proc.pid) / 1024.0
@@ -745,7 +793,7 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
                 return
 
         async def _load() -> tuple[int, int, list[float]]:
-            url = f"http://127.0.0.1:{port}/bench/mixed/"
+            url = f"http://127.0.0.1:{port}/bench/{view}/"
             stop_at = time.perf_counter() + duration_s
             limits = httpx.Limits(
                 max_connections=concurrency * 2,
@@ -770,6 +818,13 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
         total_requests, errors, latencies = asyncio.run(_load())
         actual_duration = time.perf_counter() - load_started
 
+        loop_lag: dict[str, float] = {}
+        if view == "lag":
+            with httpx.Client(timeout=5.0) as c:
+                r = c.get(f"http://127.0.0.1:{port}/bench/loop-lag/")
+                r.raise_for_status()
+                loop_lag = r.json()
+
         final_rss = _total_rss_kb(proc.pid) / 1024.0
         final_conns = _server_connections(info_client) or 0
         peak_rss = max(peak_rss, final_rss)
@@ -803,6 +858,9 @@ def run_asgi_benchmark(  # noqa: C901, PLR0915 (orchestrates many phases in one
             settled_conns=settled_conns,
             duration_s=actual_duration,
             concurrency=concurrency,
+            loop_lag_p50_ms=loop_lag.get("p50"),
+            loop_lag_p99_ms=loop_lag.get("p99"),
+            loop_lag_max_ms=loop_lag.get("max"),
         )
     finally:
         proc.terminate()
@@ -918,6 +976,79 @@ def run_async_benchmark(
     return result
 
 
+def _median_call_seconds(fn: Callable[[], object], n_runs: int) -> float:
+    samples = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return median(samples)
+
+
+def run_batch_benchmark(
+    adapter: AdapterConfig,
+    serializer: SerializerConfig,
+    location: str,
+    *,
+    batch_sizes: Iterable[int] = BATCH_SIZES,
+    max_batch_keys: int | None = None,
+    n_runs: int = 5,
+    extra_options: dict[str, Any] | None = None,
+) -> list[BatchResult]:
+    """Time one ``get_many`` / ``set_many`` (and async twins) per batch size.
+
+    ``max_batch_keys`` is passed through ``OPTIONS`` so the same sweep can
+    compare one giant MGET/MSET against the chunked (and, on the async
+    path, concurrent) variant.
+    """
+    caches = build_caches(adapter, serializer, location, extra_options=extra_options)
+    if max_batch_keys is not None:
+        caches["default"]["OPTIONS"]["max_batch_keys"] = max_batch_keys
+    payload = _build_payload()
+    results: list[BatchResult] = []
+
+    with override_settings(CACHES=caches):
+        from django.core.cache import cache
+
+        for size in batch_sizes:
+            _flush_cache(cache)
+            data = {f"batch:{i}": payload for i in range(size)}
+            keys = list(data)
+            cache.set_many(data)  # untimed warmup; also seeds the keys for get_many
+
+            async def _async_runs(data=data, keys=keys) -> tuple[float, float]:
+                async def timed(coro_fn: Callable[[], Any]) -> float:
+                    samples = []
+                    for _ in range(n_runs):
+                        start = time.perf_counter()
+                        await coro_fn()
+                        samples.append(time.perf_counter() - start)
+                    return median(samples)
+
+                amset = await timed(lambda: cache.aset_many(data))
+                amget = await timed(lambda: cache.aget_many(keys))
+                return amget, amset
+
+            mset = _median_call_seconds(lambda data=data: cache.set_many(data), n_runs)
+            mget = _median_call_seconds(lambda keys=keys: cache.get_many(keys), n_runs)
+            amget, amset = asyncio.run(_async_runs())
+            results.append(
+                BatchResult(
+                    adapter_id=adapter.id,
+                    server=adapter.server,
+                    batch_size=size,
+                    max_batch_keys=max_batch_keys,
+                    mget_seconds=mget,
+                    mset_seconds=mset,
+                    amget_seconds=amget,
+                    amset_seconds=amset,
+                ),
+            )
+        _flush_cache(cache)
+
+    return results
+
+
 def run_compressor_micro(
     compressor: CompressorConfig,
     *,
@@ -958,6 +1089,195 @@ def run_compressor_micro(
     )
 
 
+# Payload sizes for ``run_raw_passthrough_micro``.
+RAW_PAYLOAD_SIZES = (1_024, 10_240, 102_400, 1_048_576)
+
+
+@dataclass
+class PassthroughResult:
+    """Median µs per encode + decode round trip, serialized vs ``raw_passthrough``."""
+
+    kind: str
+    size: int
+    serialized_us: float
+    raw_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.serialized_us / self.raw_us if self.raw_us else 0.0
+
+
+def run_raw_passthrough_micro(*, n_runs: int = 20) -> list[PassthroughResult]:
+    """Encode + decode ``bytes`` / ``str`` payloads with and without ``raw_passthrough``.
+
+    Pickle serializer, no compressor, no server: the cache's adapter is
+    never touched, so only the codec work is timed.
+    """
+    from django_cachex.cache import RedisCache
+
+    def _cache(**options: Any) -> Any:
+        return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": options})
+
+    serialized, raw = _cache(), _cache(raw_passthrough=True)
+
+    def _median_us(cache: Any, value: bytes | str, n_ops: int) -> float:
+        encode, decode = cache.encode, cache.decode
+        samples = []
+        for _ in range(n_runs):
+            start = time.perf_counter()
+            for _ in range(n_ops):
+                decode(encode(value))
+            samples.append((time.perf_counter() - start) / n_ops * 1_000_000)
+        return median(samples)
+
+    results = []
+    for size in RAW_PAYLOAD_SIZES:
+        n_ops = max(10, 4_000_000 // size)
+        html = ("<li class='row'>cached fragment</li>" * (size // 36 + 1))[:size]
+        for kind, value in (("str", html), ("bytes", html.encode())):
+            results.append(
+                PassthroughResult(
+                    kind=kind,
+                    size=size,
+                    serialized_us=_median_us(serialized, value, n_ops),
+                    raw_us=_median_us(raw, value, n_ops),
+                ),
+            )
+    return results
+
+
+def format_passthrough_table(rows: list[PassthroughResult]) -> str:
+    headers = ["payload", "size", "pickle (µs)", "raw (µs)", "speedup"]
+    body = [[r.kind, f"{r.size:,} B", f"{r.serialized_us:,.2f}", f"{r.raw_us:,.2f}", f"{r.speedup:.1f}x"] for r in rows]
+    return _render_table(headers, body)
+
+
+# Array sizes for ``run_out_of_band_micro``.
+OOB_PAYLOAD_SIZES = (1_048_576, 16_777_216)
+
+
+class _ArrayBlock:
+    """Stand-in for a NumPy array: pickles its data as a ``PickleBuffer`` under protocol 5."""
+
+    def __init__(self, data: bytearray | memoryview) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:
+        if protocol >= 5:  # PickleBuffer needs protocol 5
+            return _ArrayBlock, (pickle.PickleBuffer(self.data),)
+        return _ArrayBlock, (bytearray(self.data),)
+
+
+@dataclass
+class OutOfBandResult:
+    """Traced peak KB of one encode and one decode, in-band pickle vs ``out_of_band``."""
+
+    size: int
+    in_band_write_kb: float
+    oob_write_kb: float
+    in_band_read_kb: float
+    oob_read_kb: float
+    in_band_us: float
+    oob_us: float
+
+
+def run_out_of_band_micro(*, n_runs: int = 5) -> list[OutOfBandResult]:
+    """Encode + decode a large array-like value with pickle protocol 5, in-band and out-of-band.
+
+    The peak is what tracemalloc sees allocated on top of the value itself
+    (and, for the decode, on top of the fetched bytes): the copies the
+    codec makes. No compressor, no server.
+    """
+    from django_cachex.cache import RedisCache
+    from django_cachex.serializers.pickle import PickleSerializer
+
+    def _cache(serializer: PickleSerializer) -> Any:
+        return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": {"serializer": serializer}})
+
+    in_band = _cache(PickleSerializer(protocol=5))
+    oob = _cache(PickleSerializer(out_of_band=True))
+
+    def _peak_kb(fn: Callable[[], object]) -> tuple[Any, float]:
+        gc.collect()
+        tracemalloc.start()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, peak / 1024
+
+    def _measure(cache: Any, value: Any) -> tuple[float, float, float]:
+        stored, write_kb = _peak_kb(lambda: cache.encode(value))
+        _, read_kb = _peak_kb(lambda: cache.decode(stored))
+        us = _median_call_seconds(lambda: cache.decode(cache.encode(value)), n_runs) * 1_000_000
+        return write_kb, read_kb, us
+
+    results = []
+    for size in OOB_PAYLOAD_SIZES:
+        value = {"shape": (size // 8,), "dtype": "float64", "data": _ArrayBlock(bytearray(size))}
+        in_band_write, in_band_read, in_band_us = _measure(in_band, value)
+        oob_write, oob_read, oob_us = _measure(oob, value)
+        results.append(
+            OutOfBandResult(
+                size=size,
+                in_band_write_kb=in_band_write,
+                oob_write_kb=oob_write,
+                in_band_read_kb=in_band_read,
+                oob_read_kb=oob_read,
+                in_band_us=in_band_us,
+                oob_us=oob_us,
+            ),
+        )
+    return results
+
+
+def format_out_of_band_table(rows: list[OutOfBandResult]) -> str:
+    headers = ["size", "write peak (KB)", "read peak (KB)", "round trip (µs)"]
+    body = [
+        [
+            f"{r.size:,} B",
+            f"{r.in_band_write_kb:,.0f} -> {r.oob_write_kb:,.0f}",
+            f"{r.in_band_read_kb:,.0f} -> {r.oob_read_kb:,.0f}",
+            f"{r.in_band_us:,.0f} -> {r.oob_us:,.0f}",
+        ]
+        for r in rows
+    ]
+    return _render_table(headers, body)
+
+
+class _NullAdapter:
+    """Adapter stand-in whose commands cost next to nothing, so only the wrapper is measured."""
+
+    def get(self, key: str, *, stampede_prevention: Any = None) -> bytes:
+        return b"value"
+
+    def set(self, key: str, value: bytes | int, timeout: int | None, *, stampede_prevention: Any = None) -> None:
+        return None
+
+
+def run_metrics_overhead(*, n_runs: int = 20, n_ops: int = 100_000) -> tuple[float, float]:
+    """Per-call cost (ns) of adapter ``get``/``set`` without and with ``OPTIONS["metrics"]``.
+
+    No server: the adapter is a stub, so the difference between the two
+    numbers is the instrumentation overhead per operation. Calls have the
+    shape ``RespCache`` sends, ``stampede_prevention=`` keyword included.
+    """
+    from django_cachex.metrics import CacheMetrics, InstrumentedAdapter
+
+    def _median_ns(adapter: Any) -> float:
+        get, set_ = adapter.get, adapter.set
+        value = b"x" * 64
+        samples = []
+        for _ in range(n_runs):
+            start = time.perf_counter_ns()
+            for _ in range(n_ops):
+                get("k", stampede_prevention=None)
+                set_("k", value, 300, stampede_prevention=None)
+            samples.append((time.perf_counter_ns() - start) / (2 * n_ops))
+        return median(samples)
+
+    return _median_ns(_NullAdapter()), _median_ns(InstrumentedAdapter(_NullAdapter(), CacheMetrics()))
+
+
 def _render_table(headers: list[str], rows: list[list[str]]) -> str:
     """Right-justify every column except the first; pad to widest cell."""
     widths = [len(h) for h in headers]
@@ -1014,6 +1334,12 @@ def format_table(results: Iterable[BenchmarkResult]) -> str:
 
 
 def format_asgi_summary(result: AsgiResult) -> str:
+    lag = (
+        f"\n  loop lag p50={result.loop_lag_p50_ms:.2f}ms  p99={result.loop_lag_p99_ms:.2f}ms  "
+        f"max={result.loop_lag_max_ms:.1f}ms"
+        if result.loop_lag_max_ms is not None
+        else ""
+    )
     return (
         f"  adapter={result.adapter_id}  serializer={result.serializer_id}  server={result.server}\n"
         f"  duration={result.duration_s:.1f}s  concurrency={result.concurrency}  "
@@ -1026,6 +1352,7 @@ def format_asgi_summary(result: AsgiResult) -> str:
         f"(growth {result.rss_growth_mb:+.1f} MB)\n"
         f"  conns init={result.initial_conns}  peak={result.peak_conns}  "
         f"final={result.final_conns}  settled={result.settled_conns}"
+        f"{lag}"
     )
 
 
@@ -1043,6 +1370,7 @@ def format_asgi_table(results: Iterable[AsgiResult]) -> str:
         "RSS final",
         "conns peak",
         "conns settled",
+        "lag p99 ms",
     ]
     rows = [
         [
@@ -1055,6 +1383,27 @@ def format_asgi_table(results: Iterable[AsgiResult]) -> str:
             f"{r.final_rss_mb:.0f}",
             str(r.peak_conns),
             str(r.settled_conns),
+            "-" if r.loop_lag_p99_ms is None else f"{r.loop_lag_p99_ms:.1f}",
+        ]
+        for r in results
+    ]
+    return _render_table(headers, rows)
+
+
+def format_batch_table(results: Iterable[BatchResult]) -> str:
+    """One row per (config, batch size): keys/sec for each bulk op."""
+    results = list(results)
+    if not results:
+        return "(no batch results)"
+    headers = ["config", "batch", "mget keys/s", "mset keys/s", "amget keys/s", "amset keys/s"]
+    rows = [
+        [
+            r.label,
+            f"{r.batch_size:,}",
+            f"{r.keys_per_sec(r.mget_seconds):,.0f}",
+            f"{r.keys_per_sec(r.mset_seconds):,.0f}",
+            f"{r.keys_per_sec(r.amget_seconds):,.0f}",
+            f"{r.keys_per_sec(r.amset_seconds):,.0f}",
         ]
         for r in results
     ]
@@ -11,6 +11,30 @@ Parametrized tests:
   cost vs network savings tradeoff in real cache calls.
 - ``test_compressors_micro`` runs pure compress/decompress in-process, with
   no adapter or container. Reports ratio and MB/s for each compressor.
+- ``test_raw_passthrough_micro`` encodes and decodes 1KB-1MB ``str`` and
+  ``bytes`` payloads through pickle and through ``raw_passthrough``, which
+  stores them behind a two-byte header with no serializer call.
+- ``test_out_of_band_micro`` encodes and decodes a 1MB and a 16MB
+  array-like value (pickled the way NumPy arrays are) with pickle protocol 5
+  in-band and with ``PickleSerializer(out_of_band=True)``, and reports the
+  traced peak memory of each side.
+- ``test_metrics_overhead`` times a stub adapter's ``get`` and ``set``,
+  called the way ``RespCache`` calls them, bare and wrapped by
+  ``OPTIONS["metrics"]`` instrumentation, and checks the wrapper adds less
+  than ``METRICS_OVERHEAD_BUDGET_NS`` per call.
+- ``test_batch_sizes`` sweeps get_many/set_many from 10 to 50k keys, once
+  as a single MGET/MSET and once split with ``max_batch_keys`` (chunks run
+  concurrently on the async path).
+- ``test_set_many_shapes`` compares the ``mset`` phase (and a 100k-key
+  bulk write) for the redis-py/valkey-py adapters with MULTI + MSET +
+  N x EXPIRE (``atomic_set_many=True``, the default) against one SET EX per
+  key in a plain pipeline (``atomic_set_many=False``).
+- ``test_asgi_auto_batch`` runs the ASGI fan-out view (many gathered
+  ``aget`` calls per request) with and without ``auto_batch``, which
+  merges the reads of one event-loop iteration into a single MGET.
+- ``test_asgi_loop_lag`` runs the ASGI lag view (a ~5 MB read gathered
+  with small ones) on one worker, with and without ``async_offload``, and
+  reports how late a 1 ms event-loop probe wakes up.
 - ``test_adapters_request_cycle`` has the same shape as ``test_adapters_sync`` but
   every cache op is wrapped in a real Django request cycle (URL resolve,
   middleware, view dispatch, signals). Direct comparison reveals the
@@ -31,21 +55,45 @@ from benchmarks.configs import (
 )
 from benchmarks.runner import (
     format_asgi_summary,
+    format_batch_table,
+    format_out_of_band_table,
+    format_passthrough_table,
     format_summary,
     run_asgi_benchmark,
     run_async_benchmark,
+    run_batch_benchmark,
     run_benchmark,
     run_compressor_micro,
+    run_metrics_overhead,
+    run_out_of_band_micro,
+    run_raw_passthrough_micro,
     run_request_cycle_benchmark,
 )
 
 ASYNC_CONCURRENCY = 50
 
+# Chunk size used by the chunked half of ``test_batch_sizes``.
+BATCH_CHUNK_KEYS = 1_000
+
+# Adapters whose set_many shape is switchable via ``atomic_set_many``, and
+# the bulk-warmup size ``test_set_many_shapes`` writes in one call.
+SET_MANY_SHAPE_ADAPTERS = ("redis-py", "valkey-py")
+BULK_WARMUP_KEYS = 100_000
+
 # ASGI benchmark knobs, kept short by default so the suite stays runnable
 # in CI; bump these manually for hero numbers.
 ASGI_DURATION_S = 20
 ASGI_CONCURRENCY = 100
 ASGI_WORKERS = 4
+# Each lag request moves ~5 MB, so fewer clients keep the server from
+# being purely bandwidth-bound.
+ASGI_LAG_CONCURRENCY = 10
+
+# Largest payload for which ``test_raw_passthrough_micro`` requires a speedup.
+RAW_ASSERT_MAX_BYTES = 10_240
+
+# Per-call budget for ``OPTIONS["metrics"]`` instrumentation.
+METRICS_OVERHEAD_BUDGET_NS = 1_000
 
 
 @pytest.mark.parametrize("adapter", ADAPTER_CONFIGS, ids=lambda c: c.id)
@@ -127,6 +175,53 @@ def test_adapters_async_concurrent(adapter, server_url, results, capsys) -> None
         print(format_summary(result))
 
 
+@pytest.mark.parametrize("max_batch_keys", [None, BATCH_CHUNK_KEYS], ids=["single", "chunked"])
+@pytest.mark.parametrize("adapter", ADAPTER_CONFIGS, ids=lambda c: c.id)
+def test_batch_sizes(adapter, max_batch_keys, server_url, batch_results, capsys) -> None:
+    if max_batch_keys is not None and not adapter.backend.startswith("django_cachex."):
+        pytest.skip("max_batch_keys is a django-cachex option")
+    pickle_serializer = SERIALIZER_BY_ID["pickle"]
+    location = server_url(adapter.server)
+
+    rows = run_batch_benchmark(adapter, pickle_serializer, location, max_batch_keys=max_batch_keys)
+    for row in rows:
+        batch_results.add(row)
+
+    with capsys.disabled():
+        print()
+        print(format_batch_table(rows))
+
+
+@pytest.mark.parametrize("atomic", [True, False], ids=["multi", "setex"])
+@pytest.mark.parametrize("adapter_id", SET_MANY_SHAPE_ADAPTERS)
+def test_set_many_shapes(adapter_id, atomic, server_url, results, batch_results, capsys) -> None:
+    adapter = ADAPTER_BY_ID[adapter_id]
+    pickle_serializer = SERIALIZER_BY_ID["pickle"]
+    location = server_url(adapter.server)
+    extra_options = {"atomic_set_many": atomic}
+    shape = "multi" if atomic else "setex"
+
+    result = run_benchmark(adapter, pickle_serializer, location, extra_options=extra_options)
+    result.adapter_id = f"{adapter.id}#{shape}"
+    results.add(result)
+
+    rows = run_batch_benchmark(
+        adapter,
+        pickle_serializer,
+        location,
+        batch_sizes=(BULK_WARMUP_KEYS,),
+        extra_options=extra_options,
+    )
+    for row in rows:
+        row.adapter_id = f"{adapter.id}#{shape}"
+        batch_results.add(row)
+
+    with capsys.disabled():
+        print()
+        print(format_summary(result))
+        print(format_batch_table(rows))
+
+
 @pytest.mark.parametrize("adapter", ADAPTER_CONFIGS, ids=lambda c: c.id)
 def test_adapters_request_cycle(adapter, server_url, results, capsys) -> None:
     pickle_serializer = SERIALIZER_BY_ID["pickle"]
@@ -172,6 +267,60 @@ def test_adapters_asgi(adapter, server_url, asgi_results, capsys) -> None:
         print(format_asgi_summary(result))
 
 
+@pytest.mark.parametrize("auto_batch", [False, True], ids=["per-key", "auto-batch"])
+@pytest.mark.parametrize("adapter", ADAPTER_CONFIGS, ids=lambda c: c.id)
+def test_asgi_auto_batch(adapter, auto_batch, server_url, asgi_results, capsys) -> None:
+    """ASGI fan-out view at ``ASGI_CONCURRENCY`` clients, per-key GETs vs auto-batched MGET."""
+    if auto_batch and not adapter.backend.startswith("django_cachex."):
+        pytest.skip("auto_batch is a django-cachex option")
+    pickle_serializer = SERIALIZER_BY_ID["pickle"]
+    location = server_url(adapter.server)
+
+    result = run_asgi_benchmark(
+        adapter,
+        pickle_serializer,
+        location,
+        duration_s=ASGI_DURATION_S,
+        concurrency=ASGI_CONCURRENCY,
+        workers=ASGI_WORKERS,
+        view="fanout",
+        extra_options={"auto_batch": True} if auto_batch else None,
+    )
+    result.adapter_id = f"{adapter.id}#fanout{'+batch' if auto_batch else ''}"
+    asgi_results.add(result)
+
+    with capsys.disabled():
+        print()
+        print(format_asgi_summary(result))
+
+
+@pytest.mark.parametrize("offload", [False, True], ids=["inline", "offload"])
+@pytest.mark.parametrize("adapter", ADAPTER_CONFIGS, ids=lambda c: c.id)
+def test_asgi_loop_lag(adapter, offload, server_url, asgi_results, capsys) -> None:
+    """Event-loop lag with mixed large and small reads, decoded inline vs on the codec pool."""
+    if not adapter.backend.startswith("django_cachex."):
+        pytest.skip("async_offload is a django-cachex option")
+    pickle_serializer = SERIALIZER_BY_ID["pickle"]
+    location = server_url(adapter.server)
+
+    result = run_asgi_benchmark(
+        adapter,
+        pickle_serializer,
+        location,
+        duration_s=ASGI_DURATION_S,
+        concurrency=ASGI_LAG_CONCURRENCY,
+        workers=1,
+        view="lag",
+        extra_options={"async_offload": True} if offload else None,
+    )
+    result.adapter_id = f"{adapter.id}#lag{'+offload' if offload else ''}"
+    asgi_results.add(result)
+
+    with capsys.disabled():
+        print()
+        print(format_asgi_summary(result))
+
+
 @pytest.mark.parametrize("compressor", COMPRESSOR_CONFIGS, ids=lambda c: c.id)
 def test_compressors_micro(compressor, micro_results, capsys) -> None:
     micro = run_compressor_micro(compressor)
@@ -188,3 +337,42 @@ def test_compressors_micro(compressor, micro_results, capsys) -> None:
             f"compress={micro.compress_mb_s:,.1f} MB/s  "
             f"decompress={micro.decompress_mb_s:,.1f} MB/s",
         )
+
+
+def test_raw_passthrough_micro(capsys) -> None:
+    rows = run_raw_passthrough_micro()
+
+    with capsys.disabled():
+        print()
+        print(format_passthrough_table(rows))
+
+    # Large payloads are dominated by copying either way; the serializer
+    # call and framing it saves show on small ones.
+    assert all(row.raw_us < row.serialized_us for row in rows if row.size <= RAW_ASSERT_MAX_BYTES)
+
+
+def test_out_of_band_micro(capsys) -> None:
+    rows = run_out_of_band_micro()
+
+    with capsys.disabled():
+        print()
+        print(format_out_of_band_table(rows))
+
+    # In-band, the pickle stream holds a copy of the array on write and
+    # loads() copies it back out; out-of-band, only the assembled value is.
+    for row in rows:
+        assert row.oob_write_kb < row.in_band_write_kb
+        assert row.oob_read_kb < row.in_band_read_kb / 2
+
+
+def test_metrics_overhead(capsys) -> None:
+    bare_ns, instrumented_ns = run_metrics_overhead()
+    overhead_ns = instrumented_ns - bare_ns
+
+    with capsys.disabled():
+        print()
+        print(
+            f"  metrics: bare={bare_ns:,.0f} ns/op  instrumented={instrumented_ns:,.0f} ns/op  overhead={overhead_ns:,.0f} ns/op"
+        )
+
+    assert overhead_ns < METRICS_OVERHEAD_BUDGET_NS
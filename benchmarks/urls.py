@@ -8,10 +8,11 @@ numbers reflect what a real Django request paying for the same cache work
 looks like, not just the cache call in isolation.
 """
 
+import asyncio
 from typing import Any
 
 from django.core.cache import cache
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.urls import path
 
 from benchmarks.runner import MGET_BATCH, WARMUP_KEYS, _build_payload, _build_payload_large
@@ -77,12 +78,42 @@ _BENCH_LARGE: dict[str, Any] = {
 }
 
 
+# Independent reads per ``bench_fanout`` request, like a page assembling
+# many fragments: the shape ``OPTIONS["auto_batch"]`` coalesces into MGET.
+FANOUT_KEYS = 24
+
+# ``bench_lag`` reads one ~5 MB value alongside small ones per request,
+# while a probe task in each worker measures how late its event loop wakes
+# from a ``LAG_PROBE_INTERVAL_S`` sleep. Decoding the large value inline
+# shows up directly as lag.
+LAG_PROBE_INTERVAL_S = 0.001
+_lag_samples_ms: list[float] = []
+_lag_probe: asyncio.Task[None] | None = None
+
+
+async def _probe_loop_lag() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(LAG_PROBE_INTERVAL_S)
+        _lag_samples_ms.append((loop.time() - started - LAG_PROBE_INTERVAL_S) * 1000)
+
+
 async def bench_seed(_request: Any) -> HttpResponse:
     await cache.aset("bench:s1", _BENCH_SMALL, 300)
     await cache.aset("bench:s2", _BENCH_SMALL, 300)
     await cache.aset("bench:s3", _BENCH_SMALL, 300)
     await cache.aset("bench:large", _BENCH_LARGE, 300)
     await cache.aset("bench:counter", 0, 300)
+    await cache.aset_many({f"bench:f{i}": _BENCH_SMALL for i in range(FANOUT_KEYS)}, 300)
+    return HttpResponse(b"seeded", status=200)
+
+
+async def bench_seed_lag(request: Any) -> HttpResponse:
+    """``bench_seed`` plus the large value ``bench_lag`` reads (kept out of the other runs' RSS)."""
+    await bench_seed(request)
+    huge = {"rows": [{"id": i, "name": f"row {i}", "payload": "x" * 80} for i in range(40_000)]}
+    await cache.aset("bench:huge", huge, 300)
     return HttpResponse(b"seeded", status=200)
 
 
@@ -97,6 +128,41 @@ async def bench_mixed(_request: Any) -> HttpResponse:
     return HttpResponse(b"", status=204)
 
 
+async def bench_fanout(_request: Any) -> HttpResponse:
+    """``FANOUT_KEYS`` concurrent ``aget`` calls gathered in one request."""
+    await asyncio.gather(*(cache.aget(f"bench:f{i}") for i in range(FANOUT_KEYS)))
+    return HttpResponse(b"", status=204)
+
+
+async def bench_lag(_request: Any) -> HttpResponse:
+    """One large and several small reads at once, with the loop-lag probe running."""
+    global _lag_probe  # noqa: PLW0603 (one probe per worker process)
+    if _lag_probe is None:
+        _lag_probe = asyncio.get_running_loop().create_task(_probe_loop_lag())
+    await asyncio.gather(
+        cache.aget("bench:huge"),
+        cache.aget_many([f"bench:f{i}" for i in range(FANOUT_KEYS)]),
+        *(cache.aget(f"bench:s{i}") for i in range(1, 4)),
+    )
+    return HttpResponse(b"", status=204)
+
+
+async def bench_loop_lag(_request: Any) -> JsonResponse:
+    """Loop-lag percentiles (ms) collected by this worker's probe since the last call."""
+    samples = sorted(_lag_samples_ms)
+    _lag_samples_ms.clear()
+    if not samples:
+        return JsonResponse({"samples": 0, "p50": 0.0, "p99": 0.0, "max": 0.0})
+    return JsonResponse(
+        {
+            "samples": len(samples),
+            "p50": samples[len(samples) // 2],
+            "p99": samples[int(0.99 * (len(samples) - 1))],
+            "max": samples[-1],
+        },
+    )
+
+
 urlpatterns = [
     path("bench/get/<int:i>/", get_view),
     path("bench/get-miss/<int:i>/", get_miss_view),
@@ -106,5 +172,9 @@ urlpatterns = [
     path("bench/incr/<int:i>/", incr_view),
     path("bench/delete/<int:i>/", delete_view),
     path("bench/seed/", bench_seed),
+    path("bench/seed-lag/", bench_seed_lag),
     path("bench/mixed/", bench_mixed),
+    path("bench/fanout/", bench_fanout),
+    path("bench/lag/", bench_lag),
+    path("bench/loop-lag/", bench_loop_lag),
 ]
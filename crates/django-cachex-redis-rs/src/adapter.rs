@@ -1279,21 +1279,26 @@ impl RedisRsAdapter {
         stampede_prevention: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Py<PyAny>> {
         let py = slf.py();
-        let r: Result<Option<Vec<u8>>, _> = adapter_sync!(slf, conn, conn.get_bytes(&key).await);
-        let val_opt = r.map_err(crate::client::to_py_err)?;
+        let cfg = &slf.borrow().stampede_config;
+        let resolved = call_resolve_stampede(py, cfg, stampede_prevention)?;
+        if resolved.is_none() {
+            let r: Result<Option<Vec<u8>>, _> =
+                adapter_sync!(slf, conn, conn.get_bytes(&key).await);
+            return Ok(match r.map_err(crate::client::to_py_err)? {
+                Some(val) => pyo3::types::PyBytes::new(py, &val).into_any().unbind(),
+                None => py.None(),
+            });
+        }
+        // GET returns bytes (Redis is type-strict here). GET and TTL go out
+        // in one pipeline so the stampede check costs no extra round trip.
+        let r: Result<(Option<Vec<u8>>, i64), _> =
+            adapter_sync!(slf, conn, conn.get_bytes_with_ttl(&key).await);
+        let (val_opt, ttl) = r.map_err(crate::client::to_py_err)?;
         let Some(val) = val_opt else {
             return Ok(py.None());
         };
-        let cfg = &slf.borrow().stampede_config;
-        let resolved = call_resolve_stampede(py, cfg, stampede_prevention)?;
-        if !resolved.is_none() {
-            // GET returns bytes (Redis is type-strict here). Stampede check
-            // applies to TTL'd entries only.
-            let ttl_r: Result<i64, _> = adapter_sync!(slf, conn, conn.ttl(&key).await);
-            let ttl = ttl_r.map_err(crate::client::to_py_err)?;
-            if ttl > 0 && call_should_recompute(py, ttl, &resolved)? {
-                return Ok(py.None());
-            }
+        if ttl > 0 && call_should_recompute(py, ttl, &resolved)? {
+            return Ok(py.None());
         }
         Ok(pyo3::types::PyBytes::new(py, &val).into_any().unbind())
     }
@@ -1314,28 +1319,27 @@ impl RedisRsAdapter {
             Some(resolved_bound.unbind())
         };
         adapter_async!(slf, conn, {
-            let bytes_opt = match conn.get_bytes(&key).await {
+            let Some(cfg_py) = resolved.as_ref() else {
+                return match conn.get_bytes(&key).await {
+                    Ok(Some(b)) => crate::async_bridge::RawResult::OptBytes(Some(b)),
+                    Ok(None) => crate::async_bridge::RawResult::Nil,
+                    Err(e) => crate::client::classify(e),
+                };
+            };
+            let (bytes_opt, ttl) = match conn.get_bytes_with_ttl(&key).await {
                 Ok(v) => v,
                 Err(e) => return crate::client::classify(e),
             };
             match bytes_opt {
                 None => crate::async_bridge::RawResult::Nil,
                 Some(b) => {
-                    if let Some(cfg_py) = resolved.as_ref() {
-                        let ttl = match conn.ttl(&key).await {
-                            Ok(t) => t,
-                            Err(e) => return crate::client::classify(e),
-                        };
-                        if ttl > 0
-                            && pyo3::Python::try_attach(|py| {
-                                call_should_recompute(py, ttl, cfg_py.bind(py)).unwrap_or(false)
-                            })
-                            .unwrap_or(false)
-                        {
-                            crate::async_bridge::RawResult::Nil
-                        } else {
-                            crate::async_bridge::RawResult::OptBytes(Some(b))
-                        }
+                    if ttl > 0
+                        && pyo3::Python::try_attach(|py| {
+                            call_should_recompute(py, ttl, cfg_py.bind(py)).unwrap_or(false)
+                        })
+                        .unwrap_or(false)
+                    {
+                        crate::async_bridge::RawResult::Nil
                     } else {
                         crate::async_bridge::RawResult::OptBytes(Some(b))
                     }
@@ -1499,31 +1503,30 @@ impl RedisRsAdapter {
         if keys.is_empty() {
             return Ok(out.into_any().unbind());
         }
-        let r: Result<Vec<Option<Vec<u8>>>, _> =
-            adapter_sync!(slf, conn, conn.mget_bytes(&keys).await);
-        let results = r.map_err(crate::client::to_py_err)?;
-        for (k, v) in keys.iter().zip(results.into_iter()) {
-            if let Some(b) = v {
-                out.set_item(k.as_str(), pyo3::types::PyBytes::new(py, &b))?;
-            }
-        }
         let cfg = &slf.borrow().stampede_config;
         let resolved = call_resolve_stampede(py, cfg, stampede_prevention)?;
-        if !resolved.is_none() && !out.is_empty() {
-            // All present entries are bytes (MGET semantics); apply stampede
-            // check to each. Per-key TTL roundtrip, same shape as before.
-            let present_keys: Vec<String> = out
-                .keys()
-                .iter()
-                .map(|k| k.extract::<String>())
-                .collect::<PyResult<_>>()?;
-            for k in &present_keys {
-                let ttl_r: Result<i64, _> = adapter_sync!(slf, conn, conn.ttl(k).await);
-                let ttl = ttl_r.map_err(crate::client::to_py_err)?;
-                if ttl > 0 && call_should_recompute(py, ttl, &resolved)? {
-                    out.del_item(k.as_str())?;
+        if resolved.is_none() {
+            let r: Result<Vec<Option<Vec<u8>>>, _> =
+                adapter_sync!(slf, conn, conn.mget_bytes(&keys).await);
+            let results = r.map_err(crate::client::to_py_err)?;
+            for (k, v) in keys.iter().zip(results.into_iter()) {
+                if let Some(b) = v {
+                    out.set_item(k.as_str(), pyo3::types::PyBytes::new(py, &b))?;
                 }
             }
+            return Ok(out.into_any().unbind());
+        }
+        // All present entries are bytes (GET semantics); values and TTLs
+        // arrive together from one pipeline.
+        let r: Result<Vec<(Option<Vec<u8>>, i64)>, _> =
+            adapter_sync!(slf, conn, conn.mget_bytes_with_ttl(&keys).await);
+        let results = r.map_err(crate::client::to_py_err)?;
+        for (k, (v, ttl)) in keys.iter().zip(results.into_iter()) {
+            let Some(b) = v else { continue };
+            if ttl > 0 && call_should_recompute(py, ttl, &resolved)? {
+                continue;
+            }
+            out.set_item(k.as_str(), pyo3::types::PyBytes::new(py, &b))?;
         }
         Ok(out.into_any().unbind())
     }
@@ -1547,27 +1550,32 @@ impl RedisRsAdapter {
             Some(resolved_bound.unbind())
         };
         adapter_async!(slf, conn, {
-            let mget_r = match conn.mget_bytes(&keys).await {
+            let Some(cfg_py) = resolved.as_ref() else {
+                let mget_r = match conn.mget_bytes(&keys).await {
+                    Ok(v) => v,
+                    Err(e) => return crate::client::classify(e),
+                };
+                let survivors: Vec<(String, Vec<u8>)> = keys
+                    .iter()
+                    .zip(mget_r.into_iter())
+                    .filter_map(|(k, v)| v.map(|b| (k.clone(), b)))
+                    .collect();
+                return crate::async_bridge::RawResult::StringBytesPairs(survivors);
+            };
+            let fetched = match conn.mget_bytes_with_ttl(&keys).await {
                 Ok(v) => v,
                 Err(e) => return crate::client::classify(e),
             };
-            // For each present key, optionally check TTL/stampede.
             let mut survivors: Vec<(String, Vec<u8>)> = Vec::new();
-            for (k, v) in keys.iter().zip(mget_r.into_iter()) {
+            for (k, (v, ttl)) in keys.iter().zip(fetched.into_iter()) {
                 let Some(b) = v else { continue };
-                if let Some(cfg_py) = resolved.as_ref() {
-                    let ttl = match conn.ttl(k).await {
-                        Ok(t) => t,
-                        Err(e) => return crate::client::classify(e),
-                    };
-                    if ttl > 0
-                        && pyo3::Python::try_attach(|py| {
-                            call_should_recompute(py, ttl, cfg_py.bind(py)).unwrap_or(false)
-                        })
-                        .unwrap_or(false)
-                    {
-                        continue;
-                    }
+                if ttl > 0
+                    && pyo3::Python::try_attach(|py| {
+                        call_should_recompute(py, ttl, cfg_py.bind(py)).unwrap_or(false)
+                    })
+                    .unwrap_or(false)
+                {
+                    continue;
                 }
                 survivors.push((k.clone(), b));
             }
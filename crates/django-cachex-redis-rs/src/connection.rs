@@ -176,6 +176,42 @@ impl SentinelConn {
     }
 }
 
+/// Cluster hash slot of `key`: CRC16 (XMODEM) of its `{hash tag}` if it has
+/// a non-empty one, else of the whole key, modulo 16384.
+fn key_slot(key: &[u8]) -> u16 {
+    let hashed = match key.iter().position(|&b| b == b'{') {
+        Some(open) => match key[open + 1..].iter().position(|&b| b == b'}') {
+            Some(len) if len > 0 => &key[open + 1..open + 1 + len],
+            _ => key,
+        },
+        None => key,
+    };
+    let mut crc: u16 = 0;
+    for &byte in hashed {
+        crc ^= u16::from(byte) << 8;
+        for _ in 0..8 {
+            crc = if crc & 0x8000 != 0 {
+                (crc << 1) ^ 0x1021
+            } else {
+                crc << 1
+            };
+        }
+    }
+    crc % 16384
+}
+
+/// Pair up the replies of a GET, TTL, GET, TTL, ... pipeline.
+fn ttl_pairs(replies: Vec<redis::Value>) -> RedisResult<Vec<(Option<Vec<u8>>, i64)>> {
+    let mut results = Vec::with_capacity(replies.len() / 2);
+    let mut it = replies.into_iter();
+    while let (Some(val), Some(ttl)) = (it.next(), it.next()) {
+        let val: Option<Vec<u8>> = redis::from_redis_value(val)?;
+        let ttl: i64 = redis::from_redis_value(ttl)?;
+        results.push((val, ttl));
+    }
+    Ok(results)
+}
+
 /// Inner connection enum, one per connection type.
 /// All methods for individual Redis commands live here.
 ///
@@ -390,6 +426,68 @@ impl ConnInner {
         }
     }
 
+    /// GET + TTL for one key in a single pipelined round trip, for the
+    /// stampede check. Both commands hit the same slot, so this is safe on
+    /// Cluster too.
+    pub async fn get_bytes_with_ttl(&mut self, key: &str) -> RedisResult<(Option<Vec<u8>>, i64)> {
+        let mut pipe = redis::pipe();
+        pipe.get(key).ttl(key);
+        dispatch_cmd!(self, pipe)
+    }
+
+    /// GET + TTL for every key in one pipeline (one round trip). A Cluster
+    /// pipeline must stay within one slot, so Cluster groups the keys by
+    /// slot and runs one pipeline per slot, all of them concurrently.
+    pub async fn mget_bytes_with_ttl(
+        &mut self,
+        keys: &[String],
+    ) -> RedisResult<Vec<(Option<Vec<u8>>, i64)>> {
+        match self {
+            Self::Cluster(c) => {
+                let mut groups: std::collections::HashMap<u16, Vec<usize>> =
+                    std::collections::HashMap::new();
+                for (i, key) in keys.iter().enumerate() {
+                    groups.entry(key_slot(key.as_bytes())).or_default().push(i);
+                }
+                let mut tasks = tokio::task::JoinSet::new();
+                for indices in groups.into_values() {
+                    let mut pipe = redis::pipe();
+                    for &i in &indices {
+                        pipe.get(keys[i].as_str()).ttl(keys[i].as_str());
+                    }
+                    let mut conn = c.clone();
+                    tasks.spawn(async move {
+                        let replies: RedisResult<Vec<redis::Value>> =
+                            pipe.query_async(&mut conn).await;
+                        (indices, replies)
+                    });
+                }
+                let mut results: Vec<(Option<Vec<u8>>, i64)> = vec![(None, -2); keys.len()];
+                while let Some(joined) = tasks.join_next().await {
+                    let (indices, replies) = joined.map_err(|e| {
+                        redis::RedisError::from((
+                            redis::ErrorKind::Io,
+                            "Cluster GET+TTL pipeline task failed",
+                            e.to_string(),
+                        ))
+                    })?;
+                    for (i, pair) in indices.into_iter().zip(ttl_pairs(replies?)?) {
+                        results[i] = pair;
+                    }
+                }
+                Ok(results)
+            }
+            _ => {
+                let mut pipe = redis::pipe();
+                for key in keys {
+                    pipe.get(key.as_str()).ttl(key.as_str());
+                }
+                let replies: Vec<redis::Value> = dispatch_cmd!(self, pipe)?;
+                ttl_pairs(replies)
+            }
+        }
+    }
+
     pub async fn pipeline_set(
         &mut self,
         entries: &[(String, Vec<u8>)],
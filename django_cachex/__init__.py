@@ -14,6 +14,8 @@ except PackageNotFoundError:
 from django_cachex.adapters.pipeline import AsyncPipeline, Pipeline
 from django_cachex.exceptions import (
     CachexError,
+    ChunkedValueError,
+    ClusterFanoutError,
     CompressorError,
     NotSupportedError,
     SerializerError,
@@ -38,6 +40,8 @@ __all__ = [
     "AsyncLock",
     "AsyncPipeline",
     "CachexError",
+    "ChunkedValueError",
+    "ClusterFanoutError",
     "CompressorError",
     "Lock",
     "LockError",
@@ -13,6 +13,7 @@ from pkgutil import extend_path
 # prefixes.
 __path__ = extend_path(__path__, __name__)
 
+from django_cachex.adapters._routing import ReadPolicy
 from django_cachex.adapters.pipeline import AsyncPipeline, Pipeline
 from django_cachex.adapters.protocols import (
     RespAdapterProtocol,
@@ -21,8 +22,10 @@ from django_cachex.adapters.protocols import (
 )
 from django_cachex.adapters.redis_py import (
     RedisPyAdapter,
+    RedisPyAsyncClusterPipelineAdapter,
     RedisPyAsyncPipelineAdapter,
     RedisPyClusterAdapter,
+    RedisPyClusterPipelineAdapter,
     RedisPyPipelineAdapter,
     RedisPySentinelAdapter,
 )
@@ -41,8 +44,10 @@ from django_cachex.adapters.valkey_glide import (
 )
 from django_cachex.adapters.valkey_py import (
     ValkeyPyAdapter,
+    ValkeyPyAsyncClusterPipelineAdapter,
     ValkeyPyAsyncPipelineAdapter,
     ValkeyPyClusterAdapter,
+    ValkeyPyClusterPipelineAdapter,
     ValkeyPyPipelineAdapter,
     ValkeyPySentinelAdapter,
 )
@@ -50,9 +55,12 @@ from django_cachex.adapters.valkey_py import (
 __all__ = [
     "AsyncPipeline",
     "Pipeline",
+    "ReadPolicy",
     "RedisPyAdapter",
+    "RedisPyAsyncClusterPipelineAdapter",
     "RedisPyAsyncPipelineAdapter",
     "RedisPyClusterAdapter",
+    "RedisPyClusterPipelineAdapter",
     "RedisPyPipelineAdapter",
     "RedisPySentinelAdapter",
     "RedisRsAdapter",
@@ -68,8 +76,10 @@ __all__ = [
     "ValkeyGlideClusterAdapter",
     "ValkeyGlidePipelineAdapter",
     "ValkeyPyAdapter",
+    "ValkeyPyAsyncClusterPipelineAdapter",
     "ValkeyPyAsyncPipelineAdapter",
     "ValkeyPyClusterAdapter",
+    "ValkeyPyClusterPipelineAdapter",
     "ValkeyPyPipelineAdapter",
     "ValkeyPySentinelAdapter",
 ]
@@ -0,0 +1,180 @@
+"""Connection-pool warm-up and gauges for the redis-py / valkey-py adapters.
+
+Pools open connections lazily, so the first commands after a deploy pay
+the TCP, TLS and ``AUTH`` handshakes inline. :func:`warm_pool` checks out
+``n`` connections (each one connects and handshakes on checkout) and
+hands them straight back, leaving them idle in the pool.
+
+:func:`instrument_pool` wraps ``get_connection`` to record how long
+callers wait for a connection; :func:`pool_stats` combines that with the
+pool's own bookkeeping into the gauges reported by ``info()["pools"]``.
+The pool internals read here (``_in_use_connections``,
+``_available_connections``, ``_created_connections``) are shared by the
+sync and asyncio pools of redis-py and valkey-py; missing ones read as 0.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+_STATS_ATTR = "_django_cachex_pool_stats"
+
+# Strong references to background warm-ups; the loop only keeps weak ones.
+_WARMUPS: set[asyncio.Task[int]] = set()
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Checkout counters for one pool."""
+
+    checkouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+
+def make_warmup_count(option: int | None) -> int:
+    """Validate the ``pool_warmup`` OPTIONS value (connections per pool)."""
+    if option is None:
+        return 0
+    if type(option) is not int or option < 0:
+        msg = f"pool_warmup must be a non-negative integer, got {option!r}"
+        raise ImproperlyConfigured(msg)
+    return option
+
+
+def instrument_pool(pool: Any) -> Any:
+    """Time ``pool.get_connection``; idempotent."""
+    if getattr(pool, _STATS_ATTR, None) is not None:
+        return pool
+    orig = getattr(pool, "get_connection", None)
+    if orig is None:
+        return pool
+    stats = PoolStats()
+    lock = threading.Lock()
+
+    if inspect.iscoroutinefunction(orig):
+
+        @functools.wraps(orig)
+        async def _aget_connection(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await orig(*args, **kwargs)
+            finally:
+                waited = time.perf_counter() - started
+                with lock:
+                    stats.record(waited)
+
+        pool.get_connection = _aget_connection
+    else:
+
+        @functools.wraps(orig)
+        def _get_connection(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return orig(*args, **kwargs)
+            finally:
+                waited = time.perf_counter() - started
+                with lock:
+                    stats.record(waited)
+
+        pool.get_connection = _get_connection
+    setattr(pool, _STATS_ATTR, stats)
+    return pool
+
+
+def pool_stats(pool: Any) -> dict[str, Any]:
+    """Gauges for one pool: connections in use / idle / created, and wait times."""
+    in_use = len(getattr(pool, "_in_use_connections", ()))
+    idle = len(getattr(pool, "_available_connections", ()))
+    result: dict[str, Any] = {
+        "in_use": in_use,
+        "idle": idle,
+        "created": getattr(pool, "_created_connections", in_use + idle),
+        "max": getattr(pool, "max_connections", None),
+    }
+    stats: PoolStats | None = getattr(pool, _STATS_ATTR, None)
+    if stats is not None:
+        result["checkouts"] = stats.checkouts
+        result["wait_avg_ms"] = round(stats.wait_total / stats.checkouts * 1000, 3) if stats.checkouts else 0.0
+        result["wait_max_ms"] = round(stats.wait_max * 1000, 3)
+    return result
+
+
+def _checkout_args(pool: Any) -> tuple[Any, ...]:
+    # Older drivers require a command name; newer ones deprecate passing it.
+    param = inspect.signature(pool.get_connection).parameters.get("command_name")
+    if param is None or param.default is not inspect.Parameter.empty:
+        return ()
+    return ("PING",)
+
+
+def _target(pool: Any, connections: int) -> int:
+    limit = getattr(pool, "max_connections", None)
+    return connections if limit is None else min(connections, limit)
+
+
+def warm_pool(pool: Any, connections: int) -> int:
+    """Make sure ``pool`` holds ``connections`` open connections; returns how many were checked."""
+    args = _checkout_args(pool)
+    target = _target(pool, connections)
+    held: list[Any] = []
+    try:
+        while len(held) < target:
+            held.append(pool.get_connection(*args))
+    finally:
+        for conn in held:
+            pool.release(conn)
+    return len(held)
+
+
+async def awarm_pool(pool: Any, connections: int) -> int:
+    """Async counterpart of :func:`warm_pool`; the handshakes run concurrently."""
+    args = _checkout_args(pool)
+    results = await asyncio.gather(
+        *(pool.get_connection(*args) for _ in range(_target(pool, connections))),
+        return_exceptions=True,
+    )
+    held = [r for r in results if not isinstance(r, BaseException)]
+    for conn in held:
+        released = pool.release(conn)
+        if inspect.isawaitable(released):
+            await released
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return len(held)
+
+
+def warm_new_pool(pool: Any, connections: int) -> None:
+    """Warm a freshly created sync pool; on failure it just keeps connecting lazily."""
+    try:
+        warm_pool(pool, connections)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("pool_warmup: opening connections failed: %s", exc)
+
+
+def schedule_warmup(pool: Any, connections: int) -> None:
+    """Warm a freshly created asyncio pool in the background on the running loop."""
+    task = asyncio.get_running_loop().create_task(awarm_pool(pool, connections))
+    _WARMUPS.add(task)
+    task.add_done_callback(_warmup_done)
+
+
+def _warmup_done(task: asyncio.Task[int]) -> None:
+    _WARMUPS.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("pool_warmup: opening connections failed: %s", exc)
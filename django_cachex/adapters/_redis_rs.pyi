@@ -37,6 +37,9 @@ class RedisRsAdapter:
     def alock_release(self, key: str, token: str) -> RedisRsAwaitable: ...
     def lock_extend(self, key: str, token: str, additional_ms: int) -> int: ...
     def alock_extend(self, key: str, token: str, additional_ms: int) -> RedisRsAwaitable: ...
+    # Pattern deletion; the Python wrapper adds the ``progress`` callback.
+    def delete_pattern(self, pattern: str, itersize: int | None = None) -> int: ...
+    def adelete_pattern(self, pattern: str, itersize: int | None = None) -> Any: ...
     # Pipeline factories, called from cache.resp. Declared with the protocol
     # return types so they don't conflict with ``RespAdapterProtocol``, which
     # is mixed in by the Python wrapper in ``django_cachex.adapters.redis_rs``.
@@ -0,0 +1,306 @@
+"""Latency-aware read routing for the redis-py / valkey-py adapters.
+
+With several servers in ``LOCATION`` the first is the primary and the rest
+are read replicas. By default a read goes to a random replica. The
+``read_routing`` option swaps that for a :class:`ReadPolicy` fed by
+per-server statistics that every command updates:
+
+- an EWMA of the command latency,
+- the number of commands in flight,
+- consecutive connection errors, which eject a server for a while.
+
+Statistics are process-wide (Django builds an adapter per thread and per
+task), so every cache instance pointed at the same servers shares them.
+When every replica is ejected, or the current context wrote recently and
+``primary_after_write`` is set, reads go to the primary. Closing the
+adapter (Django does on ``request_finished``) ends that window, so it
+never carries over to the next request served by the same thread.
+"""
+
+import contextvars
+import inspect
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    import builtins
+    from collections.abc import Hashable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the latency EWMA.
+_EWMA_ALPHA = 0.3
+
+
+@dataclass(slots=True)
+class ServerStats:
+    """Live statistics for one server (index 0 is the primary)."""
+
+    index: int
+    address: str
+    ewma: float = 0.0
+    outstanding: int = 0
+    requests: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    ejected_until: float = 0.0
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "server": self.address,
+            "role": "primary" if self.index == 0 else "replica",
+            "ewma_ms": round(self.ewma * 1000, 3),
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+            "ejected": self.ejected_until > now,
+        }
+
+
+class ReadPolicy:
+    """Pick the server for a read among the healthy replicas.
+
+    Subclass and point ``read_routing["policy"]`` at the class (or its
+    dotted path) to plug in your own. ``candidates`` is never empty and
+    ``choose`` must return one of them; the stats are a live view, so read
+    without expecting them to stay still.
+    """
+
+    def choose(self, candidates: Sequence[ServerStats]) -> ServerStats:
+        raise NotImplementedError
+
+
+class RandomPolicy(ReadPolicy):
+    """Uniform random replica: the behavior without ``read_routing``."""
+
+    def choose(self, candidates: Sequence[ServerStats]) -> ServerStats:
+        return random.choice(candidates)  # noqa: S311
+
+
+class PowerOfTwoChoicesPolicy(ReadPolicy):
+    """Sample two replicas and take the one with the lower latency EWMA.
+
+    The EWMA is scaled by ``outstanding + 1`` so a replica that is fast
+    but already busy does not attract every read.
+    """
+
+    def choose(self, candidates: Sequence[ServerStats]) -> ServerStats:
+        if len(candidates) == 1:
+            return candidates[0]
+        a, b = random.sample(candidates, 2)
+        return a if a.ewma * (a.outstanding + 1) <= b.ewma * (b.outstanding + 1) else b
+
+
+class LeastOutstandingPolicy(ReadPolicy):
+    """The replica with the fewest commands in flight (ties broken randomly)."""
+
+    def choose(self, candidates: Sequence[ServerStats]) -> ServerStats:
+        fewest = min(s.outstanding for s in candidates)
+        return random.choice([s for s in candidates if s.outstanding == fewest])  # noqa: S311
+
+
+_POLICIES: dict[str, builtins.type[ReadPolicy]] = {
+    "random": RandomPolicy,
+    "p2c": PowerOfTwoChoicesPolicy,
+    "least_outstanding": LeastOutstandingPolicy,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingConfig:
+    # policy:              built-in name ("random", "p2c", "least_outstanding"),
+    #   or a ReadPolicy subclass / dotted path to one.
+    # primary_after_write: seconds after a write in the same context
+    #   (request / asyncio task) during which reads go to the primary.
+    # eject_after:         consecutive connection errors that eject a server.
+    # eject_for:           seconds an ejected server is skipped.
+    policy: str | builtins.type[ReadPolicy] = "p2c"
+    primary_after_write: float | None = None
+    eject_after: int = 3
+    eject_for: float = 10.0
+
+
+_ROUTING_FIELDS = RoutingConfig.__slots__
+
+
+def make_routing_config(option: str | dict | None) -> RoutingConfig | None:
+    """Build a ``RoutingConfig`` from the ``read_routing`` OPTIONS value."""
+    if not option:
+        return None
+    if isinstance(option, str):
+        option = {"policy": option}
+    elif not isinstance(option, dict):
+        msg = f"read_routing must be a policy name or a dict, got {option!r}"
+        raise ImproperlyConfigured(msg)
+    unknown = sorted(set(option) - set(_ROUTING_FIELDS))
+    if unknown:
+        logger.warning(
+            "read_routing: ignoring unknown keys %s (valid: %s)",
+            unknown,
+            _ROUTING_FIELDS,
+        )
+    config = RoutingConfig(**{k: v for k, v in option.items() if k in _ROUTING_FIELDS})
+    _policy_class(config.policy)
+    window = config.primary_after_write
+    if window is not None and (isinstance(window, bool) or not isinstance(window, int | float) or window <= 0):
+        msg = f"read_routing['primary_after_write'] must be a positive number of seconds, got {window!r}"
+        raise ImproperlyConfigured(msg)
+    if type(config.eject_after) is not int or config.eject_after <= 0:
+        msg = f"read_routing['eject_after'] must be a positive integer, got {config.eject_after!r}"
+        raise ImproperlyConfigured(msg)
+    if isinstance(config.eject_for, bool) or not isinstance(config.eject_for, int | float) or config.eject_for < 0:
+        msg = f"read_routing['eject_for'] must be a non-negative number of seconds, got {config.eject_for!r}"
+        raise ImproperlyConfigured(msg)
+    return config
+
+
+def _policy_class(policy: str | builtins.type[ReadPolicy]) -> builtins.type[ReadPolicy]:
+    if isinstance(policy, str):
+        cls = _POLICIES.get(policy)
+        if cls is None:
+            try:
+                cls = import_string(policy)
+            except ImportError as e:
+                msg = f"read_routing policy {policy!r} is neither one of {sorted(_POLICIES)} nor importable"
+                raise ImproperlyConfigured(msg) from e
+        policy = cls
+    if not (isinstance(policy, type) and issubclass(policy, ReadPolicy)):
+        msg = f"read_routing policy must be a ReadPolicy subclass, got {policy!r}"
+        raise ImproperlyConfigured(msg)
+    return policy
+
+
+def server_address(url: str) -> str:
+    """``host:port`` of a server URL, without credentials."""
+    parsed = urlparse(url)
+    if parsed.hostname is None:
+        return parsed.path or url
+    return f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname
+
+
+class ReadRouter:
+    """Shared server statistics plus the read policy that consumes them."""
+
+    def __init__(self, servers: Sequence[str], config: RoutingConfig) -> None:
+        self.config = config
+        self._policy = _policy_class(config.policy)()
+        self._lock = threading.Lock()
+        self._servers = [ServerStats(i, server_address(url)) for i, url in enumerate(servers)]
+        # Monotonic time of this context's last write; contexts are per
+        # asyncio task, and per thread for sync code.
+        self._last_write: contextvars.ContextVar[float] = contextvars.ContextVar("cachex_last_write", default=0.0)
+
+    def choose(self, *, write: bool) -> int:
+        """Index of the server for the next command."""
+        window = self.config.primary_after_write
+        if write:
+            if window is not None:
+                self._last_write.set(time.monotonic())
+            return 0
+        now = time.monotonic()
+        if window is not None and now - self._last_write.get() < window:
+            return 0
+        candidates = [s for s in self._servers[1:] if s.ejected_until <= now]
+        if not candidates:
+            return 0
+        return self._policy.choose(candidates).index
+
+    def forget_write(self) -> None:
+        """Drop this context's last write, ending its ``primary_after_write`` window.
+
+        Called when a request finishes: WSGI servers reuse a thread, and its
+        context, for the next request.
+        """
+        self._last_write.set(0.0)
+
+    def start(self, index: int) -> float:
+        with self._lock:
+            self._servers[index].outstanding += 1
+        return time.perf_counter()
+
+    def finish(self, index: int, started: float, *, failed: bool) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stats = self._servers[index]
+            stats.outstanding -= 1
+            stats.requests += 1
+            if failed:
+                stats.errors += 1
+                stats.consecutive_errors += 1
+                if stats.consecutive_errors >= self.config.eject_after:
+                    stats.ejected_until = time.monotonic() + self.config.eject_for
+                    stats.consecutive_errors = 0
+                    logger.warning(
+                        "read_routing: ejecting %s for %ss after errors", stats.address, self.config.eject_for
+                    )
+                return
+            stats.consecutive_errors = 0
+            stats.ewma = stats.ewma + _EWMA_ALPHA * (elapsed - stats.ewma) if stats.ewma else elapsed
+
+    def stats(self) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return [s.as_dict(now) for s in self._servers]
+
+    def track(self, client: Any, index: int, error_types: tuple[builtins.type[BaseException], ...]) -> Any:
+        """Patch ``client`` so its commands and pipelines update server ``index``."""
+        client.execute_command = self._timed(client.execute_command, index, error_types)
+        make_pipeline = client.pipeline
+
+        def pipeline(*args: Any, **kwargs: Any) -> Any:
+            pipe = make_pipeline(*args, **kwargs)
+            pipe.execute = self._timed(pipe.execute, index, error_types)
+            return pipe
+
+        client.pipeline = pipeline
+        return client
+
+    def _timed(self, fn: Any, index: int, error_types: tuple[builtins.type[BaseException], ...]) -> Any:
+        if inspect.iscoroutinefunction(fn):
+
+            async def _atimed(*args: Any, **kwargs: Any) -> Any:
+                started = self.start(index)
+                failed = False
+                try:
+                    return await fn(*args, **kwargs)
+                except error_types:
+                    failed = True
+                    raise
+                finally:
+                    self.finish(index, started, failed=failed)
+
+            return _atimed
+
+        def _stimed(*args: Any, **kwargs: Any) -> Any:
+            started = self.start(index)
+            failed = False
+            try:
+                return fn(*args, **kwargs)
+            except error_types:
+                failed = True
+                raise
+            finally:
+                self.finish(index, started, failed=failed)
+
+        return _stimed
+
+
+_ROUTERS: dict[Hashable, ReadRouter] = {}
+_ROUTERS_LOCK = threading.Lock()
+
+
+def shared_router(key: Hashable, servers: Sequence[str], config: RoutingConfig) -> ReadRouter:
+    """The process-wide router for ``key``, created on first use."""
+    with _ROUTERS_LOCK:
+        router = _ROUTERS.get(key)
+        if router is None:
+            router = _ROUTERS[key] = ReadRouter(servers, config)
+        return router
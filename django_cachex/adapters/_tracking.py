@@ -0,0 +1,373 @@
+"""Server-assisted near-cache for the redis-py / valkey-py adapters.
+
+One background thread per (server, pool config) holds a dedicated
+connection with ``CLIENT TRACKING ON BCAST`` redirected to itself and
+subscribed to ``__redis__:invalidate``. Every write to a tracked prefix,
+from any client, arrives there as an invalidation message and evicts the
+key from an in-process LRU of raw ``GET`` replies.
+
+BCAST is the only mode used: default-mode tracking only reports keys the
+*tracking connection itself* read, which would require every pooled
+connection (sync and per-event-loop async) to be redirected at the
+listener and re-handshaken whenever it reconnects.
+
+Consistency rules:
+
+- Nothing is filled while the listener is disconnected, and the cache is
+  flushed whenever it (re)connects or drops: invalidations sent while no
+  one was listening are lost.
+- A fill is only stored if no invalidation for that key (and no flush)
+  happened between starting the read and storing its reply, so a slow
+  ``GET`` cannot resurrect a value overwritten while it was in flight.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# Listener reconnect backoff (seconds) and how often it wakes to check for stop.
+_MIN_BACKOFF = 0.1
+_MAX_BACKOFF = 5.0
+_POLL_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class TrackingConfig:
+    # prefixes:       stored-key prefixes (after KEY_PREFIX / version) to
+    #   track and cache; empty tracks every key.
+    # max_entries:    LRU bound on cached keys.
+    # max_entry_size: values larger than this many bytes are never cached.
+    # ttl:            local safety cap in seconds on how long an entry is
+    #   served without being re-read; ``None`` relies on invalidations only.
+    prefixes: tuple[str, ...] = ()
+    max_entries: int = 10_000
+    max_entry_size: int = 64 * 1024
+    ttl: float | None = 300.0
+
+
+_TRACKING_FIELDS = TrackingConfig.__slots__
+
+
+def make_tracking_config(option: bool | dict | None) -> TrackingConfig | None:
+    """Build a ``TrackingConfig`` from the ``client_tracking`` OPTIONS value."""
+    if not option:
+        return None
+    if not isinstance(option, dict):
+        return TrackingConfig()
+    unknown = sorted(set(option) - set(_TRACKING_FIELDS))
+    if unknown:
+        logger.warning(
+            "client_tracking: ignoring unknown keys %s (valid: %s)",
+            unknown,
+            _TRACKING_FIELDS,
+        )
+    known = {k: v for k, v in option.items() if k in _TRACKING_FIELDS}
+    prefixes = known.get("prefixes", ())
+    known["prefixes"] = (prefixes,) if isinstance(prefixes, str) else tuple(prefixes)
+    config = TrackingConfig(**known)
+
+    for name in ("max_entries", "max_entry_size"):
+        value = getattr(config, name)
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            msg = f"client_tracking {name} must be a positive integer, got {value!r}"
+            raise ImproperlyConfigured(msg)
+    if config.ttl is not None and config.ttl <= 0:
+        msg = f"client_tracking ttl must be positive or None, got {config.ttl!r}"
+        raise ImproperlyConfigured(msg)
+    # The server rejects BCAST prefixes that overlap each other.
+    for i, prefix in enumerate(config.prefixes):
+        for j, other in enumerate(config.prefixes):
+            if i != j and other.startswith(prefix):
+                msg = f"client_tracking prefixes {prefix!r} and {other!r} overlap"
+                raise ImproperlyConfigured(msg)
+    return config
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+
+def _glob_class(pattern: str, i: int) -> tuple[str, int] | None:
+    """Regex for the ``[...]`` class opening just before ``pattern[i]``, and the index after it.
+
+    ``None`` when the class is never closed.
+    """
+    n = len(pattern)
+    members: list[str] = []
+    if negate := i < n and pattern[i] == "^":
+        i += 1
+    while i < n and pattern[i] != "]":
+        if pattern[i] == "\\" and i + 1 < n:
+            i += 1
+            members.append(re.escape(pattern[i]))
+        elif pattern[i] == "-" and members and i + 1 < n and pattern[i + 1] != "]":
+            members.append("-")
+        else:
+            members.append(re.escape(pattern[i]))
+        i += 1
+    if i >= n:
+        return None
+    if not members:
+        return ("." if negate else "(?!)"), i + 1
+    return f"[{'^' if negate else ''}{''.join(members)}]", i + 1
+
+
+def glob_regex(pattern: str) -> re.Pattern[str] | None:
+    """Compile a Redis ``MATCH`` glob, or ``None`` if it can't be parsed.
+
+    Supports ``*``, ``?``, ``[...]`` / ``[^...]`` classes with ranges, and
+    backslash escapes.
+    """
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            out.append(".*")
+        elif char == "?":
+            out.append(".")
+        elif char == "\\" and i < n:
+            out.append(re.escape(pattern[i]))
+            i += 1
+        elif char == "[":
+            parsed = _glob_class(pattern, i)
+            if parsed is None:
+                return None
+            part, i = parsed
+            out.append(part)
+        else:
+            out.append(re.escape(char))
+    return re.compile("".join(out), re.DOTALL)
+
+
+class NearCache:
+    """Bounded LRU of raw ``GET`` replies kept coherent by a tracking listener."""
+
+    def __init__(self, config: TrackingConfig) -> None:
+        self.config = config
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        # key -> (value, monotonic deadline or None)
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        # key -> token of the read currently allowed to fill it
+        self._fills: dict[str, object] = {}
+        self._connected = False
+        self._listener: TrackingListener | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def allowed(self, key: str) -> bool:
+        prefixes = self.config.prefixes
+        return not prefixes or key.startswith(prefixes)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, deadline = entry
+                if deadline is None or deadline > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def begin(self, key: str) -> object | None:
+        """Register an in-flight read of ``key``; returns a token for :meth:`finish`."""
+        with self._lock:
+            if not self._connected:
+                return None
+            token = object()
+            self._fills[key] = token
+            return token
+
+    def finish(self, key: str, token: object | None, value: Any) -> None:
+        """Store ``value`` if no invalidation of ``key`` raced the read that produced it."""
+        if token is None:
+            return
+        with self._lock:
+            if self._fills.get(key) is not token:
+                return
+            del self._fills[key]
+            if not isinstance(value, bytes) or len(value) > self.config.max_entry_size:
+                return
+            ttl = self.config.ttl
+            self._entries[key] = (value, None if ttl is None else time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_many(self, keys: Iterable[str]) -> tuple[dict[str, bytes], list[str], list[object | None]]:
+        """Split ``keys`` into near-cache hits and the keys still to fetch.
+
+        Returns ``(hits, pending, tokens)``; pass ``pending``, ``tokens`` and
+        the fetched values to :meth:`finish_many`.
+        """
+        hits: dict[str, bytes] = {}
+        pending: list[str] = []
+        tokens: list[object | None] = []
+        for key in keys:
+            if not self.allowed(key):
+                pending.append(key)
+                tokens.append(None)
+            elif (value := self.get(key)) is not None:
+                hits[key] = value
+            else:
+                pending.append(key)
+                tokens.append(self.begin(key))
+        return hits, pending, tokens
+
+    def finish_many(self, keys: Iterable[str], tokens: Iterable[object | None], values: Iterable[Any]) -> None:
+        for key, token, value in zip(keys, tokens, values, strict=True):
+            self.finish(key, token, value)
+
+    def invalidate_many(self, keys: Iterable[str], *, remote: bool = False) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._fills.pop(key, None)
+                if remote:
+                    self.invalidations += 1
+
+    def invalidate_matching(self, pattern: str) -> None:
+        """Drop every entry whose key matches the Redis glob ``pattern``."""
+        regex = glob_regex(pattern)
+        if regex is None:
+            self.flush()
+            return
+        with self._lock:
+            for key in [key for key in self._entries if regex.fullmatch(key)]:
+                del self._entries[key]
+            for key in [key for key in self._fills if regex.fullmatch(key)]:
+                del self._fills[key]
+
+    def flush(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._fills.clear()
+
+    def set_connected(self, connected: bool) -> None:
+        with self._lock:
+            self._connected = connected
+            self._entries.clear()
+            self._fills.clear()
+
+    def start(self, pool: Any) -> None:
+        self._listener = TrackingListener(self, pool)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "connected": self._connected,
+                "entries": len(self._entries),
+                "max_entries": self.config.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+class TrackingListener:
+    """Daemon thread feeding ``__redis__:invalidate`` messages into a :class:`NearCache`."""
+
+    def __init__(self, near: NearCache, pool: Any) -> None:
+        self._near = near
+        self._pool = pool
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="django-cachex-tracking", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _connect(self) -> Any:
+        # A standalone connection built from the pool's own settings (URL,
+        # auth, TLS, sentinel master lookup) but never handed out by it.
+        conn = self._pool.connection_class(**self._pool.connection_kwargs)
+        conn.connect()
+        conn.send_command("CLIENT", "ID")
+        client_id = conn.read_response()
+        args: list[Any] = ["CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST"]
+        for prefix in self._near.config.prefixes:
+            args += ["PREFIX", prefix]
+        conn.send_command(*args)
+        conn.read_response()
+        conn.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        conn.read_response()
+        return conn
+
+    def _handle(self, message: Any) -> None:
+        if not isinstance(message, list) or len(message) != 3 or _text(message[0]) != "message":
+            return
+        keys = message[2]
+        if keys is None:
+            # FLUSHDB / FLUSHALL: the server sends a null key list.
+            self._near.flush()
+        else:
+            self._near.invalidate_many((_text(key) for key in keys), remote=True)
+
+    def _run(self) -> None:
+        backoff = _MIN_BACKOFF
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                self._near.set_connected(True)
+                backoff = _MIN_BACKOFF
+                while not self._stop.is_set():
+                    if conn.can_read(timeout=_POLL_INTERVAL):
+                        self._handle(conn.read_response())
+            except Exception:
+                logger.warning("client_tracking: listener disconnected, near-cache paused", exc_info=True)
+            finally:
+                self._near.set_connected(False)
+                if conn is not None:
+                    conn.disconnect()
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+
+# Process-wide: Django builds a cache (and so an adapter) per thread and per
+# asyncio task, but one listener per server + pool config is enough.
+_NEAR_CACHES: dict[tuple[Any, ...], NearCache] = {}
+_NEAR_CACHES_LOCK = threading.Lock()
+
+
+def shared_near_cache(key: tuple[Any, ...], config: TrackingConfig, pool: Any) -> NearCache:
+    """Return the process's near-cache for ``key``, starting its listener on first use."""
+    with _NEAR_CACHES_LOCK:
+        near = _NEAR_CACHES.get(key)
+        # After fork the parent's listener thread doesn't exist in the child.
+        if near is None or near.pid != os.getpid():
+            near = NearCache(config)
+            near.start(pool)
+            _NEAR_CACHES[key] = near
+        return near
@@ -21,7 +21,7 @@ pipeline layers rely on.
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+    from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
     from datetime import datetime, timedelta
 
     from django_cachex.stampede import StampedeConfig
@@ -513,7 +513,13 @@ class RespAdapterProtocol(Protocol):
         count: int | None = None,
         _type: str | None = None,
     ) -> tuple[int, list[str]]: ...
-    def delete_pattern(self, pattern: str, itersize: int | None = None) -> int: ...
+    def delete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int: ...
     def rename(self, src: str, dst: str) -> bool: ...
     def renamenx(self, src: str, dst: str) -> bool: ...
     async def akeys(self, pattern: str) -> list[str]: ...
@@ -521,7 +527,13 @@ class RespAdapterProtocol(Protocol):
     # generator overrides have a compatible signature; mypy types
     # ``async def -> AsyncIterator[X]`` as ``Coroutine[..., AsyncIterator[X]]``.
     def aiter_keys(self, pattern: str, itersize: int | None = None) -> AsyncIterator[str]: ...
-    async def adelete_pattern(self, pattern: str, itersize: int | None = None) -> int: ...
+    async def adelete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int: ...
     async def arename(self, src: str, dst: str) -> bool: ...
     async def arenamenx(self, src: str, dst: str) -> bool: ...
     def lock(
@@ -16,8 +16,10 @@ from django_cachex.adapters.valkey_py import (
     AsyncPoolsRegistry,
     ClusterRegistry,
     ValkeyPyAdapter,
+    ValkeyPyAsyncClusterPipelineAdapter,
     ValkeyPyAsyncPipelineAdapter,
     ValkeyPyClusterAdapter,
+    ValkeyPyClusterPipelineAdapter,
     ValkeyPyPipelineAdapter,
     ValkeyPySentinelAdapter,
 )
@@ -81,6 +83,8 @@ class _RedisPyMixin:
 # directly rather than carry empty subclasses.
 RedisPyPipelineAdapter = ValkeyPyPipelineAdapter
 RedisPyAsyncPipelineAdapter = ValkeyPyAsyncPipelineAdapter
+RedisPyClusterPipelineAdapter = ValkeyPyClusterPipelineAdapter
+RedisPyAsyncClusterPipelineAdapter = ValkeyPyAsyncClusterPipelineAdapter
 
 
 class RedisPyAdapter(_RedisPyMixin, ValkeyPyAdapter):
@@ -139,20 +143,22 @@ class RedisPyClusterAdapter(_RedisPyMixin, ValkeyPyClusterAdapter):
         _async_cluster_class = AsyncRedisCluster
         _key_slot_func = staticmethod(redis_key_slot)
 
-    def pipeline(self, *, transaction: bool = True) -> RedisPyPipelineAdapter:
+    def pipeline(self, *, transaction: bool = True) -> RedisPyClusterPipelineAdapter:
         client = self.get_client(write=True)
-        return RedisPyPipelineAdapter(client.pipeline(transaction=False))
+        return RedisPyClusterPipelineAdapter(client, self._pipeline_max_commands)
 
-    async def apipeline(self, *, transaction: bool = True) -> RedisPyAsyncPipelineAdapter:
+    async def apipeline(self, *, transaction: bool = True) -> RedisPyAsyncClusterPipelineAdapter:
         client = await self.get_async_client(write=True)
-        return RedisPyAsyncPipelineAdapter(client.pipeline(transaction=False))
+        return RedisPyAsyncClusterPipelineAdapter(client, self._pipeline_max_commands)
 
 
 __all__ = [
     "_REDIS_AVAILABLE",
     "RedisPyAdapter",
+    "RedisPyAsyncClusterPipelineAdapter",
     "RedisPyAsyncPipelineAdapter",
     "RedisPyClusterAdapter",
+    "RedisPyClusterPipelineAdapter",
     "RedisPyPipelineAdapter",
     "RedisPySentinelAdapter",
 ]
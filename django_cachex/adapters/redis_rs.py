@@ -24,6 +24,8 @@ from django_cachex.exceptions import NotSupportedError
 # stub); at runtime the fallback substitutes a stub whose ``__init__``
 # raises a friendly ``ImportError``.
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from django_cachex.adapters._redis_rs import (
         RedisRsAdapter as _RustRedisRsAdapter,
     )
@@ -114,6 +116,32 @@ class RedisRsAdapter(_RustRedisRsAdapter, RespAdapterProtocol):
         """Reject SLOWLOG LEN, which the Rust adapter does not implement."""
         raise NotSupportedError("slowlog_len", backend="redis-rs")
 
+    def delete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Delete keys matching pattern; the Rust loop reports ``progress`` once, at the end."""
+        deleted = super().delete_pattern(pattern, itersize)
+        if progress is not None:
+            progress(deleted)
+        return deleted
+
+    async def adelete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Async :meth:`delete_pattern`."""
+        deleted = await super().adelete_pattern(pattern, itersize)
+        if progress is not None:
+            progress(deleted)
+        return deleted
+
     def lock(
         self,
         key: str,
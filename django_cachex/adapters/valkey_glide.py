@@ -29,6 +29,7 @@ from django_cachex.adapters.valkey_py import _options_key
 from django_cachex.exceptions import maybe_wrap_wrongtype
 from django_cachex.stampede import (
     StampedeConfig,
+    filter_fresh,
     get_timeout_with_buffer,
     make_stampede_config,
     resolve_stampede,
@@ -37,7 +38,7 @@ from django_cachex.stampede import (
 from django_cachex.types import KeyType
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
 
 # valkey-glide is an optional install. The names below are unbound when it
@@ -1312,15 +1313,18 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
         return client.set(key, _enc(nvalue), **kw) == "OK"
 
     def get(self, key: str, *, stampede_prevention: bool | StampedeConfig | None = None) -> Any:
-        client = self._client()
-        val = client.get(key)
+        config = self.resolve_stampede(stampede_prevention)
+        if not config:
+            return self._client().get(key)
+        # GET and TTL share one non-atomic batch: one round trip.
+        pipe = self._pipeline()
+        pipe.get(key)
+        pipe.ttl(key)
+        val, ttl = pipe.execute()
         if val is None:
             return None
-        config = self.resolve_stampede(stampede_prevention)
-        if config and isinstance(val, bytes):
-            ttl = client.ttl(key)
-            if ttl > 0 and should_recompute(ttl, config):
-                return None
+        if isinstance(val, bytes) and ttl > 0 and should_recompute(ttl, config):
+            return None
         return val
 
     def set(
@@ -1403,23 +1407,19 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
         if not keys:
             return {}
 
-        client = self._client()
-        results = client.mget(keys)
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                pipe = self._pipeline()
-                for k in stampede_keys:
-                    pipe.ttl(k)
-                ttls = pipe.execute()
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config:
+            results = self._client().mget(keys)
+            return {k: v for k, v in zip(keys, results, strict=False) if v is not None}
+
+        # GET+TTL per key in one non-atomic batch (glide routes each pair
+        # by slot in cluster mode), so the stampede check adds no round trip.
+        pipe = self._pipeline()
+        for k in keys:
+            pipe.get(k)
+            pipe.ttl(k)
+        replies = pipe.execute()
+        return filter_fresh(keys, replies[0::2], replies[1::2], config)
 
     def has_key(self, key: str) -> bool:
         return bool(self._client().exists([key]))
@@ -1454,10 +1454,12 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
         elif actual_timeout is None:
             client.mset(prepared)
         else:
+            # Non-atomic either way, so one SET EX per key beats MSET + N x EXPIRE
+            # and leaves no window where a key exists without its TTL.
+            expiry = ExpirySet(ExpiryType.SEC, actual_timeout)
             batch = Batch(is_atomic=False)
-            batch.mset(prepared)
-            for key in prepared:
-                batch.expire(key, actual_timeout)
+            for key, value in prepared.items():
+                batch.set(key, value, expiry=expiry)
             client.exec(batch, raise_on_error=True)
         return []
 
@@ -1543,12 +1545,20 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
             if cursor in (b"0", "0", 0):
                 return
 
-    def delete_pattern(self, pattern: str, itersize: int | None = None) -> int:
+    def delete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
         client = self._client()
         deleted = 0
         for batch_keys in _batched(self.iter_keys(pattern, itersize=itersize), itersize or 100):
             if batch_keys:
                 deleted += client.delete(batch_keys)
+                if progress is not None:
+                    progress(deleted)
         return deleted
 
     # =========================================================================
@@ -2291,14 +2301,17 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
 
     async def aget(self, key: str, *, stampede_prevention: bool | StampedeConfig | None = None) -> Any:
         client = await self.get_async_client()
-        val = await client.get(key)
+        config = self.resolve_stampede(stampede_prevention)
+        if not config:
+            return await client.get(key)
+        batch = Batch(is_atomic=False)
+        batch.get(key)
+        batch.ttl(key)
+        val, ttl = await client.exec(batch, raise_on_error=True) or [None, -2]
         if val is None:
             return None
-        config = self.resolve_stampede(stampede_prevention)
-        if config and isinstance(val, bytes):
-            ttl = await client.ttl(key)
-            if ttl > 0 and should_recompute(ttl, config):
-                return None
+        if isinstance(val, bytes) and ttl > 0 and should_recompute(ttl, config):
+            return None
         return val
 
     async def aset(
@@ -2382,22 +2395,17 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
             return {}
 
         client = await self.get_async_client()
-        results = await client.mget(keys)
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                batch = Batch(is_atomic=False)
-                for k in stampede_keys:
-                    batch.ttl(k)
-                ttls = await client.exec(batch, raise_on_error=True) or []
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config:
+            results = await client.mget(keys)
+            return {k: v for k, v in zip(keys, results, strict=False) if v is not None}
+
+        batch = Batch(is_atomic=False)
+        for k in keys:
+            batch.get(k)
+            batch.ttl(k)
+        replies = await client.exec(batch, raise_on_error=True) or []
+        return filter_fresh(keys, replies[0::2], replies[1::2], config)
 
     async def ahas_key(self, key: str) -> bool:
         return bool(await (await self.get_async_client()).exists([key]))
@@ -2432,10 +2440,12 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
         elif actual_timeout is None:
             await client.mset(prepared)
         else:
+            # Non-atomic either way, so one SET EX per key beats MSET + N x EXPIRE
+            # and leaves no window where a key exists without its TTL.
+            expiry = ExpirySet(ExpiryType.SEC, actual_timeout)
             batch = Batch(is_atomic=False)
-            batch.mset(prepared)
-            for key in prepared:
-                batch.expire(key, actual_timeout)
+            for key, value in prepared.items():
+                batch.set(key, value, expiry=expiry)
             await client.exec(batch, raise_on_error=True)
         return []
 
@@ -2522,7 +2532,13 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
             if cursor in (b"0", "0", 0):
                 return
 
-    async def adelete_pattern(self, pattern: str, itersize: int | None = None) -> int:
+    async def adelete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
         client = await self.get_async_client()
         deleted = 0
         keys: list = []
@@ -2531,8 +2547,12 @@ class ValkeyGlideAdapter(RespAdapterProtocol):
             if len(keys) >= (itersize or 100):
                 deleted += await client.delete(keys)
                 keys = []
+                if progress is not None:
+                    progress(deleted)
         if keys:
             deleted += await client.delete(keys)
+            if progress is not None:
+                progress(deleted)
         return deleted
 
     # =========================================================================
@@ -21,11 +21,14 @@ and ``_missing_lib_error`` to redirect the check.
 """
 
 import asyncio
+import hashlib
 import inspect
+import os
 import random
 import threading
 import weakref
 from collections import defaultdict
+from dataclasses import dataclass, field
 from itertools import batched
 from typing import TYPE_CHECKING, Any, cast, override
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
@@ -33,24 +36,40 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
+from django_cachex.adapters._pools import (
+    awarm_pool,
+    instrument_pool,
+    make_warmup_count,
+    pool_stats,
+    schedule_warmup,
+    warm_new_pool,
+    warm_pool,
+)
+from django_cachex.adapters._routing import make_routing_config, server_address, shared_router
+from django_cachex.adapters._tracking import make_tracking_config, shared_near_cache
 from django_cachex.adapters.protocols import RespAdapterProtocol, RespAsyncPipelineProtocol, RespPipelineProtocol
-from django_cachex.exceptions import NotSupportedError, _main_exceptions, maybe_wrap_wrongtype
+from django_cachex.exceptions import ClusterFanoutError, NotSupportedError, _main_exceptions, maybe_wrap_wrongtype
 from django_cachex.stampede import (
     StampedeConfig,
+    filter_fresh,
     get_timeout_with_buffer,
     make_stampede_config,
     resolve_stampede,
     should_recompute,
 )
 from django_cachex.types import KeyType
+from django_cachex.utils import LazyThreadPool
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
     from datetime import datetime, timedelta
 
     from redis.connection import ConnectionPool
 
+    from django_cachex.adapters._routing import ReadRouter, RoutingConfig
+    from django_cachex.adapters._tracking import NearCache, TrackingConfig
+
 # Alias for the `set` builtin shadowed by the `set` method (PEP 649 defers
 # annotations at runtime, but type checkers still resolve them in class scope).
 # The `type` shadow uses ``builtins.type[X]`` directly. Module-level
@@ -100,6 +119,15 @@ def _options_key(options: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
     return tuple(out)
 
 
+def make_flag(options: Mapping[str, Any], name: str, *, default: bool) -> bool:
+    """Validate a boolean ``OPTIONS`` value."""
+    value = options.get(name, default)
+    if type(value) is not bool:
+        msg = f"OPTIONS[{name!r}] must be True or False, got {value!r}"
+        raise ImproperlyConfigured(msg)
+    return value
+
+
 def _raw_response(response: Any, **_options: Any) -> Any:
     """Response callback that returns the driver's reply unparsed."""
     return response
@@ -160,6 +188,153 @@ def _install_wrongtype_translation(client: Any) -> Any:
     return client
 
 
+# Cluster ``get_many()`` / ``set_many()`` / ``delete_many()`` send one
+# pipeline per node. Sync clients run the node pipelines concurrently on
+# this pool, async clients gather them on the loop.
+_FANOUT_POOL = LazyThreadPool(16, "cachex-fanout")
+
+# Queues the commands for one slot's keys on a cluster pipeline.
+type QueueSlot = Callable[[Any, list[str]], None]
+
+
+def _run_node_batch(client: Any, slot_groups: list[list[str]], queue: QueueSlot) -> list[Any]:
+    """Run one node's slot groups through a cluster pipeline; raise the first failed reply."""
+    pipe = client.pipeline()
+    for slot_keys in slot_groups:
+        queue(pipe, slot_keys)
+    replies = pipe.execute(raise_on_error=False)
+    for reply in replies:
+        if isinstance(reply, Exception):
+            raise reply
+    return replies
+
+
+async def _arun_node_batch(client: Any, slot_groups: list[list[str]], queue: QueueSlot) -> list[Any]:
+    """Async twin of ``_run_node_batch``."""
+    pipe = client.pipeline()
+    for slot_keys in slot_groups:
+        queue(pipe, slot_keys)
+    replies = await pipe.execute(raise_on_error=False)
+    for reply in replies:
+        if isinstance(reply, Exception):
+            raise reply
+    return replies
+
+
+# Cluster pipelines block the multi-key helpers (``mget()``, ``mset()``,
+# ``delete(*keys)``); the raw commands are fine for keys of one slot.
+def _queue_mget(pipe: Any, slot_keys: list[str]) -> None:
+    pipe.execute_command("MGET", *slot_keys)
+
+
+def _queue_delete(pipe: Any, slot_keys: list[str]) -> None:
+    pipe.execute_command("DEL", *slot_keys)
+
+
+def _queue_set(data: Mapping[str, Any], timeout_ms: int | None) -> QueueSlot:
+    """SET PX per key (atomic with its TTL), or one MSET per slot without expiry."""
+
+    def queue(pipe: Any, slot_keys: list[str]) -> None:
+        if timeout_ms is None:
+            pipe.execute_command("MSET", *(item for key in slot_keys for item in (key, data[key])))
+        else:
+            for key in slot_keys:
+                pipe.set(key, data[key], px=timeout_ms)
+
+    return queue
+
+
+def _found_values(batches: dict[str, list[list[str]]], replies: dict[str, list[Any]]) -> dict[str, Any]:
+    """Merge per-node MGET replies into ``{key: value}`` for the keys that exist."""
+    found: dict[str, Any] = {}
+    for name, node_replies in replies.items():
+        for slot_keys, values in zip(batches[name], node_replies, strict=True):
+            found.update((k, v) for k, v in zip(slot_keys, values, strict=True) if v is not None)
+    return found
+
+
+def _fanout_error(
+    batches: dict[str, list[list[str]]],
+    errors: dict[str, Exception],
+    partial: Any,
+) -> ClusterFanoutError:
+    keys = {name: [key for slot_keys in batches[name] for key in slot_keys] for name in errors}
+    return ClusterFanoutError(errors, keys, partial)
+
+
+# delete_pattern() with OPTIONS["scripted_delete_pattern"]: one SCAN page and
+# the UNLINK of its matches per call, so matched keys never travel to the
+# client and each call blocks the server for one page only.
+# ARGV: cursor, pattern, count. Returns {next cursor, keys unlinked}.
+_DELETE_PATTERN_STEP_LUA = """
+local page = redis.call('SCAN', ARGV[1], 'MATCH', ARGV[2], 'COUNT', ARGV[3])
+local keys = page[2]
+local unlinked = 0
+for i = 1, #keys, 1000 do
+  unlinked = unlinked + redis.call('UNLINK', unpack(keys, i, math.min(i + 999, #keys)))
+end
+return {page[1], unlinked}
+"""
+
+# Cluster nodes only run scripts touching several slots when the script says
+# so (Redis 7+ / Valkey). The keys SCAN returns are all served by the node.
+_CLUSTER_DELETE_PATTERN_STEP_LUA = "#!lua flags=allow-cross-slot-keys\n" + _DELETE_PATTERN_STEP_LUA.lstrip()
+
+
+@dataclass(frozen=True, slots=True)
+class _LuaScript:
+    """A Lua script sent by SHA1 (``EVALSHA``), with its source for the first call."""
+
+    source: str
+    sha: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sha", hashlib.sha1(self.source.encode(), usedforsecurity=False).hexdigest())
+
+
+_DELETE_PATTERN_STEP = _LuaScript(_DELETE_PATTERN_STEP_LUA)
+_CLUSTER_DELETE_PATTERN_STEP = _LuaScript(_CLUSTER_DELETE_PATTERN_STEP_LUA)
+
+
+def _delete_pattern_step(
+    client: Any,
+    script: _LuaScript,
+    no_script: builtins.type[Exception],
+    cursor: int,
+    pattern: str,
+    count: int,
+    **kwargs: Any,
+) -> list[int]:
+    """Run one SCAN + UNLINK step; returns ``[next cursor, keys unlinked]``.
+
+    The step goes out as ``EVALSHA``. A server that doesn't have the script
+    yet answers ``NOSCRIPT`` (``no_script``); the ``EVAL`` retry caches it
+    there, so every later page is sent by SHA again.
+    """
+    try:
+        cursor, unlinked = client.execute_command("EVALSHA", script.sha, 0, cursor, pattern, count, **kwargs)
+    except no_script:
+        cursor, unlinked = client.execute_command("EVAL", script.source, 0, cursor, pattern, count, **kwargs)
+    return [int(cursor), int(unlinked)]
+
+
+async def _adelete_pattern_step(
+    client: Any,
+    script: _LuaScript,
+    no_script: builtins.type[Exception],
+    cursor: int,
+    pattern: str,
+    count: int,
+    **kwargs: Any,
+) -> list[int]:
+    """Async twin of ``_delete_pattern_step``."""
+    try:
+        cursor, unlinked = await client.execute_command("EVALSHA", script.sha, 0, cursor, pattern, count, **kwargs)
+    except no_script:
+        cursor, unlinked = await client.execute_command("EVAL", script.source, 0, cursor, pattern, count, **kwargs)
+    return [int(cursor), int(unlinked)]
+
+
 _VALKEY_AVAILABLE = False
 try:
     import valkey
@@ -233,9 +408,39 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             "sentinel_kwargs",
             "async_pool_class",
             "stampede_prevention",
+            "max_batch_keys",
+            "max_batch_bytes",
+            "max_batch_concurrency",
+            "atomic_set_many",
+            "client_tracking",
+            "singleflight",
+            "auto_batch",
+            "auto_batch_window_us",
+            "read_routing",
+            "pool_warmup",
+            "metrics",
+            "hot_keys",
+            "codec_header",
+            "raw_passthrough",
+            "async_offload",
+            "chunking",
+            "pipeline_max_commands",
+            "scripted_delete_pattern",
         },
     )
 
+    # The near-cache listens on one server; cluster keys live on many.
+    _supports_client_tracking: bool = True
+    # Read routing picks among LOCATION's replicas; cluster routes by slot.
+    _supports_read_routing: bool = True
+
+    # Instance state set in __init__; class defaults keep adapters built
+    # without it (e.g. via ``__new__``) on the plain code paths.
+    _routing: RoutingConfig | None = None
+    _read_router: ReadRouter | None = None
+    _pool_warmup: int = 0
+    _scripted_delete_pattern: bool = False
+
     @staticmethod
     def _missing_lib_error() -> ImportError:
         return _missing_valkey()
@@ -262,6 +467,28 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         self._options = options
         self._pools: dict[int, Any] = {}
         self._stampede_config: StampedeConfig | None = make_stampede_config(options.get("stampede_prevention"))
+        # False: set_many with a timeout sends one SET EX per key in a
+        # non-transactional pipeline instead of MULTI + MSET + N x EXPIRE.
+        self._atomic_set_many = make_flag(options, "atomic_set_many", default=True)
+        # True: delete_pattern() runs SCAN + UNLINK server-side, one Lua call per page.
+        self._scripted_delete_pattern = make_flag(options, "scripted_delete_pattern", default=False)
+        # Near-cache of GET replies kept coherent by CLIENT TRACKING; the
+        # shared cache and its listener are attached on first use.
+        self._tracking: TrackingConfig | None = make_tracking_config(options.get("client_tracking"))
+        self._near: NearCache | None = None
+        if self._tracking is not None and not self._supports_client_tracking:
+            msg = f"client_tracking is not supported by {type(self).__name__}"
+            raise ImproperlyConfigured(msg)
+        # Latency-aware replica selection; statistics are shared process-wide
+        # and attached on first use. Meaningless with a single server.
+        self._routing = make_routing_config(options.get("read_routing"))
+        self._read_router = None
+        if self._routing is not None and not self._supports_read_routing:
+            msg = f"read_routing is not supported by {type(self).__name__}"
+            raise ImproperlyConfigured(msg)
+        # Connections per pool opened by warm_up(), and in the background
+        # whenever a new event loop gets its async pool.
+        self._pool_warmup = make_warmup_count(options.get("pool_warmup"))
 
         if isinstance(pool_class, str):
             pool_class = import_string(pool_class)
@@ -296,8 +523,59 @@ class ValkeyPyAdapter(RespAdapterProtocol):
     ) -> int | None:
         return get_timeout_with_buffer(timeout, self._stampede_config, stampede_prevention)
 
+    def _near_cache(self) -> NearCache | None:
+        """Return the process-wide near-cache for this server, if tracking is on."""
+        if self._tracking is None:
+            return None
+        near = self._near
+        if near is None or near.pid != os.getpid():
+            # The primary's pool, picked directly: asking the router for a
+            # write pool would count as a write and open primary_after_write.
+            pool = self._get_connection_pool(write=True, index=0)
+            key = (type(pool), self._servers[0], _options_key(self._pool_options), self._tracking)
+            near = self._near = shared_near_cache(key, self._tracking, pool)
+        return near
+
+    def _forget(self, *keys: str) -> None:
+        """Drop keys this process just wrote from the near-cache.
+
+        The server's invalidation message arrives asynchronously; doing it
+        here too keeps read-your-writes within the process.
+        """
+        if self._tracking is not None and (near := self._near_cache()) is not None:
+            near.invalidate_many(keys)
+
+    def _forget_matching(self, pattern: str) -> None:
+        """Drop near-cache entries matching a pattern this process just deleted."""
+        if self._tracking is not None and (near := self._near_cache()) is not None:
+            near.invalidate_matching(pattern)
+
+    def forget(self, *keys: str) -> None:
+        """Drop keys written outside this adapter's commands (scripts, raw pipelines) from the near-cache."""
+        self._forget(*keys)
+
+    def _router(self) -> ReadRouter | None:
+        """Return the process-wide read router for these servers, if routing is on."""
+        if self._routing is None or len(self._servers) == 1:
+            return None
+        router = self._read_router
+        if router is None:
+            key = (type(self), tuple(self._servers), self._routing)
+            router = self._read_router = shared_router(key, self._servers, self._routing)
+        return router
+
+    def _track(self, client: Any, index: int) -> Any:
+        """Feed ``client``'s command latencies and errors to the read router."""
+        router = self._router()
+        if router is None:
+            return client
+        errors = (self._lib.exceptions.ConnectionError, self._lib.exceptions.TimeoutError, OSError)
+        return router.track(client, index, errors)
+
     def _get_connection_pool_index(self, *, write: bool) -> int:
         """Get the pool index for read/write operations."""
+        if (router := self._router()) is not None:
+            return router.choose(write=write)
         # Write to first server, read from any replica
         if write or len(self._servers) == 1:
             return 0
@@ -313,32 +591,44 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             return None
         return result
 
-    def _get_connection_pool(self, *, write: bool) -> Any:
-        """Get a connection pool for the given operation type."""
-        index = self._get_connection_pool_index(write=write)
+    def _get_connection_pool(self, *, write: bool, index: int | None = None) -> Any:
+        """Get a connection pool for the given operation type (or server ``index``).
+
+        Sync pools belong to this adapter, and Django builds a cache per
+        thread, so with ``pool_warmup`` each new pool opens its connections
+        as soon as it is created rather than on the thread's first requests.
+        """
+        if index is None:
+            index = self._get_connection_pool_index(write=write)
         if index not in self._pools:
             if self._pool_class is None:
                 msg = "Subclasses must set _pool_class"
                 raise RuntimeError(msg)
-            self._pools[index] = self._pool_class.from_url(
-                self._servers[index],
-                **self._pool_options,
+            pool = instrument_pool(
+                self._pool_class.from_url(
+                    self._servers[index],
+                    **self._pool_options,
+                ),
             )
+            self._pools[index] = pool
+            if self._pool_warmup:
+                warm_new_pool(pool, self._pool_warmup)
         return self._pools[index]
 
     def get_client(self, key: str | None = None, *, write: bool = False) -> Any:
         """Get a client connection."""
-        pool = self._get_connection_pool(write=write)
+        index = self._get_connection_pool_index(write=write)
+        pool = self._get_connection_pool(write=write, index=index)
         if self._client_class is None:
             msg = "Subclasses must set _client_class"
             raise RuntimeError(msg)
-        return _install_wrongtype_translation(self._client_class(connection_pool=pool))
+        return self._track(_install_wrongtype_translation(self._client_class(connection_pool=pool)), index)
 
     # =========================================================================
     # Async Connection Pool Management
     # =========================================================================
 
-    def _get_async_connection_pool(self, *, write: bool) -> Any:
+    def _get_async_connection_pool(self, *, write: bool, index: int | None = None) -> Any:
         """Get an async connection pool, cached process-wide per (loop, config).
 
         The cache lives on the driver-specific class (``_async_pools``)
@@ -348,7 +638,8 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         a fresh TCP connection on every cache call.
         """
         loop = asyncio.get_running_loop()
-        index = self._get_connection_pool_index(write=write)
+        if index is None:
+            index = self._get_connection_pool_index(write=write)
 
         if self._async_pool_class is None:
             msg = "Async operations require _async_pool_class to be set. Use RedisPyAdapter or ValkeyPyAdapter."
@@ -358,7 +649,7 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         async_pool_options: dict[str, Any] = {k: v for k, v in self._pool_options.items() if k != "parser_class"}
 
         url = self._servers[index]
-        key = (self._async_pool_class, url, _options_key(async_pool_options), index)
+        key = self._async_pool_key(index)
 
         sub = self._async_pools.get(loop)
         if sub is None:
@@ -367,10 +658,17 @@ class ValkeyPyAdapter(RespAdapterProtocol):
 
         pool = sub.get(key)
         if pool is None:
-            pool = self._async_pool_class.from_url(url, **async_pool_options)
+            pool = instrument_pool(self._async_pool_class.from_url(url, **async_pool_options))
             sub[key] = pool
+            if self._pool_warmup:
+                schedule_warmup(pool, self._pool_warmup)
         return pool
 
+    def _async_pool_key(self, index: int) -> tuple[Any, ...]:
+        """Registry key of server ``index``'s async pool within a loop's ``_async_pools`` entry."""
+        async_pool_options = {k: v for k, v in self._pool_options.items() if k != "parser_class"}
+        return (self._async_pool_class, self._servers[index], _options_key(async_pool_options), index)
+
     async def get_async_client(self, key: str | None = None, *, write: bool = False) -> Any:
         """Get an async client connection.
 
@@ -381,17 +679,66 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         lazily on the first awaited command.
         """
         del key
-        pool = self._get_async_connection_pool(write=write)
+        index = self._get_connection_pool_index(write=write)
+        pool = self._get_async_connection_pool(write=write, index=index)
         if self._async_client_class is None:
             msg = "Async operations require _async_client_class to be set. Use RedisPyAdapter or ValkeyPyAdapter."
             raise RuntimeError(msg)
-        return _install_wrongtype_translation(self._async_client_class(connection_pool=pool))
+        return self._track(_install_wrongtype_translation(self._async_client_class(connection_pool=pool)), index)
 
     def close(self, **kwargs: Any) -> None:
-        """No-op. Pools live for the instance's lifetime (matches Django's BaseCache)."""
+        """End the request's read-your-writes window; pools live for the instance's lifetime.
+
+        Django calls this on ``request_finished``, in the thread that served
+        the request.
+        """
+        if self._read_router is not None:
+            self._read_router.forget_write()
 
     async def aclose(self, **kwargs: Any) -> None:
-        """No-op. Pools live for the instance's lifetime (matches Django's BaseCache)."""
+        """Async :meth:`close`."""
+        self.close()
+
+    # =========================================================================
+    # Pool warm-up and gauges
+    # =========================================================================
+
+    def warm_up(self, connections: int | None = None) -> int:
+        """Open ``connections`` connections in every server's sync pool.
+
+        Defaults to the ``pool_warmup`` option (or 1). Sync pools belong to
+        this adapter, so call it from the thread that will serve traffic.
+        Returns the number of connections now open and idle.
+        """
+        n = (self._pool_warmup or 1) if connections is None else connections
+        return sum(
+            warm_pool(self._get_connection_pool(write=index == 0, index=index), n)
+            for index in range(len(self._servers))
+        )
+
+    async def awarm_up(self, connections: int | None = None) -> int:
+        """Open ``connections`` connections in every server's async pool for the running loop."""
+        n = (self._pool_warmup or 1) if connections is None else connections
+        total = 0
+        for index in range(len(self._servers)):
+            total += await awarm_pool(self._get_async_connection_pool(write=index == 0, index=index), n)
+        return total
+
+    def pool_stats(self) -> list[dict[str, Any]]:
+        """Gauges for every pool opened so far: this adapter's sync pools, and the
+        process-wide async pools of each event loop."""
+        rows = [
+            {"server": server_address(self._servers[index]), "mode": "sync", **pool_stats(pool)}
+            for index, pool in sorted(self._pools.items())
+        ]
+        if self._async_pool_class is None:
+            return rows
+        keys = [(index, self._async_pool_key(index)) for index in range(len(self._servers))]
+        for sub in list(self._async_pools.values()):
+            for index, key in keys:
+                if (pool := sub.get(key)) is not None:
+                    rows.append({"server": server_address(self._servers[index]), "mode": "async", **pool_stats(pool)})
+        return rows
 
     # =========================================================================
     # Core Cache Operations
@@ -437,28 +784,49 @@ class ValkeyPyAdapter(RespAdapterProtocol):
 
     def get(self, key: str, *, stampede_prevention: bool | StampedeConfig | None = None) -> Any:
         """Fetch a value from the cache."""
+        config = self.resolve_stampede(stampede_prevention)
+        if not config and (near := self._near_cache()) is not None and near.allowed(key):
+            if (value := near.get(key)) is not None:
+                return value
+            token = near.begin(key)
+            value = self.get_client(key, write=False).get(key)
+            near.finish(key, token, value)
+            return value
         client = self.get_client(key, write=False)
-        val = client.get(key)
+        if not config:
+            return client.get(key)
+        # GET and TTL share one non-transactional pipeline: one round trip.
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.ttl(key)
+        val, ttl = pipe.execute()
         if val is None:
             return None
-        config = self.resolve_stampede(stampede_prevention)
-        if config and isinstance(val, bytes):
-            ttl = client.ttl(key)
-            if ttl > 0 and should_recompute(ttl, config):
-                return None
+        if isinstance(val, bytes) and ttl > 0 and should_recompute(ttl, config):
+            return None
         return val
 
     async def aget(self, key: str, *, stampede_prevention: bool | StampedeConfig | None = None) -> Any:
         """Fetch a value from the cache asynchronously."""
+        config = self.resolve_stampede(stampede_prevention)
+        if not config and (near := self._near_cache()) is not None and near.allowed(key):
+            if (value := near.get(key)) is not None:
+                return value
+            token = near.begin(key)
+            value = await (await self.get_async_client(key, write=False)).get(key)
+            near.finish(key, token, value)
+            return value
         client = await self.get_async_client(key, write=False)
-        val = await client.get(key)
+        if not config:
+            return await client.get(key)
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.ttl(key)
+        val, ttl = await pipe.execute()
         if val is None:
             return None
-        config = self.resolve_stampede(stampede_prevention)
-        if config and isinstance(val, bytes):
-            ttl = await client.ttl(key)
-            if ttl > 0 and should_recompute(ttl, config):
-                return None
+        if isinstance(val, bytes) and ttl > 0 and should_recompute(ttl, config):
+            return None
         return val
 
     def set(
@@ -478,6 +846,7 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             client.delete(key)
         else:
             client.set(key, nvalue, ex=actual_timeout)
+        self._forget(key)
 
     async def aset(
         self,
@@ -496,6 +865,7 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             await client.delete(key)
         else:
             await client.set(key, nvalue, ex=actual_timeout)
+        self._forget(key)
 
     def set_with_flags(
         self,
@@ -517,21 +887,25 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         nvalue = value
         actual_timeout = self.get_timeout_with_buffer(timeout, stampede_prevention)
 
-        if actual_timeout == 0:
-            result = client.set(key, nvalue, nx=nx, xx=xx, get=get)
+        # finally: drop the near-cache entry on every return path below.
+        try:
+            if actual_timeout == 0:
+                result = client.set(key, nvalue, nx=nx, xx=xx, get=get)
+                if get:
+                    executed = result is None if nx else (result is not None if xx else True)
+                else:
+                    executed = bool(result)
+                if executed:
+                    client.delete(key)
+                return result if get else bool(result)
+            result = client.set(key, nvalue, ex=actual_timeout, nx=nx, xx=xx, get=get)
             if get:
-                executed = result is None if nx else (result is not None if xx else True)
-            else:
-                executed = bool(result)
-            if executed:
-                client.delete(key)
-            return result if get else bool(result)
-        result = client.set(key, nvalue, ex=actual_timeout, nx=nx, xx=xx, get=get)
-        if get:
-            if result is None:
-                return None
-            return result
-        return bool(result)
+                if result is None:
+                    return None
+                return result
+            return bool(result)
+        finally:
+            self._forget(key)
 
     async def aset_with_flags(
         self,
@@ -553,21 +927,25 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         nvalue = value
         actual_timeout = self.get_timeout_with_buffer(timeout, stampede_prevention)
 
-        if actual_timeout == 0:
-            result = await client.set(key, nvalue, nx=nx, xx=xx, get=get)
+        # finally: drop the near-cache entry on every return path below.
+        try:
+            if actual_timeout == 0:
+                result = await client.set(key, nvalue, nx=nx, xx=xx, get=get)
+                if get:
+                    executed = result is None if nx else (result is not None if xx else True)
+                else:
+                    executed = bool(result)
+                if executed:
+                    await client.delete(key)
+                return result if get else bool(result)
+            result = await client.set(key, nvalue, ex=actual_timeout, nx=nx, xx=xx, get=get)
             if get:
-                executed = result is None if nx else (result is not None if xx else True)
-            else:
-                executed = bool(result)
-            if executed:
-                await client.delete(key)
-            return result if get else bool(result)
-        result = await client.set(key, nvalue, ex=actual_timeout, nx=nx, xx=xx, get=get)
-        if get:
-            if result is None:
-                return None
-            return result
-        return bool(result)
+                if result is None:
+                    return None
+                return result
+            return bool(result)
+        finally:
+            self._forget(key)
 
     def touch(self, key: str, timeout: int | None) -> bool:
         """Update the timeout on a key."""
@@ -589,13 +967,17 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         """Remove a key from the cache."""
         client = self.get_client(key, write=True)
 
-        return bool(client.delete(key))
+        result = bool(client.delete(key))
+        self._forget(key)
+        return result
 
     async def adelete(self, key: str) -> bool:
         """Remove a key from the cache asynchronously."""
         client = await self.get_async_client(key, write=True)
 
-        return bool(await client.delete(key))
+        result = bool(await client.delete(key))
+        self._forget(key)
+        return result
 
     def get_many(
         self,
@@ -609,26 +991,26 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             return {}
 
         client = self.get_client(write=False)
-        results = client.mget(keys)
-
-        # Collect non-None results
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
-        # Stampede filtering: pipeline TTL for found keys with bytes values
-        # (integers bypass stampede, matching get() behavior)
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                pipe = client.pipeline()
-                for k in stampede_keys:
-                    pipe.ttl(k)
-                ttls = pipe.execute()
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config and (near := self._near_cache()) is not None:
+            found, pending, tokens = near.get_many(keys)
+            if pending:
+                results = client.mget(pending)
+                near.finish_many(pending, tokens, results)
+                found.update((k, v) for k, v in zip(pending, results, strict=False) if v is not None)
+            return found
+        if not config:
+            results = client.mget(keys)
+            return {k: v for k, v in zip(keys, results, strict=False) if v is not None}
+
+        # Stampede filtering: MGET plus one TTL per key in a single
+        # non-transactional pipeline, so the check costs no extra round trip.
+        pipe = client.pipeline(transaction=False)
+        pipe.mget(keys)
+        for k in keys:
+            pipe.ttl(k)
+        results, *ttls = pipe.execute()
+        return filter_fresh(keys, results, ttls, config)
 
     async def aget_many(
         self,
@@ -642,26 +1024,26 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             return {}
 
         client = await self.get_async_client(write=False)
-        results = await client.mget(keys)
-
-        # Collect non-None results
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
-        # Stampede filtering: pipeline TTL for found keys with bytes values
-        # (integers bypass stampede, matching aget() behavior)
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                pipe = client.pipeline()
-                for k in stampede_keys:
-                    pipe.ttl(k)
-                ttls = await pipe.execute()
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config and (near := self._near_cache()) is not None:
+            found, pending, tokens = near.get_many(keys)
+            if pending:
+                results = await client.mget(pending)
+                near.finish_many(pending, tokens, results)
+                found.update((k, v) for k, v in zip(pending, results, strict=False) if v is not None)
+            return found
+        if not config:
+            results = await client.mget(keys)
+            return {k: v for k, v in zip(keys, results, strict=False) if v is not None}
+
+        # Stampede filtering: MGET plus one TTL per key in a single
+        # non-transactional pipeline, so the check costs no extra round trip.
+        pipe = client.pipeline(transaction=False)
+        pipe.mget(keys)
+        for k in keys:
+            pipe.ttl(k)
+        results, *ttls = await pipe.execute()
+        return filter_fresh(keys, results, ttls, config)
 
     def has_key(self, key: str) -> bool:
         """Check if a key exists."""
@@ -696,12 +1078,16 @@ class ValkeyPyAdapter(RespAdapterProtocol):
     def incr(self, key: str, delta: int = 1) -> int:
         """Increment a value."""
         client = self.get_client(key, write=True)
-        return client.incr(key, delta)
+        result = client.incr(key, delta)
+        self._forget(key)
+        return result
 
     async def aincr(self, key: str, delta: int = 1) -> int:
         """Increment a value asynchronously."""
         client = await self.get_async_client(key, write=True)
-        return await client.incr(key, delta)
+        result = await client.incr(key, delta)
+        self._forget(key)
+        return result
 
     def set_many(
         self,
@@ -722,12 +1108,20 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             client.delete(*prepared.keys())
         elif actual_timeout is None:
             client.mset(prepared)
+        elif not self._atomic_set_many:
+            # One SET EX per key: 1 command per key instead of 1 + N inside MULTI,
+            # and each key is written with its TTL atomically.
+            pipe = client.pipeline(transaction=False)
+            for key, value in prepared.items():
+                pipe.set(key, value, ex=actual_timeout)
+            pipe.execute()
         else:
             pipe = client.pipeline()
             pipe.mset(prepared)
             for key in prepared:
                 pipe.expire(key, actual_timeout)
             pipe.execute()
+        self._forget(*prepared)
         return []
 
     async def aset_many(
@@ -749,12 +1143,20 @@ class ValkeyPyAdapter(RespAdapterProtocol):
             await client.delete(*prepared.keys())
         elif actual_timeout is None:
             await client.mset(prepared)
+        elif not self._atomic_set_many:
+            # One SET EX per key: 1 command per key instead of 1 + N inside MULTI,
+            # and each key is written with its TTL atomically.
+            pipe = client.pipeline(transaction=False)
+            for key, value in prepared.items():
+                pipe.set(key, value, ex=actual_timeout)
+            await pipe.execute()
         else:
             pipe = client.pipeline()
             pipe.mset(prepared)
             for key in prepared:
                 pipe.expire(key, actual_timeout)
             await pipe.execute()
+        self._forget(*prepared)
         return []
 
     def delete_many(self, keys: Sequence[str]) -> int:
@@ -764,7 +1166,9 @@ class ValkeyPyAdapter(RespAdapterProtocol):
 
         client = self.get_client(write=True)
 
-        return client.delete(*keys)
+        result = client.delete(*keys)
+        self._forget(*keys)
+        return result
 
     async def adelete_many(self, keys: Sequence[str]) -> int:
         """Remove multiple keys asynchronously."""
@@ -773,19 +1177,27 @@ class ValkeyPyAdapter(RespAdapterProtocol):
 
         client = await self.get_async_client(write=True)
 
-        return await client.delete(*keys)
+        result = await client.delete(*keys)
+        self._forget(*keys)
+        return result
 
     def clear(self) -> bool:
         """Flush the database."""
         client = self.get_client(write=True)
 
-        return bool(client.flushdb())
+        result = bool(client.flushdb())
+        if (near := self._near_cache()) is not None:
+            near.flush()
+        return result
 
     async def aclear(self) -> bool:
         """Flush the database asynchronously."""
         client = await self.get_async_client(write=True)
 
-        return bool(await client.flushdb())
+        result = bool(await client.flushdb())
+        if (near := self._near_cache()) is not None:
+            near.flush()
+        return result
 
     # =========================================================================
     # Extended Operations (beyond Django's BaseCache)
@@ -950,17 +1362,84 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         decoded_keys = [k.decode() if isinstance(k, bytes) else k for k in keys]
         return next_cursor, decoded_keys
 
-    def delete_pattern(self, pattern: str, itersize: int | None = None) -> int:
-        """Delete all keys matching pattern (already prefixed)."""
+    def delete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Delete all keys matching pattern (already prefixed).
+
+        ``progress`` is called with the running count of deleted keys after
+        every batch.
+        """
         client = self.get_client(write=True)
 
         if itersize is None:
             itersize = self._default_scan_itersize
 
+        try:
+            if self._scripted_delete_pattern:
+                return self._delete_pattern_scripted(client, pattern, itersize, progress)
+            count = 0
+            for batch in batched(client.scan_iter(match=pattern, count=itersize), itersize, strict=False):
+                count += cast("int", client.delete(*batch))
+                if progress is not None:
+                    progress(count)
+            return count
+        finally:
+            self._forget_matching(pattern)
+
+    def _delete_pattern_scripted(
+        self,
+        client: Any,
+        pattern: str,
+        itersize: int,
+        progress: Callable[[int], None] | None,
+    ) -> int:
+        """``delete_pattern()`` as server-side SCAN + UNLINK steps, one Lua call per page."""
+        count = 0
+        cursor = 0
+        while True:
+            cursor, unlinked = _delete_pattern_step(
+                client,
+                _DELETE_PATTERN_STEP,
+                self._lib.exceptions.NoScriptError,
+                cursor,
+                pattern,
+                itersize,
+            )
+            count += unlinked
+            if progress is not None:
+                progress(count)
+            if cursor == 0:
+                return count
+
+    async def _adelete_pattern_scripted(
+        self,
+        client: Any,
+        pattern: str,
+        itersize: int,
+        progress: Callable[[int], None] | None,
+    ) -> int:
+        """Async twin of ``_delete_pattern_scripted``."""
         count = 0
-        for batch in batched(client.scan_iter(match=pattern, count=itersize), itersize, strict=False):
-            count += cast("int", client.delete(*batch))
-        return count
+        cursor = 0
+        while True:
+            cursor, unlinked = await _adelete_pattern_step(
+                client,
+                _DELETE_PATTERN_STEP,
+                self._lib.exceptions.NoScriptError,
+                cursor,
+                pattern,
+                itersize,
+            )
+            count += unlinked
+            if progress is not None:
+                progress(count)
+            if cursor == 0:
+                return count
 
     def rename(self, src: str, dst: str) -> bool:
         """Rename a key."""
@@ -974,6 +1453,7 @@ class ValkeyPyAdapter(RespAdapterProtocol):
                 raise ValueError(f"Key {src!r} not found") from e
             raise
         else:
+            self._forget(src, dst)
             return True
 
     def renamenx(self, src: str, dst: str) -> bool:
@@ -981,12 +1461,15 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         client = self.get_client(src, write=True)
 
         try:
-            return bool(client.renamenx(src, dst))
+            renamed = bool(client.renamenx(src, dst))
         except _main_exceptions as e:
             err_msg = str(e).lower()
             if "no such key" in err_msg:
                 raise ValueError(f"Key {src!r} not found") from e
             raise
+        if renamed:
+            self._forget(src, dst)
+        return renamed
 
     async def akeys(self, pattern: str) -> list[str]:
         """Get all keys matching pattern (already prefixed) asynchronously."""
@@ -1005,23 +1488,38 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         async for item in client.scan_iter(match=pattern, count=itersize):
             yield item.decode() if isinstance(item, bytes) else item
 
-    async def adelete_pattern(self, pattern: str, itersize: int | None = None) -> int:
+    async def adelete_pattern(
+        self,
+        pattern: str,
+        itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
         """Delete all keys matching pattern (already prefixed) asynchronously."""
         client = await self.get_async_client(write=True)
 
         if itersize is None:
             itersize = self._default_scan_itersize
 
-        count = 0
-        batch: list[Any] = []
-        async for key in client.scan_iter(match=pattern, count=itersize):
-            batch.append(key)
-            if len(batch) >= itersize:
+        try:
+            if self._scripted_delete_pattern:
+                return await self._adelete_pattern_scripted(client, pattern, itersize, progress)
+            count = 0
+            batch: list[Any] = []
+            async for key in client.scan_iter(match=pattern, count=itersize):
+                batch.append(key)
+                if len(batch) >= itersize:
+                    count += cast("int", await client.delete(*batch))
+                    batch.clear()
+                    if progress is not None:
+                        progress(count)
+            if batch:
                 count += cast("int", await client.delete(*batch))
-                batch.clear()
-        if batch:
-            count += cast("int", await client.delete(*batch))
-        return count
+                if progress is not None:
+                    progress(count)
+            return count
+        finally:
+            self._forget_matching(pattern)
 
     async def arename(self, src: str, dst: str) -> bool:
         """Rename a key asynchronously."""
@@ -1035,6 +1533,7 @@ class ValkeyPyAdapter(RespAdapterProtocol):
                 raise ValueError(f"Key {src!r} not found") from e
             raise
         else:
+            self._forget(src, dst)
             return True
 
     async def arenamenx(self, src: str, dst: str) -> bool:
@@ -1042,12 +1541,15 @@ class ValkeyPyAdapter(RespAdapterProtocol):
         client = await self.get_async_client(src, write=True)
 
         try:
-            return bool(await client.renamenx(src, dst))
+            renamed = bool(await client.renamenx(src, dst))
         except _main_exceptions as e:
             err_msg = str(e).lower()
             if "no such key" in err_msg:
                 raise ValueError(f"Key {src!r} not found") from e
             raise
+        if renamed:
+            self._forget(src, dst)
+        return renamed
 
     def lock(
         self,
@@ -1128,12 +1630,24 @@ class ValkeyPyAdapter(RespAdapterProtocol):
     # =========================================================================
 
     def info(self, section: str | None = None) -> dict[str, Any]:
-        """Get server information and statistics."""
+        """Get server information and statistics.
+
+        With ``client_tracking`` on, the unfiltered result also carries the
+        near-cache counters under ``"client_tracking"``; with ``read_routing``
+        on, the per-server latency stats under ``"read_routing"``. Connection
+        pool gauges are always included under ``"pools"``.
+        """
         client = self.get_client(write=False)
 
         if section:
             return dict(client.info(section))
-        return dict(client.info())
+        result = dict(client.info())
+        if (near := self._near_cache()) is not None:
+            result["client_tracking"] = near.stats()
+        if (router := self._router()) is not None:
+            result["read_routing"] = router.stats()
+        result["pools"] = self.pool_stats()
+        return result
 
     def slowlog_get(self, count: int = 10) -> list[dict[str, Any]]:
         """Get slow query log entries with decoded bytes."""
@@ -3086,9 +3600,10 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
         return service_name, is_master, clean_url
 
     @override
-    def _get_connection_pool(self, *, write: bool) -> ConnectionPool:
+    def _get_connection_pool(self, *, write: bool, index: int | None = None) -> ConnectionPool:
         """Get a sentinel-managed connection pool."""
-        index = self._get_connection_pool_index(write=write)
+        if index is None:
+            index = self._get_connection_pool_index(write=write)
 
         if index in self._pools:
             return self._pools[index]
@@ -3106,8 +3621,10 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
         if self._sentinel_pool_class is None:
             msg = "Subclasses must set _sentinel_pool_class"
             raise RuntimeError(msg)
-        pool = self._sentinel_pool_class.from_url(clean_url, **pool_options)
+        pool = instrument_pool(self._sentinel_pool_class.from_url(clean_url, **pool_options))
         self._pools[index] = pool
+        if self._pool_warmup:
+            warm_new_pool(pool, self._pool_warmup)
 
         return pool
 
@@ -3140,7 +3657,7 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
         return async_sentinel
 
     @override
-    def _get_async_connection_pool(self, *, write: bool) -> Any:
+    def _get_async_connection_pool(self, *, write: bool, index: int | None = None) -> Any:
         """Get an async sentinel-managed connection pool, shared process-wide.
 
         Uses the same ``_async_pools`` registry (driver-specific class
@@ -3149,7 +3666,8 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
         ``RespAdapterProtocol._get_async_connection_pool`` for the rationale.
         """
         loop = asyncio.get_running_loop()
-        index = self._get_connection_pool_index(write=write)
+        if index is None:
+            index = self._get_connection_pool_index(write=write)
 
         if self._async_sentinel_pool_class is None:
             msg = "Subclasses must set _async_sentinel_pool_class"
@@ -3164,19 +3682,7 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
             else {}
         )
 
-        # The key must be stable across adapter instances (asgiref hands each
-        # task a fresh one), so the fleet stands in for its sentinel manager.
-        sentinels = self._options.get("sentinels") or ()
-        key = (
-            self._async_sentinel_pool_class,
-            clean_url,
-            service_name,
-            is_master,
-            tuple(tuple(entry) for entry in sentinels),
-            _options_key(self._options.get("sentinel_kwargs") or {}),
-            _options_key(pool_options),
-            index,
-        )
+        key = self._async_pool_key(index)
 
         sub = self._async_pools.get(loop)
         if sub is None:
@@ -3192,9 +3698,30 @@ class ValkeyPySentinelAdapter(ValkeyPyAdapter):
                 is_master=is_master,
                 **pool_options,
             )
+            instrument_pool(pool)
             sub[key] = pool
+            if self._pool_warmup:
+                schedule_warmup(pool, self._pool_warmup)
         return pool
 
+    @override
+    def _async_pool_key(self, index: int) -> tuple[Any, ...]:
+        service_name, is_master, clean_url = self._parse_sentinel_url(index)
+        pool_options = {k: v for k, v in self._pool_options.items() if k != "parser_class"}
+        # The key must be stable across adapter instances (asgiref hands each
+        # task a fresh one), so the fleet stands in for its sentinel manager.
+        sentinels = self._options.get("sentinels") or ()
+        return (
+            self._async_sentinel_pool_class,
+            clean_url,
+            service_name,
+            is_master,
+            tuple(tuple(entry) for entry in sentinels),
+            _options_key(self._options.get("sentinel_kwargs") or {}),
+            _options_key(pool_options),
+            index,
+        )
+
 
 class ValkeyPyClusterAdapter(ValkeyPyAdapter):
     """Cluster cache client base class.
@@ -3212,6 +3739,9 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
     # per call (see ``ValkeyPyAdapter._per_call_clients``).
     _per_call_clients: bool = False
 
+    _supports_client_tracking: bool = False
+    _supports_read_routing: bool = False
+
     # Subclasses must set these
     _cluster_class: builtins.type[Any] | None = None
     _async_cluster_class: builtins.type[Any] | None = None
@@ -3224,11 +3754,24 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
     _clusters_lock: threading.Lock = _VALKEY_CLUSTERS_LOCK
     _async_clusters: AsyncClusterRegistry = _VALKEY_ASYNC_CLUSTERS
 
+    # Commands per node sent in one round trip by cluster pipelines
+    # (``OPTIONS["pipeline_max_commands"]``); ``None`` sends a node's whole
+    # bucket at once.
+    _pipeline_max_commands: int | None = None
+
     if _VALKEY_AVAILABLE:
         _cluster_class = ValkeyCluster
         _async_cluster_class = AsyncValkeyCluster
         _key_slot_func = staticmethod(valkey_key_slot)
 
+    def __init__(self, servers: list[str], **options: Any) -> None:
+        super().__init__(servers, **options)
+        max_commands = options.get("pipeline_max_commands")
+        if max_commands is not None and (type(max_commands) is not int or max_commands <= 0):
+            msg = f"pipeline_max_commands must be a positive integer, got {max_commands!r}"
+            raise ImproperlyConfigured(msg)
+        self._pipeline_max_commands = max_commands
+
     @property
     def _cluster(self) -> builtins.type[Any]:
         """Get the cluster class, asserting it's configured."""
@@ -3287,6 +3830,28 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
             sub[cache_key] = cluster
         return _install_wrongtype_translation(cluster)
 
+    def _node_pools(self) -> list[tuple[str, Any]]:
+        """``(node name, connection pool)`` for every node the sync cluster client knows."""
+        return [
+            (node.name, node.redis_connection.connection_pool)
+            for node in self.get_client().get_nodes()
+            if node.redis_connection is not None
+        ]
+
+    @override
+    def warm_up(self, connections: int | None = None) -> int:
+        """Open ``connections`` connections to every node of the sync cluster client."""
+        n = (self._pool_warmup or 1) if connections is None else connections
+        return sum(warm_pool(instrument_pool(pool), n) for _name, pool in self._node_pools())
+
+    @override
+    async def awarm_up(self, connections: int | None = None) -> int:
+        raise NotSupportedError("awarm_up", backend="cluster")
+
+    @override
+    def pool_stats(self) -> list[dict[str, Any]]:
+        return [{"server": name, "mode": "sync", **pool_stats(pool)} for name, pool in self._node_pools()]
+
     def _group_keys_by_slot(self, keys: Iterable[str]) -> dict[int, list[str]]:
         """Group keys by their cluster slot."""
         slots: dict[int, list[str]] = defaultdict(list)
@@ -3296,6 +3861,70 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
             slots[slot].append(key)
         return dict(slots)
 
+    def _group_keys_by_node(self, client: Any, keys: Iterable[str]) -> dict[str, list[list[str]]]:
+        """Group keys by slot, then the slot groups by the node serving them."""
+        nodes: dict[str, list[list[str]]] = defaultdict(list)
+        for slot_keys in self._group_keys_by_slot(keys).values():
+            nodes[client.get_node_from_key(slot_keys[0]).name].append(slot_keys)
+        return dict(nodes)
+
+    def _fan_out(
+        self,
+        client: Any,
+        batches: dict[str, list[list[str]]],
+        queue: QueueSlot,
+    ) -> tuple[dict[str, list[Any]], dict[str, Exception]]:
+        """Run every node's batch as one pipeline, the nodes concurrently.
+
+        Returns the replies of the nodes that succeeded and the errors of
+        those that failed. If every node failed, the first error is raised
+        as-is.
+        """
+        if len(batches) == 1:
+            [(name, slot_groups)] = batches.items()
+            return {name: _run_node_batch(client, slot_groups, queue)}, {}
+        executor = _FANOUT_POOL.executor()
+        futures = {
+            name: executor.submit(_run_node_batch, client, slot_groups, queue) for name, slot_groups in batches.items()
+        }
+        replies: dict[str, list[Any]] = {}
+        errors: dict[str, Exception] = {}
+        for name, future in futures.items():
+            try:
+                replies[name] = future.result()
+            except _main_exceptions as e:
+                errors[name] = e
+        if errors and not replies:
+            raise next(iter(errors.values()))
+        return replies, errors
+
+    async def _afan_out(
+        self,
+        client: Any,
+        batches: dict[str, list[list[str]]],
+        queue: QueueSlot,
+    ) -> tuple[dict[str, list[Any]], dict[str, Exception]]:
+        """Async twin of ``_fan_out``: the node pipelines are gathered on the loop."""
+        if len(batches) == 1:
+            [(name, slot_groups)] = batches.items()
+            return {name: await _arun_node_batch(client, slot_groups, queue)}, {}
+        results = await asyncio.gather(
+            *(_arun_node_batch(client, slot_groups, queue) for slot_groups in batches.values()),
+            return_exceptions=True,
+        )
+        replies: dict[str, list[Any]] = {}
+        errors: dict[str, Exception] = {}
+        for name, result in zip(batches, results, strict=True):
+            if isinstance(result, _main_exceptions):
+                errors[name] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                replies[name] = result
+        if errors and not replies:
+            raise next(iter(errors.values()))
+        return replies, errors
+
     # Override methods that need cluster-specific handling
 
     @override
@@ -3311,30 +3940,25 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
             return {}
 
         client = self.get_client(write=False)
-        # mget_nonatomic handles slot splitting
-        results = cast(
-            "list[bytes | None]",
-            client.mget_nonatomic(keys),
-        )
-
-        # Collect non-None results
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
-        # Stampede filtering: pipeline TTL for found keys with bytes values
-        # (integers bypass stampede, matching the standalone get_many path).
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                pipe = client.pipeline()
-                for k in stampede_keys:
-                    pipe.ttl(k)
-                ttls = pipe.execute()
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config:
+            # One MGET per slot, one pipeline per node, nodes in parallel.
+            batches = self._group_keys_by_node(client, keys)
+            replies, errors = self._fan_out(client, batches, _queue_mget)
+            found = _found_values(batches, replies)
+            if errors:
+                raise _fanout_error(batches, errors, found)
+            return {k: found[k] for k in keys if k in found}
+
+        # Stampede filtering: GET+TTL per key through the cluster pipeline,
+        # which groups commands by node -- one round trip per node instead
+        # of an MGET pass followed by a TTL pass.
+        pipe = client.pipeline()
+        for k in keys:
+            pipe.get(k)
+            pipe.ttl(k)
+        replies = pipe.execute()
+        return filter_fresh(keys, replies[0::2], replies[1::2], config)
 
     @override
     def set_many(
@@ -3355,19 +3979,16 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
 
         if actual_timeout == 0:
             # timeout=0 means "delete immediately" (matches base client behavior)
-            for slot_keys in self._group_keys_by_slot(prepared_data.keys()).values():
-                client.delete(*slot_keys)
-        elif actual_timeout is None:
-            # No expiry
-            client.mset_nonatomic(prepared_data)
+            queue: QueueSlot = _queue_delete
         else:
-            # Use SET with PX per key in a pipeline so each key is set
-            # atomically with its TTL (no window where keys exist without expiry)
-            timeout_ms = int(actual_timeout * 1000)
-            pipe = client.pipeline()
-            for key, value in prepared_data.items():
-                pipe.set(key, value, px=timeout_ms)
-            pipe.execute()
+            # SET PX per key so each key is set atomically with its TTL (no
+            # window where keys exist without expiry); MSET per slot otherwise.
+            timeout_ms = None if actual_timeout is None else int(actual_timeout * 1000)
+            queue = _queue_set(prepared_data, timeout_ms)
+        batches = self._group_keys_by_node(client, prepared_data)
+        _replies, errors = self._fan_out(client, batches, queue)
+        if errors:
+            raise _fanout_error(batches, errors, None)
         return []
 
     @override
@@ -3378,12 +3999,12 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
 
         client = self.get_client(write=True)
 
-        # Group keys by slot
-        slots = self._group_keys_by_slot(keys)
-
-        total_deleted = 0
-        for slot_keys in slots.values():
-            total_deleted += cast("int", client.delete(*slot_keys))
+        # One DEL per slot, one pipeline per node, nodes in parallel.
+        batches = self._group_keys_by_node(client, keys)
+        replies, errors = self._fan_out(client, batches, _queue_delete)
+        total_deleted = sum(sum(node_replies) for node_replies in replies.values())
+        if errors:
+            raise _fanout_error(batches, errors, total_deleted)
         return total_deleted
 
     @override
@@ -3430,13 +4051,21 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
         self,
         pattern: str,
         itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
     ) -> int:
-        """Remove all keys matching pattern across all primary nodes (pattern is already prefixed)."""
+        """Remove all keys matching pattern across all primary nodes (pattern is already prefixed).
+
+        With ``scripted_delete_pattern``, every primary runs its own SCAN +
+        UNLINK steps; the steps of one round run on all primaries in parallel.
+        """
         client = self.get_client(write=True)
 
         if itersize is None:
             itersize = self._default_scan_itersize
 
+        if self._scripted_delete_pattern:
+            return self._delete_pattern_scripted(client, pattern, itersize, progress)
         total_deleted = 0
         for batch in batched(
             client.scan_iter(
@@ -3449,6 +4078,85 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
         ):
             for slot_keys in self._group_keys_by_slot(batch).values():
                 total_deleted += cast("int", client.delete(*slot_keys))
+            if progress is not None:
+                progress(total_deleted)
+        return total_deleted
+
+    @override
+    def _delete_pattern_scripted(
+        self,
+        client: Any,
+        pattern: str,
+        itersize: int,
+        progress: Callable[[int], None] | None,
+    ) -> int:
+        """Run the SCAN + UNLINK steps on every primary, one step per primary per round in parallel."""
+        # Keyed by name: cluster node objects aren't hashable.
+        nodes = {node.name: node for node in client.get_primaries()}
+        cursors = dict.fromkeys(nodes, 0)
+        executor = _FANOUT_POOL.executor()
+        total_deleted = 0
+        while cursors:
+            futures = {
+                name: executor.submit(
+                    _delete_pattern_step,
+                    client,
+                    _CLUSTER_DELETE_PATTERN_STEP,
+                    self._lib.exceptions.NoScriptError,
+                    cursor,
+                    pattern,
+                    itersize,
+                    target_nodes=nodes[name],
+                )
+                for name, cursor in cursors.items()
+            }
+            for name, future in futures.items():
+                cursor, unlinked = future.result()
+                total_deleted += unlinked
+                if cursor == 0:
+                    del cursors[name]
+                else:
+                    cursors[name] = cursor
+            if progress is not None:
+                progress(total_deleted)
+        return total_deleted
+
+    @override
+    async def _adelete_pattern_scripted(
+        self,
+        client: Any,
+        pattern: str,
+        itersize: int,
+        progress: Callable[[int], None] | None,
+    ) -> int:
+        """Async twin of ``_delete_pattern_scripted``: each round's steps are gathered."""
+        await client.initialize()
+        nodes = {node.name: node for node in client.get_primaries()}
+        cursors = dict.fromkeys(nodes, 0)
+        total_deleted = 0
+        while cursors:
+            steps = await asyncio.gather(
+                *(
+                    _adelete_pattern_step(
+                        client,
+                        _CLUSTER_DELETE_PATTERN_STEP,
+                        self._lib.exceptions.NoScriptError,
+                        cursor,
+                        pattern,
+                        itersize,
+                        target_nodes=nodes[name],
+                    )
+                    for name, cursor in cursors.items()
+                ),
+            )
+            for name, (cursor, unlinked) in zip(list(cursors), steps, strict=True):
+                total_deleted += unlinked
+                if cursor == 0:
+                    del cursors[name]
+                else:
+                    cursors[name] = cursor
+            if progress is not None:
+                progress(total_deleted)
         return total_deleted
 
     @override
@@ -3484,31 +4192,26 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
             return {}
 
         client = await self.get_async_client(write=False)
-
-        # mget_nonatomic handles slot splitting
-        results = cast(
-            "list[bytes | None]",
-            await client.mget_nonatomic(keys),
-        )
-
-        # Collect non-None results
-        found = {k: v for k, v in zip(keys, results, strict=False) if v is not None}
-
-        # Stampede filtering: pipeline TTL for found keys with bytes values
-        # (integers bypass stampede, matching the standalone aget_many path).
         config = self.resolve_stampede(stampede_prevention)
-        if config and found:
-            stampede_keys = [k for k, v in found.items() if isinstance(v, bytes)]
-            if stampede_keys:
-                pipe = client.pipeline()
-                for k in stampede_keys:
-                    pipe.ttl(k)
-                ttls = await pipe.execute()
-                for k, ttl in zip(stampede_keys, ttls, strict=False):
-                    if isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
-                        del found[k]
-
-        return dict(found.items())
+        if not config:
+            # One MGET per slot, one pipeline per node, nodes gathered.
+            await client.initialize()
+            batches = self._group_keys_by_node(client, keys)
+            replies, errors = await self._afan_out(client, batches, _queue_mget)
+            found = _found_values(batches, replies)
+            if errors:
+                raise _fanout_error(batches, errors, found)
+            return {k: found[k] for k in keys if k in found}
+
+        # Stampede filtering: GET+TTL per key through the cluster pipeline,
+        # which groups commands by node -- one round trip per node instead
+        # of an MGET pass followed by a TTL pass.
+        pipe = client.pipeline()
+        for k in keys:
+            pipe.get(k)
+            pipe.ttl(k)
+        replies = await pipe.execute()
+        return filter_fresh(keys, replies[0::2], replies[1::2], config)
 
     @override
     async def aset_many(
@@ -3529,19 +4232,17 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
 
         if actual_timeout == 0:
             # timeout=0 means "delete immediately" (matches base client behavior)
-            for slot_keys in self._group_keys_by_slot(prepared_data.keys()).values():
-                await client.delete(*slot_keys)
-        elif actual_timeout is None:
-            # No expiry
-            await client.mset_nonatomic(prepared_data)
+            queue: QueueSlot = _queue_delete
         else:
-            # Use SET with PX per key in a pipeline so each key is set
-            # atomically with its TTL (no window where keys exist without expiry)
-            timeout_ms = int(actual_timeout * 1000)
-            pipe = client.pipeline()
-            for key, value in prepared_data.items():
-                pipe.set(key, value, px=timeout_ms)
-            await pipe.execute()
+            # SET PX per key so each key is set atomically with its TTL (no
+            # window where keys exist without expiry); MSET per slot otherwise.
+            timeout_ms = None if actual_timeout is None else int(actual_timeout * 1000)
+            queue = _queue_set(prepared_data, timeout_ms)
+        await client.initialize()
+        batches = self._group_keys_by_node(client, prepared_data)
+        _replies, errors = await self._afan_out(client, batches, queue)
+        if errors:
+            raise _fanout_error(batches, errors, None)
         return []
 
     @override
@@ -3552,12 +4253,13 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
 
         client = await self.get_async_client(write=True)
 
-        # Group keys by slot
-        slots = self._group_keys_by_slot(keys)
-
-        total_deleted = 0
-        for slot_keys in slots.values():
-            total_deleted += cast("int", await client.delete(*slot_keys))
+        # One DEL per slot, one pipeline per node, nodes gathered.
+        await client.initialize()
+        batches = self._group_keys_by_node(client, keys)
+        replies, errors = await self._afan_out(client, batches, _queue_delete)
+        total_deleted = sum(sum(node_replies) for node_replies in replies.values())
+        if errors:
+            raise _fanout_error(batches, errors, total_deleted)
         return total_deleted
 
     @override
@@ -3604,6 +4306,8 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
         self,
         pattern: str,
         itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
     ) -> int:
         """Remove all keys matching pattern asynchronously across all primary nodes."""
         client = await self.get_async_client(write=True)
@@ -3611,6 +4315,8 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
         if itersize is None:
             itersize = self._default_scan_itersize
 
+        if self._scripted_delete_pattern:
+            return await self._adelete_pattern_scripted(client, pattern, itersize, progress)
         total_deleted = 0
         batch: list[Any] = []
         async for key in client.scan_iter(
@@ -3623,9 +4329,13 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
                 for slot_keys in self._group_keys_by_slot(batch).values():
                     total_deleted += cast("int", await client.delete(*slot_keys))
                 batch.clear()
+                if progress is not None:
+                    progress(total_deleted)
         if batch:
             for slot_keys in self._group_keys_by_slot(batch).values():
                 total_deleted += cast("int", await client.delete(*slot_keys))
+            if progress is not None:
+                progress(total_deleted)
         return total_deleted
 
     @override
@@ -3644,16 +4354,16 @@ class ValkeyPyClusterAdapter(ValkeyPyAdapter):
         """No-op. Cluster lives for the instance's lifetime (matches Django's BaseCache)."""
 
     @override
-    def pipeline(self, *, transaction: bool = True) -> ValkeyPyPipelineAdapter:
-        """Construct a cluster pipeline adapter. Transactions are ignored in cluster mode."""
+    def pipeline(self, *, transaction: bool = True) -> ValkeyPyClusterPipelineAdapter:
+        """Construct a slot-aware cluster pipeline adapter. Transactions are ignored in cluster mode."""
         client = self.get_client(write=True)
-        return ValkeyPyPipelineAdapter(client.pipeline(transaction=False))
+        return ValkeyPyClusterPipelineAdapter(client, self._pipeline_max_commands)
 
     @override
-    async def apipeline(self, *, transaction: bool = True) -> ValkeyPyAsyncPipelineAdapter:
-        """Construct an async cluster pipeline adapter. ``ClusterPipeline`` doesn't use MULTI/EXEC."""
+    async def apipeline(self, *, transaction: bool = True) -> ValkeyPyAsyncClusterPipelineAdapter:
+        """Construct an async slot-aware cluster pipeline adapter. ``ClusterPipeline`` doesn't use MULTI/EXEC."""
         client = await self.get_async_client(write=True)
-        return ValkeyPyAsyncPipelineAdapter(client.pipeline(transaction=False))
+        return ValkeyPyAsyncClusterPipelineAdapter(client, self._pipeline_max_commands)
 
 
 class ValkeyPyPipelineAdapter(RespPipelineProtocol):
@@ -4237,12 +4947,169 @@ class ValkeyPyAsyncPipelineAdapter(ValkeyPyPipelineAdapter, RespAsyncPipelinePro
         self._raw._command_stack = []
 
 
+# A queued cluster pipeline command: its arguments and driver options.
+type QueuedCommand = tuple[tuple[Any, ...], dict[str, Any]]
+
+
+def _command_key(args: tuple[Any, ...]) -> Any:
+    """The key a queued command is routed by, or ``None`` if it has none."""
+    command = str(args[0]).upper()
+    if command in ("EVAL", "EVALSHA"):
+        return args[3] if int(args[2]) else None
+    return args[1] if len(args) > 1 else None
+
+
+def _flush_batches(commands: list[QueuedCommand], max_commands: int | None) -> list[list[QueuedCommand]]:
+    return [list(batch) for batch in batched(commands, max_commands or len(commands), strict=False)]
+
+
+def _flush_bucket(client: Any, commands: list[QueuedCommand], max_commands: int | None) -> list[Any]:
+    """Send one node's commands as cluster pipelines of at most ``max_commands``, in order."""
+    replies: list[Any] = []
+    for batch in _flush_batches(commands, max_commands):
+        pipe = client.pipeline(transaction=False)
+        for args, options in batch:
+            pipe.execute_command(*args, **options)
+        try:
+            replies.extend(pipe.execute(raise_on_error=False))
+        except _main_exceptions as e:
+            replies.extend([e] * len(batch))
+    return replies
+
+
+async def _aflush_bucket(client: Any, commands: list[QueuedCommand], max_commands: int | None) -> list[Any]:
+    """Async twin of ``_flush_bucket``."""
+    replies: list[Any] = []
+    for batch in _flush_batches(commands, max_commands):
+        pipe = client.pipeline(transaction=False)
+        for args, options in batch:
+            pipe.execute_command(*args, **options)
+        try:
+            replies.extend(await pipe.execute(raise_on_error=False))
+        except _main_exceptions as e:
+            replies.extend([e] * len(batch))
+    return replies
+
+
+class ValkeyPyClusterPipelineAdapter(ValkeyPyPipelineAdapter):
+    """Slot-aware pipeline adapter for cluster clients.
+
+    Commands are recorded as they are queued: the driver pipeline still
+    builds each command's arguments, but its ``execute_command`` is swapped
+    for a recorder. ``execute()`` buckets the commands by the node serving
+    their key and sends every bucket as driver cluster pipelines of at most
+    ``max_commands`` commands. The buckets run concurrently (on a thread
+    pool here, gathered on the loop in the async sibling), a bucket's
+    flushes in order; the driver pipelines follow MOVED/ASK redirects.
+    Replies come back in queue order, and the first failed command raises
+    once every bucket has finished, like the driver's own ``execute()``.
+    """
+
+    def __init__(self, client: Any, max_commands: int | None = None) -> None:
+        super().__init__(client.pipeline(transaction=False))
+        self._client = client
+        self._max_commands = max_commands
+        self._commands: list[QueuedCommand] = []
+        self._raw.execute_command = self._record
+
+    def _record(self, *args: Any, **options: Any) -> Any:
+        self._commands.append((args, options))
+        return self._raw
+
+    def _buckets(self) -> dict[str | None, list[int]]:
+        """Positions of the queued commands, grouped by node name (``None``: keyless)."""
+        buckets: dict[str | None, list[int]] = defaultdict(list)
+        nodes: dict[Any, str] = {}
+        for position, (args, _options) in enumerate(self._commands):
+            key = _command_key(args)
+            if key is None:
+                buckets[None].append(position)
+                continue
+            name = nodes.get(key)
+            if name is None:
+                name = nodes[key] = self._client.get_node_from_key(key).name
+            buckets[name].append(position)
+        return dict(buckets)
+
+    def _assemble(self, buckets: dict[str | None, list[int]], replies: list[list[Any]]) -> list[Any]:
+        results: list[Any] = [None] * len(self._commands)
+        for positions, bucket_replies in zip(buckets.values(), replies, strict=True):
+            for position, reply in zip(positions, bucket_replies, strict=True):
+                results[position] = reply
+        for reply in results:
+            if isinstance(reply, Exception):
+                raise reply
+        return results
+
+    def _bucket_commands(self, positions: list[int]) -> list[QueuedCommand]:
+        return [self._commands[position] for position in positions]
+
+    @override
+    def execute(self) -> list[Any]:
+        """Run every node's bucket, the nodes concurrently, and return the replies in queue order."""
+        try:
+            if not self._commands:
+                return []
+            buckets = self._buckets()
+            commands = [self._bucket_commands(positions) for positions in buckets.values()]
+            if len(commands) == 1:
+                replies = [_flush_bucket(self._client, commands[0], self._max_commands)]
+            else:
+                executor = _FANOUT_POOL.executor()
+                futures = [
+                    executor.submit(_flush_bucket, self._client, bucket, self._max_commands) for bucket in commands
+                ]
+                replies = [future.result() for future in futures]
+            return self._assemble(buckets, replies)
+        finally:
+            self._commands = []
+
+    @override
+    def reset(self) -> None:
+        """Discard any buffered commands without executing."""
+        self._commands = []
+
+    @override
+    def delete(self, *keys: Any) -> Any:
+        # The sync driver pipeline queues DEL past ``execute_command``.
+        return self._record("DEL", *keys)
+
+
+class ValkeyPyAsyncClusterPipelineAdapter(ValkeyPyClusterPipelineAdapter, RespAsyncPipelineProtocol):
+    """Async sibling of :class:`ValkeyPyClusterPipelineAdapter`; node buckets are gathered on the loop."""
+
+    @override
+    async def execute(self) -> list[Any]:  # type: ignore[override]
+        """Run every node's bucket concurrently and return the replies in queue order."""
+        try:
+            if not self._commands:
+                return []
+            await self._client.initialize()
+            buckets = self._buckets()
+            replies = await asyncio.gather(
+                *(
+                    _aflush_bucket(self._client, self._bucket_commands(positions), self._max_commands)
+                    for positions in buckets.values()
+                ),
+            )
+            return self._assemble(buckets, list(replies))
+        finally:
+            self._commands = []
+
+    @override
+    async def reset(self) -> None:  # type: ignore[override]
+        """Discard buffered commands."""
+        self._commands = []
+
+
 __all__ = [
     "_VALKEY_AVAILABLE",
     "AsyncPoolsRegistry",
     "ValkeyPyAdapter",
+    "ValkeyPyAsyncClusterPipelineAdapter",
     "ValkeyPyAsyncPipelineAdapter",
     "ValkeyPyClusterAdapter",
+    "ValkeyPyClusterPipelineAdapter",
     "ValkeyPyPipelineAdapter",
     "ValkeyPySentinelAdapter",
 ]
@@ -87,6 +87,31 @@ def _stats_rows(stats: Mapping[str, Any]) -> list[dict[str, Any]]:
     return [r for r in candidates if r is not None]
 
 
+def _pool_rows(pools: Any) -> list[dict[str, Any]]:
+    # ``info()["pools"]``: one dict of gauges per connection pool.
+    if not isinstance(pools, list):
+        return []
+    return [p for p in pools if isinstance(p, dict)]
+
+
+def _hot_key_rows(hot_keys: Any) -> list[dict[str, Any]]:
+    # ``info()["hot_keys"]``: top keys and prefixes per operation type.
+    if not isinstance(hot_keys, dict):
+        return []
+    rows = []
+    for op in ("read", "write"):
+        section = hot_keys.get(op)
+        if not isinstance(section, dict):
+            continue
+        for kind, label in (("keys", "key"), ("prefixes", "prefix")):
+            rows.extend(
+                {"op": op, "kind": label, "name": entry.get(label), "count": entry.get("count")}
+                for entry in section.get(kind) or ()
+                if isinstance(entry, dict)
+            )
+    return rows
+
+
 def get_cache(cache_name: str) -> Any:
     """Get a cache backend for admin use."""
     cache_config = settings.CACHES.get(cache_name)
@@ -122,6 +147,9 @@ def parse_metadata(
         "memory_rows": [],
         "clients_rows": [],
         "stats_rows": [],
+        "pool_rows": [],
+        "hot_key_rows": [],
+        "hot_key_sample_rate": None,
     }
 
     if not raw_info:
@@ -139,6 +167,10 @@ def parse_metadata(
         base_info["memory_rows"] = _memory_rows(_section("memory"))
         base_info["clients_rows"] = _clients_rows(_section("clients"))
         base_info["stats_rows"] = _stats_rows(_section("stats"))
+        base_info["pool_rows"] = _pool_rows(raw_info.get("pools"))
+        base_info["hot_key_rows"] = _hot_key_rows(raw_info.get("hot_keys"))
+        if base_info["hot_key_rows"]:
+            base_info["hot_key_sample_rate"] = raw_info["hot_keys"].get("sample_rate")
 
         # Keyspace stays nested (per-db cards in the template).
         if isinstance(raw_info.get("keyspace"), dict):
@@ -0,0 +1,86 @@
+"""Train a zstd dictionary from the values stored in a cache."""
+
+from compression import zstd
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from django_cachex.cache import RespCache
+
+# zstd needs a few samples per dictionary entry to find anything worth sharing.
+MIN_SAMPLES = 10
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Sample values from a cache and train a zstd dictionary for "
+        "ZstdCompressor(dictionaries=[...]). Values are serialized the way "
+        "the cache writes them, before compression."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("alias", help="Cache alias to sample from.")
+        parser.add_argument("output", help="File the dictionary is written to.")
+        parser.add_argument("--pattern", default="*", help="Key pattern to sample (default: all keys).")
+        parser.add_argument("--samples", type=int, default=5_000, help="Maximum number of values to sample.")
+        parser.add_argument("--size", type=int, default=110 * 1024, help="Dictionary size in bytes.")
+        parser.add_argument(
+            "--max-value-size",
+            type=int,
+            default=16 * 1024,
+            help="Skip serialized values larger than this; big values compress well without a dictionary.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            cache = caches[options["alias"]]
+        except InvalidCacheBackendError as e:
+            raise CommandError(str(e)) from e
+        if not isinstance(cache, RespCache):
+            msg = f"Cache {options['alias']!r} is a {type(cache).__name__}, not a django-cachex Redis/Valkey cache"
+            raise CommandError(msg)
+
+        samples = self._sample(cache, options["pattern"], options["samples"], options["max_value_size"])
+        if len(samples) < MIN_SAMPLES:
+            msg = f"Found {len(samples)} usable values matching {options['pattern']!r}; need at least {MIN_SAMPLES}"
+            raise CommandError(msg)
+        try:
+            dictionary = zstd.train_dict(samples, options["size"])
+        except zstd.ZstdError as e:
+            msg = f"Training failed: {e}"
+            raise CommandError(msg) from e
+
+        Path(options["output"]).write_bytes(dictionary.dict_content)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote dictionary {dictionary.dict_id} ({len(dictionary.dict_content)} bytes, "
+                f"trained on {len(samples)} values) to {options['output']}",
+            ),
+        )
+        self.stdout.write(f'Use it with: ZstdCompressor(dictionaries=["{options["output"]}"])')
+
+    @staticmethod
+    def _sample(cache: RespCache, pattern: str, limit: int, max_size: int) -> list[bytes]:
+        serializer = cache._serializers[0]
+        raw = cache._raw_passthrough
+        samples: list[bytes] = []
+        keys = cache.iter_keys(pattern)
+        while len(samples) < limit and (batch := list(islice(keys, BATCH_SIZE))):
+            for value in cache.get_many(batch).values():
+                kind = type(value)
+                if kind is int:
+                    # Stored as plain integers, never compressed.
+                    continue
+                if raw and kind is bytes:
+                    data = value
+                elif raw and kind is str:
+                    data = value.encode()
+                else:
+                    data = serializer.dumps(value)
+                if len(data) <= max_size:
+                    samples.append(data)
+        return samples[:limit]
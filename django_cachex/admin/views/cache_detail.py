@@ -113,6 +113,12 @@ def _cache_detail_view(
     except Exception as e:  # noqa: BLE001
         messages.error(request, f"Error retrieving slow log: {e!s}")
 
+    # Client-side per-command metrics (``OPTIONS["metrics"]``); ``None`` when off.
+    command_metrics = None
+    metrics = getattr(cache, "metrics", None)
+    if callable(metrics):
+        command_metrics = metrics()
+
     raw_info_json = None
     if raw_info:
         raw_info_json = json.dumps(raw_info, indent=2, default=str)
@@ -130,6 +136,7 @@ def _cache_detail_view(
             "raw_info_json": raw_info_json,
             "slowlog_data": slowlog_data,
             "slowlog_count": slowlog_count,
+            "command_metrics": command_metrics,
             "help_active": help_active,
             "show_danger_zone": is_cachex and can_change,
         },
@@ -0,0 +1,110 @@
+"""Automatic batching of concurrent async reads (DataLoader-style).
+
+Under ASGI a single request often fires many independent
+``await cache.aget(...)`` calls, e.g. through ``asyncio.gather``. Each
+would otherwise be its own round trip. :class:`AsyncGetBatcher` parks
+every ``aget`` issued on the same event loop until the current loop
+iteration finishes (or a short window elapses), then sends them as one
+``get_many`` and hands each caller its own reply.
+
+Batchers are per event loop (their futures are bound to it) and are shared
+by every cache instance with the same scope, since Django builds a fresh
+cache object per task.
+"""
+
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Sequence
+
+    type FetchMany = Callable[..., Awaitable[dict[str, Any]]]
+
+
+class AsyncGetBatcher:
+    """Collect single-key reads on one loop and flush them as ``get_many`` calls."""
+
+    def __init__(self, window: float, max_keys: int | None) -> None:
+        self._window = window
+        self._max_keys = max_keys
+        # stampede_prevention value -> (fetch function, key -> waiting futures)
+        self._pending: dict[Hashable, tuple[FetchMany, dict[str, list[asyncio.Future[Any]]]]] = {}
+        self._handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: str, stampede_prevention: Hashable, fetch_many: FetchMany) -> asyncio.Future[Any]:
+        """Queue ``key`` for the next flush; the future resolves to its raw value or ``None``."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        group = self._pending.get(stampede_prevention)
+        if group is None:
+            group = self._pending[stampede_prevention] = (fetch_many, {})
+        group[1].setdefault(key, []).append(future)
+        if self._max_keys is not None and len(group[1]) >= self._max_keys:
+            self._flush()
+        elif self._handle is None:
+            # call_soon runs after every task already scheduled for this
+            # iteration, so gather()-ed reads issued together share a flush.
+            if self._window:
+                self._handle = loop.call_later(self._window, self._flush)
+            else:
+                self._handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        for stampede_prevention, (fetch_many, waiters) in pending.items():
+            task = asyncio.get_running_loop().create_task(self._fetch(fetch_many, stampede_prevention, waiters))
+            # Keep a strong reference until done (the loop only holds a weak one).
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _fetch(
+        fetch_many: FetchMany,
+        stampede_prevention: Hashable,
+        waiters: dict[str, list[asyncio.Future[Any]]],
+    ) -> None:
+        keys: Sequence[str] = list(waiters)
+        try:
+            values = await fetch_many(keys, stampede_prevention=stampede_prevention)
+        except BaseException as e:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        for key, futures in waiters.items():
+            value = values.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+
+
+_BATCHERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, AsyncGetBatcher]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_batcher(scope: Hashable, window: float, max_keys: int | None) -> AsyncGetBatcher:
+    """The batcher for ``scope`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    batchers = _BATCHERS.get(loop)
+    if batchers is None:
+        batchers = _BATCHERS[loop] = {}
+    batcher = batchers.get(scope)
+    if batcher is None:
+        batcher = batchers[scope] = AsyncGetBatcher(window, max_keys)
+    return batcher
+
+
+__all__ = [
+    "AsyncGetBatcher",
+    "get_batcher",
+]
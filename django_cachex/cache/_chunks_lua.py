@@ -0,0 +1,99 @@
+"""Lua scripts for key-level operations on chunked values (``OPTIONS["chunking"]``).
+
+A chunked value is a manifest under its key plus chunk keys named after
+that key. Expiry, deletion and renaming must move the chunks with the
+manifest, or the value silently turns into a miss (and the chunks linger
+until their TTL). The scripts read the chunk count from the manifest and
+apply the operation to the key and its chunks in one call.
+
+Chunk keys are hash-tagged into their value's slot (see
+``RespCache._chunk_keys``; ``chunk_prefix()`` below mirrors it), so on
+cluster a script call only touches one slot per value key.
+"""
+
+from django_cachex.chunking import CHUNK_MAGIC, MANIFEST_SIZE
+
+# The manifest magic as a Lua string literal body (decimal escapes).
+_MAGIC = "".join(f"\\{byte}" for byte in CHUNK_MAGIC)
+
+# Shared helpers: the chunk count of a manifest (0 for any other value,
+# without reading large values), a key hash-tagged into its own slot, and
+# the chunk key prefix of a key.
+_PRELUDE = rf"""
+local function chunk_count(key)
+  -- pcall: STRLEN fails on non-string keys, which hold no manifest.
+  if redis.pcall('STRLEN', key) ~= {MANIFEST_SIZE} then
+    return 0
+  end
+  local head = redis.call('GETRANGE', key, 0, 15)
+  if string.sub(head, 1, 4) ~= '{_MAGIC}' then
+    return 0
+  end
+  local a, b, c, d = string.byte(head, 13, 16)
+  return ((a * 256 + b) * 256 + c) * 256 + d
+end
+
+local function slot_tagged(key)
+  local open = string.find(key, '{{', 1, true)
+  if open then
+    local close = string.find(key, '}}', open + 1, true)
+    if close and close > open + 1 then
+      return key
+    end
+  end
+  return '{{' .. key .. '}}'
+end
+
+local function chunk_prefix(key)
+  return slot_tagged(key) .. ':chunk:'
+end
+"""
+
+# ARGV: command (EXPIRE, PERSIST, UNLINK, ...), then its arguments after the key.
+# Runs the command on every chunk of each key, then on the key itself.
+# Returns the command's reply for each key.
+APPLY_LUA = (
+    _PRELUDE
+    + r"""
+local replies = {}
+for i, key in ipairs(KEYS) do
+  local prefix = chunk_prefix(key)
+  for n = 0, chunk_count(key) - 1 do
+    redis.call(ARGV[1], prefix .. n, unpack(ARGV, 2))
+  end
+  replies[i] = redis.call(ARGV[1], key, unpack(ARGV, 2))
+end
+return replies
+"""
+)
+
+# KEYS: source, destination. ARGV: 1 to only rename when the destination is
+# missing (RENAMENX), else 0. Renames the chunks that still exist along with
+# the value, and drops the destination's old chunks first.
+# Returns 0 when the source is missing, 2 when NX found the destination,
+# else 1.
+RENAME_LUA = (
+    _PRELUDE
+    + r"""
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+if ARGV[1] == '1' and redis.call('EXISTS', KEYS[2]) == 1 then
+  return 2
+end
+if KEYS[1] == KEYS[2] then
+  return 1
+end
+local src, dst = chunk_prefix(KEYS[1]), chunk_prefix(KEYS[2])
+for n = 0, chunk_count(KEYS[2]) - 1 do
+  redis.call('UNLINK', dst .. n)
+end
+for n = 0, chunk_count(KEYS[1]) - 1 do
+  if redis.call('EXISTS', src .. n) == 1 then
+    redis.call('RENAME', src .. n, dst .. n)
+  end
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+return 1
+"""
+)
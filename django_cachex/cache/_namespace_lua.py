@@ -0,0 +1,18 @@
+"""Lua script for ``CacheNamespace.invalidate()``.
+
+A generation counter that was evicted must not restart at 1, where it
+would hand out generations already used. The script increments the
+counter if it exists and otherwise sets it to the caller's start value,
+in one step: a separate ``INCR`` then ``SET`` lets two invalidations race
+and the second ``SET`` take the counter back to a generation already read.
+"""
+
+# ARGV: generation to start from when the counter is missing
+# Returns the new generation.
+INVALIDATE_LUA = r"""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  return redis.call('INCR', KEYS[1])
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return tonumber(ARGV[1])
+"""
@@ -0,0 +1,56 @@
+"""Lua scripts for ``get_or_set(..., recompute_lock=...)``.
+
+Two keys cooperate per cached value (passed as ``KEYS[1..2]``):
+
+  1. the value key itself;
+  2. the recompute lock key (``{value key}:recompute-lock``, or the value
+     key plus the suffix when it already has a hash tag), holding the
+     winner's random token with a ``PX`` lease.
+
+The lock key is hash-tagged into the value key's slot, so the scripts run
+on cluster too.
+"""
+
+# ARGV: token, lease_ms, saw_miss ("1" when the caller found nothing stored)
+# Returns {1} when the lock was taken, else {0, <current value or nil>} so a
+# caller that lost the race learns about a stale (or fresh) value in the
+# same round trip. A caller that saw a miss takes a value stored meanwhile
+# (the winner's write) instead of competing for the lock the winner just
+# released; a caller holding a stale value competes for it regardless.
+ACQUIRE_LUA = r"""
+if ARGV[3] == '1' then
+  local value = redis.call('GET', KEYS[1])
+  if value then
+    return {0, value}
+  end
+end
+if redis.call('SET', KEYS[2], ARGV[1], 'NX', 'PX', ARGV[2]) then
+  return {1}
+end
+return {0, redis.call('GET', KEYS[1])}
+"""
+
+# ARGV: value, ttl_s (-1 = no expiry, 0 = delete), token
+# Stores the recomputed value and drops the lock if we still own it.
+WRITE_LUA = r"""
+local ttl = tonumber(ARGV[2])
+if ttl > 0 then
+  redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+elseif ttl < 0 then
+  redis.call('SET', KEYS[1], ARGV[1])
+else
+  redis.call('DEL', KEYS[1])
+end
+if redis.call('GET', KEYS[2]) == ARGV[3] then
+  redis.call('DEL', KEYS[2])
+end
+return 1
+"""
+
+# ARGV: token. Deletes the lock only if we still own it.
+RELEASE_LUA = r"""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
@@ -0,0 +1,156 @@
+"""Lua scripts for ``invalidate_tags()``.
+
+Each tag is a sorted set (``KEYS[i]``) of the cache keys written with it,
+scored by their expiry. One call of ``INVALIDATE_STEP_LUA`` pops at most
+``batch`` members across the tag sets and ``UNLINK``-s them, so the server
+is never blocked for longer than one batch; the caller repeats it until no
+members are left. With chunking on it unlinks the chunks of chunked values
+too, and with a near-cache it returns the members so the caller can drop
+them locally.
+
+A tagged write also stores a stamp next to the value (``{key}:tags``, in
+the value's slot): the SHA-1 of the stored bytes, then each tag set key
+between NUL bytes. A member is only deleted while its stamp still matches
+the stored value and lists one of the invalidated tags, so a key rewritten
+without those tags survives. Members without a stamp (written before
+stamps, or whose stamp expired after a ``touch()``) are deleted as before.
+
+A tag set expires with its newest member: ``TAG_ADD_LUA`` moves the
+set's expiry to the highest member score on every write, and makes it
+persistent while it holds a member without expiry. A tag that is never
+written again disappears with its last value.
+
+The keys it unlinks are not passed as ``KEYS``, so the step script only
+runs on a single node; ``RespClusterCache`` pops the members and runs
+``DROP_TAGGED_LUA`` once per member, in that member's slot, instead.
+"""
+
+from django_cachex.cache._chunks_lua import _PRELUDE
+
+# Helpers on top of the chunk prelude: what invalidating ``tags`` does to
+# ``member`` ('drop' it, drop only its 'stale' stamp, or 'keep' it), and
+# the keys to unlink for it.
+_TAGGED = (
+    _PRELUDE
+    + r"""
+local function tag_state(member, stamp_key, tags)
+  local stamp = redis.call('GET', stamp_key)
+  if not stamp then
+    return 'drop'
+  end
+  local value = redis.pcall('GET', member)
+  if type(value) ~= 'string' or redis.sha1hex(value) ~= string.sub(stamp, 1, 40) then
+    return 'stale'
+  end
+  for _, tag in ipairs(tags) do
+    if string.find(stamp, '\0' .. tag .. '\0', 41, true) then
+      return 'drop'
+    end
+  end
+  return 'keep'
+end
+
+-- unpack() is limited by the Lua stack; UNLINK in slices. Returns the count.
+local function unlink_all(keys)
+  local unlinked = 0
+  for i = 1, #keys, 1000 do
+    unlinked = unlinked + redis.call('UNLINK', unpack(keys, i, math.min(i + 999, #keys)))
+  end
+  return unlinked
+end
+
+-- Appends the keys to unlink for member to doomed; returns true when the
+-- member itself goes.
+local function doom(member, tags, chunked, doomed)
+  local stamp_key = slot_tagged(member) .. ':tags'
+  local state = tag_state(member, stamp_key, tags)
+  if state == 'keep' then
+    return false
+  end
+  doomed[#doomed + 1] = stamp_key
+  if state == 'stale' then
+    return false
+  end
+  if chunked then
+    local prefix = chunk_prefix(member)
+    for n = 0, chunk_count(member) - 1 do
+      doomed[#doomed + 1] = prefix .. n
+    end
+  end
+  return true
+end
+"""
+)
+
+# KEYS: one tag set. ARGV: member, its expiry (unix seconds, 'inf' for none), now
+# Drops the members that have expired, adds this one, and lets the set
+# expire with its newest member.
+TAG_ADD_LUA = r"""
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[3])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+local newest = redis.call('ZRANGE', KEYS[1], -1, -1, 'WITHSCORES')[2]
+if newest == 'inf' then
+  redis.call('PERSIST', KEYS[1])
+else
+  redis.call('EXPIREAT', KEYS[1], math.ceil(tonumber(newest)))
+end
+return 1
+"""
+
+# ARGV: batch size, unlink chunks (1/0), return the members (1/0)
+# Returns {keys unlinked, members left in the tag sets}, plus the list of
+# unlinked members when asked for.
+INVALIDATE_STEP_LUA = (
+    _TAGGED
+    + r"""
+local batch = tonumber(ARGV[1])
+local seen, members = {}, {}
+for _, tag in ipairs(KEYS) do
+  local want = batch - #members
+  if want <= 0 then
+    break
+  end
+  local popped = redis.call('ZPOPMIN', tag, want)
+  for i = 1, #popped, 2 do
+    local member = popped[i]
+    if not seen[member] then
+      seen[member] = true
+      members[#members + 1] = member
+    end
+  end
+end
+-- Stamps and chunks are not counted: they are part of their value.
+local doomed, dropped = {}, {}
+for _, member in ipairs(members) do
+  if doom(member, KEYS, ARGV[2] == '1', doomed) then
+    dropped[#dropped + 1] = member
+  end
+end
+unlink_all(doomed)
+local unlinked = unlink_all(dropped)
+local left = 0
+for _, tag in ipairs(KEYS) do
+  left = left + redis.call('ZCARD', tag)
+end
+if ARGV[3] == '1' then
+  return {unlinked, left, dropped}
+end
+return {unlinked, left}
+"""
+)
+
+# KEYS: one member popped from the tag sets. ARGV: unlink chunks (1/0),
+# then the tag set keys being invalidated.
+# Returns 1 when the member was deleted, else 0.
+DROP_TAGGED_LUA = (
+    _TAGGED
+    + r"""
+local doomed = {}
+local dropped = doom(KEYS[1], {unpack(ARGV, 2)}, ARGV[1] == '1', doomed)
+unlink_all(doomed)
+if not dropped then
+  return 0
+end
+return redis.call('UNLINK', KEYS[1])
+"""
+)
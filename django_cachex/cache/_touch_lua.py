@@ -0,0 +1,22 @@
+"""Lua script for ``touch()`` of a value carrying a stampede envelope.
+
+Moving the envelope's logical expiry means rewriting the value. The
+script stores the re-stamped value only if the key still holds the bytes
+it was built from, so a concurrent ``set()`` is never overwritten with
+older data and a concurrent ``delete()`` is never undone.
+"""
+
+# ARGV: value read, re-stamped value, ttl_s (-1 = no expiry)
+# Returns 1 when the value was replaced, 0 when it changed or vanished.
+RESTAMP_LUA = r"""
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+local ttl = tonumber(ARGV[3])
+if ttl > 0 then
+  redis.call('SET', KEYS[1], ARGV[2], 'EX', ttl)
+else
+  redis.call('SET', KEYS[1], ARGV[2])
+end
+return 1
+"""
@@ -11,9 +11,18 @@ concrete subclasses live in:
 - :mod:`django_cachex.cache.valkey_glide`: ``valkey-glide``
 """
 
+import asyncio
+import contextlib
+import copy
+import hashlib
 import inspect
 import re
-from functools import cached_property
+import secrets
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import cached_property, partial
+from itertools import batched
 from typing import TYPE_CHECKING, Any, cast, override
 
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
@@ -22,17 +31,41 @@ from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
-    from datetime import datetime, timedelta
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 
     from django_cachex.adapters.pipeline import AsyncPipeline, Pipeline
-    from django_cachex.adapters.protocols import RespAdapterProtocol
+    from django_cachex.adapters.protocols import (
+        RespAdapterProtocol,
+        RespAsyncPipelineProtocol,
+        RespPipelineProtocol,
+    )
+    from django_cachex.chunking import Manifest
+    from django_cachex.namespace import CacheNamespace
+    from django_cachex.offload import OffloadConfig
     from django_cachex.stampede import StampedeConfig
     from django_cachex.types import KeyType
 
+from django_cachex.batching import get_batcher
+from django_cachex.cache import _chunks_lua, _recompute_lua, _tags_lua, _touch_lua
 from django_cachex.cache.base import BaseCachex, CachexSupportLevel
-from django_cachex.exceptions import CompressorError, NotSupportedError, SerializerError
+from django_cachex.chunking import chunk_data, join_chunks, make_chunking_config, parse_manifest, split_value
+from django_cachex.exceptions import ChunkedValueError, CompressorError, NotSupportedError, SerializerError
+from django_cachex.framing import (
+    FRAME_MAGIC,
+    FRAME_SIZE,
+    RAW_BYTES_ID,
+    RAW_STR_ID,
+    build_frame_table,
+    codec_id,
+    frame_header,
+)
+from django_cachex.hotkeys import HotKeyTracker, SampledAdapter, make_hot_keys_config, shared_tracker
+from django_cachex.metrics import CacheMetrics, InstrumentedAdapter, shared_metrics
+from django_cachex.offload import codec_pool, make_offload_config
+from django_cachex.refresh import task_refresher, thread_refresher
 from django_cachex.script import ScriptHelpers
+from django_cachex.singleflight import async_flights, thread_flights
+from django_cachex.stampede import envelope_should_recompute, envelope_staleness, unwrap_envelope, wrap_envelope
 
 # Alias for the `set` builtin shadowed by the `set` method (PEP 649 defers
 # annotations at runtime, but type checkers still resolve them in class scope).
@@ -41,6 +74,38 @@ from django_cachex.script import ScriptHelpers
 # subscript through mypy's name resolution.
 _set = set
 
+# get_or_set(recompute_lock=...): lock key suffix, default lease, and the
+# bounds of the losers' exponential poll interval (seconds).
+_RECOMPUTE_LOCK_SUFFIX = ":recompute-lock"
+_RECOMPUTE_LEASE = 10.0
+_RECOMPUTE_POLL_MIN = 0.01
+_RECOMPUTE_POLL_MAX = 0.2
+
+# aget_many()/aset_many(): split batches in flight at once by default, so a
+# huge call doesn't open one pooled connection per batch.
+_MAX_BATCH_CONCURRENCY = 8
+
+# touch() of an enveloped value: re-stamp attempts before a concurrent
+# writer wins and the key just gets its TTL moved.
+_TOUCH_ATTEMPTS = 3
+
+# delete_pattern() with chunking: keys per chunk-aware delete when no
+# itersize is given.
+_CHUNKED_DELETE_BATCH = 1000
+
+# set(..., tags=...): key prefix of the tag sets, and how many keys one
+# invalidate_tags() step deletes by default.
+_TAG_PREFIX = "_tag:"
+_TAG_BATCH = 1000
+# Stamp stored next to a tagged value (see _tags_lua).
+_TAG_STAMP_SUFFIX = ":tags"
+
+# decode(): returned by _decode_framed() for values without a codec header.
+_UNFRAMED = object()
+
+# get_stream(): header of an uncompressed raw_passthrough bytes value.
+_RAW_BYTES_FRAME = frame_header(RAW_BYTES_ID, 0)
+
 # Regex for escaping glob special characters
 _special_re = re.compile("([*?[])")
 
@@ -50,6 +115,11 @@ def _glob_escape(s: str) -> str:
     return _special_re.sub(r"[\1]", s)
 
 
+def _tag_member(member: bytes | str) -> str:
+    """A cache key popped from a tag set (drivers return members as bytes)."""
+    return member.decode() if isinstance(member, bytes) else member
+
+
 def _has_hash_tag(key: str) -> bool:
     """Return True if ``key`` contains a Redis hash tag (a ``{...}`` with content).
 
@@ -64,6 +134,133 @@ def _has_hash_tag(key: str) -> bool:
     return close_idx > open_idx + 1
 
 
+def _expiry_arg(value: int | timedelta | datetime, per_second: int = 1) -> int:
+    """An expiry as the server takes it: ``per_second`` units, or a timestamp for a ``datetime``."""
+    if isinstance(value, datetime):
+        return int(value.timestamp() * per_second)
+    if isinstance(value, timedelta):
+        return int(value.total_seconds() * per_second)
+    return value
+
+
+def _entry_size(item: str | tuple[str, bytes | int]) -> int:
+    """Approximate wire size of a key or ``(key, encoded value)`` pair."""
+    if isinstance(item, str):
+        return len(item)
+    key, value = item
+    return len(key) + (len(value) if isinstance(value, bytes) else 8)
+
+
+def _split_batches[T: (str, tuple[str, bytes | int])](
+    items: Sequence[T],
+    max_keys: int | None,
+    max_bytes: int | None,
+) -> list[Sequence[T]]:
+    """Split ``items`` so no batch exceeds ``max_keys`` entries or ``max_bytes``.
+
+    An entry larger than ``max_bytes`` on its own still gets a batch of one.
+    """
+    if not max_bytes:
+        if not max_keys or len(items) <= max_keys:
+            return [items]
+        return [items[i : i + max_keys] for i in range(0, len(items), max_keys)]
+    batches: list[Sequence[T]] = []
+    batch: list[T] = []
+    batch_bytes = 0
+    for item in items:
+        size = _entry_size(item)
+        if batch and ((max_keys and len(batch) >= max_keys) or batch_bytes + size > max_bytes):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _batch_limit(options: Mapping[str, Any], name: str, default: int | None = None) -> int | None:
+    """Read a positive-int ``OPTIONS`` batch limit (``None`` = unlimited)."""
+    value = options.get(name, default)
+    if value is None:
+        return None
+    if type(value) is not int or value <= 0:
+        msg = f"OPTIONS[{name!r}] must be a positive integer or None, got {value!r}"
+        raise ImproperlyConfigured(msg)
+    return value
+
+
+async def _gather_limited[T](aws: Iterable[Awaitable[T]], limit: int | None) -> list[T]:
+    """``asyncio.gather`` with at most ``limit`` awaitables running at once (``None`` = no cap)."""
+    if limit is None:
+        return await asyncio.gather(*aws)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
+
+
+def _auto_batch_window(options: Mapping[str, Any]) -> float | None:
+    """Read ``auto_batch`` / ``auto_batch_window_us`` into a flush delay in seconds.
+
+    ``None`` = auto-batching off; ``0.0`` = flush at the end of the current
+    event-loop iteration.
+    """
+    if not options.get("auto_batch"):
+        return None
+    window_us = options.get("auto_batch_window_us", 0)
+    if isinstance(window_us, bool) or not isinstance(window_us, (int, float)) or window_us < 0:
+        msg = f"OPTIONS['auto_batch_window_us'] must be a non-negative number, got {window_us!r}"
+        raise ImproperlyConfigured(msg)
+    return window_us / 1_000_000
+
+
+def _options_scope(options: Mapping[str, Any]) -> str:
+    """A hashable fingerprint of ``OPTIONS``, equal for aliases configured alike.
+
+    Process-wide state (flights, batchers, metrics) is shared between the
+    per-thread instances of one alias, but two aliases on the same servers
+    may encode, decode or route differently and must not share it.
+    """
+    return repr(sorted(options.items()))
+
+
+def _max_stale(stale_while_revalidate: float | None) -> float | None:
+    """Validate ``get_or_set``'s ``stale_while_revalidate`` (seconds, ``None`` = off)."""
+    if stale_while_revalidate is None:
+        return None
+    if (
+        isinstance(stale_while_revalidate, bool)
+        or not isinstance(stale_while_revalidate, int | float)
+        or stale_while_revalidate < 0
+    ):
+        msg = f"stale_while_revalidate must be a non-negative number of seconds, got {stale_while_revalidate!r}"
+        raise ValueError(msg)
+    return float(stale_while_revalidate)
+
+
+def _ttl_staleness(ttl: Any, config: StampedeConfig) -> float | None:
+    """Seconds since the logical expiry of a key stored with ``timeout + buffer`` TTL."""
+    if not isinstance(ttl, int) or ttl < 0:
+        return None
+    return config.buffer - ttl
+
+
+def _stream_piece(value: Any) -> bytes:
+    """A value ``get_stream()`` read whole, checked to be ``bytes``."""
+    if type(value) is not bytes:
+        msg = f"get_stream() needs a bytes value, got {type(value).__name__}"
+        raise TypeError(msg)
+    return value
+
+
+async def _aiter_piece(value: bytes) -> AsyncIterator[bytes]:
+    yield value
+
+
 def _load_codec(config: str | type | Any) -> Any:
     """Resolve a serializer/compressor config: dotted-path / class / instance → instance."""
     if isinstance(config, str):
@@ -94,6 +291,9 @@ class RespCache(BaseCachex):
     # Class attribute - subclasses override this
     _adapter_class: builtins.type[RespAdapterProtocol]
 
+    # Set on the copies ``namespace()`` views work through.
+    _namespace: CacheNamespace | None = None
+
     def __init__(self, server: str, params: dict[str, Any]) -> None:
         super().__init__(params)
         # Parse server(s) - matches Django's RedisCache behavior
@@ -123,11 +323,90 @@ class RespCache(BaseCachex):
 
         # Setup compressor chain (optional; empty = no compression)
         self._compressors: list[Any] = self._create_compressors(self._options.get("compressor"))
+        # Compressors that decide per key prefix (AdaptiveCompressor) also get the key.
+        self._compress_for_key = getattr(self._compressors[0], "compress_for_key", None) if self._compressors else None
+
+        # Raw passthrough: exact bytes / str values are framed, not serialized.
+        self._raw_passthrough = bool(self._options.get("raw_passthrough", False))
+        self._raw_compressor_id = 0
+        if self._raw_passthrough and self._compressors:
+            compressor_id = codec_id(self._compressors[0], "compressor")
+            if compressor_id is None:
+                msg = f"raw_passthrough requires a codec_id on compressor {type(self._compressors[0]).__name__}"
+                raise ImproperlyConfigured(msg)
+            self._raw_compressor_id = compressor_id
+
+        # Codec header: decode dispatches on it; encode writes it when enabled.
+        self._frames = build_frame_table(self._serializers, self._compressors, raw=self._raw_passthrough)
+        self._write_frame = self._create_write_frame() if self._options.get("codec_header", False) else None
+
+        # Optional limits that split get_many/set_many into several commands
+        self._max_batch_keys = _batch_limit(self._options, "max_batch_keys")
+        self._max_batch_bytes = _batch_limit(self._options, "max_batch_bytes")
+        self._max_batch_concurrency = _batch_limit(self._options, "max_batch_concurrency", _MAX_BATCH_CONCURRENCY)
+
+        # Coalesce concurrent get()/get_or_set() of the same key in this
+        # process. Flights are process-wide (Django builds a cache per
+        # thread / task), so they're scoped by backend + servers + OPTIONS.
+        self._singleflight = bool(self._options.get("singleflight", False))
+        self._flight_scope = (type(self), tuple(self._servers), _options_scope(self._options))
+
+        # Merge concurrent aget() calls on one event loop into get_many().
+        self._auto_batch_window = _auto_batch_window(self._options)
+
+        # Per-command latency / byte counters, shared process-wide per scope.
+        self._metrics: CacheMetrics | None = None
+        if self._options.get("metrics", False):
+            self._metrics = shared_metrics((*self._flight_scope, self.key_prefix, self.version))
+
+        # Sampled top-K read/write keys and prefixes, shared like the metrics.
+        self._hot_keys: HotKeyTracker | None = None
+        hot_keys_config = make_hot_keys_config(self._options.get("hot_keys"))
+        if hot_keys_config is not None:
+            self._hot_keys = shared_tracker((*self._flight_scope, self.key_prefix, self.version), hot_keys_config)
+
+        # Large values are encoded / decoded off the event loop on async paths.
+        self._offload = make_offload_config(self._options.get("async_offload"))
+
+        # Large values are split across chunk keys behind a manifest.
+        self._chunking = make_chunking_config(self._options.get("chunking"))
+
+        # Scripts that delete keys they weren't passed return them for the near-cache.
+        self._near_cached = bool(self._options.get("client_tracking"))
 
     @cached_property
     def adapter(self) -> RespAdapterProtocol:
         """Get the adapter instance (matches Django's pattern)."""
-        return self._adapter_class(self._servers, **self._options)
+        adapter = self._adapter_class(self._servers, **self._options)
+        if self._hot_keys is not None:
+            adapter = SampledAdapter(adapter, self._hot_keys)
+        if self._metrics is not None:
+            adapter = InstrumentedAdapter(adapter, self._metrics)
+        return cast("RespAdapterProtocol", adapter)
+
+    def metrics(self, *, reset: bool = False) -> dict[str, dict[str, Any]] | None:
+        """Per-command client-side metrics, or ``None`` unless ``OPTIONS["metrics"]`` is on.
+
+        Maps each adapter command (``get``, ``set_many``, ``pipeline``, ...;
+        async calls count under their sync name) to its call and error
+        counts, bytes sent and received, and latency quantiles in
+        microseconds. ``reset=True`` starts a fresh window.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(reset=reset)
+
+    def hot_keys(self, *, reset: bool = False) -> dict[str, Any] | None:
+        """Most accessed keys and prefixes, or ``None`` unless ``OPTIONS["hot_keys"]`` is on.
+
+        ``{"read": {"keys": [...], "prefixes": [...]}, "write": {...},
+        "sample_rate": ..., "sampled": ...}``, each list holding up to
+        ``top_k`` entries with their estimated access counts, highest
+        first. ``reset=True`` starts a fresh window.
+        """
+        if self._hot_keys is None:
+            return None
+        return self._hot_keys.snapshot(reset=reset)
 
     # =========================================================================
     # Serializer / Compressor stack. Encoding lives at the cache layer
@@ -150,6 +429,133 @@ class RespCache(BaseCachex):
         items: list = config if isinstance(config, list) else [config]
         return [_load_codec(item) for item in items]
 
+    def _create_write_frame(self) -> tuple[bytes, bytes | None]:
+        """Headers for values stored uncompressed / compressed by the first codecs."""
+        serializer_id = codec_id(self._serializers[0], "serializer")
+        if serializer_id is None:
+            msg = f"codec_header requires a codec_id on serializer {type(self._serializers[0]).__name__}"
+            raise ImproperlyConfigured(msg)
+        compressed = None
+        if self._compressors:
+            compressor_id = codec_id(self._compressors[0], "compressor")
+            if compressor_id is None:
+                msg = f"codec_header requires a codec_id on compressor {type(self._compressors[0]).__name__}"
+                raise ImproperlyConfigured(msg)
+            compressed = frame_header(serializer_id, compressor_id)
+        return frame_header(serializer_id, 0), compressed
+
+    def _compress(self, payload: bytes, key: str | None) -> bytes:
+        """Compress with the first compressor, handing it ``key`` if it takes one."""
+        if key is not None and self._compress_for_key is not None:
+            return self._compress_for_key(payload, key)
+        return self._compressors[0].compress(payload)
+
+    def _frame(self, payload: bytes, key: str | None = None) -> bytes:
+        """Compress ``payload`` with the first compressor and prefix the codec header."""
+        plain, compressed = cast("tuple[bytes, bytes | None]", self._write_frame)
+        if compressed is not None:
+            packed = self._compress(payload, key)
+            # compress() hands back its input when the value is too short.
+            if packed is not payload:
+                return compressed + packed
+        return plain + payload
+
+    def _frame_raw(self, value: bytes | str, key: str | None = None) -> bytes:
+        """Frame an exact ``bytes`` / ``str`` value without serializing it."""
+        if type(value) is str:
+            serializer_id, payload = RAW_STR_ID, value.encode()
+        else:
+            serializer_id, payload = RAW_BYTES_ID, cast("bytes", value)
+        if self._compressors:
+            packed = self._compress(payload, key)
+            if packed is not payload:
+                return frame_header(serializer_id, self._raw_compressor_id) + packed
+        return frame_header(serializer_id, 0) + payload
+
+    def _decode_framed(self, value: Any) -> Any:
+        """Decode a value carrying a codec header; ``_UNFRAMED`` for anything else."""
+        if type(value) is not bytes or len(value) < FRAME_SIZE or value[0] != FRAME_MAGIC:
+            return _UNFRAMED
+        codecs = self._frames.get(value[1])
+        if codecs is None:
+            return _UNFRAMED
+        serializer, compressor = codecs
+        payload = value[FRAME_SIZE:]
+        try:
+            if compressor is not None:
+                payload = compressor.decompress(payload)
+            return serializer.loads(payload)
+        except CompressorError, SerializerError:
+            # An unframed value that merely starts like a header.
+            return _UNFRAMED
+
+    async def _aencode(
+        self,
+        value: Any,
+        *,
+        key: str | None = None,
+        stampede: StampedeConfig | None = None,
+        timeout: int | None = None,
+    ) -> bytes | int:
+        """``encode`` with the heavy part on the codec pool for values of ``async_offload`` size.
+
+        ``bytes`` / ``str`` values of that size are encoded on the pool
+        whole. Other values are serialized inline, since their size isn't
+        known before; once the payload reaches the threshold, compression,
+        framing and the envelope run on the pool.
+        """
+        offload = self._offload
+        kind = type(value)
+        if offload is None or kind is int:
+            return self.encode(value, key=key, stampede=stampede, timeout=timeout)
+        if kind is bytes or kind is str:
+            if len(value) >= offload.threshold:
+                return await codec_pool().run(self.encode, value, key=key, stampede=stampede, timeout=timeout)
+            return self.encode(value, key=key, stampede=stampede, timeout=timeout)
+        payload = self._serializers[0].dumps(value)
+        if len(payload) >= offload.threshold:
+            return await codec_pool().run(self._pack, payload, key, stampede, timeout)
+        return self._pack(payload, key, stampede, timeout)
+
+    async def _adecode(self, value: Any) -> Any:
+        """``decode``, on the codec pool for values of ``async_offload`` size."""
+        offload = self._offload
+        if offload is not None and type(value) is bytes and len(value) >= offload.threshold:
+            return await codec_pool().run(self.decode, value)
+        return self.decode(value)
+
+    async def _adecode_many(self, items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+        """Decode ``(key, value)`` pairs without holding the event loop for long.
+
+        Large values go to the codec pool and decode in parallel while the
+        rest are decoded inline, yielding to the loop after every
+        ``chunk_bytes``.
+        """
+        offload = cast("OffloadConfig", self._offload)
+        pool = codec_pool()
+        result: dict[str, Any] = {}
+        pending: list[tuple[str, asyncio.Future[Any]]] = []
+        budget = 0
+        try:
+            for key, value in items:
+                size = len(value) if type(value) is bytes else 0
+                if size >= offload.threshold:
+                    pending.append((key, pool.run(self.decode, value)))
+                    continue
+                result[key] = self.decode(value)
+                budget += size
+                if budget >= offload.chunk_bytes:
+                    budget = 0
+                    await asyncio.sleep(0)
+        except BaseException:
+            for _, future in pending:
+                future.cancel()
+            raise
+        if pending:
+            decoded = await asyncio.gather(*(future for _, future in pending))
+            result.update(zip((key for key, _ in pending), decoded, strict=True))
+        return result
+
     def _decompress(self, value: bytes) -> bytes:
         """Decompress with fallback support for multiple compressors.
 
@@ -179,25 +585,73 @@ class RespCache(BaseCachex):
             raise last_error
         raise SerializerError("No serializers configured")
 
-    def encode(self, value: Any) -> bytes | int:
-        """Encode a value for storage (serialize + compress). Exact ints pass through unchanged."""
-        # Not isinstance(): bool and int subclasses (IntEnum, IntFlag) go
-        # through the serializer so they round-trip with their type intact.
-        if type(value) is not int:
-            value = self._serializers[0].dumps(value)
-            if self._compressors:
-                return self._compressors[0].compress(value)
+    def encode(
+        self,
+        value: Any,
+        *,
+        key: str | None = None,
+        stampede: StampedeConfig | None = None,
+        timeout: int | None = None,
+    ) -> bytes | int:
+        """Encode a value for storage (serialize + compress). Exact ints pass through unchanged.
+
+        When ``stampede`` enables the XFetch envelope, the encoded bytes are
+        prefixed with the logical expiry (now + ``timeout``) and ``stampede.delta``.
+        With ``raw_passthrough``, exact ``bytes`` / ``str`` values skip the
+        serializer and are stored behind a two-byte header instead. ``key``
+        (the made key) is passed on to compressors that decide per key
+        prefix, such as ``AdaptiveCompressor``.
+        """
+        # Not isinstance(): bool and int subclasses (IntEnum, IntFlag), and
+        # str subclasses such as SafeString, go through the serializer so
+        # they round-trip with their type intact.
+        kind = type(value)
+        if kind is int:
             return value
-        return value
+        if self._raw_passthrough and (kind is bytes or kind is str):
+            value = self._frame_raw(value, key)
+            if stampede is not None and stampede.envelope:
+                return wrap_envelope(value, timeout, stampede.delta)
+            return value
+        return self._pack(self._serializers[0].dumps(value), key, stampede, timeout)
+
+    def _pack(
+        self,
+        payload: bytes,
+        key: str | None,
+        stampede: StampedeConfig | None,
+        timeout: int | None,
+    ) -> bytes:
+        """The rest of :meth:`encode` after serializing: compress or frame, then the envelope."""
+        if self._write_frame is not None:
+            payload = self._frame(payload, key)
+        elif self._compressors:
+            payload = self._compress(payload, key)
+        if stampede is not None and stampede.envelope:
+            return wrap_envelope(payload, timeout, stampede.delta)
+        return payload
 
     def decode(self, value: Any) -> Any:
-        """Decode a value from storage. Returns int directly if parseable, otherwise decompress + deserialize."""
+        """Decode a value from storage. Returns int directly if parseable, otherwise decompress + deserialize.
+
+        Values with a codec header go straight to the codecs it names;
+        others try each configured compressor and serializer in turn.
+        """
         try:
             return int(value)
         except ValueError, TypeError:
+            if isinstance(value, bytes) and (envelope := unwrap_envelope(value)) is not None:
+                value = envelope[0]
+            if (decoded := self._decode_framed(value)) is not _UNFRAMED:
+                return decoded
             value = self._decompress(value)
             return self._deserialize(value)
 
+    def _envelope_config(self, stampede_prevention: bool | StampedeConfig | None) -> StampedeConfig | None:
+        """Effective stampede config if it uses the XFetch envelope, else ``None``."""
+        config = self.adapter.resolve_stampede(stampede_prevention)
+        return config if config and config.envelope else None
+
     def get_backend_timeout(self, timeout: float | None = DEFAULT_TIMEOUT) -> int | None:
         """Convert timeout to backend format (matches Django's RedisCache).
 
@@ -210,14 +664,321 @@ class RespCache(BaseCachex):
         # Non-positive values will cause the key to be deleted.
         return None if timeout is None else max(0, int(timeout))
 
+    # =========================================================================
+    # Chunking: large values stored across several keys
+    # =========================================================================
+
+    @staticmethod
+    def _chunk_keys(key: str, count: int) -> list[str]:
+        """Keys of a chunked value's chunks, hash-tagged into ``key``'s cluster slot."""
+        tagged = key if _has_hash_tag(key) else f"{{{key}}}"
+        return [f"{tagged}:chunk:{i}" for i in range(count)]
+
+    def _chunk(self, key: str, value: bytes | int, timeout: int | None) -> tuple[bytes, dict[str, bytes]] | None:
+        """The manifest and chunks to store for an encoded value, or ``None`` to store it whole.
+
+        Only values with a timeout are chunked: chunks left behind by a
+        delete or by an overwrite with fewer chunks then expire on their own.
+        """
+        config = self._chunking
+        if config is None or not timeout or type(value) is not bytes or len(value) < config.threshold:
+            return None
+        manifest, chunks = split_value(value, config.chunk_size)
+        return manifest, dict(zip(self._chunk_keys(key, len(chunks)), chunks, strict=True))
+
+    def _add_encoded(
+        self,
+        data: dict[str, bytes | int],
+        key: str,
+        value: bytes | int,
+        timeout: int | None,
+        chunk_data: dict[str, bytes | int] | None = None,
+    ) -> None:
+        """Add an encoded value to a ``set_many()`` mapping, as chunks plus manifest if it is large.
+
+        The chunks go into ``chunk_data`` when given, else into ``data``
+        ahead of their manifest.
+        """
+        chunked = self._chunk(key, value, timeout)
+        if chunked is None:
+            data[key] = value
+        else:
+            manifest, chunks = chunked
+            (data if chunk_data is None else chunk_data).update(chunks)
+            data[key] = manifest
+
+    def _unchunk(self, key: str, value: Any) -> Any:
+        """Reassemble a chunked value from its manifest; other values pass through.
+
+        ``None`` (a miss) when a chunk is missing or belongs to another write.
+        """
+        manifest = parse_manifest(value)
+        if manifest is None:
+            return value
+        keys = self._chunk_keys(key, manifest.count)
+        chunks = self.adapter.get_many(keys, stampede_prevention=False)
+        return join_chunks(manifest, [chunks.get(k) for k in keys])
+
+    async def _aunchunk(self, key: str, value: Any) -> Any:
+        """Async :meth:`_unchunk`."""
+        manifest = parse_manifest(value)
+        if manifest is None:
+            return value
+        keys = self._chunk_keys(key, manifest.count)
+        chunks = await self.adapter.aget_many(keys, stampede_prevention=False)
+        return join_chunks(manifest, [chunks.get(k) for k in keys])
+
+    def _chunked_reads(self, values: Mapping[str, Any]) -> dict[str, tuple[Manifest, list[str]]]:
+        """Manifest and chunk keys for every chunked value among ``get_many()`` results."""
+        return {
+            key: (manifest, self._chunk_keys(key, manifest.count))
+            for key, value in values.items()
+            if (manifest := parse_manifest(value)) is not None
+        }
+
+    @staticmethod
+    def _join_chunked(
+        values: dict[str, Any],
+        chunked: dict[str, tuple[Manifest, list[str]]],
+        chunks: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        for key, (manifest, keys) in chunked.items():
+            value = join_chunks(manifest, [chunks.get(k) for k in keys])
+            if value is None:
+                del values[key]
+            else:
+                values[key] = value
+        return values
+
+    def _unchunk_many(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Reassemble the chunked values among ``get_many()`` results, all chunks in one read."""
+        chunked = self._chunked_reads(values)
+        if not chunked:
+            return values
+        keys = [k for _, chunk_keys in chunked.values() for k in chunk_keys]
+        return self._join_chunked(values, chunked, self.adapter.get_many(keys, stampede_prevention=False))
+
+    async def _aunchunk_many(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Async :meth:`_unchunk_many`."""
+        chunked = self._chunked_reads(values)
+        if not chunked:
+            return values
+        keys = [k for _, chunk_keys in chunked.values() for k in chunk_keys]
+        return self._join_chunked(values, chunked, await self.adapter.aget_many(keys, stampede_prevention=False))
+
+    def _chunked_command(self, keys: Sequence[str], command: str, *args: Any) -> list[Any]:
+        """Run a key command (``EXPIRE``, ``UNLINK``, ...) on ``keys`` and the chunks of chunked values.
+
+        One script call; returns the command's reply for each key.
+        """
+        return self.adapter.eval(_chunks_lua.APPLY_LUA, len(keys), *keys, command, *args)
+
+    async def _achunked_command(self, keys: Sequence[str], command: str, *args: Any) -> list[Any]:
+        """Async :meth:`_chunked_command`."""
+        return await self.adapter.aeval(_chunks_lua.APPLY_LUA, len(keys), *keys, command, *args)
+
+    def _delete_chunked(self, keys: Sequence[str]) -> int:
+        """Unlink ``keys`` and the chunks of chunked values; returns how many keys were deleted."""
+        deleted = sum(self._chunked_command(keys, "UNLINK"))
+        self._forget_written(*keys)
+        return deleted
+
+    async def _adelete_chunked(self, keys: Sequence[str]) -> int:
+        """Async :meth:`_delete_chunked`."""
+        deleted = sum(await self._achunked_command(keys, "UNLINK"))
+        self._forget_written(*keys)
+        return deleted
+
+    @staticmethod
+    def _touch_command(timeout: int | None) -> tuple[str] | tuple[str, int]:
+        """What ``touch()`` runs on a key: ``PERSIST``, or ``EXPIRE`` (``timeout`` ≤ 0 deletes it)."""
+        return ("PERSIST",) if timeout is None else ("EXPIRE", timeout)
+
+    def _rename_chunked(self, src: str, dst: str, *, nx: bool = False) -> bool:
+        """``RENAME`` (``RENAMENX`` with ``nx``) a value along with its chunks."""
+        return self._renamed(src, dst, self.adapter.eval(_chunks_lua.RENAME_LUA, 2, src, dst, int(nx)))
+
+    async def _arename_chunked(self, src: str, dst: str, *, nx: bool = False) -> bool:
+        """Async :meth:`_rename_chunked`."""
+        return self._renamed(src, dst, await self.adapter.aeval(_chunks_lua.RENAME_LUA, 2, src, dst, int(nx)))
+
+    def _renamed(self, src: str, dst: str, reply: int) -> bool:
+        """Interpret a ``RENAME_LUA`` reply: raise for a missing source, ``False`` when NX found the destination."""
+        if not reply:
+            msg = f"Key {src!r} not found"
+            raise ValueError(msg)
+        if reply == 2:
+            return False
+        self._forget_written(src, dst)
+        return True
+
+    def _delete_matching(self, pattern: str, itersize: int | None, progress: Callable[[int], None] | None) -> int:
+        """Delete the keys matching an already-prefixed pattern, with their chunks when chunking is on."""
+        if self._chunking is None:
+            return self.adapter.delete_pattern(pattern, itersize=itersize, progress=progress)
+        deleted = 0
+        keys = self.adapter.iter_keys(pattern, itersize=itersize)
+        for batch in batched(keys, itersize or _CHUNKED_DELETE_BATCH, strict=False):
+            deleted += self._delete_chunked(batch)
+            if progress is not None:
+                progress(deleted)
+        return deleted
+
+    async def _adelete_matching(
+        self,
+        pattern: str,
+        itersize: int | None,
+        progress: Callable[[int], None] | None,
+    ) -> int:
+        """Async :meth:`_delete_matching`."""
+        if self._chunking is None:
+            return await self.adapter.adelete_pattern(pattern, itersize=itersize, progress=progress)
+        deleted = 0
+        batch: list[str] = []
+        size = itersize or _CHUNKED_DELETE_BATCH
+        async for key in self.adapter.aiter_keys(pattern, itersize=itersize):
+            batch.append(key)
+            if len(batch) < size:
+                continue
+            deleted += await self._adelete_chunked(batch)
+            batch = []
+            if progress is not None:
+                progress(deleted)
+        if batch:
+            deleted += await self._adelete_chunked(batch)
+            if progress is not None:
+                progress(deleted)
+        return deleted
+
+    # =========================================================================
+    # Tags: sorted sets of the keys written with each tag
+    # =========================================================================
+
+    def _tag_keys(self, tags: Iterable[str]) -> list[str]:
+        return [self.make_key(f"{_TAG_PREFIX}{tag}") for tag in dict.fromkeys(tags)]
+
+    @staticmethod
+    def _tag_stamp_key(key: str) -> str:
+        """Key of a tagged value's stamp, hash-tagged into ``key``'s cluster slot."""
+        tagged = key if _has_hash_tag(key) else f"{{{key}}}"
+        return tagged + _TAG_STAMP_SUFFIX
+
+    @staticmethod
+    def _tag_stamp(stored: bytes | int, tag_keys: Sequence[str]) -> bytes:
+        """SHA-1 of the bytes stored under the key, then each tag set key between NULs."""
+        raw = str(stored).encode() if type(stored) is int else cast("bytes", stored)
+        digest = hashlib.sha1(raw, usedforsecurity=False).hexdigest().encode()
+        return digest + b"\0" + b"".join(tag_key.encode() + b"\0" for tag_key in tag_keys)
+
+    def _queue_tagged_set(
+        self,
+        pipe: RespPipelineProtocol | RespAsyncPipelineProtocol,
+        key: str,
+        value: bytes | int,
+        timeout: int | None,
+        tags: Sequence[str],
+        stampede_prevention: bool | StampedeConfig | None,
+    ) -> list[str]:
+        """Queue a value write and its tag memberships on one pipeline.
+
+        Members are scored with the value's expiry (``inf`` for none), so
+        each write also drops the members that have expired since, and the
+        tag set itself expires with its newest member. The tags
+        go first: a stored value is always reachable from its tags. The
+        value's stamp goes last, so invalidation only skips the value once
+        it has been rewritten. Returns the keys written, for
+        :meth:`_forget_written` once the pipeline ran.
+        """
+        actual_timeout = self.adapter.get_timeout_with_buffer(timeout, stampede_prevention)
+        if actual_timeout == 0:
+            pipe.delete(key)
+            return [key]
+        now = time.time()
+        expiry = "inf" if actual_timeout is None else repr(now + actual_timeout)
+        tag_keys = self._tag_keys(tags)
+        for tag_key in tag_keys:
+            pipe.execute_command("EVAL", _tags_lua.TAG_ADD_LUA, 1, tag_key, key, expiry, repr(now))
+        chunked = self._chunk(key, value, timeout)
+        data = {key: value} if chunked is None else {**chunked[1], key: chunked[0]}
+        written = list(data)
+        data[self._tag_stamp_key(key)] = self._tag_stamp(data[key], tag_keys)
+        for k, v in data.items():
+            if actual_timeout is None:
+                pipe.set(k, v)
+            else:
+                pipe.set(k, v, ex=actual_timeout)
+        return written
+
+    @staticmethod
+    def _check_tag_batch(batch_size: int) -> None:
+        if type(batch_size) is not int or batch_size <= 0:
+            msg = f"batch_size must be a positive integer, got {batch_size!r}"
+            raise ValueError(msg)
+
+    def _invalidate_step_args(self, batch_size: int) -> tuple[int, int, int]:
+        """``INVALIDATE_STEP_LUA`` ARGV: batch size, unlink chunks, return the members."""
+        return batch_size, int(self._chunking is not None), int(self._near_cached)
+
+    def invalidate_tags(self, tags: Iterable[str], *, batch_size: int = _TAG_BATCH) -> int:
+        """Delete every key set with any of ``tags``; returns how many were deleted.
+
+        The keys are unlinked server-side, ``batch_size`` per script call,
+        without scanning the keyspace.
+        """
+        self._check_tag_batch(batch_size)
+        tag_keys = self._tag_keys(tags)
+        deleted = 0
+        while tag_keys:
+            unlinked, left, *members = self.adapter.eval(
+                _tags_lua.INVALIDATE_STEP_LUA,
+                len(tag_keys),
+                *tag_keys,
+                *self._invalidate_step_args(batch_size),
+            )
+            deleted += unlinked
+            if members:
+                self._forget_written(*map(_tag_member, members[0]))
+            if not left:
+                break
+        return deleted
+
+    async def ainvalidate_tags(self, tags: Iterable[str], *, batch_size: int = _TAG_BATCH) -> int:
+        """Async :meth:`invalidate_tags`."""
+        self._check_tag_batch(batch_size)
+        tag_keys = self._tag_keys(tags)
+        deleted = 0
+        while tag_keys:
+            unlinked, left, *members = await self.adapter.aeval(
+                _tags_lua.INVALIDATE_STEP_LUA,
+                len(tag_keys),
+                *tag_keys,
+                *self._invalidate_step_args(batch_size),
+            )
+            deleted += unlinked
+            if members:
+                self._forget_written(*map(_tag_member, members[0]))
+            if not left:
+                break
+        return deleted
+
     # =========================================================================
     # Pattern helpers
     # =========================================================================
 
+    @override
+    def make_key(self, key: str, version: int | None = None) -> str:
+        namespace = self._namespace
+        if namespace is not None:
+            key = namespace.fold(key)
+        return super().make_key(key, version)
+
     def make_pattern(self, pattern: str, version: int | None = None) -> str:
         """Build a pattern for key matching with proper escaping."""
         escaped_prefix = _glob_escape(self.key_prefix)
         ver = version if version is not None else self.version
+        namespace = self._namespace
+        if namespace is not None:
+            pattern = f"{_glob_escape(namespace.name)}:{namespace.current}:{pattern}"
         return self.key_func(pattern, escaped_prefix, ver)
 
     def reverse_key(self, key: str) -> str:
@@ -229,13 +990,17 @@ class RespCache(BaseCachex):
         losing unrelated leading segments.
         """
         if self._reverse_key_func is not None:
-            return self._reverse_key_func(key)
-        prefix = f"{self.key_prefix}:"
-        if not key.startswith(prefix):
-            return key
-        _version, sep, original = key.removeprefix(prefix).partition(":")
-        if not sep:
-            return key
+            original = self._reverse_key_func(key)
+        else:
+            prefix = f"{self.key_prefix}:"
+            if not key.startswith(prefix):
+                return key
+            _version, sep, original = key.removeprefix(prefix).partition(":")
+            if not sep:
+                return key
+        namespace = self._namespace
+        if namespace is not None:
+            return original.removeprefix(namespace.fold(""))
         return original
 
     # =========================================================================
@@ -252,14 +1017,22 @@ class RespCache(BaseCachex):
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
     ) -> bool:
-        """Set a value only if the key doesn't exist."""
+        """Set a value only if the key doesn't exist.
+
+        A chunked value's manifest is added first and its chunks written
+        only if that succeeded; until they land, the key reads as a miss.
+        """
         key = self.make_and_validate_key(key, version=version)
-        return self.adapter.add(
-            key,
-            self.encode(value),
-            self.get_backend_timeout(timeout),
-            stampede_prevention=stampede_prevention,
-        )
+        timeout_s = self.get_backend_timeout(timeout)
+        nvalue = self.encode(value, key=key, stampede=self._envelope_config(stampede_prevention), timeout=timeout_s)
+        chunked = self._chunk(key, nvalue, timeout_s)
+        if chunked is None:
+            return self.adapter.add(key, nvalue, timeout_s, stampede_prevention=stampede_prevention)
+        manifest, chunks = chunked
+        if not self.adapter.add(key, manifest, timeout_s, stampede_prevention=stampede_prevention):
+            return False
+        self.adapter.set_many(chunks, timeout_s, stampede_prevention=stampede_prevention)
+        return True
 
     @override
     async def aadd(
@@ -273,12 +1046,17 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set a value only if the key doesn't exist, asynchronously."""
         key = self.make_and_validate_key(key, version=version)
-        return await self.adapter.aadd(
-            key,
-            self.encode(value),
-            self.get_backend_timeout(timeout),
-            stampede_prevention=stampede_prevention,
-        )
+        timeout_s = self.get_backend_timeout(timeout)
+        envelope = self._envelope_config(stampede_prevention)
+        nvalue = await self._aencode(value, key=key, stampede=envelope, timeout=timeout_s)
+        chunked = self._chunk(key, nvalue, timeout_s)
+        if chunked is None:
+            return await self.adapter.aadd(key, nvalue, timeout_s, stampede_prevention=stampede_prevention)
+        manifest, chunks = chunked
+        if not await self.adapter.aadd(key, manifest, timeout_s, stampede_prevention=stampede_prevention):
+            return False
+        await self.adapter.aset_many(chunks, timeout_s, stampede_prevention=stampede_prevention)
+        return True
 
     @override
     def get(
@@ -291,9 +1069,13 @@ class RespCache(BaseCachex):
     ) -> Any:
         """Fetch a value from the cache."""
         key = self.make_and_validate_key(key, version=version)
-        value = self.adapter.get(key, stampede_prevention=stampede_prevention)
+        envelope = self._envelope_config(stampede_prevention)
+        value = self._adapter_get(key, stampede_prevention if envelope is None else False)
         if value is None:
             return default
+        value = self._unchunk(key, value)
+        if value is None or (envelope is not None and envelope_should_recompute(value, envelope)):
+            return default
         return self.decode(value)
 
     @override
@@ -307,10 +1089,42 @@ class RespCache(BaseCachex):
     ) -> Any:
         """Fetch a value from the cache asynchronously."""
         key = self.make_and_validate_key(key, version=version)
-        value = await self.adapter.aget(key, stampede_prevention=stampede_prevention)
+        envelope = self._envelope_config(stampede_prevention)
+        value = await self._adapter_aget(key, stampede_prevention if envelope is None else False)
         if value is None:
             return default
-        return self.decode(value)
+        value = await self._aunchunk(key, value)
+        if value is None or (envelope is not None and envelope_should_recompute(value, envelope)):
+            return default
+        return self.decode(value) if self._offload is None else await self._adecode(value)
+
+    def _adapter_get(self, key: str, stampede_prevention: bool | StampedeConfig | None) -> Any:
+        """``adapter.get``, shared with concurrent callers when ``singleflight`` is on.
+
+        Only the raw reply is shared; each caller decodes its own copy.
+        """
+        if not self._singleflight:
+            return self.adapter.get(key, stampede_prevention=stampede_prevention)
+        return thread_flights().do(
+            (self._flight_scope, "get", key, stampede_prevention),
+            lambda: self.adapter.get(key, stampede_prevention=stampede_prevention),
+        )
+
+    async def _adapter_aget(self, key: str, stampede_prevention: bool | StampedeConfig | None) -> Any:
+        """``adapter.aget``, shared with concurrent tasks when ``singleflight`` is on.
+
+        With ``auto_batch`` on, the read is queued and sent together with the
+        other ``aget`` calls of the same loop iteration as one ``get_many``.
+        """
+        fetch: Callable[[], Awaitable[Any]]
+        if self._auto_batch_window is None:
+            fetch = partial(self.adapter.aget, key, stampede_prevention=stampede_prevention)
+        else:
+            batcher = get_batcher(self._flight_scope, self._auto_batch_window, self._max_batch_keys)
+            fetch = partial(batcher.load, key, stampede_prevention, self.adapter.aget_many)
+        if not self._singleflight:
+            return await fetch()
+        return await async_flights().do((self._flight_scope, "get", key, stampede_prevention), fetch)
 
     @override
     async def aset(
@@ -324,18 +1138,32 @@ class RespCache(BaseCachex):
         nx: bool = False,
         xx: bool = False,
         get: bool = False,
+        tags: Sequence[str] | None = None,
     ) -> Any:
         """Set a value in the cache asynchronously.
 
         ``nx=True`` only sets if key doesn't exist, ``xx=True`` only sets
-        if key exists, ``get=True`` returns the old value.
+        if key exists, ``get=True`` returns the old value. See :meth:`set`
+        for ``tags``.
         """
-        key = self.make_and_validate_key(key, version=version)
+        if tags and (nx or xx or get):
+            msg = "tags can't be combined with nx, xx or get"
+            raise ValueError(msg)
+        key = self.make_and_validate_key(key, version=version)
+        timeout_s = self.get_backend_timeout(timeout)
+        envelope = self._envelope_config(stampede_prevention)
+        nvalue = await self._aencode(value, key=key, stampede=envelope, timeout=timeout_s)
+        if tags:
+            pipe = await self.adapter.apipeline(transaction=False)
+            written = self._queue_tagged_set(pipe, key, nvalue, timeout_s, tags, stampede_prevention)
+            await pipe.execute()
+            self._forget_written(*written)
+            return None
         if nx or xx or get:
             result = await self.adapter.aset_with_flags(
                 key,
-                self.encode(value),
-                self.get_backend_timeout(timeout),
+                nvalue,
+                timeout_s,
                 nx=nx,
                 xx=xx,
                 get=get,
@@ -344,14 +1172,15 @@ class RespCache(BaseCachex):
             # set_with_flags returns the previous value when get=True (bytes or None);
             # otherwise a bool indicating NX/XX success.
             if get:
-                return self.decode(result) if result is not None else None
+                result = await self._aunchunk(key, result)
+                return await self._adecode(result) if result is not None else None
             return result
-        await self.adapter.aset(
-            key,
-            self.encode(value),
-            self.get_backend_timeout(timeout),
-            stampede_prevention=stampede_prevention,
-        )
+        chunked = self._chunk(key, nvalue, timeout_s)
+        if chunked is not None:
+            manifest, chunks = chunked
+            await self.adapter.aset_many({**chunks, key: manifest}, timeout_s, stampede_prevention=stampede_prevention)
+            return None
+        await self.adapter.aset(key, nvalue, timeout_s, stampede_prevention=stampede_prevention)
         return None
 
     @override
@@ -366,35 +1195,50 @@ class RespCache(BaseCachex):
         nx: bool = False,
         xx: bool = False,
         get: bool = False,
+        tags: Sequence[str] | None = None,
     ) -> Any:
         """Set a value in the cache.
 
         ``nx=True`` only sets if key doesn't exist, ``xx=True`` only sets
         if key exists, ``get=True`` returns the old value. Returns ``bool``
         when ``nx``/``xx`` is used, the old value when ``get=True``, ``None``
-        otherwise.
+        otherwise. ``tags`` are recorded in the same pipeline as the value,
+        for :meth:`invalidate_tags`.
         """
-        key = self.make_and_validate_key(key, version=version)
+        if tags and (nx or xx or get):
+            msg = "tags can't be combined with nx, xx or get"
+            raise ValueError(msg)
+        key = self.make_and_validate_key(key, version=version)
+        timeout_s = self.get_backend_timeout(timeout)
+        nvalue = self.encode(value, key=key, stampede=self._envelope_config(stampede_prevention), timeout=timeout_s)
+        if tags:
+            pipe = self.adapter.pipeline(transaction=False)
+            written = self._queue_tagged_set(pipe, key, nvalue, timeout_s, tags, stampede_prevention)
+            pipe.execute()
+            self._forget_written(*written)
+            return None
         if nx or xx or get:
             result = self.adapter.set_with_flags(
                 key,
-                self.encode(value),
-                self.get_backend_timeout(timeout),
+                nvalue,
+                timeout_s,
                 nx=nx,
                 xx=xx,
                 get=get,
                 stampede_prevention=stampede_prevention,
             )
             if get:
+                result = self._unchunk(key, result)
                 return self.decode(result) if result is not None else None
             return result
+        chunked = self._chunk(key, nvalue, timeout_s)
+        if chunked is not None:
+            # Chunks before the manifest, all in one pipeline.
+            manifest, chunks = chunked
+            self.adapter.set_many({**chunks, key: manifest}, timeout_s, stampede_prevention=stampede_prevention)
+            return None
         # Use standard Django method - returns None
-        self.adapter.set(
-            key,
-            self.encode(value),
-            self.get_backend_timeout(timeout),
-            stampede_prevention=stampede_prevention,
-        )
+        self.adapter.set(key, nvalue, timeout_s, stampede_prevention=stampede_prevention)
         return None
 
     @override
@@ -410,10 +1254,26 @@ class RespCache(BaseCachex):
 
         With stampede prevention active, the stored TTL gets the same
         buffer that ``set()`` applies, keeping the logical remaining TTL
-        intact.
+        intact. An enveloped value is rewritten so its embedded logical
+        expiry moves along with the TTL; the rewrite is a compare-and-set
+        script, so it never replaces a value written (or deleted) since
+        it was read.
         """
         key = self.make_and_validate_key(key, version=version)
-        timeout_s = self.adapter.get_timeout_with_buffer(self.get_backend_timeout(timeout), stampede_prevention)
+        backend_timeout = self.get_backend_timeout(timeout)
+        timeout_s = self.adapter.get_timeout_with_buffer(backend_timeout, stampede_prevention)
+        if self._envelope_config(stampede_prevention) is not None and (backend_timeout is None or backend_timeout > 0):
+            for _ in range(_TOUCH_ATTEMPTS):
+                value = self.adapter.get(key, stampede_prevention=False)
+                rewrapped = self._rewrap_envelope(value, backend_timeout)
+                if rewrapped is None:
+                    break
+                ttl = -1 if timeout_s is None else timeout_s
+                if self.adapter.eval(_touch_lua.RESTAMP_LUA, 1, key, value, rewrapped, ttl):
+                    self._forget_written(key)
+                    return True
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], *self._touch_command(timeout_s))[0])
         return self.adapter.touch(key, timeout_s)
 
     @override
@@ -427,19 +1287,54 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Update the timeout on a key asynchronously."""
         key = self.make_and_validate_key(key, version=version)
-        timeout_s = self.adapter.get_timeout_with_buffer(self.get_backend_timeout(timeout), stampede_prevention)
+        backend_timeout = self.get_backend_timeout(timeout)
+        timeout_s = self.adapter.get_timeout_with_buffer(backend_timeout, stampede_prevention)
+        if self._envelope_config(stampede_prevention) is not None and (backend_timeout is None or backend_timeout > 0):
+            for _ in range(_TOUCH_ATTEMPTS):
+                value = await self.adapter.aget(key, stampede_prevention=False)
+                rewrapped = self._rewrap_envelope(value, backend_timeout)
+                if rewrapped is None:
+                    break
+                ttl = -1 if timeout_s is None else timeout_s
+                if await self.adapter.aeval(_touch_lua.RESTAMP_LUA, 1, key, value, rewrapped, ttl):
+                    self._forget_written(key)
+                    return True
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], *self._touch_command(timeout_s)))[0])
         return await self.adapter.atouch(key, timeout_s)
 
+    @staticmethod
+    def _rewrap_envelope(value: Any, timeout: int | None) -> bytes | None:
+        """Re-stamp an enveloped value with a new logical expiry; ``None`` if it has no envelope."""
+        if not isinstance(value, bytes) or (envelope := unwrap_envelope(value)) is None:
+            return None
+        payload, _expires_at, delta = envelope
+        return wrap_envelope(payload, timeout, delta)
+
+    def _forget_written(self, *keys: str) -> None:
+        """Drop keys written by a script or a raw pipeline from the adapter's near-cache.
+
+        Adapter ``set()`` / ``delete()`` do this themselves; writes that
+        bypass them need it too to keep read-your-writes in this process.
+        """
+        forget = getattr(self.adapter, "forget", None)
+        if forget is not None:
+            forget(*keys)
+
     @override
     def delete(self, key: str, version: int | None = None) -> bool:
         """Remove a key from the cache."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._delete_chunked([key]))
         return self.adapter.delete(key)
 
     @override
     async def adelete(self, key: str, version: int | None = None) -> bool:
         """Remove a key from the cache asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(await self._adelete_chunked([key]))
         return await self.adapter.adelete(key)
 
     @override
@@ -450,10 +1345,21 @@ class RespCache(BaseCachex):
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
     ) -> dict[str, Any]:
-        """Retrieve many keys."""
+        """Retrieve many keys.
+
+        With ``max_batch_keys`` / ``max_batch_bytes`` set, large requests
+        are split into several reads issued one after another.
+        """
         key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
-        ret = self.adapter.get_many(list(key_map), stampede_prevention=stampede_prevention)
-        return {key_map[k]: self.decode(v) for k, v in ret.items()}
+        envelope = self._envelope_config(stampede_prevention)
+        read_stampede = stampede_prevention if envelope is None else False
+        ret: dict[str, Any] = {}
+        for batch in _split_batches(list(key_map), self._max_batch_keys, self._max_batch_bytes):
+            ret.update(self.adapter.get_many(batch, stampede_prevention=read_stampede))
+        ret = self._unchunk_many(ret)
+        if envelope is None:
+            return {key_map[k]: self.decode(v) for k, v in ret.items()}
+        return {key_map[k]: self.decode(v) for k, v in ret.items() if not envelope_should_recompute(v, envelope)}
 
     @override
     async def aget_many(  # type: ignore[override]
@@ -463,10 +1369,108 @@ class RespCache(BaseCachex):
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
     ) -> dict[str, Any]:
-        """Retrieve many keys asynchronously."""
+        """Retrieve many keys asynchronously.
+
+        Batches split by ``max_batch_keys`` / ``max_batch_bytes`` are read
+        concurrently, each on its own pooled connection, at most
+        ``max_batch_concurrency`` at a time.
+        """
         key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
-        ret = await self.adapter.aget_many(list(key_map), stampede_prevention=stampede_prevention)
-        return {key_map[k]: self.decode(v) for k, v in ret.items()}
+        envelope = self._envelope_config(stampede_prevention)
+        read_stampede = stampede_prevention if envelope is None else False
+        batches = _split_batches(list(key_map), self._max_batch_keys, self._max_batch_bytes)
+        if len(batches) == 1:
+            ret = await self.adapter.aget_many(batches[0], stampede_prevention=read_stampede)
+        else:
+            ret = {}
+            for part in await _gather_limited(
+                (self.adapter.aget_many(batch, stampede_prevention=read_stampede) for batch in batches),
+                self._max_batch_concurrency,
+            ):
+                ret.update(part)
+        ret = await self._aunchunk_many(ret)
+        if envelope is not None:
+            ret = {k: v for k, v in ret.items() if not envelope_should_recompute(v, envelope)}
+        if self._offload is None:
+            return {key_map[k]: self.decode(v) for k, v in ret.items()}
+        return await self._adecode_many((key_map[k], v) for k, v in ret.items())
+
+    def get_stream(self, key: str, version: int | None = None) -> Iterator[bytes] | None:
+        """Read a ``bytes`` value piece by piece; ``None`` on a miss.
+
+        A chunked value stored through ``raw_passthrough`` without
+        compression is fetched one chunk key at a time, so the whole value
+        is never held in memory. Any other value is read and decoded whole
+        and yielded as one piece. Raises ``TypeError`` for values that
+        aren't ``bytes``; the iterator raises ``ChunkedValueError`` if the
+        value is overwritten or expires while it is being read.
+        """
+        key = self.make_and_validate_key(key, version=version)
+        envelope = self._envelope_config(None)
+        value = self._adapter_get(key, None if envelope is None else False)
+        if value is None:
+            return None
+        manifest = parse_manifest(value)
+        if manifest is not None:
+            first_key = self._chunk_keys(key, 1)[0]
+            first = chunk_data(manifest, self.adapter.get(first_key, stampede_prevention=False))
+            if first is None:
+                return None
+            if first[:FRAME_SIZE] == _RAW_BYTES_FRAME:
+                return self._stream_chunks(key, manifest, first)
+            value = self._unchunk(key, value)
+        if value is None or (envelope is not None and envelope_should_recompute(value, envelope)):
+            return None
+        return iter((_stream_piece(self.decode(value)),))
+
+    async def aget_stream(self, key: str, version: int | None = None) -> AsyncIterator[bytes] | None:
+        """Async :meth:`get_stream`."""
+        key = self.make_and_validate_key(key, version=version)
+        envelope = self._envelope_config(None)
+        value = await self._adapter_aget(key, None if envelope is None else False)
+        if value is None:
+            return None
+        manifest = parse_manifest(value)
+        if manifest is not None:
+            first_key = self._chunk_keys(key, 1)[0]
+            first = chunk_data(manifest, await self.adapter.aget(first_key, stampede_prevention=False))
+            if first is None:
+                return None
+            if first[:FRAME_SIZE] == _RAW_BYTES_FRAME:
+                return self._astream_chunks(key, manifest, first)
+            value = await self._aunchunk(key, value)
+        if value is None or (envelope is not None and envelope_should_recompute(value, envelope)):
+            return None
+        value = self.decode(value) if self._offload is None else await self._adecode(value)
+        return _aiter_piece(_stream_piece(value))
+
+    def _stream_chunks(self, key: str, manifest: Manifest, first: memoryview) -> Iterator[bytes]:
+        size = len(first)
+        yield bytes(first[FRAME_SIZE:])
+        for chunk_key in self._chunk_keys(key, manifest.count)[1:]:
+            data = chunk_data(manifest, self.adapter.get(chunk_key, stampede_prevention=False))
+            if data is None:
+                msg = f"{key!r} was overwritten or expired while streaming"
+                raise ChunkedValueError(msg)
+            size += len(data)
+            yield bytes(data)
+        if size != manifest.size:
+            msg = f"{key!r} was overwritten or expired while streaming"
+            raise ChunkedValueError(msg)
+
+    async def _astream_chunks(self, key: str, manifest: Manifest, first: memoryview) -> AsyncIterator[bytes]:
+        size = len(first)
+        yield bytes(first[FRAME_SIZE:])
+        for chunk_key in self._chunk_keys(key, manifest.count)[1:]:
+            data = chunk_data(manifest, await self.adapter.aget(chunk_key, stampede_prevention=False))
+            if data is None:
+                msg = f"{key!r} was overwritten or expired while streaming"
+                raise ChunkedValueError(msg)
+            size += len(data)
+            yield bytes(data)
+        if size != manifest.size:
+            msg = f"{key!r} was overwritten or expired while streaming"
+            raise ChunkedValueError(msg)
 
     @override
     def has_key(self, key: str, version: int | None = None) -> bool:
@@ -506,12 +1510,87 @@ class RespCache(BaseCachex):
         version: int | None = None,
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
+        recompute_lock: bool | float = False,
+        stale_while_revalidate: float | None = None,
     ) -> Any:
-        """Fetch a key from the cache, setting it to default if missing."""
+        """Fetch a key from the cache, setting it to default if missing.
+
+        With ``singleflight`` on, concurrent calls for the same key share
+        one read and at most one run of ``default``; every waiter receives
+        the same result object.
+
+        ``recompute_lock`` extends that across processes: on a miss only
+        the caller holding a short-lived lock runs ``default``, and the
+        others get the stale value if one is still stored or wait until
+        the fresh one lands. ``True`` uses a 10 second lease; a number sets
+        the lease in seconds and should exceed the time ``default`` takes.
+
+        ``stale_while_revalidate=N`` returns a value that expired at most
+        ``N`` seconds ago (still stored thanks to the stampede ``buffer``)
+        right away, and recomputes it on a background thread instead of
+        making this caller wait. It needs stampede prevention to be active.
+        """
+        val, _fresh = self._get_or_set_fresh(
+            key,
+            default,
+            timeout,
+            version,
+            stampede_prevention,
+            recompute_lock,
+            stale_while_revalidate,
+        )
+        return val
+
+    def _get_or_set_fresh(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        recompute_lock: bool | float,
+        stale_while_revalidate: float | None,
+    ) -> tuple[Any, bool]:
+        """:meth:`get_or_set`, plus whether the value is known to be fresh.
+
+        The flag is False when a stale value was served, or a recompute lock
+        loser may have returned one; ``TieredCache`` keeps those out of L1.
+        """
+        lease = self._recompute_lease(recompute_lock)
+        max_stale = _max_stale(stale_while_revalidate)
+        if self._singleflight:
+            return thread_flights().do(
+                (self._flight_scope, "get_or_set", self.make_and_validate_key(key, version=version)),
+                lambda: self._get_or_set(key, default, timeout, version, stampede_prevention, lease, max_stale),
+            )
+        return self._get_or_set(key, default, timeout, version, stampede_prevention, lease, max_stale)
+
+    def _get_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float | None = None,
+        max_stale: float | None = None,
+    ) -> tuple[Any, bool]:
         val = self.get(key, self._missing_key, version=version, stampede_prevention=stampede_prevention)
         if val is self._missing_key:
+            if max_stale is not None:
+                stale = self._get_stale(key, version, stampede_prevention, max_stale)
+                if stale is not self._missing_key:
+                    thread_refresher().submit(
+                        (self._flight_scope, self.make_and_validate_key(key, version=version)),
+                        partial(self._refresh, key, default, timeout, version, stampede_prevention, lease),
+                    )
+                    return stale, False
+            if lease is not None:
+                return self._locked_recompute(key, default, timeout, version, stampede_prevention, lease), False
             if callable(default):
+                started = time.monotonic()
                 default = default()
+                stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
             if self.adapter.resolve_stampede(stampede_prevention):
                 # Stampede may return "miss" for a key that still physically exists.
                 # Use set() (unconditional write) instead of add() (NX) so the
@@ -522,8 +1601,8 @@ class RespCache(BaseCachex):
             # Fetch the value again to avoid a race condition if another caller
             # set between the first get() and the set/add() above.
             # Disable stampede here. We just wrote the value, don't re-trigger.
-            return self.get(key, default, version=version, stampede_prevention=False)
-        return val
+            return self.get(key, default, version=version, stampede_prevention=False), True
+        return val, True
 
     @override
     async def aget_or_set(
@@ -534,12 +1613,71 @@ class RespCache(BaseCachex):
         version: int | None = None,
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
+        recompute_lock: bool | float = False,
+        stale_while_revalidate: float | None = None,
     ) -> Any:
-        """Fetch a key from the cache asynchronously, setting it to default if missing."""
+        """Fetch a key from the cache asynchronously, setting it to default if missing.
+
+        See :meth:`get_or_set` for ``recompute_lock`` and
+        ``stale_while_revalidate``; here the refresh runs as an asyncio task.
+        """
+        val, _fresh = await self._aget_or_set_fresh(
+            key,
+            default,
+            timeout,
+            version,
+            stampede_prevention,
+            recompute_lock,
+            stale_while_revalidate,
+        )
+        return val
+
+    async def _aget_or_set_fresh(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        recompute_lock: bool | float,
+        stale_while_revalidate: float | None,
+    ) -> tuple[Any, bool]:
+        """Async :meth:`_get_or_set_fresh`."""
+        lease = self._recompute_lease(recompute_lock)
+        max_stale = _max_stale(stale_while_revalidate)
+        if self._singleflight:
+            return await async_flights().do(
+                (self._flight_scope, "get_or_set", self.make_and_validate_key(key, version=version)),
+                lambda: self._aget_or_set(key, default, timeout, version, stampede_prevention, lease, max_stale),
+            )
+        return await self._aget_or_set(key, default, timeout, version, stampede_prevention, lease, max_stale)
+
+    async def _aget_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float | None = None,
+        max_stale: float | None = None,
+    ) -> tuple[Any, bool]:
         val = await self.aget(key, self._missing_key, version=version, stampede_prevention=stampede_prevention)
         if val is self._missing_key:
+            if max_stale is not None:
+                stale = await self._aget_stale(key, version, stampede_prevention, max_stale)
+                if stale is not self._missing_key:
+                    task_refresher().submit(
+                        (self._flight_scope, self.make_and_validate_key(key, version=version)),
+                        partial(self._arefresh, key, default, timeout, version, stampede_prevention, lease),
+                    )
+                    return stale, False
+            if lease is not None:
+                return await self._alocked_recompute(key, default, timeout, version, stampede_prevention, lease), False
             if callable(default):
+                started = time.monotonic()
                 default = await default() if inspect.iscoroutinefunction(default) else default()
+                stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
             if self.adapter.resolve_stampede(stampede_prevention):
                 await self.aset(key, default, timeout=timeout, version=version, stampede_prevention=stampede_prevention)
             else:
@@ -547,8 +1685,301 @@ class RespCache(BaseCachex):
             # Fetch the value again to avoid a race condition if another caller
             # set between the first aget() and the aset/aadd() above.
             # Disable stampede here. We just wrote the value, don't re-trigger.
-            return await self.aget(key, default, version=version, stampede_prevention=False)
-        return val
+            return await self.aget(key, default, version=version, stampede_prevention=False), True
+        return val, True
+
+    def _get_stale(
+        self,
+        key: str,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        max_stale: float,
+    ) -> Any:
+        """The value still stored under ``key`` if it expired at most ``max_stale`` seconds ago.
+
+        Returns ``_missing_key`` otherwise. Without stampede prevention an
+        expired key is gone, so there is nothing stale to serve.
+        """
+        envelope = self._envelope_config(stampede_prevention)
+        made_key = self.make_and_validate_key(key, version=version)
+        if envelope is not None:
+            value = self._unchunk(made_key, self.adapter.get(made_key, stampede_prevention=False))
+            return self._fresh_enough(value, envelope_staleness(value), max_stale)
+        config = self.adapter.resolve_stampede(stampede_prevention)
+        if config is None:
+            return self._missing_key
+        if self._chunking is not None:
+            # A pipeline would decode a chunk manifest as the value.
+            value = self._unchunk(made_key, self.adapter.get(made_key, stampede_prevention=False))
+            return self._fresh_enough(value, _ttl_staleness(self.adapter.ttl(made_key), config), max_stale)
+        with self.pipeline(transaction=False, version=version) as pipe:
+            value, ttl = pipe.get(key).ttl(key).execute()
+        return self._fresh_enough(value, _ttl_staleness(ttl, config), max_stale, decoded=True)
+
+    async def _aget_stale(
+        self,
+        key: str,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        max_stale: float,
+    ) -> Any:
+        """Async :meth:`_get_stale`."""
+        envelope = self._envelope_config(stampede_prevention)
+        made_key = self.make_and_validate_key(key, version=version)
+        if envelope is not None:
+            value = await self._aunchunk(made_key, await self.adapter.aget(made_key, stampede_prevention=False))
+            return self._fresh_enough(value, envelope_staleness(value), max_stale)
+        config = self.adapter.resolve_stampede(stampede_prevention)
+        if config is None:
+            return self._missing_key
+        if self._chunking is not None:
+            value = await self._aunchunk(made_key, await self.adapter.aget(made_key, stampede_prevention=False))
+            return self._fresh_enough(value, _ttl_staleness(await self.adapter.attl(made_key), config), max_stale)
+        async with await self.apipeline(transaction=False, version=version) as pipe:
+            value, ttl = await pipe.get(key).ttl(key).execute()
+        return self._fresh_enough(value, _ttl_staleness(ttl, config), max_stale, decoded=True)
+
+    def _fresh_enough(self, value: Any, staleness: float | None, max_stale: float, *, decoded: bool = False) -> Any:
+        if value is None or staleness is None or staleness > max_stale:
+            return self._missing_key
+        return value if decoded else self.decode(value)
+
+    def _refresh(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float | None,
+    ) -> None:
+        """Background half of ``stale_while_revalidate``: recompute ``key`` and store it."""
+        if lease is not None:
+            # Another process already refreshing: its lock makes this a no-op.
+            self._locked_recompute(key, default, timeout, version, stampede_prevention, lease)
+            return
+        if callable(default):
+            started = time.monotonic()
+            default = default()
+            stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
+        self.set(key, default, timeout=timeout, version=version, stampede_prevention=stampede_prevention)
+
+    async def _arefresh(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float | None,
+    ) -> None:
+        """Async :meth:`_refresh`."""
+        if lease is not None:
+            await self._alocked_recompute(key, default, timeout, version, stampede_prevention, lease)
+            return
+        if callable(default):
+            started = time.monotonic()
+            default = await default() if inspect.iscoroutinefunction(default) else default()
+            stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
+        await self.aset(key, default, timeout=timeout, version=version, stampede_prevention=stampede_prevention)
+
+    @staticmethod
+    def _recompute_lock_key(key: str) -> str:
+        """``key``'s recompute lock, hash-tagged into its cluster slot so the scripts can touch both."""
+        tagged = key if _has_hash_tag(key) else f"{{{key}}}"
+        return tagged + _RECOMPUTE_LOCK_SUFFIX
+
+    def _recompute_lease(self, recompute_lock: bool | float) -> float | None:
+        """Validate ``get_or_set``'s ``recompute_lock`` and return the lease in seconds."""
+        if recompute_lock is False:
+            return None
+        if recompute_lock is True:
+            return _RECOMPUTE_LEASE
+        if not isinstance(recompute_lock, int | float) or recompute_lock <= 0:
+            msg = f"recompute_lock must be a bool or a positive number of seconds, got {recompute_lock!r}"
+            raise ValueError(msg)
+        return float(recompute_lock)
+
+    def _recompute_write_args(
+        self,
+        key: str,
+        value: Any,
+        timeout: float | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        token: str,
+    ) -> tuple[tuple[bytes | int, int, str], dict[str, bytes]]:
+        """``ARGV`` for ``WRITE_LUA`` and the chunks to write with it.
+
+        ``ARGV`` is the encoded value (the manifest of a chunked value),
+        its TTL (-1 = none) and the lock token.
+        """
+        timeout_s = self.get_backend_timeout(timeout)
+        nvalue = self.encode(value, key=key, stampede=self._envelope_config(stampede_prevention), timeout=timeout_s)
+        ttl = self.adapter.get_timeout_with_buffer(timeout_s, stampede_prevention)
+        if ttl is None:
+            return (nvalue, -1, token), {}
+        chunked = self._chunk(key, nvalue, ttl) if ttl > 0 else None
+        if chunked is None:
+            return (nvalue, ttl, token), {}
+        manifest, chunks = chunked
+        return (manifest, ttl, token), chunks
+
+    def _write_recomputed(
+        self,
+        key: str,
+        lock_key: str,
+        args: tuple[bytes | int, int, str],
+        chunks: dict[str, bytes],
+    ) -> None:
+        """Store a recomputed value and drop the lock; chunks go first, in the same pipeline."""
+        if chunks:
+            pipe = self.adapter.pipeline(transaction=False)
+            for chunk_key, chunk in chunks.items():
+                pipe.set(chunk_key, chunk, ex=args[1])
+            pipe.execute_command("EVAL", _recompute_lua.WRITE_LUA, 2, key, lock_key, *args)
+            pipe.execute()
+        else:
+            self.adapter.eval(_recompute_lua.WRITE_LUA, 2, key, lock_key, *args)
+        self._forget_written(key, *chunks)
+
+    async def _awrite_recomputed(
+        self,
+        key: str,
+        lock_key: str,
+        args: tuple[bytes | int, int, str],
+        chunks: dict[str, bytes],
+    ) -> None:
+        """Async :meth:`_write_recomputed`."""
+        if chunks:
+            pipe = await self.adapter.apipeline(transaction=False)
+            for chunk_key, chunk in chunks.items():
+                pipe.set(chunk_key, chunk, ex=args[1])
+            pipe.execute_command("EVAL", _recompute_lua.WRITE_LUA, 2, key, lock_key, *args)
+            await pipe.execute()
+        else:
+            await self.adapter.aeval(_recompute_lua.WRITE_LUA, 2, key, lock_key, *args)
+        self._forget_written(key, *chunks)
+
+    def _locked_recompute(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float,
+    ) -> Any:
+        """Run ``default`` under a distributed lock so one caller per key recomputes.
+
+        Losers return the value still stored under the key (stale, or
+        written by the winner meanwhile) or poll until one appears; once a
+        caller has seen the key empty, a value stored later is taken as the
+        winner's write rather than a reason to recompute again. The
+        lock expires after ``lease``, so a crashed winner only delays the
+        others. The winner's write and unlock are a single script call.
+        """
+        made_key = self.make_and_validate_key(key, version=version)
+        lock_key = self._recompute_lock_key(made_key)
+        token = secrets.token_hex(16)
+        lease_ms = max(1, int(lease * 1000))
+        delay = _RECOMPUTE_POLL_MIN
+        # Without stampede prevention the caller's miss means nothing is stored.
+        saw_miss = self.adapter.resolve_stampede(stampede_prevention) is None
+        while True:
+            reply = self.adapter.eval(
+                _recompute_lua.ACQUIRE_LUA,
+                2,
+                made_key,
+                lock_key,
+                token,
+                lease_ms,
+                int(saw_miss),
+            )
+            if int(reply[0]):
+                break
+            if len(reply) > 1 and reply[1] is not None:
+                if (value := self._unchunk(made_key, reply[1])) is not None:
+                    return self.decode(value)
+                # A manifest whose chunks are gone: compete for the lock.
+                saw_miss = False
+            else:
+                saw_miss = True
+            time.sleep(delay)
+            delay = min(delay * 2, _RECOMPUTE_POLL_MAX)
+        try:
+            if callable(default):
+                started = time.monotonic()
+                default = default()
+                stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
+            args, chunks = self._recompute_write_args(made_key, default, timeout, stampede_prevention, token)
+        except BaseException:
+            with contextlib.suppress(Exception):
+                self.adapter.eval(_recompute_lua.RELEASE_LUA, 1, lock_key, token)
+            raise
+        self._write_recomputed(made_key, lock_key, args, chunks)
+        return default
+
+    async def _alocked_recompute(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None,
+        version: int | None,
+        stampede_prevention: bool | StampedeConfig | None,
+        lease: float,
+    ) -> Any:
+        """Async :meth:`_locked_recompute`."""
+        made_key = self.make_and_validate_key(key, version=version)
+        lock_key = self._recompute_lock_key(made_key)
+        token = secrets.token_hex(16)
+        lease_ms = max(1, int(lease * 1000))
+        delay = _RECOMPUTE_POLL_MIN
+        # Without stampede prevention the caller's miss means nothing is stored.
+        saw_miss = self.adapter.resolve_stampede(stampede_prevention) is None
+        while True:
+            reply = await self.adapter.aeval(
+                _recompute_lua.ACQUIRE_LUA,
+                2,
+                made_key,
+                lock_key,
+                token,
+                lease_ms,
+                int(saw_miss),
+            )
+            if int(reply[0]):
+                break
+            if len(reply) > 1 and reply[1] is not None:
+                if (value := await self._aunchunk(made_key, reply[1])) is not None:
+                    return self.decode(value)
+                # A manifest whose chunks are gone: compete for the lock.
+                saw_miss = False
+            else:
+                saw_miss = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECOMPUTE_POLL_MAX)
+        try:
+            if callable(default):
+                started = time.monotonic()
+                default = await default() if inspect.iscoroutinefunction(default) else default()
+                stampede_prevention = self._measured_stampede(stampede_prevention, time.monotonic() - started)
+            args, chunks = self._recompute_write_args(made_key, default, timeout, stampede_prevention, token)
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await self.adapter.aeval(_recompute_lua.RELEASE_LUA, 1, lock_key, token)
+            raise
+        await self._awrite_recomputed(made_key, lock_key, args, chunks)
+        return default
+
+    def _measured_stampede(
+        self,
+        stampede_prevention: bool | StampedeConfig | None,
+        elapsed: float,
+    ) -> bool | StampedeConfig | None:
+        """Carry a measured recompute duration into the envelope's delta."""
+        envelope = self._envelope_config(stampede_prevention)
+        if envelope is None:
+            return stampede_prevention
+        return replace(envelope, delta=elapsed)
 
     @override
     def set_many(
@@ -559,13 +1990,27 @@ class RespCache(BaseCachex):
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
     ) -> list:
-        """Set multiple values."""
+        """Set multiple values.
+
+        With ``max_batch_keys`` / ``max_batch_bytes`` set, large writes are
+        split into several commands; each batch is applied on its own, so
+        the write as a whole is no longer atomic.
+        """
         if not data:
             return []
-        safe_data = {
-            self.make_and_validate_key(key, version=version): self.encode(value) for key, value in data.items()
-        }
-        self.adapter.set_many(safe_data, self.get_backend_timeout(timeout), stampede_prevention=stampede_prevention)
+        timeout_s = self.get_backend_timeout(timeout)
+        envelope = self._envelope_config(stampede_prevention)
+        safe_data: dict[str, bytes | int] = {}
+        for key, value in data.items():
+            made_key = self.make_and_validate_key(key, version=version)
+            nvalue = self.encode(value, key=made_key, stampede=envelope, timeout=timeout_s)
+            self._add_encoded(safe_data, made_key, nvalue, timeout_s)
+        batches = _split_batches(list(safe_data.items()), self._max_batch_keys, self._max_batch_bytes)
+        if len(batches) == 1:
+            self.adapter.set_many(safe_data, timeout_s, stampede_prevention=stampede_prevention)
+        else:
+            for batch in batches:
+                self.adapter.set_many(dict(batch), timeout_s, stampede_prevention=stampede_prevention)
         return []
 
     @override
@@ -577,17 +2022,36 @@ class RespCache(BaseCachex):
         *,
         stampede_prevention: bool | StampedeConfig | None = None,
     ) -> list:
-        """Set multiple values asynchronously."""
+        """Set multiple values asynchronously.
+
+        Batches split by ``max_batch_keys`` / ``max_batch_bytes`` are
+        written concurrently, at most ``max_batch_concurrency`` at a time;
+        with chunking, the batches holding chunks are
+        all written before any manifest, so a reader never finds a manifest
+        whose chunks are still on their way.
+        """
         if not data:
             return []
-        safe_data = {
-            self.make_and_validate_key(key, version=version): self.encode(value) for key, value in data.items()
-        }
-        await self.adapter.aset_many(
-            safe_data,
-            self.get_backend_timeout(timeout),
-            stampede_prevention=stampede_prevention,
-        )
+        timeout_s = self.get_backend_timeout(timeout)
+        envelope = self._envelope_config(stampede_prevention)
+        safe_data: dict[str, bytes | int] = {}
+        chunk_data: dict[str, bytes | int] = {}
+        for key, value in data.items():
+            made_key = self.make_and_validate_key(key, version=version)
+            nvalue = await self._aencode(value, key=made_key, stampede=envelope, timeout=timeout_s)
+            self._add_encoded(safe_data, made_key, nvalue, timeout_s, chunk_data)
+        items = [*chunk_data.items(), *safe_data.items()]
+        if len(_split_batches(items, self._max_batch_keys, self._max_batch_bytes)) == 1:
+            await self.adapter.aset_many(dict(items), timeout_s, stampede_prevention=stampede_prevention)
+            return []
+        for stage in (chunk_data, safe_data):
+            await _gather_limited(
+                (
+                    self.adapter.aset_many(dict(batch), timeout_s, stampede_prevention=stampede_prevention)
+                    for batch in _split_batches(list(stage.items()), self._max_batch_keys, self._max_batch_bytes)
+                ),
+                self._max_batch_concurrency,
+            )
         return []
 
     @override
@@ -597,6 +2061,8 @@ class RespCache(BaseCachex):
         if not keys:
             return 0
         safe_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if self._chunking is not None:
+            return self._delete_chunked(safe_keys)
         return self.adapter.delete_many(safe_keys)
 
     @override
@@ -606,6 +2072,8 @@ class RespCache(BaseCachex):
         if not keys:
             return 0
         safe_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if self._chunking is not None:
+            return await self._adelete_chunked(safe_keys)
         return await self.adapter.adelete_many(safe_keys)
 
     @override
@@ -677,11 +2145,15 @@ class RespCache(BaseCachex):
     def persist(self, key: str, version: int | None = None) -> bool:
         """Remove the expiry from a key, making it persistent."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], "PERSIST")[0])
         return self.adapter.persist(key)
 
     async def apersist(self, key: str, version: int | None = None) -> bool:
         """Remove the expiry from a key asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], "PERSIST"))[0])
         return await self.adapter.apersist(key)
 
     def expire(
@@ -692,6 +2164,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry time on a key in seconds."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], "EXPIRE", _expiry_arg(timeout))[0])
         return self.adapter.expire(key, timeout)
 
     async def aexpire(
@@ -702,6 +2176,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry time on a key in seconds asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], "EXPIRE", _expiry_arg(timeout)))[0])
         return await self.adapter.aexpire(key, timeout)
 
     def expireat(
@@ -712,6 +2188,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry to an absolute time."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], "EXPIREAT", _expiry_arg(when))[0])
         return self.adapter.expireat(key, when)
 
     async def aexpireat(
@@ -722,6 +2200,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry to an absolute time asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], "EXPIREAT", _expiry_arg(when)))[0])
         return await self.adapter.aexpireat(key, when)
 
     def pexpire(
@@ -732,6 +2212,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry time on a key in milliseconds."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], "PEXPIRE", _expiry_arg(timeout, 1000))[0])
         return self.adapter.pexpire(key, timeout)
 
     async def apexpire(
@@ -742,6 +2224,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry time on a key in milliseconds asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], "PEXPIRE", _expiry_arg(timeout, 1000)))[0])
         return await self.adapter.apexpire(key, timeout)
 
     def pexpireat(
@@ -752,6 +2236,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry to an absolute time with millisecond precision."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool(self._chunked_command([key], "PEXPIREAT", _expiry_arg(when, 1000))[0])
         return self.adapter.pexpireat(key, when)
 
     async def apexpireat(
@@ -762,6 +2248,8 @@ class RespCache(BaseCachex):
     ) -> bool:
         """Set expiry to an absolute time with millisecond precision asynchronously."""
         key = self.make_and_validate_key(key, version=version)
+        if self._chunking is not None:
+            return bool((await self._achunked_command([key], "PEXPIREAT", _expiry_arg(when, 1000)))[0])
         return await self.adapter.apexpireat(key, when)
 
     def expiretime(self, key: str, version: int | None = None) -> int | None:
@@ -861,20 +2349,28 @@ class RespCache(BaseCachex):
         pattern: str,
         version: int | None = None,
         itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
     ) -> int:
-        """Delete all keys matching pattern."""
+        """Delete all keys matching pattern.
+
+        ``progress`` is called with the running count of deleted keys as
+        the scan advances.
+        """
         full_pattern = self.make_pattern(pattern, version=version)
-        return self.adapter.delete_pattern(full_pattern, itersize=itersize)
+        return self._delete_matching(full_pattern, itersize, progress)
 
     async def adelete_pattern(
         self,
         pattern: str,
         version: int | None = None,
         itersize: int | None = None,
+        *,
+        progress: Callable[[int], None] | None = None,
     ) -> int:
         """Delete all keys matching pattern asynchronously."""
         full_pattern = self.make_pattern(pattern, version=version)
-        return await self.adapter.adelete_pattern(full_pattern, itersize=itersize)
+        return await self._adelete_matching(full_pattern, itersize, progress)
 
     def lock(
         self,
@@ -984,6 +2480,28 @@ class RespCache(BaseCachex):
             timeout=timeout,
         )
 
+    def namespace(self, name: str, *, generation_ttl: float | None = None) -> CacheNamespace:
+        """Return a view of this cache whose keys are grouped under ``name``.
+
+        ``cache.namespace("tenant:42").invalidate()`` drops every key of the
+        namespace with one ``INCR`` of its generation counter instead of a
+        ``delete_pattern()`` scan. The generation is cached in-process for
+        ``generation_ttl`` seconds (default 1), which bounds how long other
+        processes keep reading the old generation.
+        """
+        from django_cachex.namespace import DEFAULT_GENERATION_TTL, CacheNamespace
+
+        if generation_ttl is None:
+            generation_ttl = DEFAULT_GENERATION_TTL
+        return CacheNamespace(self, name, generation_ttl=generation_ttl)
+
+    def _with_namespace(self, namespace: CacheNamespace) -> RespCache:
+        # A copy sharing this cache's adapter, whose make_key() folds in the namespace.
+        _ = self.adapter
+        clone = copy.copy(self)
+        clone._namespace = namespace
+        return clone
+
     def pipeline(
         self,
         *,
@@ -1037,13 +2555,13 @@ class RespCache(BaseCachex):
         """
         escaped_prefix = _glob_escape(self.key_prefix)
         full_pattern = self.key_func("*", escaped_prefix, "*")
-        return self.adapter.delete_pattern(full_pattern, itersize=itersize)
+        return self._delete_matching(full_pattern, itersize, None)
 
     async def aclear_all_versions(self, itersize: int | None = None) -> int:
         """Delete all keys for this cache's prefix across ALL versions (async)."""
         escaped_prefix = _glob_escape(self.key_prefix)
         full_pattern = self.key_func("*", escaped_prefix, "*")
-        return await self.adapter.adelete_pattern(full_pattern, itersize=itersize)
+        return await self._adelete_matching(full_pattern, itersize, None)
 
     def flush_db(self) -> bool:
         """Flush the entire Redis database (``FLUSHDB``).
@@ -3044,10 +4562,39 @@ class RespCache(BaseCachex):
 
         Returns the Redis/Valkey INFO command output as a dictionary.
         Optionally filter by section (e.g., 'server', 'memory', 'stats').
+        With ``OPTIONS["hot_keys"]`` on, the unfiltered result also carries
+        :meth:`hot_keys` under ``"hot_keys"``, and with a compressor that
+        keeps stats (``AdaptiveCompressor``) its per-prefix stats under
+        ``"compression"``.
         """
         if section:
             return self.adapter.info(section)
-        return self.adapter.info()
+        info = self.adapter.info()
+        if self._hot_keys is not None:
+            info = {**info, "hot_keys": self._hot_keys.snapshot()}
+        compression_stats = getattr(self._compressors[0], "stats", None) if self._compressors else None
+        if compression_stats is not None:
+            info = {**info, "compression": compression_stats()}
+        return info
+
+    def warm_up(self, connections: int | None = None) -> int:
+        """Open connections before traffic arrives, so first requests skip the handshakes.
+
+        Opens ``connections`` (default: ``OPTIONS["pool_warmup"]``, or 1) per
+        server pool and returns how many are now open and idle. Only the
+        redis-py / valkey-py adapters keep connection pools.
+        """
+        warm_up = getattr(self.adapter, "warm_up", None)
+        if warm_up is None:
+            raise NotSupportedError("warm_up", backend=type(self.adapter).__name__)
+        return warm_up(connections)
+
+    async def awarm_up(self, connections: int | None = None) -> int:
+        """Async counterpart of :meth:`warm_up` for the running event loop's pools."""
+        awarm_up = getattr(self.adapter, "awarm_up", None)
+        if awarm_up is None:
+            raise NotSupportedError("awarm_up", backend=type(self.adapter).__name__)
+        return await awarm_up(connections)
 
     def slowlog_get(self, count: int = 10) -> list[Any]:
         """Get slow query log entries.
@@ -3077,6 +4624,8 @@ class RespCache(BaseCachex):
         dst_ver = version_dst if version_dst is not None else version
         src_key = self.make_and_validate_key(src, version=src_ver)
         dst_key = self.make_and_validate_key(dst, version=dst_ver)
+        if self._chunking is not None:
+            return self._rename_chunked(src_key, dst_key)
         return self.adapter.rename(src_key, dst_key)
 
     async def arename(
@@ -3092,6 +4641,8 @@ class RespCache(BaseCachex):
         dst_ver = version_dst if version_dst is not None else version
         src_key = self.make_and_validate_key(src, version=src_ver)
         dst_key = self.make_and_validate_key(dst, version=dst_ver)
+        if self._chunking is not None:
+            return await self._arename_chunked(src_key, dst_key)
         return await self.adapter.arename(src_key, dst_key)
 
     def renamenx(
@@ -3107,6 +4658,8 @@ class RespCache(BaseCachex):
         dst_ver = version_dst if version_dst is not None else version
         src_key = self.make_and_validate_key(src, version=src_ver)
         dst_key = self.make_and_validate_key(dst, version=dst_ver)
+        if self._chunking is not None:
+            return self._rename_chunked(src_key, dst_key, nx=True)
         return self.adapter.renamenx(src_key, dst_key)
 
     async def arenamenx(
@@ -3122,6 +4675,8 @@ class RespCache(BaseCachex):
         dst_ver = version_dst if version_dst is not None else version
         src_key = self.make_and_validate_key(src, version=src_ver)
         dst_key = self.make_and_validate_key(dst, version=dst_ver)
+        if self._chunking is not None:
+            return await self._arename_chunked(src_key, dst_key, nx=True)
         return await self.adapter.arenamenx(src_key, dst_key)
 
     @override
@@ -3131,7 +4686,10 @@ class RespCache(BaseCachex):
             version = self.version
         old_key = self.make_and_validate_key(key, version=version)
         new_key = self.make_and_validate_key(key, version=version + delta)
-        self.adapter.rename(old_key, new_key)
+        if self._chunking is not None:
+            self._rename_chunked(old_key, new_key)
+        else:
+            self.adapter.rename(old_key, new_key)
         return version + delta
 
     @override
@@ -3146,7 +4704,10 @@ class RespCache(BaseCachex):
             version = self.version
         old_key = self.make_and_validate_key(key, version=version)
         new_key = self.make_and_validate_key(key, version=version + delta)
-        await self.adapter.arename(old_key, new_key)
+        if self._chunking is not None:
+            await self._arename_chunked(old_key, new_key)
+        else:
+            await self.adapter.arename(old_key, new_key)
         return version + delta
 
     @override
@@ -3276,6 +4837,76 @@ class RespClusterCache(RespCache):
             raise NotSupportedError("MULTI/EXEC pipelines", backend="cluster")
         return await super().apipeline(transaction=False, version=version)
 
+    @override
+    def _chunked_command(self, keys: Sequence[str], command: str, *args: Any) -> list[Any]:
+        """One script call per key, sent through the slot-aware pipeline.
+
+        A value and its chunks share a slot, but different keys may not.
+        """
+        if len(keys) == 1:
+            return super()._chunked_command(keys, command, *args)
+        pipe = self.adapter.pipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command("EVAL", _chunks_lua.APPLY_LUA, 1, key, command, *args)
+        return [reply[0] for reply in pipe.execute()]
+
+    @override
+    async def _achunked_command(self, keys: Sequence[str], command: str, *args: Any) -> list[Any]:
+        """Async :meth:`_chunked_command`."""
+        if len(keys) == 1:
+            return await super()._achunked_command(keys, command, *args)
+        pipe = await self.adapter.apipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command("EVAL", _chunks_lua.APPLY_LUA, 1, key, command, *args)
+        return [reply[0] for reply in await pipe.execute()]
+
+    @override
+    def invalidate_tags(self, tags: Iterable[str], *, batch_size: int = _TAG_BATCH) -> int:
+        """Pop each tag's keys in batches and delete them, one script call per key.
+
+        The tag sets and their keys live in different slots, so the step
+        script can't run here; ``DROP_TAGGED_LUA`` checks each key's stamp
+        in its own slot, through the slot-aware pipeline.
+        """
+        self._check_tag_batch(batch_size)
+        tag_keys = self._tag_keys(tags)
+        deleted = 0
+        for tag_key in tag_keys:
+            while popped := self.adapter.zpopmin(tag_key, batch_size):
+                members = [_tag_member(member) for member, _ in popped]
+                pipe = self.adapter.pipeline(transaction=False)
+                self._queue_drop_tagged(pipe, members, tag_keys)
+                dropped = [member for member, gone in zip(members, pipe.execute(), strict=True) if gone]
+                deleted += len(dropped)
+                self._forget_written(*dropped)
+        return deleted
+
+    @override
+    async def ainvalidate_tags(self, tags: Iterable[str], *, batch_size: int = _TAG_BATCH) -> int:
+        """Async :meth:`invalidate_tags`."""
+        self._check_tag_batch(batch_size)
+        tag_keys = self._tag_keys(tags)
+        deleted = 0
+        for tag_key in tag_keys:
+            while popped := await self.adapter.azpopmin(tag_key, batch_size):
+                members = [_tag_member(member) for member, _ in popped]
+                pipe = await self.adapter.apipeline(transaction=False)
+                self._queue_drop_tagged(pipe, members, tag_keys)
+                dropped = [member for member, gone in zip(members, await pipe.execute(), strict=True) if gone]
+                deleted += len(dropped)
+                self._forget_written(*dropped)
+        return deleted
+
+    def _queue_drop_tagged(
+        self,
+        pipe: RespPipelineProtocol | RespAsyncPipelineProtocol,
+        members: Sequence[str],
+        tag_keys: Sequence[str],
+    ) -> None:
+        chunked = int(self._chunking is not None)
+        for member in members:
+            pipe.execute_command("EVAL", _tags_lua.DROP_TAGGED_LUA, 1, member, chunked, *tag_keys)
+
     @override
     def incr_version(self, key: str, delta: int = 1, version: int | None = None) -> int:
         """Cluster mode can't ``RENAME`` across slots.
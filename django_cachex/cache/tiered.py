@@ -39,6 +39,7 @@ from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 from django.core.exceptions import ImproperlyConfigured
 
 from django_cachex.cache.base import BaseCachex, CachexSupportLevel
+from django_cachex.cache.resp import RespCache
 from django_cachex.exceptions import NotSupportedError
 
 if TYPE_CHECKING:
@@ -345,6 +346,71 @@ class TieredCache(BaseCachex):
             self._l1.set(key, value, self._l1_timeout_for_set(timeout), version=version)
         return result
 
+    def get_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+        *,
+        stale_while_revalidate: float | None = None,
+    ) -> Any:
+        """Django's ``get_or_set``, plus ``stale_while_revalidate`` handled by L2.
+
+        With ``stale_while_revalidate``, an L1 miss goes straight to L2's own
+        ``get_or_set``, which may return a stale value and refresh it in the
+        background. Only a fresh value is copied into L1, so L1 never extends
+        the life of a stale entry; the next fresh read fills it.
+        """
+        if stale_while_revalidate is None:
+            return super().get_or_set(key, default, timeout, version=version)
+        l2 = self._swr_l2()
+        val = self._l1.get(key, _L1_MISS, version=version)
+        if val is not _L1_MISS:
+            return val
+        val, fresh = l2._get_or_set_fresh(key, default, timeout, version, None, False, stale_while_revalidate)
+        if fresh:
+            l2_ttl = self._get_l2_ttl(key, version=version)
+            self._l1.set(key, val, self._l1_timeout(l2_ttl), version=version)
+        return val
+
+    async def aget_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+        *,
+        stale_while_revalidate: float | None = None,
+    ) -> Any:
+        """Async :meth:`get_or_set`."""
+        if stale_while_revalidate is None:
+            return await super().aget_or_set(key, default, timeout, version=version)
+        l2 = self._swr_l2()
+        val = self._l1.get(key, _L1_MISS, version=version)
+        if val is not _L1_MISS:
+            return val
+        val, fresh = await l2._aget_or_set_fresh(
+            key,
+            default,
+            timeout,
+            version,
+            None,
+            False,
+            stale_while_revalidate,
+        )
+        if fresh:
+            l2_ttl = await self._aget_l2_ttl(key, version=version)
+            self._l1.set(key, val, self._l1_timeout(l2_ttl), version=version)
+        return val
+
+    def _swr_l2(self) -> RespCache:
+        """L2, if it can serve ``stale_while_revalidate`` (a RESP cache)."""
+        l2 = self._l2
+        if not isinstance(l2, RespCache):
+            raise NotSupportedError("get_or_set(stale_while_revalidate=...)", backend=type(l2).__name__)
+        return l2
+
     def delete(self, key: str, version: int | None = None) -> bool:
         self._l1.delete(key, version=version)
         return self._l2.delete(key, version=version)
@@ -0,0 +1,129 @@
+"""Transparent chunking of large values (``OPTIONS["chunking"]``).
+
+A multi-megabyte value makes every command touching it slow, stalls the
+server's other clients while it is copied, and can exceed the request
+size limit of a proxy in front of Redis. With the option on, encoded
+values of at least ``threshold`` bytes are split into ``chunk_size``
+pieces stored under their own keys, and the value's key holds a small
+manifest instead. The chunks and the manifest are written in one
+``set_many()`` call with the same TTL; reads fetch the manifest, then all
+chunks with one ``MGET``.
+
+Chunk keys wrap the value's key in a hash tag (or reuse its own), so on
+cluster they live in the value's slot. Every chunk starts with the random
+write id of its manifest: a reader that sees chunks from another write,
+or chunks that expired or were evicted, treats the value as a miss.
+"""
+
+import logging
+import secrets
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# Manifest: magic, write id, chunk count, total size of the encoded value.
+CHUNK_MAGIC = b"\x00ck\x01"
+_MANIFEST = struct.Struct("!4s8sIQ")
+MANIFEST_SIZE = _MANIFEST.size
+WRITE_ID_SIZE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkingConfig:
+    # threshold:  encoded values of at least this many bytes are chunked.
+    # chunk_size: bytes of the encoded value stored per chunk key.
+    threshold: int = 1024 * 1024
+    chunk_size: int = 512 * 1024
+
+
+_CHUNKING_FIELDS = ChunkingConfig.__slots__
+
+
+def make_chunking_config(option: bool | int | dict | None) -> ChunkingConfig | None:
+    """Build a ``ChunkingConfig`` from the ``chunking`` OPTIONS value.
+
+    ``True`` uses the defaults, an int sets ``threshold``.
+    """
+    if option is None or option is False:
+        return None
+    if option is True:
+        option = {}
+    elif type(option) is int:
+        option = {"threshold": option}
+    elif not isinstance(option, dict):
+        msg = f"chunking must be True, a byte threshold or a dict, got {option!r}"
+        raise ImproperlyConfigured(msg)
+    unknown = sorted(set(option) - set(_CHUNKING_FIELDS))
+    if unknown:
+        logger.warning(
+            "chunking: ignoring unknown keys %s (valid: %s)",
+            unknown,
+            _CHUNKING_FIELDS,
+        )
+    config = ChunkingConfig(**{k: v for k, v in option.items() if k in _CHUNKING_FIELDS})
+    for name in _CHUNKING_FIELDS:
+        value = getattr(config, name)
+        if type(value) is not int or value <= 0:
+            msg = f"chunking[{name!r}] must be a positive integer, got {value!r}"
+            raise ImproperlyConfigured(msg)
+    return config
+
+
+@dataclass(frozen=True, slots=True)
+class Manifest:
+    write_id: bytes
+    count: int
+    size: int
+
+
+def split_value(value: bytes, chunk_size: int) -> tuple[bytes, list[bytes]]:
+    """Split an encoded value into its manifest and chunks."""
+    write_id = secrets.token_bytes(WRITE_ID_SIZE)
+    view = memoryview(value)
+    chunks = [write_id + view[start : start + chunk_size] for start in range(0, len(value), chunk_size)]
+    return _MANIFEST.pack(CHUNK_MAGIC, write_id, len(chunks), len(value)), chunks
+
+
+def parse_manifest(value: Any) -> Manifest | None:
+    """The manifest stored in place of a chunked value, or ``None`` for any other value."""
+    if type(value) is not bytes or len(value) != MANIFEST_SIZE or not value.startswith(CHUNK_MAGIC):
+        return None
+    _magic, write_id, count, size = _MANIFEST.unpack(value)
+    return Manifest(write_id, count, size)
+
+
+def chunk_data(manifest: Manifest, chunk: Any) -> memoryview | None:
+    """A chunk's share of the value, or ``None`` if it is missing or from another write."""
+    if type(chunk) is not bytes or not chunk.startswith(manifest.write_id):
+        return None
+    return memoryview(chunk)[WRITE_ID_SIZE:]
+
+
+def join_chunks(manifest: Manifest, chunks: Sequence[Any]) -> bytes | None:
+    """Reassemble the encoded value; ``None`` if any chunk is missing, from another write, or short."""
+    parts = []
+    for chunk in chunks:
+        data = chunk_data(manifest, chunk)
+        if data is None:
+            return None
+        parts.append(data)
+    value = b"".join(parts)
+    return value if len(value) == manifest.size else None
+
+
+__all__ = [
+    "ChunkingConfig",
+    "Manifest",
+    "chunk_data",
+    "join_chunks",
+    "make_chunking_config",
+    "parse_manifest",
+    "split_value",
+]
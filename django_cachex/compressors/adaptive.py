@@ -0,0 +1,214 @@
+"""Compression that backs off where it doesn't pay (``AdaptiveCompressor``).
+
+Images, already-compressed blobs and random tokens burn CPU in the
+compressor and come out no smaller. The wrapper keeps a running
+compression ratio per key prefix, and for payloads more than twice
+``probe_size`` it first compresses only a ``probe_size`` sample. A prefix
+whose ratio stays below ``min_ratio``, or a payload whose sample misses
+it, is passed through: ``compress`` hands back its input unchanged, which
+the codec header records as "stored uncompressed" and the compressor
+fallback reads back as-is. One value in ``reprobe_every`` of a skipped
+prefix is still compressed, so the decision follows data that changes.
+"""
+
+import copy
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from django_cachex.compressors.base import BaseCompressor
+from django_cachex.exceptions import CompressorError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Weight of the newest measurement in a prefix's running ratio.
+_EWMA_ALPHA = 0.2
+# Bucket for prefixes seen after ``max_prefixes`` distinct ones.
+OVERFLOW_PREFIX = "*"
+
+
+class _PrefixStats:
+    __slots__ = ("bytes_in", "bytes_out", "compressed", "expected_ratio", "ns", "skipped", "values")
+
+    def __init__(self, expected_ratio: float | None = None) -> None:
+        self.values = 0
+        self.compressed = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.ns = 0
+        self.expected_ratio = expected_ratio
+
+
+class AdaptiveCompressor(BaseCompressor):
+    """Wraps a compressor and stores payloads uncompressed when compression doesn't pay.
+
+    JPEG thumbnails, already-compressed blobs and random tokens cost CPU to
+    compress and come out no smaller. Each payload above ``min_length`` is
+    checked, cheapest test first:
+
+    - Key prefixes (the cache key up to its last ``separator``) whose values
+      keep compressing worse than ``min_ratio`` are stored as-is without
+      trying; one value in ``reprobe_every`` is still compressed, so a
+      prefix whose data changes is picked up again.
+    - Payloads larger than ``2 * probe_size`` compress their first
+      ``probe_size`` bytes first and skip the rest if that sample misses
+      ``min_ratio``.
+    - Anything else is compressed, and the result is only kept if it
+      reaches ``min_ratio``.
+
+    ``levels`` maps payload sizes to compression levels: ``{0: 6, 65_536: 1}``
+    compresses payloads of 64 KiB and up at level 1. Per-prefix counts,
+    ratios and compression time are reported by :meth:`stats` and under
+    ``cache.info()["compression"]``. Configure an instance in ``OPTIONS`` to
+    share one set of stats across threads.
+
+    Writes through ``set()``, ``add()`` and ``set_many()`` (and their async
+    variants) see the key; other values are tracked under the ``""`` prefix.
+    """
+
+    def __init__(
+        self,
+        compressor: str | type | BaseCompressor = "django_cachex.compressors.zstd.ZstdCompressor",
+        *,
+        min_ratio: float = 1.1,
+        probe_size: int = 4096,
+        levels: Mapping[int, int] | None = None,
+        separator: str = ":",
+        reprobe_every: int = 32,
+        max_prefixes: int = 1000,
+        min_length: int | None = None,
+    ) -> None:
+        inner = import_string(compressor) if isinstance(compressor, str) else compressor
+        self._compressor: BaseCompressor = inner() if callable(inner) else inner
+        super().__init__(min_length=self._compressor.min_length if min_length is None else min_length)
+        # Frames name the wrapped format; the wrapper doesn't add one.
+        self.codec_id = self._compressor.codec_id
+        if min_ratio <= 0 or probe_size <= 0 or reprobe_every <= 0 or max_prefixes <= 0:
+            msg = "AdaptiveCompressor min_ratio, probe_size, reprobe_every and max_prefixes must be positive"
+            raise ImproperlyConfigured(msg)
+        self.min_ratio = min_ratio
+        self.probe_size = probe_size
+        self.separator = separator
+        self.reprobe_every = reprobe_every
+        self.max_prefixes = max_prefixes
+        self._levels = self._level_compressors(levels or {})
+        self._lock = threading.Lock()
+        self._stats: dict[str, _PrefixStats] = {}
+
+    def _level_compressors(self, levels: Mapping[int, int]) -> list[tuple[int, BaseCompressor]]:
+        """``(min_size, compressor)`` pairs, largest size first."""
+        if levels and not hasattr(self._compressor, "level"):
+            msg = f"AdaptiveCompressor levels need a compressor with a level, got {type(self._compressor).__name__}"
+            raise ImproperlyConfigured(msg)
+        result = []
+        for size, level in sorted(levels.items(), reverse=True):
+            clone = copy.copy(self._compressor)
+            clone.level = level  # type: ignore[attr-defined]
+            result.append((size, clone))
+        return result
+
+    def _compressor_for(self, size: int) -> BaseCompressor:
+        for min_size, compressor in self._levels:
+            if size >= min_size:
+                return compressor
+        return self._compressor
+
+    def _prefix_stats(self, prefix: str) -> _PrefixStats:
+        # Called with the lock held.
+        stats = self._stats.get(prefix)
+        if stats is None:
+            if len(self._stats) >= self.max_prefixes:
+                prefix = OVERFLOW_PREFIX
+                stats = self._stats.get(prefix)
+            if stats is None:
+                stats = self._stats[prefix] = _PrefixStats()
+        return stats
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compress_for_key(data, None)
+
+    def compress_for_key(self, data: bytes, key: str | None) -> bytes:
+        """Compress ``data`` stored under ``key``, or return it unchanged if that doesn't pay."""
+        size = len(data)
+        if size <= self.min_length:
+            return data
+        prefix = "" if key is None else key.rpartition(self.separator)[0]
+        with self._lock:
+            stats = self._prefix_stats(prefix)
+            stats.values += 1
+            expected = stats.expected_ratio
+            skip = expected is not None and expected < self.min_ratio and stats.values % self.reprobe_every != 0
+            if skip:
+                stats.skipped += 1
+                stats.bytes_in += size
+                stats.bytes_out += size
+        if skip:
+            return data
+
+        compressor = self._compressor_for(size)
+        start = time.perf_counter_ns()
+        try:
+            result = data
+            probe = self.probe_size
+            if size > 2 * probe:
+                ratio = probe / len(compressor._compress(data[:probe]))
+                if ratio >= self.min_ratio:
+                    packed = compressor._compress(data)
+                    ratio = size / len(packed)
+                    if ratio >= self.min_ratio:
+                        result = packed
+            else:
+                packed = compressor._compress(data)
+                ratio = size / len(packed)
+                if ratio >= self.min_ratio:
+                    result = packed
+        except Exception as e:
+            raise CompressorError from e
+        elapsed = time.perf_counter_ns() - start
+
+        with self._lock:
+            previous = stats.expected_ratio
+            stats.expected_ratio = ratio if previous is None else previous + _EWMA_ALPHA * (ratio - previous)
+            if result is data:
+                stats.skipped += 1
+            else:
+                stats.compressed += 1
+            stats.bytes_in += size
+            stats.bytes_out += len(result)
+            stats.ns += elapsed
+        return result
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._compressor.decompress(data)
+
+    def stats(self, *, reset: bool = False) -> dict[str, dict[str, Any]]:
+        """Per-prefix ``{"values", "compressed", "skipped", "bytes_in", "bytes_out", "ratio", ...}``.
+
+        ``ratio`` is what was actually stored (``bytes_in / bytes_out``,
+        skipped values included), ``expected_ratio`` the running estimate
+        that decides skipping, and ``compress_ms`` the total time spent
+        compressing. ``reset=True`` starts a fresh window but keeps the
+        learned estimates.
+        """
+        with self._lock:
+            result = {
+                prefix: {
+                    "values": stats.values,
+                    "compressed": stats.compressed,
+                    "skipped": stats.skipped,
+                    "bytes_in": stats.bytes_in,
+                    "bytes_out": stats.bytes_out,
+                    "ratio": round(stats.bytes_in / stats.bytes_out, 3) if stats.bytes_out else None,
+                    "expected_ratio": None if stats.expected_ratio is None else round(stats.expected_ratio, 3),
+                    "compress_ms": round(stats.ns / 1e6, 3),
+                }
+                for prefix, stats in sorted(self._stats.items())
+            }
+            if reset:
+                self._stats = {prefix: _PrefixStats(stats.expected_ratio) for prefix, stats in self._stats.items()}
+        return result
@@ -11,8 +11,11 @@ class BaseCompressor:
 
     Subclasses implement ``_compress`` and ``_decompress``. Compression is
     skipped for values up to ``min_length`` bytes (boundary inclusive).
+    ``codec_id`` (1-13) names the format in the ``codec_header`` frame;
+    built-ins use 1-5, so custom compressors should pick from the top.
     """
 
+    codec_id: int | None = None
     min_length: int = 256
 
     def __init__(self, *, min_length: int | None = None) -> None:
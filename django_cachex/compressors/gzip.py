@@ -11,6 +11,7 @@ from django_cachex.compressors.base import BaseCompressor
 class GzipCompressor(BaseCompressor):
     """gzip compressor with configurable compression level."""
 
+    codec_id = 2
     level: int = 9
 
     def __init__(self, *, level: int | None = None, min_length: int | None = None) -> None:
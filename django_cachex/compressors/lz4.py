@@ -13,6 +13,7 @@ class Lz4Compressor(BaseCompressor):
     compressor at all.
     """
 
+    codec_id = 4
     level: int = 0
 
     def __init__(self, *, level: int | None = None, min_length: int | None = None) -> None:
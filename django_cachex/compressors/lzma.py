@@ -6,6 +6,7 @@ from django_cachex.compressors.base import BaseCompressor
 class LzmaCompressor(BaseCompressor):
     """LZMA compressor with configurable compression level (``preset`` in lzma terms)."""
 
+    codec_id = 3
     level: int = 4
 
     def __init__(self, *, level: int | None = None, min_length: int | None = None) -> None:
@@ -6,6 +6,7 @@ from django_cachex.compressors.base import BaseCompressor
 class ZlibCompressor(BaseCompressor):
     """zlib compressor with configurable compression level."""
 
+    codec_id = 1
     level: int = 6
 
     def __init__(self, *, level: int | None = None, min_length: int | None = None) -> None:
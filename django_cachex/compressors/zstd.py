@@ -1,20 +1,94 @@
 from compression import zstd
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ImproperlyConfigured
 
 from django_cachex.compressors.base import BaseCompressor
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type DictionarySource = str | PathLike[str] | bytes | zstd.ZstdDict
+
 
 class ZstdCompressor(BaseCompressor):
-    """Zstandard compressor with configurable compression level."""
+    """Zstandard compressor with configurable compression level.
+
+    ``dictionaries`` loads trained dictionaries (file paths, raw dictionary
+    bytes, or ``ZstdDict`` objects; see the ``cachex_train_zstd_dict``
+    management command). New values are compressed with the one whose id
+    is ``dictionary_id`` (default: the first). Every zstd frame records the
+    id of the dictionary it needs, so values written with any of the
+    loaded dictionaries, or with none, stay readable while a new one rolls
+    out. With a dictionary, ``min_length`` defaults to
+    ``dictionary_min_length``, since shared structure makes even small
+    values worth compressing.
+    """
 
+    codec_id = 5
     level: int = 3
+    dictionary_min_length: int = 32
 
-    def __init__(self, *, level: int | None = None, min_length: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        level: int | None = None,
+        min_length: int | None = None,
+        dictionaries: Iterable[DictionarySource] = (),
+        dictionary_id: int | None = None,
+    ) -> None:
         super().__init__(min_length=min_length)
         if level is not None:
             self.level = level
+        self._dictionaries: dict[int, zstd.ZstdDict] = {}
+        for source in dictionaries:
+            dictionary = _load_dictionary(source)
+            self._dictionaries.setdefault(dictionary.dict_id, dictionary)
+        self._dictionary: zstd.ZstdDict | None = None
+        if self._dictionaries:
+            if dictionary_id is None:
+                dictionary_id = next(iter(self._dictionaries))
+            if dictionary_id not in self._dictionaries:
+                msg = (
+                    f"ZstdCompressor dictionary_id {dictionary_id} is not among the loaded {sorted(self._dictionaries)}"
+                )
+                raise ImproperlyConfigured(msg)
+            self._dictionary = self._dictionaries[dictionary_id]
+            if min_length is None:
+                self.min_length = self.dictionary_min_length
+        elif dictionary_id is not None:
+            msg = "ZstdCompressor dictionary_id needs dictionaries"
+            raise ImproperlyConfigured(msg)
+
+    @property
+    def dictionary_id(self) -> int | None:
+        """Id of the dictionary new values are compressed with, if any."""
+        return None if self._dictionary is None else self._dictionary.dict_id
 
     def _compress(self, data: bytes) -> bytes:
-        return zstd.compress(data, level=self.level)
+        return zstd.compress(data, level=self.level, zstd_dict=self._dictionary)
 
     def _decompress(self, data: bytes) -> bytes:
+        if self._dictionaries:
+            dictionary_id = zstd.get_frame_info(data).dictionary_id
+            if dictionary_id:
+                dictionary = self._dictionaries.get(dictionary_id)
+                if dictionary is None:
+                    msg = f"zstd frame needs dictionary {dictionary_id}, which is not loaded"
+                    raise ValueError(msg)
+                return zstd.decompress(data, zstd_dict=dictionary)
         return zstd.decompress(data)
+
+
+def _load_dictionary(source: DictionarySource) -> zstd.ZstdDict:
+    if isinstance(source, zstd.ZstdDict):
+        dictionary = source
+    else:
+        content = source if isinstance(source, bytes) else Path(source).read_bytes()
+        dictionary = zstd.ZstdDict(content)
+    if not dictionary.dict_id:
+        msg = "ZstdCompressor dictionaries must be trained zstd dictionaries (dictionary id 0 is a raw-content dict)"
+        raise ImproperlyConfigured(msg)
+    return dictionary
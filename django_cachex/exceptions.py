@@ -8,6 +8,7 @@
 """Exceptions for django-cachex."""
 
 import socket
+from typing import Any
 
 # Network/server-side errors the client layer treats as transient or
 # backend-specific failures. Each block is best-effort: redis-py and
@@ -53,6 +54,27 @@ class SerializerError(CachexError):
     """Raised when serialization or deserialization fails. Triggers the client's serializer fallback."""
 
 
+class ChunkedValueError(CachexError):
+    """Raised when a chunked value is overwritten or expires while ``get_stream()`` is reading it."""
+
+
+class ClusterFanoutError(CachexError):
+    """Raised when a cluster ``get_many()`` / ``set_many()`` / ``delete_many()`` fails on some nodes only.
+
+    ``errors`` maps each failed node (``host:port``) to its exception and
+    ``keys`` to the keys sent to it, whose outcome is unknown. ``partial``
+    holds what the nodes that succeeded returned: the stored values by key
+    for ``get_many()``, the number of keys removed for ``delete_many()``.
+    """
+
+    def __init__(self, errors: dict[str, Exception], keys: dict[str, list[str]], partial: Any = None) -> None:
+        self.errors = errors
+        self.keys = keys
+        self.partial = partial
+        failed = ", ".join(f"{node} ({exc!r})" for node, exc in errors.items())
+        super().__init__(f"Cluster batch failed on {len(errors)} node(s): {failed}")
+
+
 class NotSupportedError(CachexError):
     """Raised when an operation is not supported by the cache backend."""
 
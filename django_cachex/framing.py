@@ -0,0 +1,123 @@
+"""Self-describing codec header for encoded cache values (``OPTIONS["codec_header"]``).
+
+Framed values start with two bytes: :data:`FRAME_MAGIC` and a byte
+holding the serializer's ``codec_id`` in the high nibble and the
+compressor's in the low nibble (0 = stored uncompressed). ``decode`` reads
+the header and calls exactly that serializer and compressor, instead of
+trying every configured one until something doesn't raise.
+
+``0xC1`` can't start a value written by any built-in codec: it is never
+used by msgpack, is not a pickle opcode, is not valid UTF-8 (so no JSON),
+and none of the built-in compressors' magic numbers begin with it. A
+value from a custom codec that happens to look like a header and then
+fails to decode goes through the regular fallback chain, so unframed
+values written before the option was turned on stay readable. The raw
+codecs below raise :class:`~django_cachex.exceptions.SerializerError` like
+any serializer, so they take part in that fallback too.
+
+``OPTIONS["raw_passthrough"]`` stores ``bytes`` and ``str`` values without
+a serializer, framed with the reserved serializer ids :data:`RAW_BYTES_ID`
+and :data:`RAW_STR_ID` (UTF-8), so they round-trip with their type.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.exceptions import SerializerError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+FRAME_MAGIC = 0xC1
+FRAME_SIZE = 2
+
+# Valid codec ids; 0 is reserved for "not compressed", and the serializer
+# ids above _MAX_CODEC_ID for raw passthrough values.
+_MAX_CODEC_ID = 13
+RAW_BYTES_ID = 14
+RAW_STR_ID = 15
+
+
+class _RawBytes:
+    @staticmethod
+    def loads(data: bytes) -> bytes:
+        return data
+
+
+class _RawStr:
+    @staticmethod
+    def loads(data: bytes) -> str:
+        try:
+            return data.decode()
+        except UnicodeDecodeError as e:
+            raise SerializerError from e
+
+
+_RAW_CODECS = {RAW_BYTES_ID: _RawBytes(), RAW_STR_ID: _RawStr()}
+
+
+def frame_header(serializer_id: int, compressor_id: int) -> bytes:
+    return bytes((FRAME_MAGIC, serializer_id << 4 | compressor_id))
+
+
+def codec_id(codec: Any, kind: str) -> int | None:
+    """``codec.codec_id``, validated; ``None`` for codecs that don't define one."""
+    ident = getattr(codec, "codec_id", None)
+    if ident is None:
+        return None
+    if type(ident) is not int or not 1 <= ident <= _MAX_CODEC_ID:
+        msg = f"{kind} {type(codec).__name__}.codec_id must be an integer from 1 to {_MAX_CODEC_ID}, got {ident!r}"
+        raise ImproperlyConfigured(msg)
+    return ident
+
+
+def _by_id(codecs: Sequence[Any], kind: str) -> dict[int, Any]:
+    result: dict[int, Any] = {}
+    for codec in codecs:
+        ident = codec_id(codec, kind)
+        if ident is None:
+            continue
+        other = result.setdefault(ident, codec)
+        if type(other) is not type(codec):
+            msg = (
+                f"{kind}s {type(other).__name__} and {type(codec).__name__} "
+                f"share codec_id {ident}; give custom codecs an unused id"
+            )
+            raise ImproperlyConfigured(msg)
+    return result
+
+
+def build_frame_table(
+    serializers: Sequence[Any],
+    compressors: Sequence[Any],
+    *,
+    raw: bool = False,
+) -> dict[int, tuple[Any, Any]]:
+    """Map each possible header byte to the configured codecs it names.
+
+    Codecs without a ``codec_id`` can't be framed and are left out; values
+    they wrote are still read through the fallback chain. The raw
+    passthrough ids are only mapped with ``raw``, so unframed values that
+    happen to start like one are left to the fallback chain otherwise.
+    """
+    serializer_ids = _by_id(serializers, "serializer")
+    if raw:
+        serializer_ids.update(_RAW_CODECS)
+    compressor_ids: dict[int, Any] = {0: None, **_by_id(compressors, "compressor")}
+    return {
+        s_id << 4 | c_id: (serializer, compressor)
+        for s_id, serializer in serializer_ids.items()
+        for c_id, compressor in compressor_ids.items()
+    }
+
+
+__all__ = [
+    "FRAME_MAGIC",
+    "FRAME_SIZE",
+    "RAW_BYTES_ID",
+    "RAW_STR_ID",
+    "build_frame_table",
+    "codec_id",
+    "frame_header",
+]
@@ -0,0 +1,359 @@
+"""Hot-key detection for ``RespCache`` (``OPTIONS["hot_keys"]``).
+
+A sampled fraction of the adapter calls that read or write keys feeds the
+made keys into streaming top-K trackers: a Count-Min Sketch estimates how
+often each key was seen, and a min-heap keeps the ``top_k`` keys with the
+largest estimates. The same is done for key prefixes (the key up to its
+last ``separator``), separately for reads and writes.
+
+Memory is fixed by the configuration: four sketches of ``width * depth``
+8-byte counters plus at most ``top_k`` keys each, whatever the keyspace.
+Counts are scaled by ``1 / sample_rate``, so they estimate real accesses;
+the sketch only over-estimates, by at most ``e / width`` of the sampled
+total with probability ``1 - exp(-depth)``.
+"""
+
+import heapq
+import logging
+import random
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Adapter methods whose first argument is a key (or a list / mapping of
+# keys), by operation type. Anything else passes through unsampled.
+_READS = frozenset(
+    {
+        "get",
+        "get_many",
+        "has_key",
+        "ttl",
+        "pttl",
+        "expiretime",
+        "type",
+        "hget",
+        "hgetall",
+        "hmget",
+        "hkeys",
+        "hvals",
+        "hlen",
+        "hexists",
+        "lrange",
+        "llen",
+        "lindex",
+        "lpos",
+        "smembers",
+        "scard",
+        "sismember",
+        "smismember",
+        "srandmember",
+        "zrange",
+        "zrevrange",
+        "zrangebyscore",
+        "zrevrangebyscore",
+        "zscore",
+        "zmscore",
+        "zrank",
+        "zrevrank",
+        "zcard",
+        "zcount",
+        "xrange",
+        "xrevrange",
+        "xlen",
+    },
+)
+_WRITES = frozenset(
+    {
+        "set",
+        "set_many",
+        "set_with_flags",
+        "add",
+        "delete",
+        "delete_many",
+        "incr",
+        "incrby",
+        "decrby",
+        "touch",
+        "expire",
+        "expireat",
+        "pexpire",
+        "pexpireat",
+        "persist",
+        "hset",
+        "hsetnx",
+        "hdel",
+        "hincrby",
+        "hincrbyfloat",
+        "lpush",
+        "rpush",
+        "lpop",
+        "rpop",
+        "lset",
+        "ltrim",
+        "lrem",
+        "linsert",
+        "sadd",
+        "srem",
+        "spop",
+        "zadd",
+        "zrem",
+        "zincrby",
+        "zpopmin",
+        "zpopmax",
+        "zremrangebyrank",
+        "zremrangebyscore",
+        "xadd",
+        "xdel",
+        "xtrim",
+    },
+)
+
+_OPS = dict.fromkeys(_READS, "read") | dict.fromkeys(_WRITES, "write")
+
+# Second hash seed for double hashing (Kirsch-Mitzenmacher).
+_SEED = 0x9E3779B97F4A7C15
+
+
+@dataclass(frozen=True, slots=True)
+class HotKeyConfig:
+    # sample_rate: fraction of key-addressed calls that are counted.
+    # top_k:       keys (and prefixes) reported per operation type.
+    # width:       counters per sketch row; bounds the estimation error.
+    # depth:       sketch rows; bounds the probability of exceeding it.
+    # separator:   a key's prefix is everything before its last separator.
+    sample_rate: float = 0.01
+    top_k: int = 20
+    width: int = 2048
+    depth: int = 4
+    separator: str = ":"
+
+
+_HOT_KEY_FIELDS = HotKeyConfig.__slots__
+
+
+def make_hot_keys_config(option: bool | dict | None) -> HotKeyConfig | None:
+    """Build a ``HotKeyConfig`` from the ``hot_keys`` OPTIONS value."""
+    if not option:
+        return None
+    if option is True:
+        option = {}
+    elif not isinstance(option, dict):
+        msg = f"hot_keys must be True or a dict, got {option!r}"
+        raise ImproperlyConfigured(msg)
+    unknown = sorted(set(option) - set(_HOT_KEY_FIELDS))
+    if unknown:
+        logger.warning(
+            "hot_keys: ignoring unknown keys %s (valid: %s)",
+            unknown,
+            _HOT_KEY_FIELDS,
+        )
+    config = HotKeyConfig(**{k: v for k, v in option.items() if k in _HOT_KEY_FIELDS})
+    rate = config.sample_rate
+    if isinstance(rate, bool) or not isinstance(rate, int | float) or not 0 < rate <= 1:
+        msg = f"hot_keys['sample_rate'] must be a number in (0, 1], got {rate!r}"
+        raise ImproperlyConfigured(msg)
+    for name in ("top_k", "width", "depth"):
+        value = getattr(config, name)
+        if type(value) is not int or value <= 0:
+            msg = f"hot_keys[{name!r}] must be a positive integer, got {value!r}"
+            raise ImproperlyConfigured(msg)
+    if not isinstance(config.separator, str) or not config.separator:
+        msg = f"hot_keys['separator'] must be a non-empty string, got {config.separator!r}"
+        raise ImproperlyConfigured(msg)
+    return config
+
+
+class CountMinSketch:
+    """``depth`` rows of ``width`` counters; estimates never under-count."""
+
+    __slots__ = ("_rows", "_width")
+
+    def __init__(self, width: int, depth: int) -> None:
+        self._width = width
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def add(self, item: str) -> int:
+        """Count one occurrence of ``item``; returns its new estimate."""
+        h1 = hash(item)
+        h2 = hash((item, _SEED)) | 1
+        width = self._width
+        estimate = 0
+        for i, row in enumerate(self._rows):
+            index = (h1 + i * h2) % width
+            row[index] += 1
+            estimate = row[index] if not i else min(estimate, row[index])
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        h1 = hash(item)
+        h2 = hash((item, _SEED)) | 1
+        return min(row[(h1 + i * h2) % self._width] for i, row in enumerate(self._rows))
+
+
+class TopK:
+    """Heavy hitters: a Count-Min Sketch plus a min-heap of the ``k`` largest estimates.
+
+    ``_top`` holds the current estimate of every tracked item; heap entries
+    go stale as those grow and are refreshed lazily when the minimum is
+    needed, so an update to a tracked item costs a dict store.
+    """
+
+    __slots__ = ("_heap", "_k", "_sketch", "_top")
+
+    def __init__(self, k: int, width: int, depth: int) -> None:
+        self._k = k
+        self._sketch = CountMinSketch(width, depth)
+        self._top: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def add(self, item: str) -> None:
+        estimate = self._sketch.add(item)
+        top = self._top
+        if item in top:
+            top[item] = estimate
+            return
+        heap = self._heap
+        if len(top) < self._k:
+            top[item] = estimate
+            heapq.heappush(heap, (estimate, item))
+            return
+        # Refresh stale minimums until the heap head is current.
+        while (current := top[heap[0][1]]) != heap[0][0]:
+            heapq.heapreplace(heap, (current, heap[0][1]))
+        if estimate > heap[0][0]:
+            _, evicted = heapq.heapreplace(heap, (estimate, item))
+            del top[evicted]
+            top[item] = estimate
+
+    def items(self) -> list[tuple[str, int]]:
+        """Tracked items, most frequent first."""
+        return sorted(self._top.items(), key=lambda item: (-item[1], item[0]))
+
+
+class HotKeyTracker:
+    """Sampled read/write key and prefix counters for one cache scope."""
+
+    def __init__(self, config: HotKeyConfig) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        config = self.config
+        self._sampled = 0
+        self._trackers = {
+            (op, kind): TopK(config.top_k, config.width, config.depth)
+            for op in ("read", "write")
+            for kind in ("keys", "prefixes")
+        }
+
+    def observe(self, op: str, keys: Iterable[str]) -> None:
+        """Count one sampled access to each of ``keys``."""
+        separator = self.config.separator
+        with self._lock:
+            key_counts = self._trackers[op, "keys"]
+            prefix_counts = self._trackers[op, "prefixes"]
+            for key in keys:
+                if not isinstance(key, str):
+                    continue
+                self._sampled += 1
+                key_counts.add(key)
+                prefix, found, _ = key.rpartition(separator)
+                prefix_counts.add(prefix if found else "")
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, Any]:
+        """``{"read": {"keys": [...], "prefixes": [...]}, "write": {...}, ...}``.
+
+        Entries are ``{"key": ..., "count": ...}`` (``"prefix"`` for
+        prefixes), with counts scaled up to estimated accesses.
+        """
+        scale = 1 / self.config.sample_rate
+        with self._lock:
+            result: dict[str, Any] = {
+                "sample_rate": self.config.sample_rate,
+                "sampled": self._sampled,
+            }
+            for (op, kind), tracker in self._trackers.items():
+                label = "key" if kind == "keys" else "prefix"
+                result.setdefault(op, {})[kind] = [
+                    {label: item, "count": round(count * scale)} for item, count in tracker.items()
+                ]
+            if reset:
+                self._reset()
+        return result
+
+
+def _sampled(
+    fn: Callable[..., Any],
+    op: str,
+    tracker: HotKeyTracker,
+    rate: float,
+) -> Callable[..., Any]:
+    observe = tracker.observe
+    rand = random.random
+
+    # Sampling happens before the call, so one sync wrapper serves async
+    # methods as well: it hands back their awaitable untouched.
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        if args and rand() < rate:
+            keys = args[0]
+            observe(op, (keys,) if type(keys) is str else keys)
+        return fn(*args, **kwargs)
+
+    return _wrapper
+
+
+class SampledAdapter:
+    """Adapter proxy that feeds sampled key accesses into a :class:`HotKeyTracker`.
+
+    Only methods in the read / write tables are wrapped (their async twins
+    too); everything else is the adapter's own attribute.
+    """
+
+    def __init__(self, adapter: Any, tracker: HotKeyTracker) -> None:
+        self._adapter = adapter
+        self._tracker = tracker
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._adapter, name)
+        op = _OPS.get(name) or (_OPS.get(name[1:]) if name.startswith("a") else None)
+        if op is None:
+            return attr
+        wrapped = _sampled(attr, op, self._tracker, self._tracker.config.sample_rate)
+        self.__dict__[name] = wrapped
+        return wrapped
+
+
+# (scope, config) -> tracker. The config is part of the key, so caches on the
+# same scope with different settings each keep their own counts instead of
+# replacing each other's tracker.
+_REGISTRY: dict[tuple[Hashable, HotKeyConfig], HotKeyTracker] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def shared_tracker(scope: Hashable, config: HotKeyConfig) -> HotKeyTracker:
+    """The process-wide tracker for ``scope`` and ``config``, created on first use."""
+    with _REGISTRY_LOCK:
+        tracker = _REGISTRY.get((scope, config))
+        if tracker is None:
+            tracker = _REGISTRY[scope, config] = HotKeyTracker(config)
+        return tracker
+
+
+__all__ = [
+    "CountMinSketch",
+    "HotKeyConfig",
+    "HotKeyTracker",
+    "SampledAdapter",
+    "TopK",
+    "make_hot_keys_config",
+    "shared_tracker",
+]
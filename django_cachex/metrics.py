@@ -0,0 +1,390 @@
+"""Client-side command metrics for ``RespCache`` (``OPTIONS["metrics"]``).
+
+With metrics on, the cache's adapter is wrapped in an
+:class:`InstrumentedAdapter` that times every public adapter method (sync,
+async, and pipeline ``execute``) and records, per command:
+
+- calls and errors,
+- bytes sent (``bytes`` arguments, and the values of a mapping argument
+  such as ``set_many``'s) and bytes received (a ``bytes`` reply, or the
+  ``bytes`` items of a list / dict reply),
+- latency in a log-linear histogram: exact below 16 ns, then 8 buckets per
+  power of two, so any quantile is within 12.5% of the true value. A
+  sample costs a couple of integer ops and one list increment.
+
+Counters are process-wide (Django builds a cache per thread and per task)
+and shared by every cache instance with the same scope; read them with
+``cache.metrics()`` or, for all configured aliases, :func:`snapshot`.
+Every thread records into its own shard of the counters without taking a
+lock, so threads never contend on the hot path; reads merge the shards.
+"""
+
+import inspect
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+# Histogram layout: values below 2**(_SUB_BITS + 1) get their own bucket;
+# above that each power of two is split into 2**_SUB_BITS buckets.
+_SUB_BITS = 3
+_SUB_COUNT = 1 << _SUB_BITS
+_EXACT = _SUB_COUNT << 1
+_BUCKETS = (64 - _SUB_BITS) * _SUB_COUNT + _SUB_COUNT
+
+# Adapter methods that do no I/O of their own, hand out clients or
+# iterators, or are bookkeeping; they pass through untimed.
+_UNTIMED = frozenset(
+    {
+        "resolve_stampede",
+        "get_timeout_with_buffer",
+        "get_client",
+        "get_async_client",
+        "close",
+        "aclose",
+        "pool_stats",
+        "forget",
+    },
+)
+
+_QUANTILES = (("p50_us", 0.5), ("p90_us", 0.9), ("p99_us", 0.99))
+
+
+def _bucket(ns: int) -> int:
+    if ns < _EXACT:
+        return ns
+    shift = ns.bit_length() - _SUB_BITS - 1
+    return shift * _SUB_COUNT + (ns >> shift)
+
+
+def _bucket_value(index: int) -> float:
+    """Midpoint (ns) of the range covered by bucket ``index``."""
+    if index < _EXACT:
+        return float(index)
+    shift = index // _SUB_COUNT - 1
+    low = (index - shift * _SUB_COUNT) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+class Histogram:
+    """Log-linear (HDR-style) latency histogram in nanoseconds. Not locked."""
+
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        self.counts[_bucket(ns)] += 1
+        self.count += 1
+        self.total += ns
+        self.max = max(self.max, ns)
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile in nanoseconds (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_value(index), float(self.max))
+        return float(self.max)
+
+    def merge(self, other: Histogram) -> None:
+        """Add ``other``'s samples to this histogram."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> dict[str, float]:
+        result = {"mean_us": round(self.total / self.count / 1000, 3) if self.count else 0.0}
+        for name, q in _QUANTILES:
+            result[name] = round(self.quantile(q) / 1000, 3)
+        result["max_us"] = round(self.max / 1000, 3)
+        return result
+
+
+class CommandStats:
+    """Counters for one command on one thread. Only that thread writes them, so they aren't locked."""
+
+    __slots__ = ("bytes_in", "bytes_out", "errors", "latency")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.latency = Histogram()
+
+    def record(self, ns: int, bytes_out: int, bytes_in: int, failed: bool) -> None:
+        self.latency.record(ns)
+        self.bytes_out += bytes_out
+        self.bytes_in += bytes_in
+        if failed:
+            self.errors += 1
+
+    def merge(self, other: CommandStats) -> None:
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        self.bytes_out += other.bytes_out
+        self.bytes_in += other.bytes_in
+
+
+class CacheMetrics:
+    """Per-command counters for one cache scope; safe to share across threads.
+
+    Each thread gets its own ``CommandStats`` per command; ``snapshot()``
+    merges them. The shards of threads that have exited are folded into
+    one retired total, so short-lived threads don't pile up.
+    """
+
+    def __init__(self) -> None:
+        # Guards the shard registry, not the counters.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: dict[str, list[tuple[threading.Thread, CommandStats]]] = {}
+        self._retired: dict[str, CommandStats] = {}
+
+    def command(self, name: str) -> CommandStats:
+        """The calling thread's counters for ``name``, created on first use."""
+        shards = self._local.__dict__
+        stats = shards.get(name)
+        if stats is None:
+            stats = shards[name] = CommandStats()
+            with self._lock:
+                self._retire_exited()
+                self._shards.setdefault(name, []).append((threading.current_thread(), stats))
+        return stats
+
+    def _retire_exited(self) -> None:
+        for name, shards in self._shards.items():
+            exited = [entry for entry in shards if not entry[0].is_alive()]
+            if not exited:
+                continue
+            retired = self._retired.setdefault(name, CommandStats())
+            for entry in exited:
+                retired.merge(entry[1])
+                shards.remove(entry)
+
+    def record(self, command: str, ns: int, bytes_out: int = 0, bytes_in: int = 0, *, failed: bool = False) -> None:
+        self.command(command).record(ns, bytes_out, bytes_in, failed)
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, dict[str, Any]]:
+        """``{command: {"calls", "errors", "bytes_out", "bytes_in", "mean_us", "p50_us", ...}}``.
+
+        Commands with no calls since the last reset are left out. A sample
+        recorded by another thread while a reset runs may be dropped.
+        """
+        with self._lock:
+            self._retire_exited()
+            result = {}
+            for name in sorted(self._shards.keys() | self._retired.keys()):
+                parts = [stats for _, stats in self._shards.get(name, ())]
+                if name in self._retired:
+                    parts.append(self._retired[name])
+                stats = CommandStats()
+                for part in parts:
+                    stats.merge(part)
+                    if reset:
+                        part.reset()
+                if not stats.latency.count:
+                    continue
+                result[name] = {
+                    "calls": stats.latency.count,
+                    "errors": stats.errors,
+                    "bytes_out": stats.bytes_out,
+                    "bytes_in": stats.bytes_in,
+                    **stats.latency.summary(),
+                }
+            return result
+
+
+_BUFFERS = frozenset({bytes, bytearray, memoryview})
+
+# Default of the sync wrapper's ``stampede_prevention``: not passed at all.
+_NO_ARG = object()
+
+
+# Exact type checks instead of isinstance(): these run on every call.
+def _size_out(args: tuple[Any, ...], kwargs: dict[str, Any]) -> int:
+    size = 0
+    for arg in args:
+        kind = type(arg)
+        if kind in _BUFFERS:
+            size += len(arg)
+        elif kind is dict:
+            size += sum(len(v) for v in arg.values() if type(v) in _BUFFERS)
+    for value in kwargs.values():
+        if type(value) in _BUFFERS:
+            size += len(value)
+    return size
+
+
+def _size_in(result: Any) -> int:
+    kind = type(result)
+    if kind is bytes:
+        return len(result)
+    if kind is list:
+        return sum(len(v) for v in result if type(v) is bytes)
+    if kind is dict:
+        return sum(len(v) for v in result.values() if type(v) is bytes)
+    return 0
+
+
+def _record_sync(stats: CommandStats, ns: int, args: tuple[Any, ...], kwargs: dict[str, Any], result: Any) -> None:
+    """Record a sync call that succeeded; the argument scan is skipped for a lone key."""
+    stats.latency.record(ns)
+    if kwargs or len(args) != 1 or type(args[0]) is not str:
+        stats.bytes_out += _size_out(args, kwargs)
+    kind = type(result)
+    if kind is bytes:
+        stats.bytes_in += len(result)
+    elif kind is list or kind is dict:
+        stats.bytes_in += _size_in(result)
+
+
+def _timed(fn: Callable[..., Any], command: str, metrics: CacheMetrics, *, is_async: bool) -> Callable[..., Any]:
+    clock = time.perf_counter_ns
+    # The calling thread's counters for ``command``, cached per wrapper.
+    local = threading.local()
+
+    def shard() -> CommandStats:
+        try:
+            return local.stats
+        except AttributeError:
+            local.stats = metrics.command(command)
+            return local.stats
+
+    if is_async:
+
+        async def _atimed(*args: Any, **kwargs: Any) -> Any:
+            started = clock()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception:
+                shard().record(clock() - started, _size_out(args, kwargs), 0, True)
+                raise
+            shard().record(clock() - started, _size_out(args, kwargs), _size_in(result), False)
+            return result
+
+        return _atimed
+
+    # ``stampede_prevention`` is named so the keyword RespCache passes on
+    # nearly every call is forwarded without building a kwargs dict.
+    def _stimed(*args: Any, stampede_prevention: Any = _NO_ARG, **kwargs: Any) -> Any:
+        started = clock()
+        try:
+            if stampede_prevention is _NO_ARG:
+                result = fn(*args, **kwargs)
+            else:
+                result = fn(*args, stampede_prevention=stampede_prevention, **kwargs)
+        except Exception:
+            shard().record(clock() - started, _size_out(args, kwargs), 0, True)
+            raise
+        ns = clock() - started
+        try:
+            stats = local.stats
+        except AttributeError:
+            stats = shard()
+        _record_sync(stats, ns, args, kwargs, result)
+        return result
+
+    return _stimed
+
+
+class InstrumentedPipeline:
+    """Pipeline adapter proxy that times ``execute`` as the ``pipeline`` command."""
+
+    def __init__(self, pipeline: Any, metrics: CacheMetrics, *, is_async: bool) -> None:
+        self._pipeline = pipeline
+        self.execute = _timed(pipeline.execute, "pipeline", metrics, is_async=is_async)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pipeline, name)
+
+
+class InstrumentedAdapter:
+    """Adapter proxy that records a sample for every public method call.
+
+    Wrappers are built on first access and cached on the proxy, so later
+    calls skip ``__getattr__`` entirely.
+    """
+
+    def __init__(self, adapter: Any, metrics: CacheMetrics) -> None:
+        self._adapter = adapter
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._adapter, name)
+        if name.startswith("_") or name in _UNTIMED or "iter" in name or not callable(attr):
+            return attr
+        # Sync and async twins share one entry: ``aget`` is recorded as
+        # ``get``. Twins count as async even when they aren't coroutine
+        # functions (the Rust adapter returns its own awaitables).
+        twin = name.startswith("a") and hasattr(self._adapter, name[1:])
+        is_async = twin or inspect.iscoroutinefunction(attr)
+        if name in ("pipeline", "apipeline"):
+            wrapped = self._pipeline_factory(attr, is_async=is_async)
+        else:
+            wrapped = _timed(attr, name[1:] if twin else name, self._metrics, is_async=is_async)
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def _pipeline_factory(self, factory: Callable[..., Any], *, is_async: bool) -> Callable[..., Any]:
+        metrics = self._metrics
+        if is_async:
+
+            async def _apipeline(*args: Any, **kwargs: Any) -> Any:
+                return InstrumentedPipeline(await factory(*args, **kwargs), metrics, is_async=True)
+
+            return _apipeline
+
+        def _pipeline(*args: Any, **kwargs: Any) -> Any:
+            return InstrumentedPipeline(factory(*args, **kwargs), metrics, is_async=False)
+
+        return _pipeline
+
+
+_REGISTRY: dict[Hashable, CacheMetrics] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def shared_metrics(scope: Hashable) -> CacheMetrics:
+    """The process-wide metrics for ``scope``, created on first use."""
+    with _REGISTRY_LOCK:
+        metrics = _REGISTRY.get(scope)
+        if metrics is None:
+            metrics = _REGISTRY[scope] = CacheMetrics()
+        return metrics
+
+
+def snapshot(*, reset: bool = False) -> dict[str, dict[str, dict[str, Any]]]:
+    """Metrics of every configured cache alias that has ``OPTIONS["metrics"]`` on."""
+    from django.conf import settings
+    from django.core.cache import caches
+
+    result = {}
+    for alias in settings.CACHES:
+        metrics = getattr(caches[alias], "metrics", None)
+        if metrics is not None and (data := metrics(reset=reset)) is not None:
+            result[alias] = data
+    return result
+
+
+__all__ = [
+    "CacheMetrics",
+    "Histogram",
+    "InstrumentedAdapter",
+    "shared_metrics",
+    "snapshot",
+]
@@ -0,0 +1,167 @@
+"""Namespaces invalidated by a generation counter (``cache.namespace(name)``).
+
+Dropping every key of a tenant used to take ``delete_pattern()``, which
+SCANs the whole keyspace. A namespace folds a generation number into its
+keys instead: ``cache.namespace("tenant:42").get("k")`` reads
+``<prefix>:<version>:tenant:42:<generation>:k``. ``invalidate()`` is one
+``INCR`` of the generation key, in a Lua script that restarts a missing
+counter; keys of older generations are never read again and age out
+through their TTL (or eviction).
+
+The generation is read with one ``GET`` and kept in a process-wide cache
+for ``generation_ttl`` seconds, so other processes see an invalidation
+within that window; the invalidating process sees it at once. A missing
+generation key starts at the current time in milliseconds, so a counter
+that was evicted never restarts at a generation already used.
+
+The generation a call works with is kept in a context variable, so threads
+and tasks sharing one namespace each fold keys with the generation they
+read themselves.
+"""
+
+import contextvars
+import inspect
+import time
+from typing import TYPE_CHECKING, Any
+
+from django_cachex.cache import _namespace_lua
+
+if TYPE_CHECKING:
+    from django_cachex.cache.resp import RespCache
+
+# Seconds a namespace generation is cached in-process by default.
+DEFAULT_GENERATION_TTL = 1.0
+
+# (cache scope, generation key) -> (generation, monotonic expiry).
+_GENERATIONS: dict[tuple[Any, ...], tuple[int, float]] = {}
+
+# The generation each namespace last read in this thread / task, by scope.
+# One variable for all namespaces: a ContextVar per ``cache.namespace()``
+# call would leave an entry in a long-lived thread's context per request.
+# The mapping is replaced, never mutated, so copied contexts don't share writes.
+_CURRENT: contextvars.ContextVar[dict[tuple[Any, ...], int]] = contextvars.ContextVar("cachex_ns_current")
+
+
+def _initial_generation() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class CacheNamespace:
+    """A view of a ``RespCache`` whose keys carry a namespace and its generation.
+
+    Every public cache method is available and reads the current generation
+    first (``await``-ed for the ``a*`` methods). ``invalidate()`` /
+    ``ainvalidate()`` move the namespace to a new generation; ``clear()``
+    does the same rather than flushing the whole cache.
+    """
+
+    def __init__(self, cache: RespCache, name: str, *, generation_ttl: float = DEFAULT_GENERATION_TTL) -> None:
+        if not name:
+            msg = "namespace name must not be empty"
+            raise ValueError(msg)
+        self.name = name
+        self.generation_ttl = generation_ttl
+        self._base = cache
+        self._key = cache.make_and_validate_key(f"_ns:{name}")
+        self._scope = (*cache._flight_scope, self._key)
+        self._cache = cache._with_namespace(self)
+
+    def __repr__(self) -> str:
+        return f"<CacheNamespace {self.name!r}>"
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._cache, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+        if inspect.isasyncgenfunction(value):
+
+            async def aiterate(*args: Any, **kwargs: Any) -> Any:
+                await self.ageneration()
+                async for item in value(*args, **kwargs):
+                    yield item
+
+            return aiterate
+        if inspect.iscoroutinefunction(value):
+
+            async def acall(*args: Any, **kwargs: Any) -> Any:
+                await self.ageneration()
+                return await value(*args, **kwargs)
+
+            return acall
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self.generation()
+            return value(*args, **kwargs)
+
+        return call
+
+    def clear(self) -> None:
+        """Drop the namespace's keys (not the whole cache): same as :meth:`invalidate`."""
+        self.invalidate()
+
+    async def aclear(self) -> None:
+        """Async :meth:`clear`."""
+        await self.ainvalidate()
+
+    @property
+    def current(self) -> int:
+        """The generation last read or set by this thread / task."""
+        return _CURRENT.get({}).get(self._scope, 0)
+
+    def fold(self, key: str) -> str:
+        """The cache key ``key`` is stored under in the current generation (before prefixing)."""
+        return f"{self.name}:{self.current}:{key}"
+
+    def _cached(self) -> bool:
+        entry = _GENERATIONS.get(self._scope)
+        if entry is None or time.monotonic() >= entry[1]:
+            return False
+        self._set_current(entry[0])
+        return True
+
+    def _set_current(self, generation: int) -> None:
+        current = _CURRENT.get({})
+        if current.get(self._scope) != generation:
+            _CURRENT.set({**current, self._scope: generation})
+
+    def _store(self, generation: int) -> int:
+        _GENERATIONS[self._scope] = (generation, time.monotonic() + self.generation_ttl)
+        self._set_current(generation)
+        return generation
+
+    def generation(self) -> int:
+        """The namespace's current generation, from the in-process cache or the server."""
+        if self._cached():
+            return self.current
+        adapter = self._base.adapter
+        raw = adapter.get(self._key, stampede_prevention=False)
+        if raw is None:
+            initial = _initial_generation()
+            added = adapter.add(self._key, initial, None)
+            raw = initial if added else adapter.get(self._key, stampede_prevention=False)
+        return self._store(int(raw if raw is not None else _initial_generation()))
+
+    async def ageneration(self) -> int:
+        """Async :meth:`generation`."""
+        if self._cached():
+            return self.current
+        adapter = self._base.adapter
+        raw = await adapter.aget(self._key, stampede_prevention=False)
+        if raw is None:
+            initial = _initial_generation()
+            added = await adapter.aadd(self._key, initial, None)
+            raw = initial if added else await adapter.aget(self._key, stampede_prevention=False)
+        return self._store(int(raw if raw is not None else _initial_generation()))
+
+    def invalidate(self) -> int:
+        """Move the namespace to a new generation with one ``INCR``; returns the new generation."""
+        generation = self._base.adapter.eval(_namespace_lua.INVALIDATE_LUA, 1, self._key, _initial_generation())
+        return self._store(int(generation))
+
+    async def ainvalidate(self) -> int:
+        """Async :meth:`invalidate`."""
+        generation = await self._base.adapter.aeval(_namespace_lua.INVALIDATE_LUA, 1, self._key, _initial_generation())
+        return self._store(int(generation))
+
+
+__all__ = ["DEFAULT_GENERATION_TTL", "CacheNamespace"]
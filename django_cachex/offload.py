@@ -0,0 +1,85 @@
+"""Codec offload for async cache calls (``OPTIONS["async_offload"]``).
+
+Decompressing and unpickling a multi-megabyte value takes milliseconds,
+and on the async paths that time blocks every other coroutine of the
+worker. With the option on, ``aget()`` / ``aget_many()`` decode values of
+at least ``threshold`` bytes, and ``aset()`` / ``aadd()`` /
+``aset_many()`` encode ``bytes`` / ``str`` values of that size, on a
+process-wide thread pool instead. Compressors release the GIL, and on
+free-threaded builds the serializers run in parallel too.
+
+Smaller values stay on the loop: a thread hop costs more than decoding
+them. ``aget_many()`` yields to the loop after every ``chunk_bytes`` of
+inline decoding, so a large batch of small values doesn't stall it either.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.utils import LazyThreadPool
+
+logger = logging.getLogger(__name__)
+
+# Worker threads of the codec pool.
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True, slots=True)
+class OffloadConfig:
+    # threshold:   payloads of at least this many bytes are encoded / decoded
+    #              on the codec pool.
+    # chunk_bytes: aget_many() yields to the event loop after decoding this
+    #              many bytes inline.
+    threshold: int = 256 * 1024
+    chunk_bytes: int = 1024 * 1024
+
+
+_OFFLOAD_FIELDS = OffloadConfig.__slots__
+
+
+def make_offload_config(option: bool | int | dict | None) -> OffloadConfig | None:
+    """Build an ``OffloadConfig`` from the ``async_offload`` OPTIONS value.
+
+    ``True`` uses the defaults, an int sets ``threshold``.
+    """
+    if option is None or option is False:
+        return None
+    if option is True:
+        option = {}
+    elif type(option) is int:
+        option = {"threshold": option}
+    elif not isinstance(option, dict):
+        msg = f"async_offload must be True, a byte threshold or a dict, got {option!r}"
+        raise ImproperlyConfigured(msg)
+    unknown = sorted(set(option) - set(_OFFLOAD_FIELDS))
+    if unknown:
+        logger.warning(
+            "async_offload: ignoring unknown keys %s (valid: %s)",
+            unknown,
+            _OFFLOAD_FIELDS,
+        )
+    config = OffloadConfig(**{k: v for k, v in option.items() if k in _OFFLOAD_FIELDS})
+    for name in _OFFLOAD_FIELDS:
+        value = getattr(config, name)
+        if type(value) is not int or value <= 0:
+            msg = f"async_offload[{name!r}] must be a positive integer, got {value!r}"
+            raise ImproperlyConfigured(msg)
+    return config
+
+
+_CODEC_POOL = LazyThreadPool(MAX_WORKERS, "cachex-codec")
+
+
+def codec_pool() -> LazyThreadPool:
+    """The process-wide codec pool."""
+    return _CODEC_POOL
+
+
+__all__ = [
+    "OffloadConfig",
+    "codec_pool",
+    "make_offload_config",
+]
@@ -0,0 +1,116 @@
+"""Background refreshes for stale-while-revalidate reads.
+
+``get_or_set(..., stale_while_revalidate=N)`` hands a logically expired
+value straight back to the caller and schedules the recompute here instead
+of running it inline. Refreshes are deduplicated per key (a hot stale key
+queues one refresh, not one per request) and bounded: when too many are
+pending, new ones are dropped and a later read schedules them again.
+
+Sync callers share one process-wide thread pool, rebuilt after ``fork()``.
+Async callers get an asyncio task on the running loop.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from django_cachex.utils import LazyThreadPool
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Worker threads of the sync pool, and the cap on refreshes pending at once
+# (per process for threads, per event loop for tasks).
+MAX_WORKERS = 4
+MAX_PENDING = 256
+
+
+class ThreadRefresher:
+    """Run deduplicated refreshes on a small, lazily started thread pool."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS, max_pending: int = MAX_PENDING) -> None:
+        self._pool = LazyThreadPool(max_workers, "cachex-refresh")
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: set[Hashable] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> bool:
+        """Schedule ``fn`` unless a refresh for ``key`` is already pending.
+
+        Returns False when the refresh was skipped (duplicate or queue full).
+        """
+        with self._lock:
+            if (executor := self._pool.executor()) is not self._executor:
+                # A new pool after fork(): the parent's pending refreshes never run here.
+                self._executor = executor
+                self._pending.clear()
+            if key in self._pending or len(self._pending) >= self._max_pending:
+                return False
+            self._pending.add(key)
+        executor.submit(self._run, key, fn)
+        return True
+
+    def _run(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        try:
+            fn()
+        except Exception:
+            logger.exception("Background cache refresh failed for %r", key)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+
+class TaskRefresher:
+    """Run deduplicated refreshes as tasks on one event loop."""
+
+    def __init__(self, max_pending: int = MAX_PENDING) -> None:
+        self._max_pending = max_pending
+        # Strong references: the loop only keeps weak ones to its tasks.
+        self._tasks: dict[Hashable, asyncio.Task[None]] = {}
+
+    def submit(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """Start ``fn()`` as a task unless a refresh for ``key`` is already running."""
+        if key in self._tasks or len(self._tasks) >= self._max_pending:
+            return False
+        self._tasks[key] = asyncio.get_running_loop().create_task(self._run(key, fn))
+        return True
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await fn()
+        except Exception:
+            logger.exception("Background cache refresh failed for %r", key)
+        finally:
+            del self._tasks[key]
+
+
+_THREAD_REFRESHER = ThreadRefresher()
+_TASK_REFRESHERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TaskRefresher] = weakref.WeakKeyDictionary()
+
+
+def thread_refresher() -> ThreadRefresher:
+    """The process-wide thread refresher."""
+    return _THREAD_REFRESHER
+
+
+def task_refresher() -> TaskRefresher:
+    """The refresher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    refresher = _TASK_REFRESHERS.get(loop)
+    if refresher is None:
+        refresher = _TASK_REFRESHERS[loop] = TaskRefresher()
+    return refresher
+
+
+__all__ = [
+    "TaskRefresher",
+    "ThreadRefresher",
+    "task_refresher",
+    "thread_refresher",
+]
@@ -13,8 +13,12 @@ class BaseSerializer:
 
     Subclasses implement ``_dumps`` and ``_loads``. Plain ints pass through
     ``loads`` unchanged so Redis ``INCR`` results don't need re-decoding.
+    ``codec_id`` (1-13) names the format in the ``codec_header`` frame;
+    built-ins use 1-5, so custom serializers should pick from the top.
     """
 
+    codec_id: int | None = None
+
     def dumps(self, obj: Any) -> bytes:
         try:
             return self._dumps(obj)
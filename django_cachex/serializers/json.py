@@ -14,6 +14,8 @@ from django_cachex.serializers.base import BaseSerializer
 class JsonSerializer(BaseSerializer):
     """JSON serializer using ``DjangoJSONEncoder`` (handles datetime, UUID, etc.)."""
 
+    codec_id = 2
+
     def __init__(self, *, encoder_class: type[json.JSONEncoder] = DjangoJSONEncoder) -> None:
         super().__init__()
         self.encoder_class = encoder_class
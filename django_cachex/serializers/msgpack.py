@@ -13,6 +13,8 @@ from django_cachex.serializers.base import BaseSerializer
 class MsgpackSerializer(BaseSerializer):
     """MessagePack-based serializer."""
 
+    codec_id = 3
+
     def _dumps(self, obj: Any) -> bytes:
         return msgpack.dumps(obj)
 
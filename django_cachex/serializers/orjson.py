@@ -12,6 +12,8 @@ class OrjsonSerializer(BaseSerializer):
     Other arbitrary types raise ``SerializerError`` on dumps.
     """
 
+    codec_id = 4
+
     def _dumps(self, obj: Any) -> bytes:
         return orjson.dumps(obj)
 
@@ -8,6 +8,8 @@ from django_cachex.serializers.base import BaseSerializer
 class OrmsgpackSerializer(BaseSerializer):
     """MessagePack serializer backed by ormsgpack (Rust)."""
 
+    codec_id = 5
+
     def _dumps(self, obj: Any) -> bytes:
         return ormsgpack.packb(obj)
 
@@ -1,17 +1,91 @@
 import pickle
+import struct
 from typing import Any
 
+from django.core.exceptions import ImproperlyConfigured
+
 from django_cachex.serializers.base import BaseSerializer
 
+# Out-of-band values start with this byte (not a pickle opcode, so never the
+# first byte of a regular pickle), then the buffer count, the in-band pickle
+# size and each buffer's size, followed by the pickle and the buffers.
+_OOB_MARKER = 0xB5
+_OOB_HEADER = struct.Struct("<BIQ")
+# PickleBuffer (out-of-band data) needs pickle protocol 5.
+_OOB_PROTOCOL = 5
+
 
 class PickleSerializer(BaseSerializer):
-    """Pickle-based serializer matching Django's RedisSerializer interface."""
+    """Pickle-based serializer matching Django's RedisSerializer interface.
+
+    With ``out_of_band=True``, objects that pickle their data as a
+    ``pickle.PickleBuffer`` (NumPy arrays, and pandas / Arrow data built on
+    them) keep buffers of at least ``out_of_band_min_size`` bytes out of the
+    pickle stream (protocol 5). They are appended to the stored value
+    as-is, and on read handed to ``pickle.loads`` as views into the fetched
+    value instead of being copied out of it, so such arrays come back
+    read-only. Values without large buffers are stored as regular pickles;
+    out-of-band values are readable whether the option is on or not.
+    """
 
-    def __init__(self, *, protocol: int | None = None) -> None:
-        self.protocol = protocol if protocol is not None else pickle.DEFAULT_PROTOCOL
+    codec_id = 1
+    out_of_band_min_size: int = 64 * 1024
+
+    def __init__(
+        self,
+        *,
+        protocol: int | None = None,
+        out_of_band: bool = False,
+        out_of_band_min_size: int | None = None,
+    ) -> None:
+        if protocol is None:
+            protocol = max(pickle.DEFAULT_PROTOCOL, _OOB_PROTOCOL) if out_of_band else pickle.DEFAULT_PROTOCOL
+        self.protocol = protocol
+        self.out_of_band = out_of_band
+        if out_of_band and protocol < _OOB_PROTOCOL:
+            msg = f"PickleSerializer out_of_band needs pickle protocol 5 or higher, got {self.protocol}"
+            raise ImproperlyConfigured(msg)
+        if out_of_band_min_size is not None:
+            self.out_of_band_min_size = out_of_band_min_size
 
     def _dumps(self, obj: Any) -> bytes:
-        return pickle.dumps(obj, self.protocol)
+        if not self.out_of_band:
+            return pickle.dumps(obj, self.protocol)
+        buffers: list[memoryview] = []
+        min_size = self.out_of_band_min_size
+
+        def keep_in_band(buffer: pickle.PickleBuffer) -> bool:
+            try:
+                view = buffer.raw()
+            except BufferError:
+                # Non-contiguous; pickle copies it in-band.
+                return True
+            if view.nbytes < min_size:
+                return True
+            buffers.append(view)
+            return False
+
+        data = pickle.dumps(obj, self.protocol, buffer_callback=keep_in_band)
+        if not buffers:
+            return data
+        header = _OOB_HEADER.pack(_OOB_MARKER, len(buffers), len(data))
+        sizes = struct.pack(f"<{len(buffers)}Q", *(view.nbytes for view in buffers))
+        return b"".join((header, sizes, data, *buffers))
 
     def _loads(self, data: bytes) -> Any:
-        return pickle.loads(data)  # noqa: S301
+        if not data or data[0] != _OOB_MARKER:
+            return pickle.loads(data)  # noqa: S301
+        view = memoryview(data)
+        _, count, size = _OOB_HEADER.unpack_from(view)
+        sizes = struct.unpack_from(f"<{count}Q", view, _OOB_HEADER.size)
+        offset = _OOB_HEADER.size + 8 * count
+        if offset + size + sum(sizes) != len(view):
+            msg = "truncated out-of-band pickle"
+            raise ValueError(msg)
+        stream = view[offset : offset + size]
+        offset += size
+        buffers = []
+        for buffer_size in sizes:
+            buffers.append(view[offset : offset + buffer_size])
+            offset += buffer_size
+        return pickle.loads(stream, buffers=buffers)  # noqa: S301
@@ -0,0 +1,131 @@
+"""In-process request coalescing ("singleflight").
+
+When many threads or asyncio tasks ask for the same key at once, only the
+first (the leader) runs the underlying call; the rest wait for it and get
+its result or exception. A key is only coalesced while a call for it is
+in flight: once the leader finishes, the next caller starts a new one.
+
+Thread flights are process-wide and guarded by a lock, so they also work
+on free-threaded builds. Async flights are per event loop, since their
+futures are bound to the loop that created them.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "error", "leader", "result")
+
+    def __init__(self, leader: int) -> None:
+        self.done = threading.Event()
+        self.leader = leader
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key across threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do[T](self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn``, or wait for the in-flight call for ``key`` and share its outcome."""
+        me = threading.get_ident()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call(me)
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            # Re-entrant call from the leader itself (e.g. get() inside the
+            # get_or_set() callable): waiting on ourselves would deadlock.
+            if call.leader == me:
+                return fn()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent awaits with the same key within one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, tuple[asyncio.Future[Any], asyncio.Task[Any] | None]] = {}
+
+    async def do[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the in-flight call for ``key``, and share its outcome."""
+        me = asyncio.current_task()
+        while (entry := self._calls.get(key)) is not None:
+            future, leader = entry
+            if leader is me:
+                return await fn()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: take over the call.
+                if not future.cancelled():
+                    raise
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = (future, me)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark it retrieved: with no waiters asyncio would log it at GC.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+_THREAD_FLIGHTS = SingleFlight()
+_ASYNC_FLIGHTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSingleFlight] = weakref.WeakKeyDictionary()
+
+
+def thread_flights() -> SingleFlight:
+    """The process-wide thread flight group."""
+    return _THREAD_FLIGHTS
+
+
+def async_flights() -> AsyncSingleFlight:
+    """The flight group for the running event loop."""
+    loop = asyncio.get_running_loop()
+    flights = _ASYNC_FLIGHTS.get(loop)
+    if flights is None:
+        flights = _ASYNC_FLIGHTS[loop] = AsyncSingleFlight()
+    return flights
+
+
+__all__ = [
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "async_flights",
+    "thread_flights",
+]
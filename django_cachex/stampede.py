@@ -3,11 +3,21 @@
 Keys are stored with TTL = ``timeout + buffer``. On read, the remaining
 TTL drives a probabilistic early-recompute decision so a single client
 refreshes the value before all clients see a miss simultaneously.
+
+With ``envelope=True`` the cache layer instead prefixes each stored value
+with its logical expiry and recompute duration, as in the paper, and the
+decision is made from the fetched bytes alone (no ``TTL`` lookup).
 """
 
 import logging
 import random
+import struct
+import time
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +28,12 @@ class StampedeConfig:
     #   distinguish "logically expired" from "physically expired".
     # beta:   XFetch beta. Higher values trigger recomputation earlier.
     # delta:  estimated recomputation time in seconds.
+    # envelope: store logical expiry + delta alongside the value and decide
+    #   from those on read, instead of querying the key's TTL.
     buffer: int = 60
     beta: float = 1.0
     delta: float = 1.0
+    envelope: bool = False
 
 
 def should_recompute(ttl: int, config: StampedeConfig) -> bool:
@@ -47,6 +60,29 @@ def should_recompute(ttl: int, config: StampedeConfig) -> bool:
     return False
 
 
+def filter_fresh(
+    keys: Sequence[str],
+    values: Sequence[Any],
+    ttls: Sequence[Any],
+    config: StampedeConfig,
+) -> dict[str, Any]:
+    """Zip a batched GET/TTL reply into ``{key: value}``, dropping misses.
+
+    ``values`` and ``ttls`` line up with ``keys`` (one MGET or GET reply
+    and one TTL reply per key, as returned by a single pipeline). Bytes
+    values whose TTL says "recompute now" are dropped as well; integers
+    bypass stampede, matching the single-key ``get`` path.
+    """
+    found: dict[str, Any] = {}
+    for key, value, ttl in zip(keys, values, ttls, strict=False):
+        if value is None:
+            continue
+        if isinstance(value, bytes) and isinstance(ttl, int) and ttl > 0 and should_recompute(ttl, config):
+            continue
+        found[key] = value
+    return found
+
+
 def resolve_stampede(
     instance_config: StampedeConfig | None,
     override: bool | StampedeConfig | None = None,
@@ -89,7 +125,7 @@ def get_timeout_with_buffer(
     return timeout + config.buffer
 
 
-_STAMPEDE_FIELDS = ("buffer", "beta", "delta")
+_STAMPEDE_FIELDS = ("buffer", "beta", "delta", "envelope")
 
 
 def make_stampede_config(option: bool | dict | None) -> StampedeConfig | None:
@@ -112,3 +148,62 @@ def make_stampede_config(option: bool | dict | None) -> StampedeConfig | None:
             )
         return StampedeConfig(**known)
     return StampedeConfig()
+
+
+# =============================================================================
+# XFetch envelope
+# =============================================================================
+
+# Header: magic, logical expiry (unix seconds, 0.0 = never), delta (seconds).
+# The leading NUL keeps it from parsing as an int and from colliding with
+# the pickle (0x80) and compressor magics.
+ENVELOPE_MAGIC = b"\x00xf\x01"
+_ENVELOPE_HEADER = struct.Struct("!4sdf")
+
+
+def wrap_envelope(payload: bytes, timeout: int | None, delta: float) -> bytes:
+    """Prefix ``payload`` with its logical expiry and recompute duration."""
+    expires_at = time.time() + timeout if timeout else 0.0
+    return _ENVELOPE_HEADER.pack(ENVELOPE_MAGIC, expires_at, delta) + payload
+
+
+def unwrap_envelope(value: bytes) -> tuple[bytes, float, float] | None:
+    """Split an enveloped value into ``(payload, expires_at, delta)``.
+
+    Returns ``None`` for values written without an envelope.
+    """
+    if not value.startswith(ENVELOPE_MAGIC) or len(value) < _ENVELOPE_HEADER.size:
+        return None
+    _magic, expires_at, delta = _ENVELOPE_HEADER.unpack_from(value)
+    return value[_ENVELOPE_HEADER.size :], expires_at, delta
+
+
+def envelope_should_recompute(value: Any, config: StampedeConfig) -> bool:
+    """XFetch decision for an enveloped value: ``now - delta * beta * ln(rand) >= expiry``.
+
+    Uses the delta measured when the value was computed rather than
+    ``config.delta``. Non-enveloped values (ints, legacy entries, values
+    written through pipelines) and values without a timeout never trigger.
+    """
+    if not isinstance(value, bytes):
+        return False
+    envelope = unwrap_envelope(value)
+    if envelope is None:
+        return False
+    _payload, expires_at, delta = envelope
+    if not expires_at:
+        return False
+    return time.time() + delta * config.beta * random.expovariate(1.0) >= expires_at
+
+
+def envelope_staleness(value: Any) -> float | None:
+    """Seconds since an enveloped value's logical expiry (negative while still fresh).
+
+    ``None`` for values without an envelope or written without a timeout.
+    """
+    if not isinstance(value, bytes):
+        return None
+    envelope = unwrap_envelope(value)
+    if envelope is None or not envelope[1]:
+        return None
+    return time.time() - envelope[1]
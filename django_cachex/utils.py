@@ -1,5 +1,13 @@
+import asyncio
+import os
 import sys
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 def _format_bytes(size_bytes: int) -> str:
@@ -26,3 +34,27 @@ def _deep_getsizeof(obj: Any, seen: set[int] | None = None) -> int:
     elif hasattr(obj, "__dict__"):
         size += _deep_getsizeof(obj.__dict__, seen)
     return size
+
+
+class LazyThreadPool:
+    """A thread pool started on first use, and started again after ``fork()``."""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pid: int | None = None
+
+    def executor(self) -> ThreadPoolExecutor:
+        """The pool for this process; a new one after ``fork()``."""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                # The parent's worker threads don't survive fork().
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix=self._thread_name_prefix)
+                self._pid = os.getpid()
+            return self._executor
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+        """Schedule ``fn(*args, **kwargs)`` on the pool; await the returned future for its result."""
+        return asyncio.get_running_loop().run_in_executor(self.executor(), partial(fn, *args, **kwargs))
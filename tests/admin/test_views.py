@@ -12,6 +12,7 @@ from django.test import Client, override_settings
 from django.urls import reverse
 
 from django_cachex.admin.models import Key
+from django_cachex.hotkeys import HotKeyConfig, HotKeyTracker
 
 if TYPE_CHECKING:
     from django_cachex.cache import RespCache
@@ -2295,6 +2296,22 @@ class TestCacheDetailView:
         # (always: get_slowlog returns a dict even when empty).
         assert "<h2>Slow Log</h2>" in content
 
+    def test_cache_detail_shows_connection_pools(self, admin_client: Client, test_cache):
+        url = _cache_detail_url("default")
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert "<h2>Connection Pools</h2>" in response.content.decode()
+
+    def test_cache_detail_shows_hot_keys(self, admin_client: Client, test_cache, monkeypatch):
+        tracker = HotKeyTracker(HotKeyConfig(sample_rate=1.0))
+        tracker.observe("read", [":1:user:1", ":1:user:1", ":1:user:2"])
+        monkeypatch.setattr(test_cache, "_hot_keys", tracker)
+        response = admin_client.get(_cache_detail_url("default"))
+        content = response.content.decode()
+        assert "<h2>Hot Keys</h2>" in content
+        assert "<code>:1:user:1</code>" in content
+        assert "<code>:1:user</code>" in content
+
     def test_cache_detail_count_parameter(self, admin_client: Client, test_cache):
         url = _cache_detail_url("default")
         # Test with different count values
@@ -2,24 +2,27 @@
 
 Backend-specific cache fixtures (TieredCache, StreamCache) live here so they
 can be shared between sync and async test modules without re-importing
-across files. The general-purpose ``cache`` fixture lives in
-``tests/conftest.py``.
+across files, as does ``cache_with_options`` for feature tests that need a
+cache configured with extra ``OPTIONS``. The general-purpose ``cache``
+fixture lives in ``tests/conftest.py``.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 from django.core.cache import caches
 from django.test import override_settings
 
-from tests.fixtures.cache import BACKENDS, _get_client_library_options
+from tests.fixtures.cache import BACKENDS, _get_client_library_options, build_cache_config
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from django.core.cache.backends.base import BaseCache
 
+    from django_cachex.cache import RespCache
     from tests.fixtures.containers import RedisContainerInfo
+    from tests.settings_wrapper import SettingsWrapper
 
 L1_TIMEOUT = 2  # seconds; short L1 cap for testing
 
@@ -65,3 +68,33 @@ def tiered_cache(redis_container: RedisContainerInfo) -> Iterator[BaseCache]:
         cache.clear()
         yield cache
         cache.clear()
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    """``OPTIONS`` merged into the cache ``cache_with_options`` builds.
+
+    Override it in a test module, or parametrize it, to configure that cache.
+    """
+    return {}
+
+
+@pytest.fixture
+def cache_with_options(
+    redis_container: RedisContainerInfo,
+    resp_adapter: str,
+    settings: SettingsWrapper,
+    cache_options: dict[str, Any],
+) -> Iterator[RespCache]:
+    """Standalone default cache with ``cache_options`` added to its ``OPTIONS``, cleared around the test.
+
+    The config goes through ``settings``, so a test can still add aliases
+    on top of it with ``settings.CACHES = ...``.
+    """
+    config = build_cache_config(redis_container.host, redis_container.port, resp_adapter=resp_adapter, db=9)
+    config["default"]["OPTIONS"].update(cache_options)
+    settings.CACHES = config
+    cache = cast("RespCache", caches["default"])
+    cache.clear()
+    yield cache
+    cache.clear()
@@ -0,0 +1,126 @@
+"""Tests for ``AdaptiveCompressor``."""
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.compressors.adaptive import OVERFLOW_PREFIX, AdaptiveCompressor
+from django_cachex.compressors.zlib import ZlibCompressor
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+ZLIB = "django_cachex.compressors.zlib.ZlibCompressor"
+TEXT = b"<tr><td>row</td><td>value</td></tr>" * 100
+
+
+class CountingZlib(ZlibCompressor):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.calls: list[int] = []
+
+    def _compress(self, data: bytes) -> bytes:
+        self.calls.append(len(data))
+        return super()._compress(data)
+
+
+def _make_cache(**options: Any) -> Any:
+    from django_cachex.cache import RedisCache
+
+    return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": options})
+
+
+class TestAdaptiveCompressor:
+    def test_compressible_payload_compressed(self):
+        compressor = AdaptiveCompressor(ZLIB)
+        packed = compressor.compress(TEXT)
+        assert len(packed) < len(TEXT) // 10
+        assert compressor.decompress(packed) == TEXT
+
+    def test_incompressible_payload_stored_as_is(self):
+        data = os.urandom(2_000)
+        assert AdaptiveCompressor(ZLIB).compress(data) is data
+
+    def test_large_payload_probed_with_sample(self):
+        inner = CountingZlib()
+        compressor = AdaptiveCompressor(inner, probe_size=1_024)
+        data = os.urandom(100_000)
+        assert compressor.compress(data) is data
+        assert inner.calls == [1_024]
+
+    def test_prefix_learns_to_skip(self):
+        inner = CountingZlib()
+        compressor = AdaptiveCompressor(inner, reprobe_every=4)
+        for i in range(8):
+            compressor.compress_for_key(os.urandom(1_000), f":1:thumb:{i}")
+        # Values 1, 4 and 8 were tried; the rest skipped on the learned ratio.
+        assert len(inner.calls) == 3
+        stats = compressor.stats()[":1:thumb"]
+        assert stats["values"] == stats["skipped"] == 8
+        assert stats["expected_ratio"] < 1.1
+
+    def test_prefixes_tracked_separately(self):
+        compressor = AdaptiveCompressor(ZLIB)
+        compressor.compress_for_key(os.urandom(1_000), ":1:img:1")
+        compressor.compress_for_key(TEXT, ":1:html:1")
+        stats = compressor.stats()
+        assert stats[":1:img"]["skipped"] == 1
+        assert stats[":1:html"]["compressed"] == 1
+        assert stats[":1:html"]["ratio"] > 10
+
+    def test_prefixes_capped(self):
+        compressor = AdaptiveCompressor(ZLIB, max_prefixes=2)
+        for i in range(5):
+            compressor.compress_for_key(TEXT, f"p{i}:k")
+        assert list(compressor.stats()) == [OVERFLOW_PREFIX, "p0", "p1"]
+
+    def test_levels_by_size(self):
+        compressor = AdaptiveCompressor(ZLIB, levels={0: 9, 2_000: 1})
+        assert compressor._compressor_for(500).level == 9  # type: ignore[attr-defined]
+        assert compressor._compressor_for(5_000).level == 1  # type: ignore[attr-defined]
+
+    def test_reset_keeps_estimates(self):
+        compressor = AdaptiveCompressor(ZLIB)
+        compressor.compress_for_key(TEXT, "a:b")
+        assert compressor.stats(reset=True)["a"]["values"] == 1
+        stats = compressor.stats()["a"]
+        assert stats["values"] == 0
+        assert stats["expected_ratio"] > 10
+
+    def test_small_values_untouched(self):
+        compressor = AdaptiveCompressor(ZLIB)
+        assert compressor.compress(b"x" * 100) == b"x" * 100
+        assert compressor.stats() == {}
+
+    def test_invalid_options(self):
+        with pytest.raises(ImproperlyConfigured):
+            AdaptiveCompressor(ZLIB, min_ratio=0)
+
+
+class TestCacheIntegration:
+    def test_encode_passes_key(self):
+        compressor = AdaptiveCompressor(ZLIB)
+        cache = _make_cache(compressor=compressor)
+        assert cache.decode(cache.encode("v" * 2_000, key=":1:page:1")) == "v" * 2_000
+        assert list(compressor.stats()) == [":1:page"]
+
+    def test_codec_header_names_wrapped_compressor(self):
+        cache = _make_cache(codec_header=True, compressor=AdaptiveCompressor(ZLIB))
+        reader = _make_cache(compressor=ZLIB)
+        assert reader.decode(cache.encode(TEXT.decode())) == TEXT.decode()
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"compressor": AdaptiveCompressor(ZLIB)}
+
+
+@pytest.mark.parametrize("resp_adapter", ["redis-py"])
+def test_stats_in_info(cache_with_options: RespCache):
+    cache_with_options.set("thumb:1", os.urandom(5_000))
+    cache_with_options.set_many({"page:1": "x" * 5_000, "page:2": "y" * 5_000})
+    compression = cache_with_options.info()["compression"]
+    assert compression[cache_with_options.make_key("thumb")]["skipped"] == 1
+    assert compression[cache_with_options.make_key("page")]["compressed"] == 2
@@ -0,0 +1,131 @@
+"""Tests for codec offload on async paths (``OPTIONS["async_offload"]``)."""
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.compressors.zlib import ZlibCompressor
+from django_cachex.offload import OffloadConfig, make_offload_config
+from django_cachex.serializers.pickle import PickleSerializer
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+THRESHOLD = 10_000
+
+
+class ThreadRecordingPickle(PickleSerializer):
+    threads: ClassVar[list[str]] = []
+
+    def loads(self, data: bytes | int) -> Any:
+        self.threads.append(threading.current_thread().name)
+        return super().loads(data)
+
+
+class ThreadRecordingCompressor(ZlibCompressor):
+    threads: ClassVar[list[str]] = []
+
+    def compress(self, data: bytes) -> bytes:
+        self.threads.append(threading.current_thread().name)
+        return super().compress(data)
+
+
+def _make_cache(**options: Any) -> Any:
+    from django_cachex.cache import RedisCache
+
+    return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": options})
+
+
+@pytest.fixture(autouse=True)
+def _clear_threads() -> None:
+    ThreadRecordingPickle.threads = []
+    ThreadRecordingCompressor.threads = []
+
+
+class TestOffloadConfig:
+    def test_forms(self):
+        assert make_offload_config(True) == OffloadConfig()
+        assert make_offload_config(4096) == OffloadConfig(threshold=4096)
+        assert make_offload_config({"chunk_bytes": 1}) == OffloadConfig(chunk_bytes=1)
+
+    @pytest.mark.parametrize("option", [None, False])
+    def test_disabled(self, option):
+        assert make_offload_config(option) is None
+
+    @pytest.mark.parametrize("option", [0, -1, {"threshold": 1.5}, "big"])
+    def test_invalid(self, option):
+        with pytest.raises(ImproperlyConfigured):
+            make_offload_config(option)
+
+
+class TestCodecOffload:
+    @pytest.mark.asyncio
+    async def test_large_values_decoded_on_pool(self):
+        cache = _make_cache(async_offload=THRESHOLD, serializer=ThreadRecordingPickle)
+        big, small = cache.encode("x" * THRESHOLD * 2), cache.encode("y")
+        assert await cache._adecode(big) == "x" * THRESHOLD * 2
+        assert await cache._adecode(small) == "y"
+        assert ThreadRecordingPickle.threads[0].startswith("cachex-codec")
+        assert ThreadRecordingPickle.threads[1] == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_large_bytes_encoded_on_pool(self):
+        cache = _make_cache(async_offload=THRESHOLD, raw_passthrough=True)
+        value = b"z" * THRESHOLD
+        assert cache.decode(await cache._aencode(value, key=":1:k")) == value
+
+    @pytest.mark.asyncio
+    async def test_large_objects_compressed_on_pool(self):
+        cache = _make_cache(async_offload=THRESHOLD, compressor=ThreadRecordingCompressor)
+        big = {"rows": [f"row {i}" for i in range(THRESHOLD)]}
+        assert cache.decode(await cache._aencode(big, key=":1:big")) == big
+        assert cache.decode(await cache._aencode({"n": 1}, key=":1:small")) == {"n": 1}
+        assert ThreadRecordingCompressor.threads[0].startswith("cachex-codec")
+        assert ThreadRecordingCompressor.threads[1] == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_decode_many_yields_to_loop(self):
+        cache = _make_cache(async_offload={"threshold": THRESHOLD, "chunk_bytes": 1_000})
+        items = [(f"k{i}", cache.encode("v" * 500)) for i in range(20)]
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        started = ticks
+        result = await cache._adecode_many(items)
+        task.cancel()
+        assert result == {f"k{i}": "v" * 500 for i in range(20)}
+        assert ticks - started >= 5
+
+    @pytest.mark.asyncio
+    async def test_decode_many_mixes_pool_and_inline(self):
+        cache = _make_cache(async_offload=THRESHOLD, serializer=ThreadRecordingPickle)
+        items = [("big", cache.encode("b" * THRESHOLD * 2)), ("small", cache.encode("s"))]
+        assert await cache._adecode_many(items) == {"big": "b" * THRESHOLD * 2, "small": "s"}
+        assert sum(name.startswith("cachex-codec") for name in ThreadRecordingPickle.threads) == 1
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"async_offload": THRESHOLD, "serializer": ThreadRecordingPickle}
+
+
+class TestCacheOffload:
+    @pytest.mark.asyncio
+    async def test_aget_and_aget_many(self, cache_with_options: RespCache):
+        big = {"rows": [f"row {i} " * 10 for i in range(500)]}
+        await cache_with_options.aset("big", big)
+        await cache_with_options.aset("small", [1, 2])
+        assert await cache_with_options.aget("big") == big
+        assert await cache_with_options.aget_many(["big", "small", "missing"]) == {"big": big, "small": [1, 2]}
+        offloaded = [name.startswith("cachex-codec") for name in ThreadRecordingPickle.threads]
+        assert sorted(offloaded) == [False, True, True]
@@ -0,0 +1,121 @@
+"""Tests for automatic batching of concurrent ``aget`` calls (``OPTIONS["auto_batch"]``)."""
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.batching import AsyncGetBatcher
+from django_cachex.cache import ValkeyCache
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+
+class TestAsyncGetBatcher:
+    @pytest.mark.asyncio
+    async def test_same_tick_reads_share_one_fetch(self):
+        calls = []
+
+        async def fetch_many(keys, *, stampede_prevention=None):
+            calls.append(list(keys))
+            return {k: k.encode() for k in keys if k != "missing"}
+
+        batcher = AsyncGetBatcher(0.0, None)
+        keys = ["a", "b", "a", "missing"]
+        results = await asyncio.gather(*(batcher.load(k, None, fetch_many) for k in keys))
+        assert results == [b"a", b"b", b"a", None]
+        assert calls == [["a", "b", "missing"]]
+
+    @pytest.mark.asyncio
+    async def test_max_keys_flushes_early(self):
+        calls = []
+
+        async def fetch_many(keys, *, stampede_prevention=None):
+            calls.append(len(keys))
+            return {}
+
+        batcher = AsyncGetBatcher(0.0, 2)
+        await asyncio.gather(*(batcher.load(f"k{i}", None, fetch_many) for i in range(5)))
+        assert calls == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self):
+        async def fetch_many(keys, *, stampede_prevention=None):
+            raise ConnectionError("down")
+
+        batcher = AsyncGetBatcher(0.0, None)
+        results = await asyncio.gather(
+            *(batcher.load(k, None, fetch_many) for k in ("a", "b")),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"auto_batch": True}
+
+
+class TestAutoBatch:
+    @pytest.mark.asyncio
+    async def test_gathered_agets_become_one_get_many(self, cache_with_options: RespCache):
+        await cache_with_options.aset_many({"ab-1": 1, "ab-2": {"two": 2}, "ab-3": "three"})
+        # Patch the class: gathered tasks may each see their own cache instance.
+        adapter_cls = type(cache_with_options.adapter)
+        aget_many = adapter_cls.aget_many
+        batches = []
+
+        async def spy(self, keys, **kwargs):
+            batches.append(list(keys))
+            return await aget_many(self, keys, **kwargs)
+
+        with patch.object(adapter_cls, "aget_many", spy):
+            results = await asyncio.gather(
+                cache_with_options.aget("ab-1"),
+                cache_with_options.aget("ab-2"),
+                cache_with_options.aget("ab-3"),
+                cache_with_options.aget("ab-missing", "fallback"),
+            )
+        assert results == [1, {"two": 2}, "three", "fallback"]
+        assert len(batches) == 1
+        assert sorted(batches[0]) == sorted(
+            cache_with_options.make_and_validate_key(k) for k in ("ab-1", "ab-2", "ab-3", "ab-missing")
+        )
+
+    @pytest.mark.asyncio
+    async def test_aliases_with_different_options_batch_apart(self, cache_with_options: RespCache, settings):
+        # Same LOCATION, different serializer: each alias must read through its own adapter.
+        caches_setting = copy.deepcopy(settings.CACHES)
+        caches_setting["json"] = copy.deepcopy(caches_setting["default"])
+        caches_setting["json"]["OPTIONS"]["serializer"] = "django_cachex.serializers.json.JsonSerializer"
+        settings.CACHES = caches_setting
+        pickled, as_json = cast("RespCache", caches["default"]), cast("RespCache", caches["json"])
+        await pickled.aset("ab-pickled", {"p": 1})
+        await as_json.aset("ab-json", {"j": 2})
+        adapter_cls = type(pickled.adapter)
+        aget_many = adapter_cls.aget_many
+        batches = []
+
+        async def spy(self, keys, **kwargs):
+            batches.append(list(keys))
+            return await aget_many(self, keys, **kwargs)
+
+        with patch.object(adapter_cls, "aget_many", spy):
+            results = await asyncio.gather(pickled.aget("ab-pickled"), as_json.aget("ab-json"))
+        assert results == [{"p": 1}, {"j": 2}]
+        assert len(batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_aget_or_set_through_batcher(self, cache_with_options: RespCache):
+        assert await cache_with_options.aget_or_set("ab-gos", lambda: "made", timeout=60) == "made"
+        assert await cache_with_options.aget("ab-gos") == "made"
+
+    @pytest.mark.parametrize("window", [-1, "10", True])
+    def test_invalid_window_rejected(self, window):
+        with pytest.raises(ImproperlyConfigured, match="auto_batch_window_us"):
+            ValkeyCache("redis://127.0.0.1:6379", {"OPTIONS": {"auto_batch": True, "auto_batch_window_us": window}})
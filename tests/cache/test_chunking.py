@@ -0,0 +1,256 @@
+"""Tests for chunked storage of large values (``OPTIONS["chunking"]``)."""
+
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from redis.cluster import key_slot
+
+from django_cachex.chunking import ChunkingConfig, make_chunking_config, parse_manifest
+from django_cachex.exceptions import ChunkedValueError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django_cachex.cache import RespCache
+
+THRESHOLD = 10_000
+CHUNK_SIZE = 4_000
+BIG = "x" * 25_000
+BLOB = bytes(range(256)) * 100
+
+
+def _make_cache(**options: Any) -> Any:
+    from django_cachex.cache import RedisCache
+
+    return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": options})
+
+
+class TestChunkingConfig:
+    def test_forms(self):
+        assert make_chunking_config(True) == ChunkingConfig()
+        assert make_chunking_config(4096) == ChunkingConfig(threshold=4096)
+        assert make_chunking_config({"chunk_size": 1}) == ChunkingConfig(chunk_size=1)
+
+    @pytest.mark.parametrize("option", [None, False])
+    def test_disabled(self, option):
+        assert make_chunking_config(option) is None
+
+    @pytest.mark.parametrize("option", [0, -1, {"chunk_size": 1.5}, "big"])
+    def test_invalid(self, option):
+        with pytest.raises(ImproperlyConfigured):
+            make_chunking_config(option)
+
+
+class TestChunkSplit:
+    def test_large_value_split(self):
+        cache = _make_cache(chunking={"threshold": THRESHOLD, "chunk_size": CHUNK_SIZE})
+        value = cache.encode(BIG)
+        manifest, chunks = cache._chunk(":1:big", value, 60)
+        assert parse_manifest(manifest).size == len(value)
+        assert len(chunks) == -(-len(value) // CHUNK_SIZE)
+
+    def test_small_or_persistent_values_stored_whole(self):
+        cache = _make_cache(chunking=THRESHOLD)
+        assert cache._chunk(":1:k", cache.encode("small"), 60) is None
+        assert cache._chunk(":1:k", cache.encode(BIG), None) is None
+
+    @pytest.mark.parametrize("key", [":1:plain", ":1:{user1}:page"])
+    def test_chunk_keys_share_the_slot(self, key):
+        for chunk_key in _make_cache()._chunk_keys(key, 3):
+            assert key_slot(chunk_key.encode()) == key_slot(key.encode())
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"chunking": {"threshold": THRESHOLD, "chunk_size": CHUNK_SIZE}, "raw_passthrough": True}
+
+
+def _chunk_keys(cache: RespCache, key: str, version: int | None = None) -> list[str]:
+    made_key = cache.make_and_validate_key(key, version=version)
+    manifest = parse_manifest(cache.adapter.get(made_key))
+    assert manifest is not None
+    return cache._chunk_keys(made_key, manifest.count)
+
+
+class TestChunkedCache:
+    def test_set_and_get(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        assert cache_with_options.get("big") == BIG
+        assert all(0 < cache_with_options.adapter.ttl(k) <= 60 for k in _chunk_keys(cache_with_options, "big"))
+
+    def test_get_many_reassembles(self, cache_with_options: RespCache):
+        cache_with_options.set_many({"a": BIG, "b": "small", "c": BIG * 2}, 60)
+        assert cache_with_options.get_many(["a", "b", "c", "missing"]) == {"a": BIG, "b": "small", "c": BIG * 2}
+
+    def test_add(self, cache_with_options: RespCache):
+        assert cache_with_options.add("big", BIG, 60)
+        assert not cache_with_options.add("big", "other", 60)
+        assert cache_with_options.get("big") == BIG
+
+    def test_missing_chunk_is_a_miss(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        cache_with_options.adapter.delete(_chunk_keys(cache_with_options, "big")[1])
+        assert cache_with_options.get("big", "default") == "default"
+        assert cache_with_options.get_many(["big"]) == {}
+
+    def test_torn_write_is_a_miss(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        first_write = cache_with_options.adapter.get(_chunk_keys(cache_with_options, "big")[0])
+        cache_with_options.set("big", "y" * 25_000, 60)
+        cache_with_options.adapter.set(_chunk_keys(cache_with_options, "big")[0], first_write, 60)
+        assert cache_with_options.get("big") is None
+
+    def test_get_stream(self, cache_with_options: RespCache):
+        cache_with_options.set("blob", BLOB, 60)
+        pieces = list(cast("Iterator[bytes]", cache_with_options.get_stream("blob")))
+        assert len(pieces) > 1
+        assert b"".join(pieces) == BLOB
+        cache_with_options.set("small", b"tiny", 60)
+        assert list(cast("Iterator[bytes]", cache_with_options.get_stream("small"))) == [b"tiny"]
+        assert cache_with_options.get_stream("missing") is None
+
+    def test_get_stream_detects_overwrite(self, cache_with_options: RespCache):
+        cache_with_options.set("blob", BLOB, 60)
+        stream = cast("Iterator[bytes]", cache_with_options.get_stream("blob"))
+        next(stream)
+        cache_with_options.set("blob", BLOB[::-1], 60)
+        with pytest.raises(ChunkedValueError):
+            list(stream)
+
+    def test_get_stream_rejects_non_bytes(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        with pytest.raises(TypeError):
+            cache_with_options.get_stream("big")
+
+    def test_incr_version_moves_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        old_chunks = _chunk_keys(cache_with_options, "big")
+        assert cache_with_options.incr_version("big") == 2
+        assert cache_with_options.get("big", version=2) == BIG
+        assert cache_with_options.get("big") is None
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in old_chunks)
+        with pytest.raises(ValueError, match="not found"):
+            cache_with_options.incr_version("missing")
+
+    def test_rename_moves_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        cache_with_options.set("other", BIG * 2, 60)
+        old_chunks = _chunk_keys(cache_with_options, "big")
+        overwritten = _chunk_keys(cache_with_options, "other")
+        assert cache_with_options.rename("big", "other")
+        assert cache_with_options.get("other") == BIG
+        assert cache_with_options.get("big") is None
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in old_chunks)
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in overwritten[len(old_chunks) :])
+        with pytest.raises(ValueError, match="not found"):
+            cache_with_options.rename("missing", "other")
+
+    def test_renamenx_moves_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set_many({"big": BIG, "taken": "small"}, 60)
+        assert not cache_with_options.renamenx("big", "taken")
+        assert cache_with_options.get("big") == BIG
+        assert cache_with_options.renamenx("big", "free")
+        assert cache_with_options.get("free") == BIG
+        assert cache_with_options.get("big") is None
+
+    @pytest.mark.asyncio
+    async def test_async_rename(self, cache_with_options: RespCache):
+        await cache_with_options.aset("big", BIG, 60)
+        old_chunks = _chunk_keys(cache_with_options, "big")
+        assert await cache_with_options.arename("big", "moved")
+        assert await cache_with_options.aget("moved") == BIG
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in old_chunks)
+        await cache_with_options.aset("taken", "small", 60)
+        assert not await cache_with_options.arenamenx("moved", "taken")
+        assert await cache_with_options.arenamenx("moved", "free")
+        assert await cache_with_options.aget("free") == BIG
+
+    def test_touch_extends_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        assert cache_with_options.touch("big", 600)
+        assert all(cache_with_options.adapter.ttl(k) > 500 for k in _chunk_keys(cache_with_options, "big"))
+        assert cache_with_options.touch("big", None)
+        assert all(cache_with_options.adapter.ttl(k) is None for k in _chunk_keys(cache_with_options, "big"))
+        assert cache_with_options.get("big") == BIG
+        assert not cache_with_options.touch("missing", 600)
+
+    def test_expire_moves_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60)
+        assert cache_with_options.expire("big", 600)
+        assert all(cache_with_options.adapter.ttl(k) > 500 for k in _chunk_keys(cache_with_options, "big"))
+        assert cache_with_options.pexpire("big", 30_000)
+        assert all(0 < cache_with_options.adapter.ttl(k) <= 30 for k in _chunk_keys(cache_with_options, "big"))
+        assert cache_with_options.persist("big")
+        assert all(cache_with_options.adapter.ttl(k) is None for k in _chunk_keys(cache_with_options, "big"))
+
+    def test_delete_drops_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set_many({"a": BIG, "b": BIG, "c": BIG, "page:1": BIG}, 60)
+        chunks = {key: _chunk_keys(cache_with_options, key) for key in ("a", "b", "c", "page:1")}
+        assert cache_with_options.delete("a")
+        assert cache_with_options.delete_many(["b", "missing"]) == 1
+        assert cache_with_options.delete_pattern("page:*") == 1
+        assert cache_with_options.get("c") == BIG
+        for key in ("a", "b", "page:1"):
+            assert all(cache_with_options.adapter.ttl(k) == -2 for k in chunks[key])
+
+    def test_invalidate_tags_drops_chunks(self, cache_with_options: RespCache):
+        cache_with_options.set("big", BIG, 60, tags=["t"])
+        chunks = _chunk_keys(cache_with_options, "big")
+        assert cache_with_options.get("big") == BIG
+        assert cache_with_options.invalidate_tags(["t"]) == 1
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in chunks)
+
+    def test_recompute_lock_chunks_value(self, cache_with_options: RespCache):
+        assert cache_with_options.get_or_set("big", lambda: BIG, 60, recompute_lock=True) == BIG
+        assert len(_chunk_keys(cache_with_options, "big")) > 1
+        assert cache_with_options.get("big") == BIG
+        lock_key = cache_with_options._recompute_lock_key(cache_with_options.make_and_validate_key("big"))
+        assert not cache_with_options.adapter.has_key(lock_key)
+
+    @pytest.mark.asyncio
+    async def test_async_recompute_lock_chunks_value(self, cache_with_options: RespCache):
+        assert await cache_with_options.aget_or_set("big", lambda: BIG, 60, recompute_lock=True) == BIG
+        assert len(_chunk_keys(cache_with_options, "big")) > 1
+        assert await cache_with_options.aget("big") == BIG
+
+    @pytest.mark.asyncio
+    async def test_async_key_operations(self, cache_with_options: RespCache):
+        await cache_with_options.aset("big", BIG, 60)
+        assert await cache_with_options.atouch("big", 600)
+        assert all(cache_with_options.adapter.ttl(k) > 500 for k in _chunk_keys(cache_with_options, "big"))
+        assert await cache_with_options.aincr_version("big") == 2
+        assert await cache_with_options.aget("big", version=2) == BIG
+        chunks = _chunk_keys(cache_with_options, "big", version=2)
+        assert all(cache_with_options.adapter.ttl(k) > 500 for k in chunks)
+        assert await cache_with_options.adelete("big", version=2)
+        assert all(cache_with_options.adapter.ttl(k) == -2 for k in chunks)
+
+    @pytest.mark.asyncio
+    async def test_async(self, cache_with_options: RespCache):
+        await cache_with_options.aset("big", BIG, 60)
+        await cache_with_options.aset_many({"blob": BLOB}, 60)
+        assert await cache_with_options.aget("big") == BIG
+        assert await cache_with_options.aget_many(["big", "blob"]) == {"big": BIG, "blob": BLOB}
+        stream = await cache_with_options.aget_stream("blob")
+        assert stream is not None
+        assert b"".join([piece async for piece in stream]) == BLOB
+
+    @pytest.mark.asyncio
+    async def test_async_split_set_many_writes_chunks_first(self, cache_with_options: RespCache, monkeypatch):
+        monkeypatch.setattr(cache_with_options, "_max_batch_keys", 2)
+        adapter_cls = type(cache_with_options.adapter)
+        aset_many = adapter_cls.aset_many
+        written: list[str] = []
+
+        async def spy(self, data, *args, **kwargs):
+            written.extend(data)
+            return await aset_many(self, data, *args, **kwargs)
+
+        with patch.object(adapter_cls, "aset_many", spy):
+            await cache_with_options.aset_many({"big": BIG, "blob": BLOB, "small": "v"}, 60)
+        for key in ("big", "blob"):
+            manifest_at = written.index(cache_with_options.make_key(key))
+            assert all(written.index(k) < manifest_at for k in _chunk_keys(cache_with_options, key))
+        assert await cache_with_options.aget_many(["big", "blob", "small"]) == {"big": BIG, "blob": BLOB, "small": "v"}
@@ -2,8 +2,10 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
+from redis.exceptions import NoScriptError
 
 from django_cachex.adapters import RedisPyAdapter, RespAdapterProtocol
+from django_cachex.adapters.valkey_py import _DELETE_PATTERN_STEP
 
 if TYPE_CHECKING:
     from django_cachex.cache import RespCache
@@ -110,3 +112,70 @@ class TestRedisPyAdapter:
         # delete is called once with all keys
         mock_client.delete.assert_called_once_with(":1:foo", ":1:foo-a")
         assert result == 2
+
+    @patch("tests.cache.test_client.RedisPyAdapter.get_client")
+    @patch("tests.cache.test_client.RedisPyAdapter.__init__", return_value=None)
+    def test_delete_pattern_reports_progress(
+        self,
+        init_mock,
+        get_client_mock,
+    ):
+        mock_client = Mock()
+        mock_client.scan_iter.return_value = [":1:foo", ":1:foo-a", ":1:foo-b"]
+        mock_client.delete.side_effect = [2, 1]
+        get_client_mock.return_value = mock_client
+
+        client = RedisPyAdapter.__new__(RedisPyAdapter)
+        progress = Mock()
+
+        assert client.delete_pattern(pattern="prefix:1:foo*", itersize=2, progress=progress) == 3
+        assert [c.args for c in progress.call_args_list] == [(2,), (3,)]
+
+    @patch("tests.cache.test_client.RedisPyAdapter.get_client")
+    @patch("tests.cache.test_client.RedisPyAdapter.__init__", return_value=None)
+    def test_scripted_delete_pattern_runs_steps_until_cursor_is_zero(
+        self,
+        init_mock,
+        get_client_mock,
+    ):
+        mock_client = Mock()
+        mock_client.execute_command.side_effect = [[b"17", 3], [b"0", 2]]
+        get_client_mock.return_value = mock_client
+
+        client = RedisPyAdapter.__new__(RedisPyAdapter)
+        client._scripted_delete_pattern = True
+        progress = Mock()
+
+        result = client.delete_pattern(pattern="prefix:1:foo*", itersize=50, progress=progress)
+
+        assert result == 5
+        assert [c.args for c in progress.call_args_list] == [(3,), (5,)]
+        # EVALSHA sha numkeys cursor pattern count
+        assert [c.args[:2] for c in mock_client.execute_command.call_args_list] == [
+            ("EVALSHA", _DELETE_PATTERN_STEP.sha),
+        ] * 2
+        assert [c.args[3] for c in mock_client.execute_command.call_args_list] == [0, 17]
+        assert mock_client.execute_command.call_args.args[4:] == ("prefix:1:foo*", 50)
+        mock_client.scan_iter.assert_not_called()
+
+    @patch("tests.cache.test_client.RedisPyAdapter.get_client")
+    @patch("tests.cache.test_client.RedisPyAdapter.__init__", return_value=None)
+    def test_scripted_delete_pattern_sends_source_once_on_noscript(
+        self,
+        init_mock,
+        get_client_mock,
+    ):
+        mock_client = Mock()
+        mock_client.execute_command.side_effect = [NoScriptError(), [b"17", 3], [b"0", 2]]
+        get_client_mock.return_value = mock_client
+
+        client = RedisPyAdapter.__new__(RedisPyAdapter)
+        client._scripted_delete_pattern = True
+
+        assert client.delete_pattern(pattern="prefix:1:foo*", itersize=50) == 5
+        commands = [c.args[:2] for c in mock_client.execute_command.call_args_list]
+        assert commands == [
+            ("EVALSHA", _DELETE_PATTERN_STEP.sha),
+            ("EVAL", _DELETE_PATTERN_STEP.source),
+            ("EVALSHA", _DELETE_PATTERN_STEP.sha),
+        ]
@@ -0,0 +1,217 @@
+"""Tests for the CLIENT TRACKING near-cache of the redis-py / valkey-py adapters."""
+
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.adapters._tracking import NearCache, TrackingConfig, TrackingListener, make_tracking_config
+from django_cachex.cache import ValkeyClusterCache
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+HOT = ":1:hot:"
+
+
+def _connected_near(config: TrackingConfig | None = None) -> NearCache:
+    near = NearCache(config or TrackingConfig())
+    near.set_connected(True)
+    return near
+
+
+def _fill(near: NearCache, key: str, value: bytes) -> None:
+    near.finish(key, near.begin(key), value)
+
+
+class TestTrackingConfig:
+    def test_true_uses_defaults(self):
+        assert make_tracking_config(True) == TrackingConfig()
+
+    @pytest.mark.parametrize("option", [None, False, {}])
+    def test_disabled(self, option):
+        assert make_tracking_config(option) is None
+
+    def test_single_prefix_string(self):
+        assert make_tracking_config({"prefixes": "a:"}) == TrackingConfig(prefixes=("a:",))
+
+    def test_overlapping_prefixes_rejected(self):
+        with pytest.raises(ImproperlyConfigured, match="overlap"):
+            make_tracking_config({"prefixes": ["cfg:", "cfg:flags:"]})
+
+    @pytest.mark.parametrize("value", [0, -5, 1.5, True])
+    def test_invalid_max_entries_rejected(self, value):
+        with pytest.raises(ImproperlyConfigured, match="max_entries"):
+            make_tracking_config({"max_entries": value})
+
+    def test_cluster_rejected(self):
+        cache = ValkeyClusterCache("redis://127.0.0.1:6379", {"OPTIONS": {"client_tracking": True}})
+        with pytest.raises(ImproperlyConfigured, match="client_tracking"):
+            _ = cache.adapter
+
+
+class TestNearCache:
+    def test_no_fill_while_disconnected(self):
+        near = NearCache(TrackingConfig())
+        _fill(near, "k", b"v")
+        assert near.get("k") is None
+
+    def test_lru_bound(self):
+        near = _connected_near(TrackingConfig(max_entries=2))
+        for key in ("a", "b", "c"):
+            _fill(near, key, key.encode())
+        assert near.get("a") is None
+        assert near.get("c") == b"c"
+        assert near.stats()["evictions"] == 1
+
+    def test_oversized_value_not_cached(self):
+        near = _connected_near(TrackingConfig(max_entry_size=4))
+        _fill(near, "k", b"12345")
+        assert near.get("k") is None
+
+    def test_invalidation_during_read_discards_fill(self):
+        near = _connected_near()
+        token = near.begin("k")
+        near.invalidate_many(["k"], remote=True)
+        near.finish("k", token, b"stale")
+        assert near.get("k") is None
+        assert near.stats()["invalidations"] == 1
+
+    def test_local_ttl(self):
+        near = _connected_near(TrackingConfig(ttl=0.01))
+        _fill(near, "k", b"v")
+        time.sleep(0.02)
+        assert near.get("k") is None
+
+    def test_prefix_allow_list(self):
+        near = NearCache(TrackingConfig(prefixes=("cfg:",)))
+        assert near.allowed("cfg:x")
+        assert not near.allowed("user:x")
+
+    def test_invalidate_matching(self):
+        near = _connected_near()
+        for key in ("p:1:a", "p:1:b", "p:2:a"):
+            _fill(near, key, b"v")
+        near.invalidate_matching("p:1:*")
+        assert near.get("p:1:a") is None
+        assert near.get("p:1:b") is None
+        assert near.get("p:2:a") == b"v"
+
+    def test_invalidate_matching_honours_escapes(self):
+        near = _connected_near()
+        _fill(near, "a*b", b"1")
+        _fill(near, "axb", b"2")
+        near.invalidate_matching("a[*]b")
+        assert near.get("a*b") is None
+        assert near.get("axb") == b"2"
+
+    def test_listener_handles_invalidate_and_flush(self):
+        near = _connected_near()
+        _fill(near, "a", b"1")
+        _fill(near, "b", b"2")
+        listener = TrackingListener(near, pool=None)
+        listener._handle([b"message", b"__redis__:invalidate", [b"a"]])
+        assert near.get("a") is None
+        assert near.get("b") == b"2"
+        listener._handle([b"message", b"__redis__:invalidate", None])
+        assert near.get("b") is None
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("timed out waiting for the tracking listener")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"client_tracking": {"prefixes": [HOT], "max_entry_size": 1024}}
+
+
+@pytest.fixture
+def tracking_cache(cache_with_options: RespCache) -> RespCache:
+    near = cache_with_options.adapter._near_cache()
+    _wait_for(lambda: near.stats()["connected"])
+    return cache_with_options
+
+
+@pytest.mark.parametrize("resp_adapter", ["redis-py", "valkey-py"])
+class TestClientTracking:
+    def test_repeat_get_skips_network(self, tracking_cache: RespCache):
+        tracking_cache.set("hot:flag", {"on": True})
+        assert tracking_cache.get("hot:flag") == {"on": True}
+        with patch.object(tracking_cache.adapter, "get_client", wraps=tracking_cache.adapter.get_client) as spy:
+            assert tracking_cache.get("hot:flag") == {"on": True}
+        assert spy.call_count == 0
+        assert tracking_cache.info()["client_tracking"]["hits"] >= 1
+
+    def test_local_write_is_visible_immediately(self, tracking_cache: RespCache):
+        tracking_cache.set("hot:n", 1)
+        assert tracking_cache.get("hot:n") == 1
+        tracking_cache.set("hot:n", 2)
+        assert tracking_cache.get("hot:n") == 2
+        tracking_cache.delete("hot:n")
+        assert tracking_cache.get("hot:n") is None
+
+    def test_rename_is_visible_immediately(self, tracking_cache: RespCache):
+        tracking_cache.set("hot:src", "v")
+        tracking_cache.set("hot:dst", "old")
+        assert tracking_cache.get("hot:src") == "v"
+        assert tracking_cache.get("hot:dst") == "old"
+        # Drop server invalidations so only the local forget can evict.
+        with patch.object(tracking_cache.adapter._near_cache()._listener, "_handle"):
+            tracking_cache.rename("hot:src", "hot:dst")
+            assert tracking_cache.get("hot:src") is None
+            assert tracking_cache.get("hot:dst") == "v"
+
+    def test_delete_pattern_is_visible_immediately(self, tracking_cache: RespCache):
+        tracking_cache.set_many({"hot:p:a": 1, "hot:p:b": 2, "hot:q": 3})
+        assert tracking_cache.get_many(["hot:p:a", "hot:p:b", "hot:q"]) == {"hot:p:a": 1, "hot:p:b": 2, "hot:q": 3}
+        with patch.object(tracking_cache.adapter._near_cache()._listener, "_handle"):
+            assert tracking_cache.delete_pattern("hot:p:*") == 2
+            assert tracking_cache.get_many(["hot:p:a", "hot:p:b", "hot:q"]) == {"hot:q": 3}
+
+    def test_tag_writes_are_visible_immediately(self, tracking_cache: RespCache):
+        tracking_cache.set("hot:tagged", "old", tags=["t"])
+        assert tracking_cache.get("hot:tagged") == "old"
+        tracking_cache.set("hot:tagged", "new", tags=["t"])
+        assert tracking_cache.get("hot:tagged") == "new"
+        assert tracking_cache.invalidate_tags(["t"]) == 1
+        assert tracking_cache.get("hot:tagged") is None
+
+    def test_remote_write_invalidates(self, tracking_cache: RespCache):
+        tracking_cache.set("hot:remote", "old")
+        assert tracking_cache.get("hot:remote") == "old"
+        key = tracking_cache.make_and_validate_key("hot:remote")
+        # Bypass the adapter so only the server's invalidation can evict it.
+        tracking_cache.adapter.get_client(write=True).delete(key)
+        _wait_for(lambda: tracking_cache.get("hot:remote") is None)
+
+    def test_untracked_prefix_not_cached(self, tracking_cache: RespCache):
+        tracking_cache.set("cold:k", "v")
+        tracking_cache.get("cold:k")
+        tracking_cache.get("cold:k")
+        assert tracking_cache.info()["client_tracking"]["entries"] == 0
+
+    def test_get_many_mixes_hits_and_fetches(self, tracking_cache: RespCache):
+        tracking_cache.set_many({"hot:a": 1, "hot:b": 2, "cold:c": 3})
+        assert tracking_cache.get("hot:a") == 1
+        assert tracking_cache.get_many(["hot:a", "hot:b", "cold:c", "hot:missing"]) == {
+            "hot:a": 1,
+            "hot:b": 2,
+            "cold:c": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_aget_uses_near_cache(self, tracking_cache: RespCache):
+        await tracking_cache.aset("hot:async", "v")
+        assert await tracking_cache.aget("hot:async") == "v"
+        with patch.object(
+            tracking_cache.adapter, "get_async_client", wraps=tracking_cache.adapter.get_async_client
+        ) as spy:
+            assert await tracking_cache.aget("hot:async") == "v"
+        assert spy.call_count == 0
@@ -1,13 +1,19 @@
 """Tests for RedisPyClusterAdapter."""
 
 import asyncio
+import threading
 import weakref
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from django.core.exceptions import ImproperlyConfigured
 from redis.cluster import RedisCluster, key_slot
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from django_cachex.adapters import RedisPyClusterAdapter
+from django_cachex.adapters.valkey_py import _CLUSTER_DELETE_PATTERN_STEP
+from django_cachex.exceptions import ClusterFanoutError
 
 
 def setup_cluster_client(mock_cluster_cls=None):
@@ -86,98 +92,18 @@ class TestRedisClusterAdapter:
         total_keys = sum(len(v) for v in slots.values())
         assert total_keys == 3
 
-    def test_get_many_uses_mget_nonatomic(self):
-        """Test get_many uses mget_nonatomic for cross-slot keys."""
-        import pickle
-
-        mock_cluster_cls = MagicMock()
-        mock_cluster = MagicMock()
-        mock_cluster_cls.from_url.return_value = mock_cluster
-
-        client = setup_cluster_client(mock_cluster_cls)
-        client._serializers = [MagicMock()]
-        client._compressors = [MagicMock()]
-
-        client.key_prefix = ""
-        client.version = 1
-        client.key_func = lambda k, p, v: k
-
-        # Setup mocks for encoding/decoding
-        client._serializers[0].loads.side_effect = pickle.loads
-        client._compressors[0].decompress.side_effect = lambda x: x
-
-        # Mock mget_nonatomic response with pickled data
-        mock_cluster.mget_nonatomic.return_value = [
-            pickle.dumps("value_a"),
-            pickle.dumps("value_b"),
-            pickle.dumps("value_c"),
-        ]
-
-        # Using hash tags that hash to different slots
-        result = client.get_many(["{a}key1", "{b}key2", "{c}key3"])
-
-        # Adapter returns raw bytes (cache layer is responsible for decoding).
-        assert len(result) == 3
-        # mget_nonatomic is called once with all keys
-        mock_cluster.mget_nonatomic.assert_called_once()
-        assert pickle.dumps("value_a") in result.values()
-        assert pickle.dumps("value_b") in result.values()
-        assert pickle.dumps("value_c") in result.values()
-
     def test_get_many_empty_keys(self):
         client = setup_cluster_client()
 
         result = client.get_many([])
         assert result == {}
 
-    def test_delete_many_groups_by_slot(self):
-        mock_cluster_cls = MagicMock()
-        mock_cluster = MagicMock()
-        mock_cluster_cls.from_url.return_value = mock_cluster
-
-        client = setup_cluster_client(mock_cluster_cls)
-
-        client.key_prefix = ""
-        client.version = 1
-        client.key_func = lambda k, p, v: k
-
-        # Mock delete to return count of deleted keys per call
-        mock_cluster.delete.return_value = 1
-
-        # Using hash tags that hash to different slots:
-        # {a} -> slot 15495, {b} -> slot 3300, {c} -> slot 7365
-        client.delete_many(["{a}key1", "{b}key2", "{c}key3"])
-
-        # delete should be called once per slot (3 different slots)
-        assert mock_cluster.delete.call_count == 3
-
     def test_delete_many_empty_keys(self):
         client = setup_cluster_client()
 
         client.delete_many([])
         # Should not raise any errors
 
-    def test_delete_many_same_slot(self):
-        """Test delete_many with keys in the same slot uses single delete."""
-        mock_cluster_cls = MagicMock()
-        mock_cluster = MagicMock()
-        mock_cluster_cls.from_url.return_value = mock_cluster
-
-        client = setup_cluster_client(mock_cluster_cls)
-
-        client.key_prefix = ""
-        client.version = 1
-        client.key_func = lambda k, p, v: k
-
-        # Mock delete to return count of deleted keys
-        mock_cluster.delete.return_value = 3
-
-        # All keys have same hash tag {user} -> same slot
-        client.delete_many(["{user}key1", "{user}key2", "{user}key3"])
-
-        # delete should be called only once (all keys in same slot)
-        mock_cluster.delete.assert_called_once()
-
     def test_clear_flushes_all_primaries(self):
         mock_cluster_cls = MagicMock()
         mock_cluster = MagicMock()
@@ -424,3 +350,247 @@ class TestRedisClusterAdapter:
         assert loop in client._async_clusters
         assert len(client._async_clusters[loop]) == 1
         mock_async_cluster.aclose.assert_not_called()
+
+
+# Hash tag -> node serving its slot.
+NODES = {"a": "node1:7000", "b": "node2:7001", "c": "node1:7000"}
+
+
+class FakePipeline:
+    """Cluster pipeline stand-in: records commands, answers from ``store``."""
+
+    def __init__(self, cluster):
+        self.cluster = cluster
+        self.commands = []
+
+    def execute_command(self, *args):
+        self.commands.append(args)
+
+    def get(self, key):
+        return self.execute_command("GET", key)
+
+    def set(self, key, value, px=None, **_options):
+        return self.execute_command("SET", key, value, px)
+
+    def execute(self, raise_on_error=True):
+        self.cluster.threads.append(threading.current_thread().name)
+        node = NODES[self.commands[0][1][1]]
+        if node in self.cluster.down:
+            raise RedisConnectionError(f"{node} is down")
+        replies = []
+        for command, *args in self.commands:
+            if command == "GET":
+                replies.append(self.cluster.store.get(args[0]))
+            elif command == "MGET":
+                replies.append([self.cluster.store.get(k) for k in args])
+            elif command == "DEL":
+                replies.append(sum(self.cluster.store.pop(k, None) is not None for k in args))
+            else:
+                self.cluster.store.update(zip(args[::2], args[1::2], strict=True) if command == "MSET" else [args[:2]])
+                replies.append(True)
+        return replies
+
+
+class AsyncFakePipeline(FakePipeline):
+    async def execute(self, raise_on_error=True):
+        return FakePipeline.execute(self, raise_on_error)
+
+
+class FakeCluster:
+    def __init__(self, pipeline_cls=FakePipeline):
+        self.store = {}
+        self.down = set()
+        self.threads = []
+        self.pipelines = []
+        self.pipeline_cls = pipeline_cls
+        self.initialize = AsyncMock()
+
+    def get_node_from_key(self, key):
+        return SimpleNamespace(name=NODES[key[1]])
+
+    def pipeline(self, transaction=None):
+        pipe = self.pipeline_cls(self)
+        self.pipelines.append(pipe)
+        return pipe
+
+
+def fan_out_client(cluster):
+    client = setup_cluster_client(MagicMock(from_url=MagicMock(return_value=cluster)))
+    client._async_cluster_class = MagicMock(from_url=MagicMock(return_value=cluster))
+    return client
+
+
+class TestClusterFanOut:
+    def test_get_many_one_pipeline_per_node(self):
+        cluster = FakeCluster()
+        cluster.store = {"{a}1": b"1", "{b}2": b"2", "{c}3": b"3"}
+        client = fan_out_client(cluster)
+
+        result = client.get_many(["{c}3", "{a}1", "{a}missing", "{b}2"])
+
+        assert list(result.items()) == [("{c}3", b"3"), ("{a}1", b"1"), ("{b}2", b"2")]
+        assert sorted(len(pipe.commands) for pipe in cluster.pipelines) == [1, 2]
+        assert all(name.startswith("cachex-fanout") for name in cluster.threads)
+
+    def test_single_node_runs_inline(self):
+        cluster = FakeCluster()
+        client = fan_out_client(cluster)
+
+        client.get_many(["{a}1", "{c}2"])
+
+        assert cluster.threads == [threading.current_thread().name]
+
+    def test_set_and_delete_many(self):
+        cluster = FakeCluster()
+        client = fan_out_client(cluster)
+
+        client.set_many({"{a}1": b"1", "{b}2": b"2"}, 60)
+        assert ("SET", "{a}1", b"1", 60_000) in cluster.pipelines[0].commands + cluster.pipelines[1].commands
+        assert client.delete_many(["{a}1", "{b}2", "{c}missing"]) == 2
+        assert cluster.store == {}
+
+    def test_partial_failure(self):
+        cluster = FakeCluster()
+        cluster.store = {"{a}1": b"1", "{b}2": b"2"}
+        cluster.down = {"node2:7001"}
+        client = fan_out_client(cluster)
+
+        with pytest.raises(ClusterFanoutError) as exc_info:
+            client.get_many(["{a}1", "{b}2"])
+
+        assert list(exc_info.value.errors) == ["node2:7001"]
+        assert exc_info.value.keys == {"node2:7001": ["{b}2"]}
+        assert exc_info.value.partial == {"{a}1": b"1"}
+        with pytest.raises(ClusterFanoutError) as exc_info:
+            client.delete_many(["{a}1", "{b}2"])
+        assert exc_info.value.partial == 1
+
+    def test_every_node_failing_raises_the_node_error(self):
+        cluster = FakeCluster()
+        cluster.down = {"node1:7000", "node2:7001"}
+        client = fan_out_client(cluster)
+
+        with pytest.raises(RedisConnectionError):
+            client.set_many({"{a}1": b"1", "{b}2": b"2"}, None)
+
+    @pytest.mark.asyncio
+    async def test_async_fan_out(self):
+        cluster = FakeCluster(AsyncFakePipeline)
+        client = fan_out_client(cluster)
+
+        await client.aset_many({"{a}1": b"1", "{b}2": b"2"}, None)
+        assert await client.aget_many(["{a}1", "{b}2", "{c}3"]) == {"{a}1": b"1", "{b}2": b"2"}
+        cluster.down = {"node1:7000"}
+        with pytest.raises(ClusterFanoutError) as exc_info:
+            await client.adelete_many(["{a}1", "{b}2"])
+        assert exc_info.value.partial == 1
+
+
+class TestClusterPipeline:
+    def test_replies_in_queue_order(self):
+        cluster = FakeCluster()
+        cluster.store = {"{a}1": b"1", "{b}2": b"2"}
+        pipe = fan_out_client(cluster).pipeline()
+
+        pipe.get("{b}2")
+        pipe.set("{a}3", b"3")
+        pipe.get("{a}1")
+        pipe.get("{c}missing")
+        pipe.delete("{b}2")
+
+        assert pipe.execute() == [b"2", True, b"1", None, 1]
+        assert cluster.store == {"{a}1": b"1", "{a}3": b"3"}
+        # The queueing pipeline plus one flush per node.
+        assert sorted(len(p.commands) for p in cluster.pipelines[1:]) == [2, 3]
+
+    def test_max_commands_per_flush(self):
+        cluster = FakeCluster()
+        client = fan_out_client(cluster)
+        client._pipeline_max_commands = 2
+        pipe = client.pipeline()
+
+        for i in range(5):
+            pipe.set(f"{{a}}{i}", b"v")
+
+        assert pipe.execute() == [True] * 5
+        assert [len(p.commands) for p in cluster.pipelines[1:]] == [2, 2, 1]
+
+    def test_failed_node_raises_after_the_others_ran(self):
+        cluster = FakeCluster()
+        cluster.down = {"node2:7001"}
+        pipe = fan_out_client(cluster).pipeline()
+
+        pipe.set("{b}1", b"1")
+        pipe.set("{a}1", b"1")
+
+        with pytest.raises(RedisConnectionError):
+            pipe.execute()
+        assert cluster.store == {"{a}1": b"1"}
+        assert pipe.execute() == []
+
+    def test_invalid_max_commands(self):
+        with pytest.raises(ImproperlyConfigured):
+            RedisPyClusterAdapter(["redis://localhost:7000"], pipeline_max_commands=0)
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        cluster = FakeCluster(AsyncFakePipeline)
+        pipe = await fan_out_client(cluster).apipeline()
+
+        pipe.set("{a}1", b"1")
+        pipe.set("{b}2", b"2")
+        pipe.get("{a}1")
+
+        assert await pipe.execute() == [True, True, b"1"]
+
+
+class ScriptedCluster(FakeCluster):
+    """Answers the scripted ``delete_pattern`` steps with canned pages per primary."""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = {"node1:7000": [(b"5", 2), (b"0", 1)], "node2:7001": [(b"0", 4)]}
+        self.steps = []
+        self.commands = []
+
+    def get_primaries(self):
+        return [SimpleNamespace(name=name) for name in self.pages]
+
+    def execute_command(self, command, script, numkeys, cursor, pattern, count, target_nodes):
+        self.steps.append((target_nodes.name, cursor, threading.current_thread().name))
+        self.commands.append((command, script))
+        return self.pages[target_nodes.name].pop(0)
+
+
+class AsyncScriptedCluster(ScriptedCluster):
+    async def execute_command(self, *args, **kwargs):
+        return ScriptedCluster.execute_command(self, *args, **kwargs)
+
+
+class TestScriptedDeletePattern:
+    def test_steps_run_per_primary_in_parallel(self):
+        cluster = ScriptedCluster()
+        client = fan_out_client(cluster)
+        client._scripted_delete_pattern = True
+        progress = []
+
+        assert client.delete_pattern("prefix:1:foo*", progress=progress.append) == 7
+
+        assert progress == [6, 7]
+        assert sorted(step[:2] for step in cluster.steps) == [("node1:7000", 0), ("node1:7000", 5), ("node2:7001", 0)]
+        assert all(step[2].startswith("cachex-fanout") for step in cluster.steps)
+        assert cluster.commands == [("EVALSHA", _CLUSTER_DELETE_PATTERN_STEP.sha)] * 3
+        assert _CLUSTER_DELETE_PATTERN_STEP.source.startswith("#!lua flags=allow-cross-slot-keys")
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        cluster = AsyncScriptedCluster()
+        client = fan_out_client(cluster)
+        client._scripted_delete_pattern = True
+        progress = []
+
+        assert await client.adelete_pattern("prefix:1:foo*", progress=progress.append) == 7
+
+        assert progress == [6, 7]
+        assert len(cluster.steps) == 3
+        cluster.initialize.assert_awaited()
@@ -0,0 +1,156 @@
+"""Tests for the codec header (``OPTIONS["codec_header"]``) and raw passthrough."""
+
+from typing import Any
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.safestring import SafeString, mark_safe
+
+from django_cachex.compressors.zlib import ZlibCompressor
+from django_cachex.framing import FRAME_MAGIC, RAW_BYTES_ID, RAW_STR_ID
+from django_cachex.serializers.base import BaseSerializer
+from django_cachex.serializers.json import JsonSerializer
+from django_cachex.serializers.pickle import PickleSerializer
+from django_cachex.stampede import StampedeConfig
+
+PICKLE = "django_cachex.serializers.pickle.PickleSerializer"
+JSON = "django_cachex.serializers.json.JsonSerializer"
+ZLIB = "django_cachex.compressors.zlib.ZlibCompressor"
+
+
+def _make_cache(**options: Any) -> Any:
+    # The adapter is lazy, so this never opens a connection.
+    from django_cachex.cache import RedisCache
+
+    return RedisCache(server="redis://localhost:6379/0", params={"OPTIONS": options})
+
+
+class CountingPickle(PickleSerializer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loads_calls = 0
+
+    def loads(self, data: bytes | int) -> Any:
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+class NoDumpsPickle(PickleSerializer):
+    def dumps(self, obj: Any) -> bytes:
+        raise AssertionError("serializer called")
+
+
+class RawSerializer(BaseSerializer):
+    def _dumps(self, obj: Any) -> bytes:
+        return obj
+
+    def _loads(self, data: bytes) -> Any:
+        return data
+
+
+class NamelessSerializer(PickleSerializer):
+    codec_id = None
+
+
+class ClashingSerializer(RawSerializer):
+    codec_id = 1
+
+
+class TestEncode:
+    def test_header_names_serializer(self):
+        cache = _make_cache(codec_header=True)
+        encoded = cache.encode({"a": 1})
+        assert encoded[0] == FRAME_MAGIC
+        assert encoded[1] == PickleSerializer.codec_id << 4
+        assert cache.decode(encoded) == {"a": 1}
+
+    def test_header_names_compressor_only_when_compressed(self):
+        cache = _make_cache(codec_header=True, compressor=ZLIB)
+        assert cache.encode("x")[1] & 0x0F == 0
+        big = cache.encode("x" * 10_000)
+        assert big[1] & 0x0F == ZlibCompressor.codec_id
+        assert cache.decode(big) == "x" * 10_000
+
+    def test_off_by_default(self):
+        assert _make_cache().encode({"a": 1})[0] != FRAME_MAGIC
+
+    def test_ints_stay_raw(self):
+        assert _make_cache(codec_header=True).encode(42) == 42
+
+    def test_with_stampede_envelope(self):
+        cache = _make_cache(codec_header=True)
+        encoded = cache.encode([1, 2], stampede=StampedeConfig(envelope=True), timeout=60)
+        assert cache.decode(encoded) == [1, 2]
+
+
+class TestDecode:
+    def test_dispatch_skips_fallback_chain(self):
+        writer = _make_cache(codec_header=True, serializer=JSON)
+        reader = _make_cache(serializer=[CountingPickle, JSON])
+        assert reader.decode(writer.encode({"a": [1, 2]})) == {"a": [1, 2]}
+        assert reader._serializers[0].loads_calls == 0
+
+    def test_unframed_values_still_read(self):
+        legacy = _make_cache(serializer=JSON, compressor=ZLIB).encode({"k": "v" * 1_000})
+        reader = _make_cache(codec_header=True, serializer=[PICKLE, JSON], compressor=ZLIB)
+        assert reader.decode(legacy) == {"k": "v" * 1_000}
+
+    def test_framed_values_read_with_option_off(self):
+        framed = _make_cache(codec_header=True, compressor=ZLIB).encode("y" * 1_000)
+        assert _make_cache(compressor=ZLIB).decode(framed) == "y" * 1_000
+
+    def test_header_lookalike_falls_back(self):
+        cache = _make_cache(serializer=[PICKLE, RawSerializer])
+        lookalike = bytes((FRAME_MAGIC, PickleSerializer.codec_id << 4)) + b"not a pickle"
+        assert cache.decode(lookalike) == lookalike
+
+
+class TestConfig:
+    def test_writer_needs_codec_id(self):
+        with pytest.raises(ImproperlyConfigured, match="codec_id"):
+            _make_cache(codec_header=True, serializer=NamelessSerializer)
+
+    def test_codecs_without_id_are_fine_as_fallbacks(self):
+        cache = _make_cache(codec_header=True, serializer=[JsonSerializer, NamelessSerializer])
+        assert cache.decode(cache.encode([1])) == [1]
+
+    def test_clashing_ids_rejected(self):
+        with pytest.raises(ImproperlyConfigured, match="share codec_id"):
+            _make_cache(serializer=[PICKLE, ClashingSerializer])
+
+
+class TestRawPassthrough:
+    @pytest.mark.parametrize("value", [b"<p>fragment</p>", "caf\u00e9 \u2603", b"", ""])
+    def test_round_trip_without_serializer(self, value):
+        cache = _make_cache(raw_passthrough=True, serializer=NoDumpsPickle)
+        encoded = cache.encode(value)
+        assert encoded[:2] == bytes((FRAME_MAGIC, (RAW_STR_ID if isinstance(value, str) else RAW_BYTES_ID) << 4))
+        decoded = cache.decode(encoded)
+        assert decoded == value
+        assert type(decoded) is type(value)
+
+    def test_large_values_compressed(self):
+        cache = _make_cache(raw_passthrough=True, compressor=ZLIB)
+        value = "<li>row</li>" * 1_000
+        encoded = cache.encode(value)
+        assert len(encoded) < len(value) // 10
+        assert cache.decode(encoded) == value
+
+    def test_str_subclasses_keep_their_type(self):
+        cache = _make_cache(raw_passthrough=True)
+        decoded = cache.decode(cache.encode(mark_safe("<b>x</b>")))
+        assert type(decoded) is SafeString
+
+    def test_raw_ids_unmapped_with_option_off(self):
+        # An unframed custom-codec value that starts like a raw header.
+        lookalike = bytes((FRAME_MAGIC, RAW_BYTES_ID << 4)) + b"custom"
+        assert _make_cache(serializer=RawSerializer).decode(lookalike) == lookalike
+
+    def test_invalid_utf8_falls_back(self):
+        lookalike = bytes((FRAME_MAGIC, RAW_STR_ID << 4)) + b"\xff\xfe"
+        assert _make_cache(raw_passthrough=True, serializer=RawSerializer).decode(lookalike) == lookalike
+
+    def test_other_values_still_serialized(self):
+        cache = _make_cache(raw_passthrough=True)
+        assert cache.decode(cache.encode({"a": b"b"})) == {"a": b"b"}
+        assert cache.encode(7) == 7
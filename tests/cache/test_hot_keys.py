@@ -0,0 +1,173 @@
+"""Tests for sampled hot-key detection (``OPTIONS["hot_keys"]``)."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.hotkeys import (
+    CountMinSketch,
+    HotKeyConfig,
+    HotKeyTracker,
+    SampledAdapter,
+    TopK,
+    make_hot_keys_config,
+    shared_tracker,
+)
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+
+class StubAdapter:
+    def get(self, key: str) -> bytes:
+        return b"value"
+
+    async def aget(self, key: str) -> bytes:
+        return b"value"
+
+    def set_many(self, data: dict[str, bytes], timeout: int | None = None) -> list[str]:
+        return []
+
+    def info(self) -> dict[str, Any]:
+        return {}
+
+
+def _tracker(**options: Any) -> HotKeyTracker:
+    return HotKeyTracker(HotKeyConfig(**{"sample_rate": 1.0, **options}))
+
+
+class TestHotKeysConfig:
+    def test_defaults(self):
+        assert make_hot_keys_config(True) == HotKeyConfig()
+
+    @pytest.mark.parametrize("option", [None, False, {}])
+    def test_disabled(self, option):
+        assert make_hot_keys_config(option) is None
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [
+            ("sample_rate", 0),
+            ("sample_rate", 1.5),
+            ("sample_rate", True),
+            ("top_k", 0),
+            ("width", 1.0),
+            ("separator", ""),
+        ],
+    )
+    def test_invalid_values_rejected(self, key, value):
+        with pytest.raises(ImproperlyConfigured, match=key):
+            make_hot_keys_config({key: value})
+
+
+class TestSketch:
+    def test_never_undercounts(self):
+        sketch = CountMinSketch(width=16, depth=3)
+        for i in range(200):
+            sketch.add(f"k{i % 40}")
+        assert all(sketch.estimate(f"k{i}") >= 5 for i in range(40))
+
+    def test_topk_keeps_heavy_hitters(self):
+        top = TopK(k=3, width=256, depth=4)
+        for i in range(2_000):
+            top.add(f"cold{i}")
+            if i % 4 == 0:
+                top.add("hot")
+            if i % 8 == 0:
+                top.add("warm")
+        items = top.items()
+        assert len(items) == 3
+        assert [item for item, _ in items[:2]] == ["hot", "warm"]
+        assert items[0][1] >= 500
+
+
+class TestHotKeyTracker:
+    def test_reads_and_writes_tracked_separately(self):
+        tracker = _tracker()
+        tracker.observe("read", [":1:user:1", ":1:user:1", ":1:user:2"])
+        tracker.observe("write", [":1:session:a"])
+        snap = tracker.snapshot()
+        assert snap["sampled"] == 4
+        assert snap["read"]["keys"][0] == {"key": ":1:user:1", "count": 2}
+        assert snap["read"]["prefixes"] == [{"prefix": ":1:user", "count": 3}]
+        assert snap["write"]["keys"] == [{"key": ":1:session:a", "count": 1}]
+
+    def test_counts_scaled_by_sample_rate(self):
+        tracker = HotKeyTracker(HotKeyConfig(sample_rate=0.5))
+        tracker.observe("read", ["k", "k"])
+        assert tracker.snapshot()["read"]["keys"] == [{"key": "k", "count": 4}]
+
+    def test_shared_per_scope_and_config(self):
+        sampled, every = HotKeyConfig(sample_rate=0.5), HotKeyConfig(sample_rate=1.0)
+        tracker = shared_tracker("shared-test", sampled)
+        tracker.observe("read", ["k"])
+        # Another config on the same scope gets its own tracker and leaves the first one's counts alone.
+        assert shared_tracker("shared-test", every) is not tracker
+        assert shared_tracker("shared-test", sampled) is tracker
+        assert tracker.snapshot()["sampled"] == 1
+
+    def test_reset(self):
+        tracker = _tracker()
+        tracker.observe("read", ["k"])
+        assert tracker.snapshot(reset=True)["sampled"] == 1
+        assert tracker.snapshot()["read"]["keys"] == []
+
+
+class TestSampledAdapter:
+    def test_samples_key_arguments(self):
+        tracker = _tracker()
+        adapter = SampledAdapter(StubAdapter(), tracker)
+        adapter.get("a")
+        adapter.set_many({"b": b"1", "c": b"2"})
+        snap = tracker.snapshot()
+        assert [e["key"] for e in snap["read"]["keys"]] == ["a"]
+        assert sorted(e["key"] for e in snap["write"]["keys"]) == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_async_twins_sampled(self):
+        tracker = _tracker()
+        adapter = SampledAdapter(StubAdapter(), tracker)
+        assert await adapter.aget("a") == b"value"
+        assert tracker.snapshot()["read"]["keys"] == [{"key": "a", "count": 1}]
+
+    def test_other_methods_pass_through(self):
+        adapter = SampledAdapter(StubAdapter(), _tracker())
+        assert adapter.info == adapter._adapter.info
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"hot_keys": {"sample_rate": 1.0, "top_k": 5}}
+
+
+@pytest.fixture
+def hot_cache(cache_with_options: RespCache) -> RespCache:
+    cache_with_options.hot_keys(reset=True)
+    return cache_with_options
+
+
+class TestCacheHotKeys:
+    def test_hot_keys_in_info(self, hot_cache: RespCache):
+        hot_cache.set("user:1", "a")
+        for _ in range(3):
+            hot_cache.get("user:1")
+        hot_cache.get_many(["user:1", "user:2"])
+        hot = hot_cache.info()["hot_keys"]
+        made = hot_cache.make_key("user:1")
+        assert hot["read"]["keys"][0] == {"key": made, "count": 4}
+        assert hot["write"]["keys"] == [{"key": made, "count": 1}]
+        assert hot["read"]["prefixes"][0]["count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_async_reads_counted(self, hot_cache: RespCache):
+        await hot_cache.aset("k", "v")
+        assert await hot_cache.aget("k") == "v"
+        hot = hot_cache.hot_keys()
+        assert hot is not None
+        assert hot["read"]["keys"] == [{"key": hot_cache.make_key("k"), "count": 1}]
+
+
+def test_hot_keys_off_by_default(cache: RespCache):
+    assert cache.hot_keys() is None
+    assert "hot_keys" not in cache.info()
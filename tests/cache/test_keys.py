@@ -164,6 +164,38 @@ class TestDeletePatternOperations:
         keys = cache.keys("foo*")
         assert set(keys) == {"foo-bb", "foo-bc"}
 
+    def test_delete_pattern_progress(self, cache: RespCache):
+        for i in range(25):
+            cache.set(f"foo-{i}", i)
+
+        progress: list[int] = []
+        assert cache.delete_pattern("foo-*", itersize=10, progress=progress.append) == 25
+        assert progress == sorted(progress)
+        assert progress[-1] == 25
+
+    def test_scripted_delete_pattern(self, cache: RespCache, monkeypatch: pytest.MonkeyPatch):
+        if not hasattr(cache.adapter, "_scripted_delete_pattern"):
+            pytest.skip("scripted_delete_pattern is a valkey-py / redis-py option")
+        monkeypatch.setattr(cache.adapter, "_scripted_delete_pattern", True)
+        for i in range(25):
+            cache.set(f"foo-{i}", i)
+        cache.set("bar", 1)
+
+        progress: list[int] = []
+        assert cache.delete_pattern("foo-*", itersize=10, progress=progress.append) == 25
+        assert progress[-1] == 25
+        assert cache.keys("*") == ["bar"]
+
+    @pytest.mark.asyncio
+    async def test_scripted_adelete_pattern(self, cache: RespCache, monkeypatch: pytest.MonkeyPatch):
+        if not hasattr(cache.adapter, "_scripted_delete_pattern"):
+            pytest.skip("scripted_delete_pattern is a valkey-py / redis-py option")
+        monkeypatch.setattr(cache.adapter, "_scripted_delete_pattern", True)
+        await cache.aset_many({f"foo-{i}": i for i in range(25)})
+
+        assert await cache.adelete_pattern("foo-*", itersize=10) == 25
+        assert await cache.akeys("foo-*") == []
+
 
 class TestIterKeysOperations:
     def test_iter_keys(self, cache: RespCache):
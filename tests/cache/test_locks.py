@@ -1,10 +1,15 @@
 """Tests for lock operations."""
 
+import asyncio
 import threading
+import time
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
+from django_cachex.stampede import StampedeConfig
+
 if TYPE_CHECKING:
     from django_cachex.cache import RespCache
 
@@ -185,3 +190,144 @@ class TestAsyncLockSyncContextManager:
         with pytest.raises(TypeError), lock:
             entered = True
         assert not entered
+
+
+ENVELOPE = StampedeConfig(envelope=True, delta=0.0)
+
+
+def _recompute_lock_key(cache: RespCache, key: str) -> str:
+    return cache._recompute_lock_key(cache.make_and_validate_key(key))
+
+
+def _hold_recompute_lock(cache: RespCache, key: str) -> str:
+    """Take ``key``'s recompute lock as if another process were recomputing it."""
+    lock_key = _recompute_lock_key(cache, key)
+    cache.adapter.set(lock_key, b"other-process", 10)
+    return lock_key
+
+
+class TestRecomputeLock:
+    """``get_or_set(..., recompute_lock=...)``: one recompute across processes."""
+
+    def test_concurrent_callers_run_default_once(self, cache: RespCache):
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"computed": True}
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_set("rl_once", compute, timeout=60, recompute_lock=True))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [{"computed": True}] * 8
+        assert len(calls) == 1
+        assert not cache.adapter.has_key(_recompute_lock_key(cache, "rl_once"))
+
+    def test_loser_gets_stale_value(self, cache: RespCache):
+        cache.set("rl_stale", "old", timeout=300, stampede_prevention=ENVELOPE)
+        _hold_recompute_lock(cache, "rl_stale")
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 301):
+            result = cache.get_or_set(
+                "rl_stale",
+                lambda: pytest.fail("loser must not recompute"),
+                timeout=300,
+                stampede_prevention=ENVELOPE,
+                recompute_lock=True,
+            )
+        assert result == "old"
+
+    def test_loser_waits_for_winner_write(self, cache: RespCache):
+        _hold_recompute_lock(cache, "rl_wait")
+        writer = threading.Timer(0.1, lambda: cache.set("rl_wait", "fresh"))
+        writer.start()
+        try:
+            result = cache.get_or_set("rl_wait", lambda: "mine", recompute_lock=True)
+        finally:
+            writer.join()
+        assert result == "fresh"
+
+    def test_waiter_reads_value_after_winner_unlocks(self, cache: RespCache):
+        lock_key = _hold_recompute_lock(cache, "rl_unlocked")
+
+        def finish():
+            cache.set("rl_unlocked", "winner")
+            cache.adapter.delete(lock_key)
+
+        writer = threading.Timer(0.1, finish)
+        writer.start()
+        try:
+            result = cache.get_or_set(
+                "rl_unlocked",
+                lambda: pytest.fail("waiter must not recompute"),
+                recompute_lock=True,
+            )
+        finally:
+            writer.join()
+        assert result == "winner"
+
+    def test_failed_recompute_releases_lock(self, cache: RespCache):
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            cache.get_or_set("rl_fail", boom, recompute_lock=True)
+        assert not cache.adapter.has_key(_recompute_lock_key(cache, "rl_fail"))
+        assert cache.get_or_set("rl_fail", lambda: "ok", recompute_lock=True) == "ok"
+
+    def test_write_keeps_timeout(self, cache: RespCache):
+        assert cache.get_or_set("rl_ttl", "v", timeout=120, recompute_lock=2.5) == "v"
+        ttl = cache.ttl("rl_ttl")
+        assert ttl is not None
+        assert 0 < ttl <= 120
+
+    @pytest.mark.parametrize("recompute_lock", [0, -1, "10"])
+    def test_invalid_lease_rejected(self, cache: RespCache, recompute_lock):
+        with pytest.raises(ValueError, match="recompute_lock"):
+            cache.get_or_set("rl_bad", "v", recompute_lock=recompute_lock)
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_callers_run_default_once(self, cache: RespCache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return "computed"
+
+        results = await asyncio.gather(
+            *(cache.aget_or_set("arl_once", compute, timeout=60, recompute_lock=True) for _ in range(8)),
+        )
+        assert results == ["computed"] * 8
+        assert len(calls) == 1
+
+
+class TestClusterRecomputeLock:
+    """The lock key shares its value key's hash slot, so the scripts run on cluster too."""
+
+    cluster_supported = True
+
+    def test_lock_key_shares_value_slot(self, cache: RespCache):
+        made_key = cache.make_and_validate_key("rl_cluster")
+        assert _recompute_lock_key(cache, "rl_cluster") == f"{{{made_key}}}:recompute-lock"
+        tagged = cache.make_and_validate_key("{rl}:cluster")
+        assert cache._recompute_lock_key(tagged) == f"{tagged}:recompute-lock"
+
+    def test_get_or_set_with_recompute_lock(self, cache: RespCache):
+        assert cache.get_or_set("rl_cluster", lambda: "v", timeout=60, recompute_lock=True) == "v"
+        assert cache.get("rl_cluster") == "v"
+        assert not cache.adapter.has_key(_recompute_lock_key(cache, "rl_cluster"))
+
+    @pytest.mark.asyncio
+    async def test_aget_or_set_with_recompute_lock(self, cache: RespCache):
+        assert await cache.aget_or_set("arl_cluster", lambda: "v", timeout=60, recompute_lock=True) == "v"
+        assert await cache.aget("arl_cluster") == "v"
+        assert not cache.adapter.has_key(_recompute_lock_key(cache, "arl_cluster"))
@@ -0,0 +1,189 @@
+"""Tests for client-side command metrics (``OPTIONS["metrics"]``)."""
+
+import random
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from django_cachex.metrics import CacheMetrics, Histogram, InstrumentedAdapter
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+
+class StubPipeline:
+    def __init__(self) -> None:
+        self.queued: list[bytes] = []
+
+    def set(self, key: str, value: bytes) -> None:
+        self.queued.append(value)
+
+    def execute(self) -> list[bool]:
+        return [True] * len(self.queued)
+
+
+class StubAdapter:
+    def __init__(self) -> None:
+        self._secret = "private"
+
+    def get(self, key: str) -> bytes | None:
+        return b"value" if key != "missing" else None
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    def set(self, key: str, value: bytes, timeout: int | None, *, stampede_prevention: object = None) -> object:
+        return stampede_prevention
+
+    def set_many(self, data: dict[str, bytes], timeout: int | None = None) -> list[str]:
+        return []
+
+    def delete(self, key: str) -> bool:
+        raise ConnectionError("down")
+
+    def resolve_stampede(self, value: object = None) -> None:
+        return None
+
+    def pipeline(self, *, transaction: bool = True) -> StubPipeline:
+        return StubPipeline()
+
+
+def _instrumented() -> tuple[InstrumentedAdapter, CacheMetrics]:
+    metrics = CacheMetrics()
+    return InstrumentedAdapter(StubAdapter(), metrics), metrics
+
+
+class TestHistogram:
+    def test_small_values_are_exact(self):
+        hist = Histogram()
+        for ns in (3, 3, 7):
+            hist.record(ns)
+        assert hist.quantile(0.5) == 3
+        assert hist.quantile(1.0) == 7
+
+    def test_quantiles_within_bucket_precision(self):
+        hist = Histogram()
+        samples = sorted(random.randint(1_000, 5_000_000) for _ in range(5_000))
+        for ns in samples:
+            hist.record(ns)
+        for q in (0.5, 0.9, 0.99):
+            exact = samples[round(q * len(samples)) - 1]
+            assert abs(hist.quantile(q) - exact) / exact < 0.125
+
+    def test_empty(self):
+        assert Histogram().summary() == {"mean_us": 0.0, "p50_us": 0.0, "p90_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+
+
+class TestInstrumentedAdapter:
+    def test_records_calls_and_bytes(self):
+        adapter, metrics = _instrumented()
+        adapter.get("k")
+        adapter.get("missing")
+        adapter.set_many({"a": b"12", "b": b"345"})
+        snap = metrics.snapshot()
+        assert snap["get"]["calls"] == 2
+        assert snap["get"]["bytes_in"] == len(b"value")
+        assert snap["set_many"]["bytes_out"] == 5
+        assert snap["get"]["max_us"] >= snap["get"]["p50_us"] >= 0
+
+    def test_stampede_keyword_passed_through(self):
+        adapter, metrics = _instrumented()
+        assert adapter.set("k", b"1234", 60, stampede_prevention=False) is False
+        assert adapter.set("k", b"12", 60) is None
+        snap = metrics.snapshot()["set"]
+        assert snap["calls"] == 2
+        assert snap["bytes_out"] == 6
+
+    def test_errors_counted_and_reraised(self):
+        adapter, metrics = _instrumented()
+        with pytest.raises(ConnectionError):
+            adapter.delete("k")
+        snap = metrics.snapshot()["delete"]
+        assert snap["calls"] == 1
+        assert snap["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_counts_under_sync_name(self):
+        adapter, metrics = _instrumented()
+        assert await adapter.aget("k") == b"value"
+        assert metrics.snapshot()["get"]["calls"] == 1
+
+    def test_pipeline_execute_timed(self):
+        adapter, metrics = _instrumented()
+        pipe = adapter.pipeline(transaction=False)
+        pipe.set("k", b"v")
+        assert pipe.execute() == [True]
+        assert metrics.snapshot()["pipeline"]["calls"] == 1
+
+    def test_bookkeeping_passes_through(self):
+        adapter, metrics = _instrumented()
+        adapter.resolve_stampede()
+        assert adapter._secret == "private"
+        assert metrics.snapshot() == {}
+
+    def test_reset(self):
+        adapter, metrics = _instrumented()
+        adapter.get("k")
+        assert metrics.snapshot(reset=True)["get"]["calls"] == 1
+        assert metrics.snapshot() == {}
+
+    def test_threads_record_into_their_own_shards(self):
+        adapter, metrics = _instrumented()
+
+        def work() -> None:
+            for _ in range(100):
+                adapter.get("k")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        adapter.get("k")
+
+        assert metrics.snapshot()["get"]["calls"] == 401
+        # The exited threads' shards were folded into one retired total.
+        assert len(metrics._shards["get"]) == 1
+        assert metrics.snapshot(reset=True)["get"]["calls"] == 401
+        assert metrics.snapshot() == {}
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"metrics": True}
+
+
+@pytest.fixture
+def metrics_cache(cache_with_options: RespCache) -> RespCache:
+    cache_with_options.metrics(reset=True)
+    return cache_with_options
+
+
+class TestCacheMetrics:
+    def test_commands_recorded(self, metrics_cache: RespCache):
+        metrics_cache.set("k", "v")
+        metrics_cache.get("k")
+        metrics_cache.get_many(["k", "other"])
+        snap = metrics_cache.metrics()
+        assert snap is not None
+        assert snap["set"]["calls"] == 1
+        assert snap["set"]["bytes_out"] > 0
+        assert snap["get"]["calls"] == 1
+        assert snap["get_many"]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_and_pipeline_recorded(self, metrics_cache: RespCache):
+        await metrics_cache.aset("k", "v")
+        assert await metrics_cache.aget("k") == "v"
+        with metrics_cache.pipeline(transaction=False) as pipe:
+            pipe.get("k")
+            pipe.execute()
+        snap = metrics_cache.metrics()
+        assert snap is not None
+        assert snap["get"]["calls"] == 1
+        assert snap["pipeline"]["calls"] == 1
+
+
+def test_metrics_off_by_default(cache: RespCache):
+    assert cache.metrics() is None
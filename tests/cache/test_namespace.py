@@ -0,0 +1,111 @@
+"""Tests for generation-counter namespaces (``cache.namespace(name)``)."""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django_cachex.namespace import _GENERATIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django_cachex.cache import RespCache
+
+
+@pytest.fixture(autouse=True)
+def _clear_generations() -> Iterator[None]:
+    _GENERATIONS.clear()
+    yield
+    _GENERATIONS.clear()
+
+
+class TestNamespace:
+    def test_keys_are_isolated(self, cache_with_options: RespCache):
+        a, b = cache_with_options.namespace("tenant:1"), cache_with_options.namespace("tenant:2")
+        a.set("k", "a", 60)
+        b.set("k", "b", 60)
+        cache_with_options.set("k", "plain", 60)
+        assert (a.get("k"), b.get("k"), cache_with_options.get("k")) == ("a", "b", "plain")
+        assert a.get_many(["k", "missing"]) == {"k": "a"}
+
+    def test_invalidate(self, cache_with_options: RespCache):
+        tenant, other = cache_with_options.namespace("tenant:1"), cache_with_options.namespace("tenant:2")
+        tenant.set_many({"a": 1, "b": 2}, 60)
+        other.set("a", 3, 60)
+        before = tenant.generation()
+        assert tenant.invalidate() == before + 1
+        assert tenant.get_many(["a", "b"]) == {}
+        assert other.get("a") == 3
+        tenant.set("a", 4, 60)
+        assert tenant.get("a") == 4
+
+    def test_clear_only_invalidates(self, cache_with_options: RespCache):
+        cache_with_options.set("outside", 1, 60)
+        tenant = cache_with_options.namespace("tenant:1")
+        tenant.set("k", 1, 60)
+        tenant.clear()
+        assert tenant.get("k") is None
+        assert cache_with_options.get("outside") == 1
+
+    def test_generation_cached_in_process(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:1", generation_ttl=60)
+        tenant.set("k", 1, 60)
+        cache_with_options.adapter.incr(tenant._key)
+        # Another process' INCR is not seen until the cached generation expires.
+        assert tenant.get("k") == 1
+        _GENERATIONS.clear()
+        assert tenant.get("k") is None
+
+    def test_lost_counter_does_not_reuse_generations(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:1")
+        first = tenant.generation()
+        cache_with_options.adapter.delete(tenant._key)
+        assert tenant.invalidate() > first
+
+    @pytest.mark.asyncio
+    async def test_lost_counter_restarted_once(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:1")
+        first = tenant.generation()
+        cache_with_options.adapter.delete(tenant._key)
+        generations = await asyncio.gather(*(tenant.ainvalidate() for _ in range(8)))
+        assert min(generations) >= first
+        assert sorted(generations) == list(range(min(generations), min(generations) + 8))
+
+    def test_generation_is_per_thread(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:1", generation_ttl=60)
+        before = tenant.generation()
+        with ThreadPoolExecutor(1) as pool:
+            after = pool.submit(tenant.invalidate).result()
+        # The other thread's invalidation doesn't change the keys this one is folding.
+        assert tenant.fold("k") == f"tenant:1:{before}:k"
+        assert tenant.generation() == after
+
+    def test_namespaces_do_not_grow_the_context(self, cache_with_options: RespCache):
+        cache_with_options.namespace("tenant:1").generation()
+        size = len(contextvars.copy_context())
+        for _ in range(50):
+            cache_with_options.namespace("tenant:1").get("k")
+        assert len(contextvars.copy_context()) == size
+
+    def test_keys_and_reverse_key(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:[1]")
+        tenant.set("user:1", 1, 60)
+        cache_with_options.set("user:2", 2, 60)
+        assert tenant.keys("user:*") == ["user:1"]
+        assert tenant.reverse_key(tenant.make_key("user:1")) == "user:1"
+
+    @pytest.mark.asyncio
+    async def test_async(self, cache_with_options: RespCache):
+        tenant = cache_with_options.namespace("tenant:1")
+        await tenant.aset("k", "v", 60)
+        assert await tenant.aget("k") == "v"
+        assert [k async for k in tenant.aiter_keys("*")] == ["k"]
+        await tenant.ainvalidate()
+        assert await tenant.aget("k") is None
+
+    def test_empty_name_rejected(self, cache_with_options: RespCache):
+        with pytest.raises(ValueError, match="empty"):
+            cache_with_options.namespace("")
@@ -1,8 +1,13 @@
+import asyncio
 import copy
 from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
 
 import pytest
 from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.cache import ValkeyCache
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -83,3 +88,111 @@ def test_custom_key_function(cache: RespCache, settings):
     raw_keys = cache.adapter.keys("*")
     decoded = {k.decode() if isinstance(k, bytes) else k for k in raw_keys}
     assert decoded == {"#1#foo-bc", "#1#foo-bb"}
+
+
+@pytest.fixture
+def batched_cache(cache: RespCache, settings) -> RespCache:
+    caches_setting = copy.deepcopy(settings.CACHES)
+    caches_setting["default"]["OPTIONS"]["max_batch_keys"] = 3
+    settings.CACHES = caches_setting
+    return cache
+
+
+class TestMaxBatchOptions:
+    def test_get_many_splits_into_batches(self, batched_cache: RespCache):
+        data = {f"batch-{i}": i * 10 for i in range(10)}
+        batched_cache.set_many(data)
+        with patch.object(batched_cache.adapter, "get_many", wraps=batched_cache.adapter.get_many) as spy:
+            assert batched_cache.get_many(list(data)) == data
+        assert spy.call_count == 4
+        assert max(len(call.args[0]) for call in spy.call_args_list) == 3
+
+    def test_set_many_splits_into_batches(self, batched_cache: RespCache):
+        data = {f"batch-set-{i}": f"v{i}" for i in range(7)}
+        with patch.object(batched_cache.adapter, "set_many", wraps=batched_cache.adapter.set_many) as spy:
+            batched_cache.set_many(data, timeout=60)
+        assert spy.call_count == 3
+        assert batched_cache.get_many(list(data)) == data
+
+    @pytest.mark.asyncio
+    async def test_async_batches_round_trip(self, batched_cache: RespCache):
+        data = {f"abatch-{i}": {"n": i} for i in range(10)}
+        await batched_cache.aset_many(data, timeout=60)
+        assert await batched_cache.aget_many([*data, "abatch-missing"]) == data
+
+    @pytest.mark.asyncio
+    async def test_async_batches_bounded_concurrency(self, batched_cache: RespCache, monkeypatch):
+        monkeypatch.setattr(batched_cache, "_max_batch_concurrency", 2)
+        data = {f"abound-{i}": i for i in range(20)}
+        await batched_cache.aset_many(data, timeout=60)
+        in_flight = peak = 0
+        aget_many = batched_cache.adapter.aget_many
+
+        async def tracked(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                return await aget_many(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        with patch.object(batched_cache.adapter, "aget_many", tracked):
+            assert await batched_cache.aget_many(list(data)) == data
+        assert peak == 2
+
+    def test_batch_concurrency_defaults_to_a_cap(self):
+        assert ValkeyCache("redis://127.0.0.1:6379", {})._max_batch_concurrency == 8
+
+    @pytest.mark.parametrize("value", [0, -1, 1.5, "100"])
+    def test_invalid_concurrency_rejected(self, value):
+        with pytest.raises(ImproperlyConfigured, match="max_batch_concurrency"):
+            ValkeyCache("redis://127.0.0.1:6379", {"OPTIONS": {"max_batch_concurrency": value}})
+
+    @pytest.mark.parametrize("value", [0, -1, 1.5, "100"])
+    def test_invalid_values_rejected(self, value):
+        with pytest.raises(ImproperlyConfigured, match="max_batch_keys"):
+            ValkeyCache("redis://127.0.0.1:6379", {"OPTIONS": {"max_batch_keys": value}})
+
+
+@pytest.fixture
+def setex_cache(cache: RespCache, settings) -> RespCache:
+    caches_setting = copy.deepcopy(settings.CACHES)
+    caches_setting["default"]["OPTIONS"]["atomic_set_many"] = False
+    settings.CACHES = caches_setting
+    return cache
+
+
+class TestNonAtomicSetMany:
+    def test_set_many_with_timeout(self, setex_cache: RespCache):
+        data = {f"setex-{i}": {"i": i} for i in range(5)}
+        setex_cache.set_many(data, timeout=120)
+        assert setex_cache.get_many(list(data)) == data
+        for key in data:
+            ttl = setex_cache.ttl(key)
+            assert ttl is not None
+            assert 0 < ttl <= 120
+
+    @pytest.mark.asyncio
+    async def test_aset_many_with_timeout(self, setex_cache: RespCache):
+        data = {f"asetex-{i}": i for i in range(5)}
+        await setex_cache.aset_many(data, timeout=120)
+        assert await setex_cache.aget_many(list(data)) == data
+        ttl = await setex_cache.attl("asetex-0")
+        assert ttl is not None
+        assert 0 < ttl <= 120
+
+    @pytest.mark.parametrize("value", [0, 1, "false", None])
+    def test_non_bool_rejected(self, value):
+        cache = ValkeyCache("redis://127.0.0.1:6379", {"OPTIONS": {"atomic_set_many": value}})
+        with pytest.raises(ImproperlyConfigured, match="atomic_set_many"):
+            _ = cache.adapter
+
+
+class TestScriptedDeletePatternOption:
+    @pytest.mark.parametrize("value", [0, 1, "true", None])
+    def test_non_bool_rejected(self, value):
+        cache = ValkeyCache("redis://127.0.0.1:6379", {"OPTIONS": {"scripted_delete_pattern": value}})
+        with pytest.raises(ImproperlyConfigured, match="scripted_delete_pattern"):
+            _ = cache.adapter
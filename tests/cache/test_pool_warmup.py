@@ -0,0 +1,159 @@
+"""Tests for connection-pool warm-up and pool gauges (redis-py / valkey-py)."""
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.adapters._pools import (
+    awarm_pool,
+    instrument_pool,
+    make_warmup_count,
+    pool_stats,
+    warm_new_pool,
+    warm_pool,
+)
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+
+class StubPool:
+    def __init__(self, max_connections: int = 10, fail_after: int | None = None) -> None:
+        self.max_connections = max_connections
+        self.fail_after = fail_after
+        self._created_connections = 0
+        self._available_connections: list[object] = []
+        self._in_use_connections: set[object] = set()
+
+    def get_connection(self) -> object:
+        if self.fail_after is not None and self._created_connections >= self.fail_after:
+            raise ConnectionError("refused")
+        if self._available_connections:
+            conn = self._available_connections.pop()
+        else:
+            conn = object()
+            self._created_connections += 1
+        self._in_use_connections.add(conn)
+        return conn
+
+    def release(self, conn: object) -> None:
+        self._in_use_connections.discard(conn)
+        self._available_connections.append(conn)
+
+
+class AsyncStubPool(StubPool):
+    async def get_connection(self) -> object:  # type: ignore[override]
+        await asyncio.sleep(0)
+        return StubPool.get_connection(self)
+
+    async def release(self, conn: object) -> None:  # type: ignore[override]
+        StubPool.release(self, conn)
+
+
+class TestWarmPool:
+    @pytest.mark.parametrize("value", [-1, True, "2", 1.5])
+    def test_invalid_option_rejected(self, value: Any):
+        with pytest.raises(ImproperlyConfigured, match="pool_warmup"):
+            make_warmup_count(value)
+
+    def test_opens_and_returns_connections(self):
+        pool = StubPool()
+        assert warm_pool(pool, 3) == 3
+        assert pool_stats(pool) == {"in_use": 0, "idle": 3, "created": 3, "max": 10}
+
+    def test_reuses_idle_connections(self):
+        pool = StubPool()
+        warm_pool(pool, 2)
+        warm_pool(pool, 3)
+        assert pool._created_connections == 3
+
+    def test_capped_by_max_connections(self):
+        pool = StubPool(max_connections=2)
+        assert warm_pool(pool, 5) == 2
+
+    def test_failure_releases_what_was_opened(self):
+        pool = StubPool(fail_after=2)
+        with pytest.raises(ConnectionError):
+            warm_pool(pool, 4)
+        assert pool_stats(pool)["idle"] == 2
+        assert pool_stats(pool)["in_use"] == 0
+
+    def test_new_pool_warm_up_failure_is_logged(self, caplog: pytest.LogCaptureFixture):
+        pool = StubPool(fail_after=1)
+        warm_new_pool(pool, 3)
+        assert pool_stats(pool)["idle"] == 1
+        assert "pool_warmup" in caplog.text
+
+    def test_instrumented_pool_reports_waits(self):
+        pool = instrument_pool(StubPool())
+        assert instrument_pool(pool) is pool
+        warm_pool(pool, 2)
+        stats = pool_stats(pool)
+        assert stats["checkouts"] == 2
+        assert stats["wait_max_ms"] >= stats["wait_avg_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_async_pool(self):
+        pool = AsyncStubPool()
+        assert await awarm_pool(pool, 3) == 3
+        assert pool_stats(pool)["idle"] == 3
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"pool_warmup": 3}
+
+
+@pytest.mark.parametrize("resp_adapter", ["redis-py", "valkey-py"])
+class TestPoolWarmup:
+    def test_warm_up_opens_connections_per_server(self, cache_with_options: RespCache):
+        # build_cache_config lists the server twice: primary + one replica.
+        assert cache_with_options.warm_up() == 6
+        sync_pools = [p for p in cache_with_options.info()["pools"] if p["mode"] == "sync"]
+        assert len(sync_pools) == 2
+        assert all(p["idle"] >= 3 for p in sync_pools)
+
+    def test_explicit_count(self, cache_with_options: RespCache):
+        assert cache_with_options.warm_up(1) == 2
+
+    def test_new_sync_pool_on_another_thread_is_warm(self, cache_with_options: RespCache):
+        pools: list[dict[str, Any]] = []
+
+        def serve() -> None:
+            # Django builds a separate cache, with its own pools, per thread.
+            cache = caches["default"]
+            assert cache is not cache_with_options
+            cache.set("k", "v")
+            pools.extend(p for p in cache.info()["pools"] if p["mode"] == "sync")
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        thread.join()
+        assert pools
+        assert pools[0]["created"] >= 3
+
+    def test_gauges_track_checkouts(self, cache_with_options: RespCache):
+        cache_with_options.set("k", "v")
+        primary = cache_with_options.info()["pools"][0]
+        assert primary["checkouts"] >= 1
+        assert primary["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_awarm_up(self, cache_with_options: RespCache):
+        assert await cache_with_options.awarm_up(2) == 4
+        assert any(p["mode"] == "async" and p["idle"] >= 2 for p in cache_with_options.info()["pools"])
+
+    @pytest.mark.asyncio
+    async def test_new_async_pool_warms_in_background(self, cache_with_options: RespCache):
+        await cache_with_options.aset("k", "v")
+        for _ in range(100):
+            pools = [p for p in cache_with_options.info()["pools"] if p["mode"] == "async"]
+            if pools and pools[0]["created"] >= 3:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("async pool was not warmed")
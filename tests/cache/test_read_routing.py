@@ -0,0 +1,194 @@
+"""Tests for latency-aware read routing in the redis-py / valkey-py adapters."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_cachex.adapters._routing import (
+    LeastOutstandingPolicy,
+    PowerOfTwoChoicesPolicy,
+    ReadPolicy,
+    ReadRouter,
+    RoutingConfig,
+    ServerStats,
+    make_routing_config,
+)
+from django_cachex.adapters._tracking import make_tracking_config
+from django_cachex.cache import ValkeyClusterCache
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django_cachex.cache import RespCache
+
+SERVERS = ["redis://:secret@primary:6379/0", "redis://replica-a:6379/0", "redis://replica-b:6380/0"]
+
+
+class FirstPolicy(ReadPolicy):
+    def choose(self, candidates: Sequence[ServerStats]) -> ServerStats:
+        return candidates[0]
+
+
+def _router(**options) -> ReadRouter:
+    return ReadRouter(SERVERS, RoutingConfig(**options))
+
+
+def _fail(router: ReadRouter, index: int, times: int) -> None:
+    for _ in range(times):
+        router.finish(index, router.start(index), failed=True)
+
+
+class TestRoutingConfig:
+    def test_policy_name(self):
+        assert make_routing_config("least_outstanding") == RoutingConfig(policy="least_outstanding")
+
+    @pytest.mark.parametrize("option", [None, False, {}, ""])
+    def test_disabled(self, option):
+        assert make_routing_config(option) is None
+
+    def test_dotted_policy_path(self):
+        config = make_routing_config({"policy": "tests.cache.test_read_routing.FirstPolicy"})
+        assert config is not None
+        assert isinstance(ReadRouter(SERVERS, config)._policy, FirstPolicy)
+
+    @pytest.mark.parametrize("policy", ["fastest", "tests.cache.test_read_routing.SERVERS"])
+    def test_bad_policy_rejected(self, policy):
+        with pytest.raises(ImproperlyConfigured, match="policy"):
+            make_routing_config({"policy": policy})
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("primary_after_write", 0), ("primary_after_write", True), ("eject_after", 0), ("eject_for", -1)],
+    )
+    def test_invalid_values_rejected(self, key, value):
+        with pytest.raises(ImproperlyConfigured, match=key):
+            make_routing_config({key: value})
+
+    def test_cluster_rejected(self):
+        cache = ValkeyClusterCache("redis://127.0.0.1:6379", {"OPTIONS": {"read_routing": "p2c"}})
+        with pytest.raises(ImproperlyConfigured, match="read_routing"):
+            _ = cache.adapter
+
+
+class TestReadRouter:
+    def test_writes_go_to_primary(self):
+        assert _router().choose(write=True) == 0
+
+    def test_reads_go_to_replicas(self):
+        router = _router()
+        assert {router.choose(write=False) for _ in range(50)} <= {1, 2}
+
+    def test_p2c_prefers_lower_latency(self):
+        fast, slow = ServerStats(1, "a", ewma=0.001), ServerStats(2, "b", ewma=0.05)
+        assert {PowerOfTwoChoicesPolicy().choose([fast, slow]).index for _ in range(20)} == {1}
+
+    def test_p2c_weighs_outstanding(self):
+        busy, idle = ServerStats(1, "a", ewma=0.001, outstanding=99), ServerStats(2, "b", ewma=0.002)
+        assert PowerOfTwoChoicesPolicy().choose([busy, idle]).index == 2
+
+    def test_least_outstanding(self):
+        router = _router(policy="least_outstanding")
+        router.start(1)
+        assert {router.choose(write=False) for _ in range(20)} == {2}
+        assert LeastOutstandingPolicy().choose([ServerStats(1, "a", outstanding=3), ServerStats(2, "b")]).index == 2
+
+    def test_ewma_tracks_latency(self):
+        router = _router()
+        router.finish(1, router.start(1) - 0.1, failed=False)
+        stats = router.stats()[1]
+        assert stats["requests"] == 1
+        assert stats["ewma_ms"] >= 100
+
+    def test_errors_eject_replica(self):
+        router = _router(eject_after=2, eject_for=60)
+        _fail(router, 1, 2)
+        assert router.stats()[1]["ejected"]
+        assert {router.choose(write=False) for _ in range(20)} == {2}
+
+    def test_success_resets_error_streak(self):
+        router = _router(eject_after=2)
+        _fail(router, 1, 1)
+        router.finish(1, router.start(1), failed=False)
+        _fail(router, 1, 1)
+        assert not router.stats()[1]["ejected"]
+        assert router.stats()[1]["errors"] == 2
+
+    def test_all_replicas_ejected_falls_back_to_primary(self):
+        router = _router(eject_after=1, eject_for=60)
+        _fail(router, 1, 1)
+        _fail(router, 2, 1)
+        assert router.choose(write=False) == 0
+
+    def test_ejection_expires(self):
+        router = _router(eject_after=1, eject_for=0)
+        _fail(router, 1, 1)
+        assert not router.stats()[1]["ejected"]
+
+    def test_primary_after_write(self):
+        router = _router(primary_after_write=60)
+        assert router.choose(write=False) != 0
+        router.choose(write=True)
+        assert router.choose(write=False) == 0
+
+    def test_forget_write_ends_window(self):
+        router = _router(primary_after_write=60)
+        router.choose(write=True)
+        router.forget_write()
+        assert router.choose(write=False) != 0
+
+    def test_primary_after_write_is_per_context(self):
+        router = _router(primary_after_write=60)
+
+        async def writer() -> None:
+            router.choose(write=True)
+
+        async def main() -> int:
+            await asyncio.create_task(writer())
+            return router.choose(write=False)
+
+        assert asyncio.run(main()) != 0
+
+    def test_stats_hide_credentials(self):
+        stats = _router().stats()
+        assert [s["server"] for s in stats] == ["primary:6379", "replica-a:6379", "replica-b:6380"]
+        assert [s["role"] for s in stats] == ["primary", "replica", "replica"]
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"read_routing": {"policy": "p2c", "primary_after_write": 5}}
+
+
+@pytest.mark.parametrize("resp_adapter", ["redis-py", "valkey-py"])
+class TestReadRouting:
+    def test_commands_feed_stats(self, cache_with_options: RespCache):
+        cache_with_options.set("k", "v")
+        assert cache_with_options.get("k") == "v"
+        stats = cache_with_options.info()["read_routing"]
+        assert len(stats) == 2
+        assert stats[0]["requests"] >= 1
+        assert all(s["outstanding"] == 0 for s in stats)
+
+    @pytest.mark.asyncio
+    async def test_async_commands_feed_stats(self, cache_with_options: RespCache):
+        await cache_with_options.aset("k", "v")
+        assert await cache_with_options.aget("k") == "v"
+        assert sum(s["requests"] for s in cache_with_options.info()["read_routing"]) >= 2
+
+    def test_close_ends_primary_after_write(self, cache_with_options: RespCache):
+        cache_with_options.set("k", "v")
+        assert cache_with_options.adapter._get_connection_pool_index(write=False) == 0
+        # Django closes the caches on request_finished; the next request reads from replicas again.
+        cache_with_options.close()
+        assert cache_with_options.adapter._get_connection_pool_index(write=False) != 0
+
+    def test_near_cache_setup_is_not_a_write(self, cache_with_options: RespCache, monkeypatch):
+        adapter = cache_with_options.adapter
+        monkeypatch.setattr(adapter, "_tracking", make_tracking_config(True))
+        with patch("django_cachex.adapters.valkey_py.shared_near_cache") as shared:
+            adapter._near_cache()
+        assert shared.call_args.args[2] is adapter._pools[0]
+        assert adapter._get_connection_pool_index(write=False) != 0
@@ -1,6 +1,7 @@
 import pickle
 
 import pytest
+from django.core.exceptions import ImproperlyConfigured
 
 from django_cachex.exceptions import SerializerError
 from django_cachex.serializers.json import JsonSerializer
@@ -14,6 +15,16 @@ except ImportError:
     OrjsonSerializer = None  # type: ignore[assignment,misc]
 
 
+class Block:
+    """Pickles its data as a ``PickleBuffer``, like a NumPy array."""
+
+    def __init__(self, data: bytearray | memoryview) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return Block, (pickle.PickleBuffer(self.data),)
+
+
 class TestJsonSerializer:
     def test_basic_roundtrip(self):
         serializer = JsonSerializer()
@@ -46,6 +57,42 @@ class TestPickleSerializer:
         with pytest.raises(SerializerError):
             serializer.dumps({"x": 1})
 
+    def test_out_of_band_roundtrip(self):
+        serializer = PickleSerializer(out_of_band=True, out_of_band_min_size=1_000)
+        value = {"big": Block(bytearray(b"a" * 5_000)), "small": Block(bytearray(b"b" * 10)), "n": 1}
+        encoded = serializer.dumps(value)
+        assert encoded[:1] == b"\xb5"
+        assert encoded.endswith(b"a" * 5_000)
+        decoded = serializer.loads(encoded)
+        assert bytes(decoded["big"].data) == b"a" * 5_000
+        assert bytes(decoded["small"].data) == b"b" * 10
+        assert decoded["n"] == 1
+
+    def test_out_of_band_buffers_are_views(self):
+        serializer = PickleSerializer(out_of_band=True, out_of_band_min_size=1_000)
+        decoded = serializer.loads(serializer.dumps(Block(bytearray(5_000))))
+        assert isinstance(decoded.data, memoryview)
+        assert decoded.data.readonly
+
+    def test_out_of_band_without_large_buffers_is_plain_pickle(self):
+        serializer = PickleSerializer(out_of_band=True)
+        assert serializer.dumps({"x": 1}) == pickle.dumps({"x": 1}, 5)
+
+    def test_out_of_band_readable_without_option(self):
+        value = Block(bytearray(b"c" * 100_000))
+        encoded = PickleSerializer(out_of_band=True).dumps(value)
+        assert bytes(PickleSerializer().loads(encoded).data) == b"c" * 100_000
+
+    def test_out_of_band_protocol(self):
+        assert PickleSerializer(out_of_band=True).protocol >= 5
+        with pytest.raises(ImproperlyConfigured):
+            PickleSerializer(protocol=4, out_of_band=True)
+
+    def test_out_of_band_truncated_raises(self):
+        serializer = PickleSerializer(out_of_band=True)
+        with pytest.raises(SerializerError):
+            serializer.loads(serializer.dumps(Block(bytearray(100_000)))[:20])
+
 
 class TestMsgpackSerializer:
     def test_basic_roundtrip(self):
@@ -0,0 +1,177 @@
+"""Tests for in-process request coalescing (``OPTIONS["singleflight"]``)."""
+
+import asyncio
+import copy
+import threading
+import time
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+
+from django_cachex.singleflight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+N_WORKERS = 16
+
+
+def _run_threads(target) -> list:
+    barrier = threading.Barrier(N_WORKERS)
+    results: list = []
+
+    def worker():
+        barrier.wait()
+        results.append(target())
+
+    threads = [threading.Thread(target=worker) for _ in range(N_WORKERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_run(self):
+        flights = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return "v"
+
+        assert _run_threads(lambda: flights.do("k", slow)) == ["v"] * N_WORKERS
+        assert len(calls) == 1
+
+    def test_error_reaches_every_waiter(self):
+        flights = SingleFlight()
+
+        def boom():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                flights.do("k", boom)
+            except ValueError as e:
+                return str(e)
+            return None
+
+        assert _run_threads(call) == ["boom"] * N_WORKERS
+
+    def test_reentrant_call_does_not_deadlock(self):
+        flights = SingleFlight()
+        assert flights.do("k", lambda: flights.do("k", lambda: 1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_calls_share_one_run(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "v"
+
+        assert await asyncio.gather(*(flights.do("k", slow) for _ in range(50))) == ["v"] * 50
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_waiter_takes_over_after_leader_cancelled(self):
+        flights = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "v"
+
+        leader = asyncio.create_task(flights.do("k", slow))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flights.do("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await waiter == "v"
+
+
+@pytest.fixture
+def cache_options() -> dict[str, Any]:
+    return {"singleflight": True}
+
+
+class TestCacheSingleFlight:
+    def test_get_or_set_runs_callable_once(self, cache_with_options: RespCache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"computed": True}
+
+        results = _run_threads(lambda: cache_with_options.get_or_set("sf-key", compute, timeout=60))
+        assert results == [{"computed": True}] * N_WORKERS
+        assert len(calls) == 1
+        assert cache_with_options.get("sf-key") == {"computed": True}
+
+    def test_concurrent_gets_share_one_read(self, cache_with_options: RespCache):
+        cache_with_options.set("sf-get", "value")
+        # Each thread gets its own cache (and adapter) instance, so patch the class.
+        adapter_cls = type(cache_with_options.adapter)
+        adapter_get = adapter_cls.get
+        calls = []
+
+        def slow_get(self, *args, **kwargs):
+            calls.append(1)
+            time.sleep(0.2)
+            return adapter_get(self, *args, **kwargs)
+
+        with patch.object(adapter_cls, "get", slow_get):
+            results = _run_threads(lambda: cache_with_options.get("sf-get"))
+        assert results == ["value"] * N_WORKERS
+        assert len(calls) == 1
+
+    def test_aliases_with_different_options_read_apart(self, cache_with_options: RespCache, settings):
+        # Same LOCATION, different stampede_prevention: a read must not be shared.
+        caches_setting = copy.deepcopy(settings.CACHES)
+        caches_setting["stampede"] = copy.deepcopy(caches_setting["default"])
+        caches_setting["stampede"]["OPTIONS"]["stampede_prevention"] = True
+        settings.CACHES = caches_setting
+        cache_with_options.set("sf-alias", "value")
+        adapter_cls = type(cache_with_options.adapter)
+        adapter_get = adapter_cls.get
+        calls = []
+
+        def slow_get(self, *args, **kwargs):
+            calls.append(1)
+            time.sleep(0.2)
+            return adapter_get(self, *args, **kwargs)
+
+        aliases = iter(["default", "stampede"] * (N_WORKERS // 2))
+        lock = threading.Lock()
+
+        def read() -> object:
+            with lock:
+                alias = next(aliases)
+            return cast("RespCache", caches[alias]).get("sf-alias")
+
+        with patch.object(adapter_cls, "get", slow_get):
+            results = _run_threads(read)
+        assert results == ["value"] * N_WORKERS
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_aget_or_set_runs_callable_once(self, cache_with_options: RespCache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "computed"
+
+        results = await asyncio.gather(
+            *(cache_with_options.aget_or_set("asf-key", compute, timeout=60) for _ in range(50))
+        )
+        assert results == ["computed"] * 50
+        assert len(calls) == 1
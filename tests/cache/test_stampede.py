@@ -1,11 +1,23 @@
 """Tests for cache stampede prevention via XFetch algorithm (TTL-based)."""
 
+import asyncio
+import threading
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
-from django_cachex.stampede import StampedeConfig, should_recompute
+from django_cachex.refresh import TaskRefresher, ThreadRefresher
+from django_cachex.stampede import (
+    StampedeConfig,
+    envelope_should_recompute,
+    envelope_staleness,
+    filter_fresh,
+    should_recompute,
+    unwrap_envelope,
+    wrap_envelope,
+)
 
 if TYPE_CHECKING:
     from django_cachex.cache import RespCache
@@ -72,6 +84,114 @@ class TestStampedeConfig:
         assert config.delta == 0.5
 
 
+class TestFilterFresh:
+    """Tests for filter_fresh(), the shared GET+TTL reply filter."""
+
+    def test_drops_misses_and_stale(self):
+        config = StampedeConfig(buffer=60, delta=0.0)
+        result = filter_fresh(
+            ["fresh", "missing", "stale", "persistent"],
+            [b"a", None, b"c", b"d"],
+            [300, -2, 50, -1],
+            config,
+        )
+        assert result == {"fresh": b"a", "persistent": b"d"}
+
+    def test_integers_bypass_stampede(self):
+        config = StampedeConfig(buffer=60, delta=0.0)
+        assert filter_fresh(["n"], [7], [10], config) == {"n": 7}
+
+
+class TestEnvelope:
+    """Tests for the XFetch value envelope helpers."""
+
+    def test_round_trip(self):
+        wrapped = wrap_envelope(b"payload", 300, 2.5)
+        payload, expires_at, delta = unwrap_envelope(wrapped)
+        assert payload == b"payload"
+        assert expires_at == pytest.approx(time.time() + 300, abs=5)
+        assert delta == 2.5
+
+    def test_plain_value_is_not_an_envelope(self):
+        assert unwrap_envelope(b"\x80\x05plain pickle") is None
+        assert unwrap_envelope(b"") is None
+
+    def test_fresh_value_does_not_recompute(self):
+        config = StampedeConfig(envelope=True)
+        assert envelope_should_recompute(wrap_envelope(b"v", 300, 0.0), config) is False
+
+    def test_logically_expired_value_recomputes(self):
+        config = StampedeConfig(envelope=True)
+        wrapped = wrap_envelope(b"v", 300, 0.0)
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 301):
+            assert envelope_should_recompute(wrapped, config) is True
+
+    def test_measured_delta_drives_early_recompute(self):
+        config = StampedeConfig(envelope=True, delta=0.0)
+        # 10s left, but the stored delta says recompute takes ~100s.
+        wrapped = wrap_envelope(b"v", 10, 100.0)
+        triggers = sum(1 for _ in range(100) if envelope_should_recompute(wrapped, config))
+        assert triggers > 50
+
+    def test_no_timeout_and_non_envelope_never_recompute(self):
+        config = StampedeConfig(envelope=True)
+        assert envelope_should_recompute(wrap_envelope(b"v", None, 100.0), config) is False
+        assert envelope_should_recompute(b"legacy", config) is False
+        assert envelope_should_recompute(42, config) is False
+
+    def test_staleness(self):
+        assert envelope_staleness(wrap_envelope(b"v", 300, 0.0)) == pytest.approx(-300, abs=5)
+        assert envelope_staleness(wrap_envelope(b"v", None, 0.0)) is None
+        assert envelope_staleness(b"legacy") is None
+        assert envelope_staleness(None) is None
+
+
+class TestRefreshers:
+    """Background refresh executors behind ``stale_while_revalidate``."""
+
+    def test_thread_refresher_dedupes_pending_key(self):
+        refresher = ThreadRefresher(max_workers=1)
+        release = threading.Event()
+        done = threading.Event()
+
+        def job():
+            release.wait(5)
+            done.set()
+
+        assert refresher.submit("k", job) is True
+        assert refresher.submit("k", job) is False
+        release.set()
+        assert done.wait(5)
+
+    def test_thread_refresher_bounded(self):
+        refresher = ThreadRefresher(max_workers=1, max_pending=1)
+        release = threading.Event()
+        assert refresher.submit("a", lambda: release.wait(5)) is True
+        assert refresher.submit("b", lambda: None) is False
+        release.set()
+
+    def test_thread_refresher_restarts_after_fork(self):
+        refresher = ThreadRefresher(max_workers=1, max_pending=1)
+        release = threading.Event()
+        assert refresher.submit("a", lambda: release.wait(5)) is True
+        # In a forked child the parent's pool and pending refreshes are gone.
+        with patch("django_cachex.utils.os.getpid", return_value=-1):
+            assert refresher.submit("a", lambda: None) is True
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_task_refresher_swallows_errors(self):
+        refresher = TaskRefresher()
+
+        async def boom():
+            raise ValueError("boom")
+
+        assert refresher.submit("k", boom) is True
+        assert refresher.submit("k", boom) is False
+        await asyncio.sleep(0.01)
+        assert refresher.submit("k", boom) is True
+
+
 # =============================================================================
 # Integration tests (require Redis)
 # =============================================================================
@@ -383,6 +503,93 @@ class TestStampedeOverride:
         assert 300 < ttl <= 390  # 300 + 90 buffer from override
 
 
+ENVELOPE = StampedeConfig(envelope=True, delta=0.0)
+
+
+class TestStampedeEnvelope:
+    """Envelope mode: logical expiry travels with the value, no TTL lookup."""
+
+    def test_set_and_get(self, cache: RespCache):
+        cache.set("sp_env_basic", {"a": 1}, timeout=300, stampede_prevention=ENVELOPE)
+        assert cache.get("sp_env_basic", stampede_prevention=ENVELOPE) == {"a": 1}
+        # Plain reads strip the envelope too.
+        assert cache.get("sp_env_basic") == {"a": 1}
+        ttl = cache.ttl("sp_env_basic")
+        assert ttl is not None
+        assert ttl > 300  # buffer still applied so stale copies survive
+
+    def test_logically_expired_is_a_miss(self, cache: RespCache):
+        cache.set("sp_env_exp", "val", timeout=300, stampede_prevention=ENVELOPE)
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 301):
+            assert cache.get("sp_env_exp", stampede_prevention=ENVELOPE) is None
+            assert cache.get_many(["sp_env_exp"], stampede_prevention=ENVELOPE) == {}
+        # Physically still there.
+        assert cache.get("sp_env_exp", stampede_prevention=False) == "val"
+
+    def test_skips_ttl_lookup(self, cache: RespCache):
+        cache.set("sp_env_nottl", "val", timeout=300, stampede_prevention=ENVELOPE)
+        # Physical TTL inside the buffer would trip the TTL-based check.
+        cache.expire("sp_env_nottl", 50)
+        assert cache.get("sp_env_nottl", stampede_prevention=ENVELOPE) == "val"
+
+    def test_get_or_set_stores_measured_delta(self, cache: RespCache):
+        def slow():
+            time.sleep(0.05)
+            return "computed"
+
+        assert cache.get_or_set("sp_env_gos", slow, timeout=300, stampede_prevention=ENVELOPE) == "computed"
+        raw = cache.adapter.get(cache.make_key("sp_env_gos"), stampede_prevention=False)
+        _payload, _expires_at, delta = unwrap_envelope(raw)
+        assert delta >= 0.05
+
+    def test_touch_moves_logical_expiry(self, cache: RespCache):
+        cache.set("sp_env_touch", "val", timeout=10, stampede_prevention=ENVELOPE)
+        assert cache.touch("sp_env_touch", timeout=600, stampede_prevention=ENVELOPE) is True
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 300):
+            assert cache.get("sp_env_touch", stampede_prevention=ENVELOPE) == "val"
+
+    def test_touch_keeps_concurrent_set(self, cache: RespCache, monkeypatch: pytest.MonkeyPatch):
+        cache.set("sp_env_race", "old", timeout=10, stampede_prevention=ENVELOPE)
+        rewrap = cache._rewrap_envelope
+        writes = ["new"]
+
+        def rewrap_then_race(value, timeout):
+            # Another client writes between touch()'s read and its rewrite.
+            if writes:
+                cache.set("sp_env_race", writes.pop(), timeout=10, stampede_prevention=ENVELOPE)
+            return rewrap(value, timeout)
+
+        monkeypatch.setattr(cache, "_rewrap_envelope", rewrap_then_race)
+        assert cache.touch("sp_env_race", timeout=600, stampede_prevention=ENVELOPE) is True
+        assert cache.get("sp_env_race", stampede_prevention=ENVELOPE) == "new"
+        assert cache.ttl("sp_env_race") > 500
+
+    def test_touch_does_not_undo_concurrent_delete(self, cache: RespCache, monkeypatch: pytest.MonkeyPatch):
+        cache.set("sp_env_gone", "val", timeout=10, stampede_prevention=ENVELOPE)
+        rewrap = cache._rewrap_envelope
+
+        def rewrap_then_delete(value, timeout):
+            cache.delete("sp_env_gone")
+            return rewrap(value, timeout)
+
+        monkeypatch.setattr(cache, "_rewrap_envelope", rewrap_then_delete)
+        assert cache.touch("sp_env_gone", timeout=600, stampede_prevention=ENVELOPE) is False
+        assert cache.has_key("sp_env_gone") is False
+
+    def test_integers_stay_raw(self, cache: RespCache):
+        cache.set("sp_env_int", 5, timeout=300, stampede_prevention=ENVELOPE)
+        assert cache.incr("sp_env_int") == 6
+        assert cache.get("sp_env_int", stampede_prevention=ENVELOPE) == 6
+
+    @pytest.mark.asyncio
+    async def test_async_set_get_and_expiry(self, cache: RespCache):
+        await cache.aset("asp_env", "val", timeout=300, stampede_prevention=ENVELOPE)
+        assert await cache.aget("asp_env", stampede_prevention=ENVELOPE) == "val"
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 301):
+            assert await cache.aget("asp_env", stampede_prevention=ENVELOPE) is None
+            assert await cache.aget_many(["asp_env"], stampede_prevention=ENVELOPE) == {}
+
+
 # =============================================================================
 # Robustness tests for XFetch algorithm
 # =============================================================================
@@ -475,6 +682,25 @@ class TestStampedeGetManyConsistency:
         assert result["sp_gmc_fresh1"] == "val"
         assert result["sp_gmc_fresh2"] == 99
 
+    def test_get_many_mixed_hits_misses_and_stale(self, stampede_cache: RespCache):
+        stampede_cache.set("sp_gmc_mix_fresh", "fresh", timeout=300)
+        stampede_cache.set("sp_gmc_mix_stale", "stale", timeout=300)
+        stampede_cache.expire("sp_gmc_mix_stale", 50)
+        stampede_cache.delete("sp_gmc_mix_missing")
+
+        result = stampede_cache.get_many(["sp_gmc_mix_missing", "sp_gmc_mix_stale", "sp_gmc_mix_fresh"])
+        assert result == {"sp_gmc_mix_fresh": "fresh"}
+
+    @pytest.mark.asyncio
+    async def test_aget_many_mixed_hits_misses_and_stale(self, stampede_cache: RespCache):
+        await stampede_cache.aset("asp_gmc_mix_fresh", "fresh", timeout=300)
+        await stampede_cache.aset("asp_gmc_mix_stale", "stale", timeout=300)
+        await stampede_cache.aexpire("asp_gmc_mix_stale", 50)
+        await stampede_cache.adelete("asp_gmc_mix_missing")
+
+        result = await stampede_cache.aget_many(["asp_gmc_mix_missing", "asp_gmc_mix_stale", "asp_gmc_mix_fresh"])
+        assert result == {"asp_gmc_mix_fresh": "fresh"}
+
 
 class TestAsyncStampedeBasicOperations:
     """Basic aset/aget/adelete with stampede prevention enabled."""
@@ -587,3 +813,80 @@ class TestAsyncStampedeGetOrSetRecompute:
             timeout=300,
         )
         assert result == "recomputed"
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("timed out waiting for the background refresh")
+        time.sleep(0.01)
+
+
+class TestStaleWhileRevalidate:
+    """``get_or_set(..., stale_while_revalidate=N)`` serves stale and refreshes in the background."""
+
+    def test_serves_stale_and_refreshes(self, stampede_cache: RespCache):
+        stampede_cache.set("swr_basic", "stale", timeout=300)
+        # TTL inside the 60s buffer: logically expired 10s ago.
+        stampede_cache.expire("swr_basic", 50)
+        computed = threading.Event()
+
+        def compute():
+            computed.set()
+            return "fresh"
+
+        result = stampede_cache.get_or_set("swr_basic", compute, timeout=300, stale_while_revalidate=30)
+        assert result == "stale"
+        assert computed.wait(5)
+        _wait_for(lambda: stampede_cache.get("swr_basic") == "fresh")
+
+    def test_too_stale_recomputes_inline(self, stampede_cache: RespCache):
+        stampede_cache.set("swr_old", "stale", timeout=300)
+        stampede_cache.expire("swr_old", 5)  # expired 55s ago
+        result = stampede_cache.get_or_set("swr_old", lambda: "fresh", timeout=300, stale_while_revalidate=30)
+        assert result == "fresh"
+
+    def test_missing_key_recomputes_inline(self, stampede_cache: RespCache):
+        result = stampede_cache.get_or_set("swr_missing", lambda: "fresh", timeout=300, stale_while_revalidate=30)
+        assert result == "fresh"
+        assert stampede_cache.get("swr_missing") == "fresh"
+
+    def test_envelope_mode(self, cache: RespCache):
+        cache.set("swr_env", "stale", timeout=300, stampede_prevention=ENVELOPE)
+        with patch("django_cachex.stampede.time.time", return_value=time.time() + 310):
+            result = cache.get_or_set(
+                "swr_env",
+                lambda: "fresh",
+                timeout=300,
+                stampede_prevention=ENVELOPE,
+                stale_while_revalidate=30,
+            )
+        assert result == "stale"
+        _wait_for(lambda: cache.get("swr_env") == "fresh")
+
+    def test_without_stampede_recomputes_inline(self, cache: RespCache):
+        result = cache.get_or_set("swr_plain", lambda: "v", stampede_prevention=False, stale_while_revalidate=30)
+        assert result == "v"
+
+    @pytest.mark.parametrize("value", [-1, "30", True])
+    def test_invalid_value_rejected(self, cache: RespCache, value):
+        with pytest.raises(ValueError, match="stale_while_revalidate"):
+            cache.get_or_set("swr_bad", "v", stale_while_revalidate=value)
+
+    @pytest.mark.asyncio
+    async def test_async_serves_stale_and_refreshes(self, stampede_cache: RespCache):
+        await stampede_cache.aset("aswr_basic", "stale", timeout=300)
+        await stampede_cache.aexpire("aswr_basic", 50)
+
+        async def compute():
+            return "fresh"
+
+        result = await stampede_cache.aget_or_set("aswr_basic", compute, timeout=300, stale_while_revalidate=30)
+        assert result == "stale"
+        for _ in range(500):
+            if await stampede_cache.aget("aswr_basic") == "fresh":
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("timed out waiting for the background refresh")
@@ -0,0 +1,111 @@
+"""Tests for tag-based invalidation (``set(..., tags=...)`` / ``invalidate_tags()``)."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django_cachex.cache.resp import _TAG_PREFIX
+
+if TYPE_CHECKING:
+    from django_cachex.cache import RespCache
+
+
+def _members(cache: RespCache, tag: str) -> list[str]:
+    members = cache.adapter.zrange(cache.make_key(f"{_TAG_PREFIX}{tag}"), 0, -1)
+    return sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+
+
+class TestTags:
+    def test_invalidate_tags(self, cache: RespCache):
+        cache.set("a", 1, 60, tags=["user:1", "page"])
+        cache.set("b", 2, 60, tags=["user:2", "page"])
+        cache.set("c", 3, 60, tags=["user:2"])
+        cache.set("untagged", 4, 60)
+        assert cache.invalidate_tags(["user:2"]) == 2
+        assert cache.get_many(["a", "b", "c", "untagged"]) == {"a": 1, "untagged": 4}
+        assert cache.invalidate_tags(["page", "missing"]) == 1
+        assert cache.get("a") is None
+        assert cache.get("untagged") == 4
+
+    def test_batches(self, cache: RespCache):
+        for i in range(25):
+            cache.set(f"k{i}", i, 60, tags=["bulk"])
+        assert cache.invalidate_tags(["bulk"], batch_size=7) == 25
+        assert cache.get_many([f"k{i}" for i in range(25)]) == {}
+        assert _members(cache, "bulk") == []
+
+    def test_members_and_ttls(self, cache: RespCache):
+        cache.set("forever", "v", None, tags=["t"])
+        assert cache.ttl("forever") is None
+        cache.set("k", "v", 60, tags=["t"])
+        assert 0 < cache.ttl("k") <= 60
+        assert _members(cache, "t") == [cache.make_key("forever"), cache.make_key("k")]
+        assert cache.invalidate_tags(["t"]) == 2
+
+    def test_expired_members_pruned_on_write(self, cache: RespCache):
+        tag_key = cache.make_key(f"{_TAG_PREFIX}t")
+        cache.adapter.zadd(tag_key, {b"gone": 1.0})
+        cache.set("k", "v", 60, tags=["t"])
+        assert _members(cache, "t") == [cache.make_key("k")]
+
+    def test_tag_set_expires_with_newest_member(self, cache: RespCache):
+        tag_key = cache.make_key(f"{_TAG_PREFIX}t")
+
+        def follows(key: str) -> bool:
+            # The set expires at the member's expiry, rounded up to a second.
+            return 0 <= cache.adapter.ttl(tag_key) - cache.adapter.ttl(cache.make_key(key)) <= 1
+
+        cache.set("short", "v", 30, tags=["t"])
+        assert follows("short")
+        cache.set("long", "v", 120, tags=["t"])
+        assert follows("long")
+        cache.set("short", "v", 30, tags=["t"])
+        assert follows("long")
+
+    def test_tag_set_with_untimed_member_persists(self, cache: RespCache):
+        tag_key = cache.make_key(f"{_TAG_PREFIX}t")
+        cache.set("k", "v", 60, tags=["t"])
+        cache.set("forever", "v", None, tags=["t"])
+        assert cache.adapter.ttl(tag_key) is None
+        cache.set("k", "v", 60, tags=["t"])
+        assert cache.adapter.ttl(tag_key) is None
+
+    def test_rewrite_without_tags_survives(self, cache: RespCache):
+        cache.set("k", 1, 60, tags=["t"])
+        cache.set("k", 2, 60)
+        assert cache.invalidate_tags(["t"]) == 0
+        assert cache.get("k") == 2
+        assert _members(cache, "t") == []
+
+    def test_retagged_follows_new_tags(self, cache: RespCache):
+        cache.set("k", 1, 60, tags=["old"])
+        cache.set("k", 2, 60, tags=["new"])
+        assert cache.invalidate_tags(["old"]) == 0
+        assert cache.get("k") == 2
+        assert cache.invalidate_tags(["new"]) == 1
+        assert cache.get("k") is None
+
+    def test_zero_timeout_deletes(self, cache: RespCache):
+        cache.set("k", "v", 60)
+        cache.set("k", "v", 0, tags=["t"])
+        assert cache.get("k") is None
+
+    def test_rejects_flags_and_bad_batch(self, cache: RespCache):
+        with pytest.raises(ValueError, match="tags"):
+            cache.set("k", "v", 60, nx=True, tags=["t"])
+        with pytest.raises(ValueError, match="batch_size"):
+            cache.invalidate_tags(["t"], batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_async(self, cache: RespCache):
+        await cache.aset("a", 1, 60, tags=["t"])
+        await cache.aset("b", 2, 60, tags=["t"])
+        assert await cache.ainvalidate_tags(["t"], batch_size=1) == 2
+        assert await cache.aget_many(["a", "b"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_async_rewrite_without_tags_survives(self, cache: RespCache):
+        await cache.aset("k", 1, 60, tags=["t"])
+        await cache.aset("k", 2, 60)
+        assert await cache.ainvalidate_tags(["t"]) == 0
+        assert await cache.aget("k") == 2
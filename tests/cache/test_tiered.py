@@ -2,6 +2,7 @@
 
 import time
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from django.core.cache import caches
@@ -108,6 +109,24 @@ class TestTieredBasicOps:
         val = tiered_cache.get_or_set("gos_key", "ignored")
         assert val == "created"
 
+    def test_get_or_set_stale_while_revalidate(self, tiered_cache: BaseCache):
+        tiered_cache.delete("swr_key")
+        assert tiered_cache.get_or_set("swr_key", "created", stale_while_revalidate=30) == "created"
+        # The fresh write landed in L1 too.
+        assert caches["l1"].get("swr_key") == "created"
+        assert tiered_cache.get_or_set("swr_key", "ignored", stale_while_revalidate=30) == "created"
+
+    def test_get_or_set_stale_while_revalidate_stale_skips_l1(self, tiered_cache: BaseCache):
+        l2 = caches["l2"]
+        with (
+            patch.object(l2, "_get_or_set_fresh", return_value=("stale", False)),
+            patch.object(l2, "get", wraps=l2.get) as l2_get,
+        ):
+            assert tiered_cache.get_or_set("swr_stale", "fresh", stale_while_revalidate=30) == "stale"
+        # One L2 round trip (its own get_or_set), and the stale value stays out of L1.
+        l2_get.assert_not_called()
+        assert caches["l1"].get("swr_stale") is None
+
     def test_clear(self, tiered_cache: BaseCache):
         tiered_cache.set("clear1", "a")
         tiered_cache.set("clear2", "b")
@@ -637,6 +656,10 @@ class TestTieredStockDjangoL2:
         with pytest.raises(NotSupportedError):
             await stock_tiered.aset("ask", "v", get=True)
 
+    def test_stale_while_revalidate_needs_resp_l2(self, stock_tiered: BaseCache):
+        with pytest.raises(NotSupportedError):
+            stock_tiered.get_or_set("swrk", "v", stale_while_revalidate=30)
+
 
 class TestTieredSetManyOrdering:
     """Verify set_many writes L2 before L1 so L1 doesn't have phantom data on L2 failure."""
@@ -702,6 +725,14 @@ class TestTieredAsync:
         assert await tiered_cache.atouch("atouch", timeout=60) is True
         assert await tiered_cache.aget("atouch") == "val"
 
+    async def test_aget_or_set_stale_while_revalidate(self, tiered_cache: BaseCache):
+        assert await tiered_cache.aget_or_set("aswr", "created", stale_while_revalidate=30) == "created"
+        assert caches["l1"].get("aswr") == "created"
+        l2 = caches["l2"]
+        with patch.object(l2, "_aget_or_set_fresh", AsyncMock(return_value=("stale", False))):
+            assert await tiered_cache.aget_or_set("aswr_stale", "fresh", stale_while_revalidate=30) == "stale"
+        assert caches["l1"].get("aswr_stale") is None
+
     async def test_adelete_many(self, tiered_cache: BaseCache):
         await tiered_cache.aset_many({"adm1": 1, "adm2": 2})
         await tiered_cache.adelete_many(["adm1", "adm2"])
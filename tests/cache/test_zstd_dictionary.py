@@ -0,0 +1,100 @@
+"""Tests for zstd dictionary compression and the ``cachex_train_zstd_dict`` command."""
+
+from compression import zstd
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+
+from django_cachex.compressors.zstd import ZstdCompressor
+from django_cachex.exceptions import CompressorError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from django_cachex.cache import RespCache
+
+
+def _record(i: int, kind: str = "user") -> bytes:
+    return f'{{"id": {i}, "type": "{kind}", "name": "{kind} number {i}", "active": true, "tags": ["a", "b"]}}'.encode()
+
+
+def _train(kind: str) -> zstd.ZstdDict:
+    return zstd.train_dict([_record(i, kind) for i in range(1_000)], 2_048)
+
+
+@pytest.fixture(scope="module")
+def user_dict() -> zstd.ZstdDict:
+    return _train("user")
+
+
+@pytest.fixture(scope="module")
+def order_dict() -> zstd.ZstdDict:
+    return _train("order")
+
+
+class TestZstdDictionary:
+    def test_round_trip_beats_plain_zstd(self, user_dict):
+        compressor = ZstdCompressor(dictionaries=[user_dict])
+        data = _record(5_000)
+        compressed = compressor.compress(data)
+        assert zstd.get_frame_info(compressed).dictionary_id == user_dict.dict_id
+        assert len(compressed) < len(zstd.compress(data))
+        assert compressor.decompress(compressed) == data
+
+    def test_small_values_compressed_by_default(self, user_dict):
+        assert ZstdCompressor(dictionaries=[user_dict]).min_length == ZstdCompressor.dictionary_min_length
+        assert ZstdCompressor(dictionaries=[user_dict], min_length=512).min_length == 512
+
+    def test_loads_from_path_and_bytes(self, user_dict, tmp_path: Path):
+        path = tmp_path / "user.dict"
+        path.write_bytes(user_dict.dict_content)
+        for source in (path, str(path), user_dict.dict_content):
+            assert ZstdCompressor(dictionaries=[source]).dictionary_id == user_dict.dict_id
+
+    def test_dictionaries_coexist(self, user_dict, order_dict):
+        old = ZstdCompressor(dictionaries=[user_dict])
+        new = ZstdCompressor(dictionaries=[user_dict, order_dict], dictionary_id=order_dict.dict_id)
+        plain = ZstdCompressor()
+        for compressed, data in [
+            (old.compress(_record(1)), _record(1)),
+            (new.compress(_record(2, "order")), _record(2, "order")),
+            (plain.compress(_record(3) * 10), _record(3) * 10),
+        ]:
+            assert new.decompress(compressed) == data
+
+    def test_missing_dictionary_raises(self, user_dict, order_dict):
+        compressed = ZstdCompressor(dictionaries=[order_dict]).compress(_record(1, "order"))
+        with pytest.raises(CompressorError):
+            ZstdCompressor(dictionaries=[user_dict]).decompress(compressed)
+
+    def test_unknown_dictionary_id_rejected(self, user_dict):
+        with pytest.raises(ImproperlyConfigured, match="dictionary_id"):
+            ZstdCompressor(dictionaries=[user_dict], dictionary_id=user_dict.dict_id + 1)
+        with pytest.raises(ImproperlyConfigured, match="dictionary_id"):
+            ZstdCompressor(dictionary_id=1)
+
+
+@pytest.mark.parametrize("resp_adapter", ["redis-py"])
+class TestTrainCommand:
+    def test_trains_dictionary_from_cache(self, cache_with_options: RespCache, tmp_path: Path):
+        cache_with_options.set_many(
+            {f"user:{i}": {"id": i, "name": f"user {i}", "roles": ["staff"]} for i in range(300)}
+        )
+        cache_with_options.set("counter", 7)
+        output = tmp_path / "users.dict"
+        call_command("cachex_train_zstd_dict", "default", str(output), "--pattern", "user:*", "--size", "1024")
+
+        compressor = ZstdCompressor(dictionaries=[output])
+        data = cache_with_options._serializers[0].dumps({"id": 999, "name": "user 999", "roles": ["staff"]})
+        assert compressor.decompress(compressor.compress(data)) == data
+
+    def test_too_few_samples(self, cache_with_options: RespCache, tmp_path: Path):
+        cache_with_options.set("user:1", {"id": 1})
+        with pytest.raises(CommandError, match="need at least"):
+            call_command("cachex_train_zstd_dict", "default", str(tmp_path / "d"))
+
+    def test_unknown_alias(self, tmp_path: Path):
+        with pytest.raises(CommandError):
+            call_command("cachex_train_zstd_dict", "missing", str(tmp_path / "d"))